@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Build (or refresh) the module catalog: one table joining every data source.
+
+Replaces the hand-run os.walk cells in DEV/SCRIPTS/notebook_agg_data.ipynb
+and the wholesale regeneration of MODULES_CONCEPT_DATA_AND_MAPPINGS.pkl.
+
+One row per module, joining:
+    - src/config/moduleRegistry.json          (registry fields)
+    - src/modules/<id>/                       (source files, sizes, hash, chapters from
+                                               chapters/<n>.json or the inline array)
+    - DEV/REACT_CONCEPTS.json                 (concept id, tier, definition)
+    - DEV/react-fiction-mappings.json         (fiction title/work for the concept)
+
+Refreshes are incremental: module directories are scanned with os.scandir in
+parallel, and a file is only re-read when its mtime/size changed (and only
+re-parsed when its content hash changed). Rows whose values changed are
+APPENDED to the column files; unchanged rows cost nothing.
+
+Output layout (append-friendly columnar store):
+    DEV/DATA/module_catalog/
+        state.json          file stats, current rows, column file sizes
+        _key.jsonl          row key (module id) per appended row
+        _deleted.jsonl      tombstone flag per appended row
+        <column>.jsonl      one JSON value per appended row
+
+Readers take the last row per key (see load_catalog). Column files are
+compacted automatically once dead rows outnumber live ones.
+
+Usage:
+    python build_catalog.py                 # refresh
+    python build_catalog.py --rebuild       # full rebuild
+    python build_catalog.py --show          # refresh, then print the table
+
+    # In a notebook
+    from build_catalog import build_catalog, load_catalog
+    build_catalog()
+    rows = load_catalog()          # list of dicts
+    df = load_catalog(as_dataframe=True)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+CONCEPTS_FILE = PROJECT_ROOT / "DEV" / "REACT_CONCEPTS.json"
+MAPPINGS_FILE = PROJECT_ROOT / "DEV" / "react-fiction-mappings.json"
+CATALOG_DIR = PROJECT_ROOT / "DEV" / "DATA" / "module_catalog"
+
+# Directories in src/modules that are not teaching modules
+NON_MODULE_DIRS = {"home", "_template"}
+
+SCHEMA_VERSION = 2
+
+COLUMNS = [
+    "id",
+    "path",
+    "title",
+    "subtitle",
+    "concept",
+    "concept_key",
+    "icon",
+    "enabled",
+    "in_registry",
+    "has_directory",
+    "source_files",
+    "source_bytes",
+    "source_lines",
+    "source_sha",
+    "chapter_count",
+    "chapter_titles",
+    "react_concept_id",
+    "react_concept_name",
+    "react_concept_tier",
+    "definition",
+    "fiction_title",
+    "fiction_work",
+]
+
+CONCEPT_PREFIX = re.compile(r"^\s*(react concept|react)\s*:?\s*", re.IGNORECASE)
+CHAPTERS_ARRAY = re.compile(r"chapters(?::\s*[\w\[\]<>]+)?\s*=\s*\[(.*?)\n\s*\];", re.DOTALL)
+CHAPTER_TITLE = re.compile(r"""\btitle:\s*(["'`])((?:\\.|(?!\1).)*)\1""", re.DOTALL)
+
+# Words that carry no concept identity ("React Concept: useRef Hook" ~ "useRef")
+CONCEPT_STOPWORDS = {"react", "concept", "hook", "hooks", "and", "the", "with", "of", "a"}
+
+
+# ---------------------------------------------------------------------------
+# Concept normalization / matching (shared with concept_catalog.py)
+# ---------------------------------------------------------------------------
+
+
+def normalize_concept(text: str) -> str:
+    """Canonical key for a concept name: lowercase words, no prefix/parentheticals.
+
+    >>> normalize_concept("React Concept: JSX (JavaScript XML)")
+    'jsx'
+    """
+    text = CONCEPT_PREFIX.sub("", text or "")
+    text = re.sub(r"\(.*?\)", " ", text)
+    text = re.sub(r"react\.memo", "reactmemo", text, flags=re.IGNORECASE)
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return " ".join(words)
+
+
+def concept_tokens(key: str) -> frozenset:
+    """Significant words of a normalized concept key."""
+    return frozenset(w for w in key.split() if w not in CONCEPT_STOPWORDS)
+
+
+class ConceptMatcher:
+    """Match free-text concept names against a set of known concepts.
+
+    Exact normalized keys hit a dict; everything else goes through a
+    token -> candidates inverted index and is scored by token overlap, so
+    matching never scans every concept.
+    """
+
+    def __init__(self, keys: List[str]):
+        self.exact = {}
+        self.tokens = {}
+        self.postings: Dict[str, set] = {}
+        for key in keys:
+            self.exact.setdefault(key, key)
+            tokens = concept_tokens(key)
+            self.tokens[key] = tokens
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(key)
+
+    def match(self, text: str, threshold: float = 0.5) -> Optional[str]:
+        key = normalize_concept(text)
+        if key in self.exact:
+            return key
+
+        # "React Props: One-Way Data Flow" -> the part before the colon names it
+        head = normalize_concept(CONCEPT_PREFIX.sub("", text).split(":")[0])
+        if head in self.exact:
+            return head
+
+        tokens = concept_tokens(key)
+        candidates = set()
+        for token in tokens:
+            candidates |= self.postings.get(token, set())
+
+        best, best_score = None, 0.0
+        for candidate in sorted(candidates):
+            other = self.tokens[candidate]
+            # Dice coefficient: "usecontext" ~ "usecontext context api", but a
+            # lone "state" doesn't swallow "server state management"
+            score = 2 * len(tokens & other) / (len(tokens) + len(other))
+            if score > best_score:
+                best, best_score = candidate, score
+
+        return best if best_score >= threshold else None
+
+
+# ---------------------------------------------------------------------------
+# Scanning
+# ---------------------------------------------------------------------------
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def extract_inline_chapter_titles(source: str) -> List[str]:
+    """Titles of the inline `chapters` array, if the module has one."""
+    match = CHAPTERS_ARRAY.search(source)
+    if not match:
+        return []
+    return [m.group(2).strip() for m in CHAPTER_TITLE.finditer(match.group(1))]
+
+
+def _chapter_number(rel: str) -> Optional[int]:
+    """n for src/modules/<id>/chapters/<n>.json (build/externalize_chapters.py)."""
+    path = Path(rel)
+    if path.parent.name == "chapters" and path.suffix == ".json" and path.stem.isdigit():
+        return int(path.stem)
+    return None
+
+
+def extract_chapter_titles(files: Dict[str, dict]) -> List[str]:
+    """Chapter titles of a scanned module: chapters/<n>.json in order, else
+    the inline array of index.tsx."""
+    numbered = sorted(
+        (_chapter_number(rel), stats) for rel, stats in files.items() if _chapter_number(rel) is not None
+    )
+    if numbered:
+        return [stats.get("chapter_title", "") for _, stats in numbered]
+    index = next((f for name, f in files.items() if name.endswith("/index.tsx")), {})
+    return index.get("chapter_titles", [])
+
+
+def sources_digest(files: Dict[str, dict]) -> Optional[str]:
+    """index.tsx hash, combined with the chapter files' hashes when externalized."""
+    index = next((f for name, f in files.items() if name.endswith("/index.tsx")), None)
+    chapters = sorted((_chapter_number(rel), f["sha"]) for rel, f in files.items() if _chapter_number(rel) is not None)
+    if not chapters:
+        return index["sha"] if index else None
+    h = hashlib.sha256((index["sha"] if index else "").encode())
+    for _, sha in chapters:
+        h.update(sha.encode())
+    return h.hexdigest()
+
+
+def scan_file(path: str, stat: os.stat_result, previous: Optional[dict]) -> dict:
+    """Stats for one source file, reusing the previous entry when unchanged."""
+    if previous and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+        return previous
+
+    digest = file_digest(path)
+    if previous and previous["sha"] == digest:
+        return {**previous, "mtime_ns": stat.st_mtime_ns}
+
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha": digest, "lines": 0}
+    if path.endswith((".tsx", ".ts")):
+        source = Path(path).read_text(encoding="utf-8", errors="replace")
+        entry["lines"] = source.count("\n") + 1
+        if os.path.basename(path).startswith("index."):
+            entry["chapter_titles"] = extract_inline_chapter_titles(source)
+    elif _chapter_number(path) is not None:
+        try:
+            chapter = json.loads(Path(path).read_text(encoding="utf-8"))
+            entry["chapter_title"] = str(chapter.get("title", "")).strip()
+        except (ValueError, AttributeError):
+            entry["chapter_title"] = ""
+    return entry
+
+
+def scan_module_dir(directory: str, previous: Dict[str, dict]) -> Dict[str, dict]:
+    """Recursively scan one module directory with os.scandir."""
+    files = {}
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    rel = Path(entry.path).relative_to(PROJECT_ROOT).as_posix()
+                    files[rel] = scan_file(entry.path, entry.stat(), previous.get(rel))
+    return files
+
+
+def scan_modules(modules_dir: Path, previous: Dict[str, dict], workers: int) -> Dict[str, Dict[str, dict]]:
+    """Scan every module directory in parallel. Returns id -> {file: stats}."""
+    with os.scandir(modules_dir) as it:
+        dirs = sorted(
+            (entry.name, entry.path)
+            for entry in it
+            if entry.is_dir() and entry.name not in NON_MODULE_DIRS
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda d: scan_module_dir(d[1], previous), dirs)
+        return {name: files for (name, _), files in zip(dirs, results)}
+
+
+def load_json_source(path: Path, previous: Optional[dict]) -> Tuple[Any, dict]:
+    """Load a JSON input, skipping the parse when its stats are unchanged."""
+    stat = path.stat()
+    if previous and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+        return None, previous
+    digest = file_digest(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha": digest}
+
+
+# ---------------------------------------------------------------------------
+# Joining
+# ---------------------------------------------------------------------------
+
+
+def concept_lookup(concepts_data: dict, mappings_data: list) -> Dict[str, dict]:
+    """normalized concept key -> joined concept + fiction fields."""
+    lookup = {}
+    for tier, concepts in concepts_data.get("reactConcepts", {}).items():
+        for concept in concepts:
+            key = normalize_concept(concept["name"])
+            fiction = concept.get("fiction", {})
+            lookup[key] = {
+                "react_concept_id": concept.get("id"),
+                "react_concept_name": concept.get("name"),
+                "react_concept_tier": tier,
+                "definition": concept.get("definition"),
+                "fiction_title": fiction.get("title"),
+                "fiction_work": fiction.get("work"),
+            }
+
+    for mapping in mappings_data:
+        key = normalize_concept(mapping.get("concept", ""))
+        row = lookup.setdefault(key, {"react_concept_name": mapping.get("concept")})
+        # REACT_CONCEPTS.json wins; the mappings file fills gaps
+        if row.get("fiction_title") is None:
+            row["fiction_title"] = mapping.get("title")
+        if row.get("fiction_work") is None:
+            row["fiction_work"] = mapping.get("fiction")
+    return lookup
+
+
+def build_rows(
+    registry: List[dict], modules: Dict[str, Dict[str, dict]], lookup: Dict[str, dict]
+) -> Dict[str, dict]:
+    """Join registry, module sources and concepts into id -> row."""
+    matcher = ConceptMatcher(list(lookup))
+    by_id = {entry["id"]: entry for entry in registry}
+
+    rows = {}
+    for module_id in sorted(set(by_id) | set(modules)):
+        entry = by_id.get(module_id, {})
+        files = modules.get(module_id, {})
+        titles = extract_chapter_titles(files)
+
+        concept = entry.get("concept", "")
+        matched = matcher.match(concept) if concept else None
+        joined = lookup.get(matched, {}) if matched else {}
+
+        row = {column: None for column in COLUMNS}
+        row.update(
+            {
+                "id": module_id,
+                "path": entry.get("path"),
+                "title": entry.get("title"),
+                "subtitle": entry.get("subtitle"),
+                "concept": concept or None,
+                "concept_key": matched,
+                "icon": entry.get("icon"),
+                "enabled": entry.get("enabled"),
+                "in_registry": module_id in by_id,
+                "has_directory": module_id in modules,
+                "source_files": len(files),
+                "source_bytes": sum(f["size"] for f in files.values()),
+                "source_lines": sum(f["lines"] for f in files.values()),
+                "source_sha": sources_digest(files),
+                "chapter_count": len(titles),
+                "chapter_titles": titles,
+            }
+        )
+        row.update({k: v for k, v in joined.items() if k in row})
+        rows[module_id] = row
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Columnar store
+# ---------------------------------------------------------------------------
+
+
+def _column_path(catalog_dir: Path, column: str) -> Path:
+    return catalog_dir / f"{column}.jsonl"
+
+
+def _all_columns() -> List[str]:
+    return ["_key", "_deleted"] + COLUMNS
+
+
+def append_rows(catalog_dir: Path, rows: List[Tuple[str, bool, dict]]):
+    """Append (key, deleted, row) records: one line per column file."""
+    for column in _all_columns():
+        with open(_column_path(catalog_dir, column), "a", encoding="utf-8", newline="\n") as f:
+            for key, deleted, row in rows:
+                if column == "_key":
+                    value = key
+                elif column == "_deleted":
+                    value = deleted
+                else:
+                    value = row.get(column)
+                f.write(json.dumps(value, ensure_ascii=False) + "\n")
+
+
+def column_sizes(catalog_dir: Path) -> Dict[str, int]:
+    sizes = {}
+    for column in _all_columns():
+        path = _column_path(catalog_dir, column)
+        sizes[column] = path.stat().st_size if path.exists() else 0
+    return sizes
+
+
+def write_state(catalog_dir: Path, state: dict):
+    tmp = catalog_dir / "state.json.tmp"
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, catalog_dir / "state.json")
+
+
+def load_state(catalog_dir: Path) -> Optional[dict]:
+    path = catalog_dir / "state.json"
+    if not path.exists():
+        return None
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    if state.get("schema_version") != SCHEMA_VERSION or state.get("columns") != COLUMNS:
+        return None
+    # Column files must be exactly what the state recorded (no torn appends)
+    if state.get("column_sizes") != column_sizes(catalog_dir):
+        return None
+    return state
+
+
+def reset_store(catalog_dir: Path):
+    for column in _all_columns():
+        _column_path(catalog_dir, column).unlink(missing_ok=True)
+
+
+def build_catalog(
+    catalog_dir: Optional[str] = None,
+    rebuild: bool = False,
+    workers: int = 8,
+) -> Dict[str, Any]:
+    """Refresh the catalog, appending only rows that changed.
+
+    Args:
+        catalog_dir: Output directory (default: DEV/DATA/module_catalog)
+        rebuild: Ignore the previous state and rewrite everything
+        workers: Threads used to scan module directories
+
+    Returns:
+        Dict with counts of appended, deleted and unchanged rows
+    """
+    catalog_dir = Path(catalog_dir) if catalog_dir else CATALOG_DIR
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+
+    state = None if rebuild else load_state(catalog_dir)
+    if state is None:
+        reset_store(catalog_dir)
+        state = {"files": {}, "inputs": {}, "inputs_data": {}, "rows": {}, "row_count": 0}
+
+    inputs = {}
+    inputs_changed = False
+    for name, path in (
+        ("registry", REGISTRY_FILE),
+        ("concepts", CONCEPTS_FILE),
+        ("mappings", MAPPINGS_FILE),
+    ):
+        data, stats = load_json_source(path, state["inputs"].get(name))
+        if data is None:
+            data = state["inputs_data"][name]
+        elif stats["sha"] != state["inputs"].get(name, {}).get("sha"):
+            inputs_changed = True
+        inputs[name] = (data, stats)
+
+    modules = scan_modules(MODULES_DIR, state["files"], workers)
+    files = {rel: stats for module_files in modules.values() for rel, stats in module_files.items()}
+
+    if inputs_changed or "lookup" not in state:
+        lookup = concept_lookup(inputs["concepts"][0], inputs["mappings"][0])
+    else:
+        lookup = state["lookup"]
+
+    rows = build_rows(inputs["registry"][0], modules, lookup)
+
+    previous_rows = state["rows"]
+    appended = [(key, False, row) for key, row in rows.items() if previous_rows.get(key) != row]
+    deleted = [(key, True, {}) for key in previous_rows if key not in rows]
+
+    if appended or deleted:
+        append_rows(catalog_dir, appended + deleted)
+
+    row_count = state["row_count"] + len(appended) + len(deleted)
+    new_state = {
+        "schema_version": SCHEMA_VERSION,
+        "columns": COLUMNS,
+        "files": files,
+        "inputs": {name: stats for name, (_, stats) in inputs.items()},
+        "inputs_data": {name: data for name, (data, _) in inputs.items()},
+        "lookup": lookup,
+        "rows": rows,
+        "row_count": row_count,
+        "column_sizes": column_sizes(catalog_dir),
+    }
+
+    compacted = False
+    if row_count > 2 * max(len(rows), 1):
+        reset_store(catalog_dir)
+        append_rows(catalog_dir, [(key, False, row) for key, row in rows.items()])
+        new_state["row_count"] = len(rows)
+        new_state["column_sizes"] = column_sizes(catalog_dir)
+        compacted = True
+
+    write_state(catalog_dir, new_state)
+
+    return {
+        "success": True,
+        "catalog_dir": str(catalog_dir),
+        "rows": len(rows),
+        "appended": len(appended),
+        "deleted": len(deleted),
+        "unchanged": len(rows) - len(appended),
+        "compacted": compacted,
+    }
+
+
+def load_catalog(catalog_dir: Optional[str] = None, as_dataframe: bool = False):
+    """Read the latest version of every row.
+
+    Args:
+        catalog_dir: Catalog directory (default: DEV/DATA/module_catalog)
+        as_dataframe: Return a pandas DataFrame instead of a list of dicts
+    """
+    catalog_dir = Path(catalog_dir) if catalog_dir else CATALOG_DIR
+
+    columns = {}
+    for column in _all_columns():
+        with open(_column_path(catalog_dir, column), encoding="utf-8") as f:
+            columns[column] = [json.loads(line) for line in f]
+
+    latest = {}
+    for i, key in enumerate(columns["_key"]):
+        latest[key] = i
+
+    rows = [
+        {column: columns[column][i] for column in COLUMNS}
+        for key, i in sorted(latest.items())
+        if not columns["_deleted"][i]
+    ]
+
+    if as_dataframe:
+        import pandas as pd
+
+        return pd.DataFrame(rows, columns=COLUMNS)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or refresh the module catalog",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--catalog-dir", default=str(CATALOG_DIR), help="Catalog directory")
+    parser.add_argument("--rebuild", action="store_true", help="Rewrite from scratch")
+    parser.add_argument("--workers", type=int, default=8, help="Scan threads (default: 8)")
+    parser.add_argument("--show", action="store_true", help="Print the catalog after refreshing")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = build_catalog(args.catalog_dir, rebuild=args.rebuild, workers=args.workers)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print("=" * 60)
+    print("📚 MODULE CATALOG")
+    print("=" * 60)
+    print(f"Rows:       {result['rows']}")
+    print(f"Appended:   {result['appended']}")
+    print(f"Deleted:    {result['deleted']}")
+    print(f"Unchanged:  {result['unchanged']}")
+    print(f"Compacted:  {result['compacted']}")
+    print(f"Time:       {elapsed:.1f} ms")
+    print("=" * 60)
+
+    if args.show:
+        for row in load_catalog(args.catalog_dir):
+            concept = row["react_concept_name"] or "—"
+            print(
+                f"{row['id']:<45} {'✅' if row['enabled'] else '⛔'} "
+                f"{row['chapter_count']:>2} ch  {row['source_lines']:>4} lines  {concept}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
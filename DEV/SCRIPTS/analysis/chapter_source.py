@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Read a module's inline `chapters` array literal without running TypeScript.
+
+Shared by build/build_search_index.py (modules not yet externalized) and
+integration/response_stats.py (chapter sizes of fresh Persona B responses).
+Only string-literal `title` / `content` fields are read; Markdown emphasis
+is stripped so word counts and search terms see plain prose.
+
+Usage:
+    from chapter_source import extract_chapters
+
+    extract_chapters(Path("src/modules/x/index.tsx").read_text())
+"""
+
+import re
+from typing import Dict, List
+
+CHAPTERS_START = re.compile(r"\bchapters\s*(?::\s*[\w\[\]<>]+\s*)?=\s*\[")
+LITERAL = r"""(`(?:\\.|[^`\\])*`|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')"""
+FIELD = re.compile(r"\b(title|content)\s*:\s*" + LITERAL, re.DOTALL)
+MARKDOWN = re.compile(r"\*\*|__|[*_`]")
+
+
+def _unquote(literal: str) -> str:
+    body = literal[1:-1]
+    return re.sub(r"\\(.)", r"\1", body)
+
+
+def array_end(text: str, start: int) -> int:
+    """Index of the `]` closing the array that opens just before `start`."""
+    depth, quote, i = 1, None, start
+    while i < len(text) and depth:
+        char = text[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'`":
+            quote = char
+        elif char in "[{(":
+            depth += 1
+        elif char in "]})":
+            depth -= 1
+        i += 1
+    return i - 1
+
+
+def extract_chapters(source: str) -> List[Dict[str, str]]:
+    """[{title, content}] from the module's `chapters` array literal."""
+    match = CHAPTERS_START.search(source)
+    if not match:
+        return []
+    array = source[match.end() : array_end(source, match.end())]
+
+    chapters: List[Dict[str, str]] = []
+    for field in FIELD.finditer(array):
+        name, value = field.group(1), MARKDOWN.sub("", _unquote(field.group(2)))
+        if name == "title" or not chapters or "content" in chapters[-1]:
+            chapters.append({})
+        chapters[-1][name] = value.strip()
+    return [c for c in chapters if c.get("content")]
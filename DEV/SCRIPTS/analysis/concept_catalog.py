@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+One typed, indexed view over every concept catalog in the repo.
+
+The concept data lives in four shapes:
+    - DEV/REACT_CONCEPTS.json              tiers -> [{id, name, fiction{...}}]
+    - DEV/react-fiction-mappings.json      [{title, concept, fiction, ...}]
+    - V3.0_PERSONAS/01.json, 02.json       [{id, phase, name, shakespeare{...}}]
+    - src/config/moduleRegistry.json       [{id, concept, enabled, ...}]
+
+Notebooks used to reload all of them and scan them with nested loops. This
+module normalizes them ONCE into dataclasses and hash indexes:
+
+    catalog.by_key        normalized concept name -> Concept
+    catalog.by_id         (source, id)            -> Concept
+    catalog.by_work       normalized fiction work -> [Concept]
+    catalog.by_module     registry id             -> Module
+
+Concept names are joined across files with the same normalization and
+ConceptMatcher as build_catalog.py. The loaded catalog is cached per file
+mtime, so repeated calls in a notebook are free.
+
+Usage:
+    from concept_catalog import load_concept_catalog
+
+    catalog = load_concept_catalog()
+    catalog.concept("useState Hook")
+    catalog.works("Hamlet")
+    report = catalog.coverage()     # covered / missing / unmatched modules
+
+    python concept_catalog.py --coverage
+    python concept_catalog.py --concept "useRef" --work "hamlet"
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from build_catalog import CONCEPT_PREFIX, ConceptMatcher, concept_tokens, normalize_concept
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CONCEPTS_FILE = PROJECT_ROOT / "DEV" / "REACT_CONCEPTS.json"
+MAPPINGS_FILE = PROJECT_ROOT / "DEV" / "react-fiction-mappings.json"
+V3_DIR = PROJECT_ROOT / "DEV" / "PROMPTS" / "PERSONA" / "V3.0_PERSONAS"
+V3_FILES = (V3_DIR / "01.json", V3_DIR / "02.json")
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+
+
+def normalize_work(text: str) -> str:
+    """Canonical key for a fiction work: "Inception (2010)" -> "inception"."""
+    text = re.sub(r"\(.*?\)", " ", text or "")
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower().replace("'", "")))
+
+
+@dataclass(frozen=True)
+class FictionMapping:
+    """One fiction work used to teach a concept."""
+
+    work: str
+    title: Optional[str]
+    description: Optional[str]
+    source: str
+
+
+@dataclass
+class Concept:
+    key: str
+    name: str
+    tier: Optional[str] = None
+    definition: Optional[str] = None
+    importance: Optional[str] = None
+    ids: Dict[str, int] = field(default_factory=dict)
+    aliases: Set[str] = field(default_factory=set)
+    mappings: List[FictionMapping] = field(default_factory=list)
+    modules: List["Module"] = field(default_factory=list)
+
+    @property
+    def live_modules(self) -> List["Module"]:
+        return [m for m in self.modules if m.enabled]
+
+
+@dataclass
+class Module:
+    id: str
+    path: str
+    title: str
+    concept_text: str
+    enabled: bool
+    concept_key: Optional[str] = None
+
+
+class ConceptCatalog:
+    """Normalized concepts, registry modules and the hash indexes over them."""
+
+    def __init__(self):
+        self.by_key: Dict[str, Concept] = {}
+        self.by_id: Dict[Tuple[str, int], Concept] = {}
+        self.by_work: Dict[str, List[Concept]] = {}
+        self.by_module: Dict[str, Module] = {}
+
+    # -- building ---------------------------------------------------------
+
+    def add_concept(
+        self,
+        name: str,
+        source: str,
+        concept_id: Optional[int] = None,
+        key: Optional[str] = None,
+        **fields: Any,
+    ) -> Concept:
+        """Add a concept, or merge ``name`` into the existing one at ``key``."""
+        key = key or normalize_concept(name)
+        concept = self.by_key.get(key)
+        if concept is None:
+            concept = self.by_key[key] = Concept(key=key, name=name)
+        concept.aliases.add(name)
+        for attr, value in fields.items():
+            if value and getattr(concept, attr) is None:
+                setattr(concept, attr, value)
+        if concept_id is not None:
+            concept.ids[source] = concept_id
+            self.by_id[(source, concept_id)] = concept
+        return concept
+
+    def add_mapping(self, concept: Concept, mapping: FictionMapping):
+        if not mapping.work:
+            return
+        concept.mappings.append(mapping)
+        bucket = self.by_work.setdefault(normalize_work(mapping.work), [])
+        if concept not in bucket:
+            bucket.append(concept)
+
+    def merge(self, concept: Concept, into: Concept):
+        """Fold a duplicate concept's names and mappings into another one."""
+        del self.by_key[concept.key]
+        into.aliases |= concept.aliases
+        for mapping in concept.mappings:
+            bucket = self.by_work[normalize_work(mapping.work)]
+            if concept in bucket:
+                bucket.remove(concept)
+            self.add_mapping(into, mapping)
+
+    def link_modules(self, registry: Iterable[Dict[str, Any]]):
+        links = link_registry(
+            {key: concept.aliases for key, concept in self.by_key.items()},
+            registry,
+            preferred=[key for key, concept in self.by_key.items() if concept.tier],
+        )
+        for entry in registry:
+            module = Module(
+                id=entry["id"],
+                path=entry.get("path", ""),
+                title=entry.get("title", ""),
+                concept_text=entry.get("concept", ""),
+                enabled=bool(entry.get("enabled")),
+                concept_key=links.get(entry["id"]),
+            )
+            self.by_module[module.id] = module
+            if module.concept_key:
+                self.by_key[module.concept_key].modules.append(module)
+
+    # -- queries ----------------------------------------------------------
+
+    def concept(self, name: str) -> Optional[Concept]:
+        """Look up by exact normalized name, falling back to fuzzy matching."""
+        key = normalize_concept(name)
+        if key in self.by_key:
+            return self.by_key[key]
+        if key in self._aliases():
+            return self.by_key[self._aliases()[key]]
+        match = self._matcher().match(name)
+        return self.by_key[match] if match else None
+
+    def works(self, work: str) -> List[Concept]:
+        return list(self.by_work.get(normalize_work(work), []))
+
+    def tier(self, tier: str) -> List[Concept]:
+        return [c for c in self.by_key.values() if (c.tier or "").lower() == tier.lower()]
+
+    def coverage(self) -> Dict[str, Any]:
+        """Which concepts have a live module, which don't, and stray modules."""
+        covered, missing = [], []
+        for concept in sorted(self.by_key.values(), key=lambda c: (c.tier or "~", c.name)):
+            (covered if concept.live_modules else missing).append(concept)
+        unmatched = [m for m in self.by_module.values() if m.concept_key is None]
+        return {
+            "covered": covered,
+            "missing": missing,
+            "unmatched_modules": unmatched,
+            "ratio": len(covered) / len(self.by_key) if self.by_key else 0.0,
+        }
+
+    def _aliases(self) -> Dict[str, str]:
+        if not hasattr(self, "_alias_keys"):
+            self._alias_keys = {
+                normalize_concept(alias): key
+                for key, concept in self.by_key.items()
+                for alias in concept.aliases
+            }
+        return self._alias_keys
+
+    def _matcher(self) -> ConceptMatcher:
+        if not hasattr(self, "_concept_matcher"):
+            self._concept_matcher = ConceptMatcher(sorted(self.by_key))
+        return self._concept_matcher
+
+
+def link_registry(
+    concepts: Dict[str, Iterable[str]],
+    registry: Iterable[Dict[str, Any]],
+    preferred: Iterable[str] = (),
+) -> Dict[str, str]:
+    """Map registry ids to normalized concept keys.
+
+    ``concepts`` maps each key to its raw names. Registry strings ("React
+    Props: One-Way Data Flow") go through ConceptMatcher against the
+    ``preferred`` keys (the tiered curriculum). Concepts whose name is the
+    SHORTER side get two more chances: one of their aliases ("React Query /
+    TanStack Query" -> "React Query") equals the registry head, or all of
+    their words appear in exactly one registry entry ("Zustand" -> "Global
+    State Management with Zustand"). Whatever is left is matched against
+    every key.
+    """
+    registry = list(registry)
+    preferred = sorted(set(preferred) & set(concepts))
+    first = ConceptMatcher(preferred) if preferred else None
+
+    heads: Dict[str, str] = {}
+    owners: Dict[str, List[str]] = {}
+    links: Dict[str, str] = {}
+
+    for entry in registry:
+        text = entry.get("concept", "")
+        match = first.match(text) if text and first else None
+        if match:
+            links[entry["id"]] = match
+        key = normalize_concept(text)
+        heads.setdefault(key, entry["id"])
+        heads.setdefault(normalize_concept(CONCEPT_PREFIX.sub("", text).split(":")[0]), entry["id"])
+        for token in concept_tokens(key):
+            owners.setdefault(token, []).append(entry["id"])
+
+    linked = set(links.values())
+    for key, names in concepts.items():
+        if key in linked:
+            continue
+        aliases = {
+            normalize_concept(part)
+            for name in names
+            for part in re.split(r"/", re.sub(r"\(.*?\)", "", name))
+        }
+        module_id = next((heads[a] for a in sorted(aliases) if a in heads and heads[a] not in links), None)
+        if module_id is None:
+            tokens = concept_tokens(key)
+            candidates = {tuple(owners.get(t, [])) for t in tokens}
+            if tokens and len(candidates) == 1:
+                (ids,) = candidates
+                if len(ids) == 1 and ids[0] not in links:
+                    module_id = ids[0]
+        if module_id:
+            links[module_id] = key
+            linked.add(key)
+
+    rest = ConceptMatcher(sorted(concepts))
+    for entry in registry:
+        if entry["id"] not in links and entry.get("concept"):
+            match = rest.match(entry["concept"])
+            if match:
+                links[entry["id"]] = match
+
+    return links
+
+
+def _load(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _stamp(path: Path) -> Tuple[str, int]:
+    return str(path), path.stat().st_mtime_ns if path.exists() else 0
+
+
+@lru_cache(maxsize=4)
+def _build(stamps: Tuple[Tuple[str, int], ...]) -> ConceptCatalog:
+    paths = [Path(p) for p, _ in stamps]
+    concepts_file, mappings_file, registry_file, *v3_files = paths
+    catalog = ConceptCatalog()
+
+    if concepts_file.exists():
+        for tier, concepts in _load(concepts_file).get("reactConcepts", {}).items():
+            for raw in concepts:
+                concept = catalog.add_concept(
+                    raw["name"], "react_concepts", raw.get("id"),
+                    tier=tier, definition=raw.get("definition"), importance=raw.get("importance"),
+                )
+                fiction = raw.get("fiction") or {}
+                catalog.add_mapping(
+                    concept,
+                    FictionMapping(fiction.get("work", ""), fiction.get("title"), fiction.get("description"), "react_concepts"),
+                )
+
+    # V3 names ("useContext Hook") are joined onto the curriculum keys
+    # ("usecontext hook and context api") the same way the mappings are
+    curriculum = ConceptMatcher(sorted(catalog.by_key))
+    for v3_file in v3_files:
+        if not v3_file.exists():
+            continue
+        source = f"v3_{v3_file.stem}"
+        for raw in _load(v3_file):
+            match = curriculum.match(raw["name"])
+            concept = catalog.add_concept(
+                raw["name"], source, raw.get("id"), key=match,
+                tier=raw.get("phase"), definition=raw.get("definition"), importance=raw.get("importance"),
+            )
+            play = raw.get("shakespeare") or {}
+            catalog.add_mapping(
+                concept,
+                FictionMapping(play.get("play", ""), play.get("act_scene"), play.get("premise"), source),
+            )
+
+    if mappings_file.exists():
+        known = ConceptMatcher(sorted(catalog.by_key))
+        for raw in _load(mappings_file):
+            name = raw.get("concept", "")
+            match = known.match(name)
+            concept = catalog.by_key[match] if match else catalog.add_concept(name, "mappings")
+            concept.aliases.add(name)
+            catalog.add_mapping(
+                concept,
+                FictionMapping(raw.get("fiction", ""), raw.get("title"), raw.get("description"), "mappings"),
+            )
+
+    if registry_file.exists():
+        catalog.link_modules(_load(registry_file))
+
+        # Mapping-only concepts that name a module's topic in other words
+        # ("Singleton Components & Global State" ~ "Global State Management
+        # with Zustand") belong to the concept that module teaches
+        topics = {
+            normalize_concept(m.concept_text): m.concept_key
+            for m in catalog.by_module.values()
+            if m.concept_key
+        }
+        matcher = ConceptMatcher(sorted(topics))
+        for concept in list(catalog.by_key.values()):
+            if concept.ids or concept.modules:
+                continue
+            match = matcher.match(concept.name)
+            if match and topics[match] != concept.key:
+                catalog.merge(concept, catalog.by_key[topics[match]])
+
+    return catalog
+
+
+def load_concept_catalog(
+    concepts_file: Optional[str] = None,
+    mappings_file: Optional[str] = None,
+    registry_file: Optional[str] = None,
+    v3_files: Optional[List[str]] = None,
+) -> ConceptCatalog:
+    """Load (or reuse) the catalog; rebuilt only when a source file changes."""
+    paths = [
+        Path(concepts_file) if concepts_file else CONCEPTS_FILE,
+        Path(mappings_file) if mappings_file else MAPPINGS_FILE,
+        Path(registry_file) if registry_file else REGISTRY_FILE,
+        *([Path(p) for p in v3_files] if v3_files is not None else V3_FILES),
+    ]
+    return _build(tuple(_stamp(p) for p in paths))
+
+
+def _describe(concept: Concept) -> str:
+    modules = ", ".join(m.id + ("" if m.enabled else " (disabled)") for m in concept.modules) or "-"
+    works = ", ".join(sorted({m.work for m in concept.mappings})) or "-"
+    return f"{concept.name} [{concept.tier or '?'}]\n      works:   {works}\n      modules: {modules}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Query the normalized concept catalogs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python concept_catalog.py --coverage
+  python concept_catalog.py --concept "useRef"
+  python concept_catalog.py --work "Hamlet" --json
+        """,
+    )
+
+    parser.add_argument("--coverage", action="store_true", help="Covered vs missing concepts")
+    parser.add_argument("--concept", help="Look up one concept")
+    parser.add_argument("--work", help="Concepts taught with a fiction work")
+    parser.add_argument("--module", help="Concept behind a registry id")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+
+    args = parser.parse_args()
+
+    try:
+        catalog = load_concept_catalog()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    output: Dict[str, Any] = {}
+
+    if args.concept:
+        concept = catalog.concept(args.concept)
+        output["concept"] = concept
+        print(f"\n🔎 {args.concept}: " + (_describe(concept) if concept else "not found"))
+
+    if args.work:
+        concepts = catalog.works(args.work)
+        output["work"] = concepts
+        print(f"\n🎭 {args.work}: {len(concepts)} concept(s)")
+        for concept in concepts:
+            print(f"   • {_describe(concept)}")
+
+    if args.module:
+        module = catalog.by_module.get(args.module)
+        concept = catalog.by_key.get(module.concept_key) if module and module.concept_key else None
+        output["module"] = {"module": module, "concept": concept}
+        print(f"\n📦 {args.module}: " + (_describe(concept) if concept else "no concept match"))
+
+    if args.coverage or not (args.concept or args.work or args.module):
+        report = catalog.coverage()
+        output["coverage"] = report
+        print("\n" + "=" * 60)
+        print("📚 CONCEPT COVERAGE")
+        print("=" * 60)
+        print(f"Concepts:           {len(catalog.by_key)}")
+        print(f"With a live module: {len(report['covered'])} ({report['ratio']:.0%})")
+        print(f"Missing:            {len(report['missing'])}")
+        print(f"Unmatched modules:  {len(report['unmatched_modules'])}")
+        print("=" * 60)
+        tier = object()
+        for concept in report["missing"]:
+            if concept.tier != tier:
+                tier = concept.tier
+                print(f"\n{tier or 'untiered'}:")
+            print(f"   ❌ {concept.name}")
+        if report["unmatched_modules"]:
+            print("\nModules without a catalog concept:")
+            for module in report["unmatched_modules"]:
+                print(f"   ⚠️  {module.id} ({module.concept_text})")
+
+    if args.json:
+        print(json.dumps(output, default=_to_json, indent=2))
+
+    return 0
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Concept):
+        return {
+            "key": value.key,
+            "name": value.name,
+            "tier": value.tier,
+            "ids": value.ids,
+            "works": sorted({m.work for m in value.mappings}),
+            "modules": [m.id for m in value.modules],
+        }
+    if isinstance(value, Module):
+        return value.__dict__
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Not serializable: {type(value).__name__}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
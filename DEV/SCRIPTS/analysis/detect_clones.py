@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Detect code duplicated across module sources (winnowing fingerprints).
+
+Every src/modules/*/index.tsx (plus any newly extracted files) is tokenized,
+hashed into k-gram fingerprints with a rolling hash, and winnowed. Shared
+fingerprints between files are extended into maximal duplicated fragments,
+grouped into clone classes and reported with their locations and the bytes
+every visitor would stop downloading if the fragment became a shared
+component in src/components/common.
+
+Fingerprints are cached per file content hash, so checking one new module
+against the corpus only tokenizes that one file.
+
+Usage:
+    # Whole corpus
+    python detect_clones.py
+
+    # Check newly extracted modules against the corpus
+    python detect_clones.py --check ../integration/EXPORT/modules/new-module/index.tsx
+
+    # Machine-readable report
+    python detect_clones.py --min-tokens 80 --json clones.json
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+CACHE_FILE = Path(__file__).resolve().parent / ".cache" / "clone_fingerprints.json"
+
+# Skipped by default: the template is meant to be copied
+EXCLUDED_MODULES = {"_template"}
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<string>`(?:\\.|[^`\\])*`|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<word>[A-Za-z_$][\w$]*)
+    | (?P<punct>=>|===|!==|\.\.\.|&&|\|\||\?\?|[^\s\w])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+HASH_BASE = 1_000_003
+HASH_MOD = (1 << 61) - 1
+
+
+def tokenize(source: str, normalize: bool = False) -> List[Tuple[str, int, int]]:
+    """Split TSX source into (token, start_offset, end_offset), dropping comments.
+
+    With normalize=True, string literals collapse to a placeholder so clones
+    that only differ in text content (titles, class names) still match.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(source):
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        value = match.group()
+        if normalize and kind == "string":
+            value = "<str>"
+        tokens.append((value, match.start(), match.end()))
+    return tokens
+
+
+def kgram_hashes(token_hashes: List[int], k: int) -> List[int]:
+    """Rolling (Rabin-Karp) hash of every k-token window."""
+    if len(token_hashes) < k:
+        return []
+
+    high = pow(HASH_BASE, k - 1, HASH_MOD)
+    h = 0
+    for value in token_hashes[:k]:
+        h = (h * HASH_BASE + value) % HASH_MOD
+
+    hashes = [h]
+    for i in range(k, len(token_hashes)):
+        h = (h - token_hashes[i - k] * high) % HASH_MOD
+        h = (h * HASH_BASE + token_hashes[i]) % HASH_MOD
+        hashes.append(h)
+    return hashes
+
+
+def winnow(hashes: List[int], window: int) -> List[Tuple[int, int]]:
+    """Select (hash, position) fingerprints: rightmost minimum of each window."""
+    fingerprints = []
+    last = -1
+    for start in range(max(len(hashes) - window + 1, 1 if hashes else 0)):
+        chunk = hashes[start : start + window]
+        offset = min(range(len(chunk)), key=lambda j: (chunk[j], -j))
+        position = start + offset
+        if position != last:
+            fingerprints.append((hashes[position], position))
+            last = position
+    return fingerprints
+
+
+def fingerprint_source(source: str, k: int, window: int, normalize: bool) -> Dict[str, Any]:
+    """Tokenize and fingerprint one file."""
+    tokens = tokenize(source, normalize=normalize)
+    token_hashes = [zlib.crc32(t[0].encode("utf-8")) for t in tokens]
+    return {
+        "tokens": [t[0] for t in tokens],
+        "spans": [[t[1], t[2]] for t in tokens],
+        "lines": line_numbers(source, [t[1] for t in tokens]),
+        "fingerprints": winnow(kgram_hashes(token_hashes, k), window),
+    }
+
+
+def line_numbers(source: str, offsets: List[int]) -> List[int]:
+    """1-based line number for each (sorted) offset."""
+    lines = []
+    line = 1
+    cursor = 0
+    for offset in offsets:
+        line += source.count("\n", cursor, offset)
+        cursor = offset
+        lines.append(line)
+    return lines
+
+
+class FingerprintCache:
+    """JSON cache of per-file fingerprints keyed by content hash and settings.
+
+    `sources` maps each file fingerprinted so far to its last content hash, so
+    a run over a subset of files keeps the others' entries; an entry is only
+    dropped once no existing file still has that content.
+    """
+
+    def __init__(self, path: Path, settings: str):
+        self.path = path
+        self.settings = settings
+        self.entries: Dict[str, Any] = {}
+        self.sources: Dict[str, str] = {}
+        self.dirty = False
+
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("settings") == settings:
+                    self.entries = data.get("entries", {})
+                    self.sources = data.get("sources", {})
+            except (OSError, ValueError):
+                self.entries, self.sources = {}, {}
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(digest)
+
+    def put(self, digest: str, entry: Dict[str, Any]):
+        self.entries[digest] = entry
+        self.dirty = True
+
+    def link(self, source: Path, digest: str):
+        key = str(source.resolve())
+        if self.sources.get(key) != digest:
+            self.sources[key] = digest
+            self.dirty = True
+
+    def save(self):
+        gone = [source for source in self.sources if not Path(source).exists()]
+        for source in gone:
+            del self.sources[source]
+        live = set(self.sources.values())
+        stale = set(self.entries) - live
+        for digest in stale:
+            del self.entries[digest]
+        if not (self.dirty or gone or stale):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"settings": self.settings, "entries": self.entries, "sources": self.sources}
+        self.path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+def collect_corpus(modules_dir: Path, extra: List[Path]) -> List[Path]:
+    """All module entry files plus extra files (deduplicated, stable order)."""
+    files = [
+        entry
+        for entry in sorted(modules_dir.glob("*/index.tsx"))
+        if entry.parent.name not in EXCLUDED_MODULES
+    ]
+    seen = {f.resolve() for f in files}
+    for path in extra:
+        if path.is_dir():
+            candidates = sorted(path.rglob("*.tsx"))
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate.resolve() not in seen:
+                seen.add(candidate.resolve())
+                files.append(candidate)
+    return files
+
+
+def extend_match(
+    a: List[str], b: List[str], pa: int, pb: int, k: int
+) -> Optional[Tuple[int, int, int]]:
+    """Grow a k-gram hit into a maximal equal token run.
+
+    Returns (start_a, start_b, length) or None on a hash collision.
+    """
+    if a[pa : pa + k] != b[pb : pb + k]:
+        return None
+
+    start_a, start_b = pa, pb
+    while start_a > 0 and start_b > 0 and a[start_a - 1] == b[start_b - 1]:
+        start_a -= 1
+        start_b -= 1
+
+    end_a, end_b = pa + k, pb + k
+    while end_a < len(a) and end_b < len(b) and a[end_a] == b[end_b]:
+        end_a += 1
+        end_b += 1
+
+    return start_a, start_b, end_a - start_a
+
+
+def find_clones(
+    docs: Dict[str, Dict[str, Any]],
+    k: int,
+    min_tokens: int,
+    focus: Optional[set] = None,
+) -> List[Dict[str, Any]]:
+    """Match fingerprints across files and group fragments into clone classes.
+
+    Args:
+        docs: name -> fingerprinted document (see fingerprint_source)
+        k: k-gram size used for fingerprints
+        min_tokens: Minimum fragment length to report
+        focus: If given, only fragments involving these names are reported
+    """
+    index = defaultdict(list)
+    for name, doc in docs.items():
+        for h, position in doc["fingerprints"]:
+            index[h].append((name, position))
+
+    fragments = defaultdict(list)  # (name_a, name_b) -> [(sa, sb, length)]
+    for postings in index.values():
+        if len(postings) < 2:
+            continue
+        for i, (name_a, pa) in enumerate(postings):
+            for name_b, pb in postings[i + 1 :]:
+                if name_a == name_b:
+                    continue
+                if focus and name_a not in focus and name_b not in focus:
+                    continue
+                if name_a > name_b:
+                    name_a, pa, name_b, pb = name_b, pb, name_a, pa
+
+                found = fragments[(name_a, name_b)]
+                if any(sa <= pa < sa + n and sa - sb == pa - pb for sa, sb, n in found):
+                    continue
+
+                match = extend_match(docs[name_a]["tokens"], docs[name_b]["tokens"], pa, pb, k)
+                if match and match[2] >= min_tokens:
+                    found.append(match)
+
+    classes: Dict[str, Dict[str, Any]] = {}
+    for (name_a, name_b), found in fragments.items():
+        for sa, sb, length in found:
+            tokens = docs[name_a]["tokens"][sa : sa + length]
+            key = hashlib.sha1("\x00".join(tokens).encode("utf-8")).hexdigest()
+            clone = classes.setdefault(key, {"tokens": length, "locations": {}})
+            for name, start in ((name_a, sa), (name_b, sb)):
+                doc = docs[name]
+                span = (doc["spans"][start][0], doc["spans"][start + length - 1][1])
+                clone["locations"][(name, start)] = {
+                    "file": name,
+                    "start_line": doc["lines"][start],
+                    "end_line": doc["lines"][start + length - 1],
+                    "bytes": span[1] - span[0],
+                }
+
+    report = []
+    for key, clone in classes.items():
+        locations = sorted(clone["locations"].values(), key=lambda l: (l["file"], l["start_line"]))
+        sizes = [l["bytes"] for l in locations]
+        report.append(
+            {
+                "id": key[:10],
+                "tokens": clone["tokens"],
+                "occurrences": len(locations),
+                "fragment_bytes": max(sizes),
+                # One copy stays behind as the shared component
+                "estimated_bytes_saved": sum(sizes) - max(sizes),
+                "locations": locations,
+            }
+        )
+
+    report.sort(key=lambda c: c["estimated_bytes_saved"], reverse=True)
+    return report
+
+
+def non_overlapping_savings(clones: List[Dict[str, Any]]) -> int:
+    """Total savings without double counting nested/overlapping clone classes.
+
+    Classes are claimed greedily (largest saving first); a class only counts
+    if none of its locations overlap lines already claimed in that file.
+    """
+    claimed = defaultdict(list)
+    total = 0
+    for clone in clones:
+        locations = clone["locations"]
+        if any(
+            loc["start_line"] <= end and start <= loc["end_line"]
+            for loc in locations
+            for start, end in claimed[loc["file"]]
+        ):
+            continue
+        for loc in locations:
+            claimed[loc["file"]].append((loc["start_line"], loc["end_line"]))
+        total += clone["estimated_bytes_saved"]
+    return total
+
+
+def detect_clones(
+    modules_dir: Optional[str] = None,
+    extra: Optional[List[str]] = None,
+    check: Optional[List[str]] = None,
+    k: int = 25,
+    window: int = 8,
+    min_tokens: int = 60,
+    normalize: bool = False,
+    cache_file: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run clone detection over the module corpus.
+
+    Args:
+        modules_dir: Directory containing module folders (default: src/modules)
+        extra: Extra files or directories to include in the corpus
+        check: Files to check against the corpus; only their clones are reported
+        k: Tokens per fingerprinted k-gram
+        window: Winnowing window (guarantees detection of runs >= k + window - 1)
+        min_tokens: Minimum duplicated fragment length to report
+        normalize: Treat all string literals as equal
+        cache_file: Fingerprint cache location
+
+    Returns:
+        Dict containing files scanned, cache hits and the clone report
+    """
+    if min_tokens < k + window - 1:
+        raise ValueError(
+            f"min_tokens ({min_tokens}) must be >= k + window - 1 ({k + window - 1}) "
+            f"for winnowing to guarantee detection"
+        )
+
+    modules_dir = Path(modules_dir) if modules_dir else MODULES_DIR
+    check_paths = [Path(p) for p in (check or [])]
+    files = collect_corpus(modules_dir, [Path(p) for p in (extra or [])] + check_paths)
+
+    settings = f"k={k};w={window};normalize={normalize}"
+    cache = FingerprintCache(Path(cache_file) if cache_file else CACHE_FILE, settings)
+
+    docs = {}
+    hits = 0
+    for path in files:
+        source = path.read_text(encoding="utf-8")
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        cache.link(path, digest)
+
+        doc = cache.get(digest)
+        if doc is None:
+            doc = fingerprint_source(source, k, window, normalize)
+            cache.put(digest, doc)
+        else:
+            hits += 1
+
+        try:
+            name = path.resolve().relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            name = path.as_posix()
+        docs[name] = doc
+
+    cache.save()
+
+    focus = None
+    if check_paths:
+        focus = set()
+        for path in check_paths:
+            targets = sorted(path.rglob("*.tsx")) if path.is_dir() else [path]
+            for target in targets:
+                try:
+                    focus.add(target.resolve().relative_to(PROJECT_ROOT).as_posix())
+                except ValueError:
+                    focus.add(target.as_posix())
+
+    clones = find_clones(docs, k, min_tokens, focus=focus)
+
+    return {
+        "files_scanned": len(files),
+        "cache_hits": hits,
+        "clone_classes": len(clones),
+        "estimated_bytes_saved": non_overlapping_savings(clones),
+        "clones": clones,
+    }
+
+
+def print_report(result: Dict[str, Any], limit: int):
+    """Print a human-readable clone report."""
+    print("\n" + "=" * 60)
+    print("🧬 CLONE REPORT")
+    print("=" * 60)
+    print(f"Files scanned:        {result['files_scanned']} ({result['cache_hits']} cached)")
+    print(f"Clone classes:        {result['clone_classes']}")
+    print(f"Est. bytes saved:     {result['estimated_bytes_saved']:,}")
+    print("=" * 60)
+
+    for clone in result["clones"][:limit]:
+        print(
+            f"\n[{clone['id']}] {clone['tokens']} tokens × {clone['occurrences']} "
+            f"→ ~{clone['estimated_bytes_saved']:,} bytes saved"
+        )
+        for loc in clone["locations"]:
+            print(f"   {loc['file']}:{loc['start_line']}-{loc['end_line']}")
+
+    if len(result["clones"]) > limit:
+        print(f"\n... {len(result['clones']) - limit} more (use --json for the full list)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Detect code duplicated across modules",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python detect_clones.py
+  python detect_clones.py --check ../integration/EXPORT/modules/new-module/index.tsx
+  python detect_clones.py --normalize --min-tokens 100 --json clones.json
+        """,
+    )
+
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module directory")
+    parser.add_argument(
+        "--extra", nargs="*", default=[], help="Extra files/directories to add to the corpus"
+    )
+    parser.add_argument(
+        "--check", nargs="*", default=[], help="Only report clones involving these files"
+    )
+    parser.add_argument("-k", type=int, default=25, help="Tokens per k-gram (default: 25)")
+    parser.add_argument("--window", type=int, default=8, help="Winnowing window (default: 8)")
+    parser.add_argument(
+        "--min-tokens", type=int, default=60, help="Minimum fragment length (default: 60)"
+    )
+    parser.add_argument(
+        "--normalize", action="store_true", help="Ignore string literal contents"
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Clone classes to print")
+    parser.add_argument("--json", dest="json_path", help="Write full report as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        result = detect_clones(
+            modules_dir=args.modules_dir,
+            extra=args.extra,
+            check=args.check,
+            k=args.k,
+            window=args.window,
+            min_tokens=args.min_tokens,
+            normalize=args.normalize,
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_report(result, args.limit)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"\n📄 Report written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Collect real-user render timings and report the slowest modules.
+
+The app sends batches of React <Profiler> samples when it's built with
+VITE_RUM_ENDPOINT (src/components/common/RenderProfiler.tsx): one sample per
+commit of a module route, tagged "mount", "update" or "chapter" (a
+ChapterNavigation transition, with click-to-commit latency).
+
+`serve` runs a local stdlib HTTP server that appends every batch to SQLite.
+`report` summarises the samples per module: count, p50 and p95 of the
+commit duration per kind, sorted by p95 so the slow modules come first.
+
+Usage:
+    # Terminal 1: collector
+    python rum_collector.py serve --port 8787
+
+    # Terminal 2: app build that reports to it
+    VITE_RUM_ENDPOINT=http://localhost:8787/rum npm run build && npm run preview
+
+    # Later
+    python rum_collector.py report
+    python rum_collector.py report --kind chapter --min-samples 20 --json rum.json
+"""
+
+import argparse
+import json
+import math
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DB_FILE = Path(__file__).resolve().parent / ".cache" / "rum.sqlite"
+
+KINDS = ("mount", "update", "chapter")
+
+# A beacon is a few KB; anything far larger isn't from the app
+MAX_BODY = 256 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    received REAL NOT NULL,
+    session TEXT,
+    path TEXT,
+    module TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    actual REAL NOT NULL,
+    base REAL,
+    chapter INTEGER,
+    latency REAL
+);
+CREATE INDEX IF NOT EXISTS samples_module_kind ON samples (module, kind);
+"""
+
+
+def connect(db_file: Path) -> sqlite3.Connection:
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file, check_same_thread=False)
+    conn.executescript(SCHEMA)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+def _number(value: Any) -> Optional[float]:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _text(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+def parse_batch(body: bytes) -> List[tuple]:
+    """Rows for one beacon payload; malformed samples are dropped.
+
+    Raises ValueError when the payload itself isn't a {"samples": [...]} object.
+    """
+    payload = json.loads(body.decode("utf-8"))
+    if not isinstance(payload, dict) or not isinstance(payload.get("samples", []), list):
+        raise ValueError("expected an object with a samples list")
+    received = time.time()
+    rows = []
+    for sample in payload.get("samples", []):
+        if not isinstance(sample, dict):
+            continue
+        if sample.get("kind") not in KINDS or _number(sample.get("actual")) is None:
+            continue
+        rows.append(
+            (
+                received,
+                _text(payload.get("session")),
+                _text(payload.get("path")),
+                str(sample.get("module", "?")),
+                sample["kind"],
+                float(sample["actual"]),
+                _number(sample.get("base")),
+                _number(sample.get("chapter")),
+                _number(sample.get("latency")),
+            )
+        )
+    return rows
+
+
+def make_handler(conn: sqlite3.Connection, lock: threading.Lock, verbose: bool):
+    class RumHandler(BaseHTTPRequestHandler):
+        def _cors(self):
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self._cors()
+            self.end_headers()
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if self.path.rstrip("/") != "/rum" or not 0 < length <= MAX_BODY:
+                self.send_response(404 if self.path.rstrip("/") != "/rum" else 413)
+                self._cors()
+                self.end_headers()
+                return
+            try:
+                rows = parse_batch(self.rfile.read(length))
+            except (ValueError, AttributeError, TypeError):
+                self.send_response(400)
+                self._cors()
+                self.end_headers()
+                return
+
+            with lock:
+                conn.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.commit()
+            if verbose:
+                print(f"📥 {len(rows)} samples from {self.client_address[0]}")
+
+            self.send_response(204)
+            self._cors()
+            self.end_headers()
+
+        def log_message(self, format, *args):  # quiet unless --verbose
+            if verbose:
+                super().log_message(format, *args)
+
+    return RumHandler
+
+
+def serve(db_file: Path, host: str, port: int, verbose: bool = False):
+    conn = connect(db_file)
+    server = ThreadingHTTPServer((host, port), make_handler(conn, threading.Lock(), verbose))
+    print(f"📡 Collecting render samples on http://{host}:{port}/rum → {db_file}")
+    print(f"   Build with VITE_RUM_ENDPOINT=http://localhost:{port}/rum")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        conn.close()
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def rum_report(
+    db_file: str = str(DB_FILE),
+    kind: Optional[str] = None,
+    min_samples: int = 1,
+    since_hours: Optional[float] = None,
+) -> Dict[str, Any]:
+    path = Path(db_file)
+    if not path.exists():
+        raise FileNotFoundError(f"No samples yet: {path} (run `rum_collector.py serve`)")
+
+    conn = connect(path)
+    query = "SELECT module, kind, actual, latency, session FROM samples WHERE 1=1"
+    params: List[Any] = []
+    if kind:
+        query += " AND kind = ?"
+        params.append(kind)
+    if since_hours:
+        query += " AND received >= ?"
+        params.append(time.time() - since_hours * 3600)
+
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    sessions = set()
+    for module, sample_kind, actual, latency, session in conn.execute(query, params):
+        group = groups.setdefault((module, sample_kind), {"actual": [], "latency": []})
+        group["actual"].append(actual)
+        if latency is not None:
+            group["latency"].append(latency)
+        sessions.add(session)
+    conn.close()
+
+    rows = []
+    for (module, sample_kind), values in groups.items():
+        if len(values["actual"]) < min_samples:
+            continue
+        actual = sorted(values["actual"])
+        latency = sorted(values["latency"])
+        rows.append(
+            {
+                "module": module,
+                "kind": sample_kind,
+                "count": len(actual),
+                "p50": percentile(actual, 0.5),
+                "p95": percentile(actual, 0.95),
+                "max": actual[-1],
+                "latency_p50": percentile(latency, 0.5) if latency else None,
+                "latency_p95": percentile(latency, 0.95) if latency else None,
+            }
+        )
+    rows.sort(key=lambda row: -row["p95"])
+
+    return {
+        "samples": sum(len(g["actual"]) for g in groups.values()),
+        "sessions": len(sessions),
+        "modules": len({module for module, _ in groups}),
+        "rows": rows,
+    }
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value:8.1f}" if value is not None else "       -"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Collect real-user render timings and report per-module p50/p95",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python rum_collector.py serve --port 8787
+  python rum_collector.py report
+  python rum_collector.py report --kind chapter --min-samples 20
+        """,
+    )
+    parser.add_argument("--db", default=str(DB_FILE), help="SQLite file for samples")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = sub.add_parser("serve", help="Run the collector")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    serve_parser.add_argument("--port", type=int, default=8787, help="Port")
+    serve_parser.add_argument("-v", "--verbose", action="store_true", help="Log every batch")
+
+    report_parser = sub.add_parser("report", help="Per-module p50/p95 commit durations")
+    report_parser.add_argument("--kind", choices=KINDS, default=None, help="Only this sample kind")
+    report_parser.add_argument("--min-samples", type=int, default=5, help="Hide modules with fewer samples")
+    report_parser.add_argument("--since", type=float, default=None, help="Only the last N hours")
+    report_parser.add_argument("--top", type=int, default=30, help="Rows to print")
+    report_parser.add_argument("--json", help="Also write the report to this file")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(Path(args.db), args.host, args.port, args.verbose)
+        return 0
+
+    try:
+        result = rum_report(args.db, args.kind, args.min_samples, args.since)
+    except (OSError, sqlite3.Error) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 78)
+    print("⏱️  MODULE RENDER TIMINGS (ms, slowest p95 first)")
+    print("=" * 78)
+    print(f"{'module':36} {'kind':8} {'n':>5} {'p50':>8} {'p95':>8} {'click→p95':>9}")
+    for row in result["rows"][: args.top]:
+        print(
+            f"{row['module'][:36]:36} {row['kind']:8} {row['count']:5} "
+            f"{_ms(row['p50'])} {_ms(row['p95'])} {_ms(row['latency_p95'])}"
+        )
+    print("-" * 78)
+    print(f"Samples: {result['samples']}  Sessions: {result['sessions']}  Modules: {result['modules']}")
+    hidden = len(result["rows"]) - args.top
+    if hidden > 0:
+        print(f"({hidden} more rows - raise --top or use --json)")
+    print("=" * 78)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Build the service worker and its precache manifest after `vite build`.
+
+Combines Vite's build manifest (dist/.vite/manifest.json, enabled by
+`build.manifest` in vite.config.ts) with moduleRegistry.json:
+
+- shell:   index.html plus everything the entry loads statically (JS, CSS,
+           the home page). Cached on install, so revisits and offline
+           visits paint without the network.
+- modules: each enabled module's chunk, its static imports, CSS, its
+           chapter chunks (the chapters/<n>.json files useChapters loads
+           dynamically) and registry detail payload, in registry order,
+           until the byte budget is spent. Fetched in the background once the page has
+           loaded; modules past the budget are cached on first visit.
+
+The result is inlined into sw.template.js and written to dist/sw.js. The
+cache name is derived from the manifest contents. Hashed URLs never change
+meaning, so on a deploy the new worker copies unchanged chunks from the old
+cache and only downloads what changed.
+
+Usage:
+    python build_precache.py                    # after npm run build
+    python build_precache.py --budget 1500000   # bytes of module chunks
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DIST_DIR = PROJECT_ROOT / "dist"
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+TEMPLATE_FILE = Path(__file__).resolve().parent / "sw.template.js"
+
+MANIFEST_PATHS = (".vite/manifest.json", "manifest.json")
+ENTRY_KEY = "index.html"
+ASSETS_PREFIX = "/assets/"
+
+# Raw bytes of module chunks to prefetch (transfer is smaller - they're compressed)
+DEFAULT_BUDGET = 2 * 1024 * 1024
+
+
+def load_manifest(dist: Path) -> Dict[str, Dict[str, Any]]:
+    for name in MANIFEST_PATHS:
+        path = dist / name
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+    raise FileNotFoundError(f"No Vite manifest in {dist} - build with build.manifest enabled")
+
+
+def static_closure(manifest: Dict[str, Dict[str, Any]], key: str, seen: Set[str]) -> List[str]:
+    """Files loaded with a manifest entry: its chunk, static imports and CSS."""
+    if key in seen or key not in manifest:
+        return []
+    seen.add(key)
+    chunk = manifest[key]
+    files = [chunk["file"], *chunk.get("css", [])]
+    for imported in chunk.get("imports", []):
+        files += static_closure(manifest, imported, seen)
+    return files
+
+
+def chapter_keys(manifest: Dict[str, Dict[str, Any]], module_id: str) -> List[str]:
+    """Manifest keys of a module's lazily loaded chapters/<n>.json chunks."""
+    entry = manifest.get(f"src/modules/{module_id}/index.tsx", {})
+    prefix = f"src/modules/{module_id}/chapters/"
+    return [key for key in entry.get("dynamicImports", []) if key.startswith(prefix)]
+
+
+def build_precache(
+    dist_dir: str = str(DIST_DIR),
+    registry_file: str = str(REGISTRY_FILE),
+    budget: int = DEFAULT_BUDGET,
+) -> Dict[str, Any]:
+    dist = Path(dist_dir)
+    manifest = load_manifest(dist)
+    if ENTRY_KEY not in manifest:
+        raise ValueError(f"Vite manifest has no {ENTRY_KEY} entry")
+    registry = json.loads(Path(registry_file).read_text(encoding="utf-8"))
+
+    def size(file: str) -> int:
+        path = dist / file
+        return path.stat().st_size if path.exists() else 0
+
+    shell_seen: Set[str] = set()
+    shell_files = static_closure(manifest, ENTRY_KEY, shell_seen)
+    index_html = (dist / "index.html").read_bytes()
+    shell = [{"url": "/index.html", "revision": hashlib.sha256(index_html).hexdigest()[:16]}]
+    shell += [{"url": f"/{file}", "revision": None} for file in dict.fromkeys(shell_files)]
+    cached = {entry["url"] for entry in shell}
+
+    modules: List[str] = []
+    spent, included, deferred, missing = 0, [], [], []
+    for entry in registry:
+        if not entry.get("enabled"):
+            continue
+        keys = [f"src/modules/{entry['id']}/index.tsx", f"src/generated/registry/{entry['id']}.json"]
+        if keys[0] not in manifest:
+            missing.append(entry["id"])
+            continue
+        # Without its chapters a precached module opens offline on chapter 0
+        # and can't leave it
+        keys += chapter_keys(manifest, entry["id"])
+        seen = set(shell_seen)
+        urls = [f"/{file}" for key in keys for file in static_closure(manifest, key, seen)]
+        urls = [url for url in dict.fromkeys(urls) if url not in cached]
+        cost = sum(size(url.lstrip("/")) for url in urls)
+        if spent + cost > budget:
+            deferred.append(entry["id"])
+            continue
+        spent += cost
+        included.append(entry["id"])
+        modules += urls
+        cached.update(urls)
+
+    precache = {"shell": shell, "modules": modules, "assetsPrefix": ASSETS_PREFIX}
+    precache["version"] = hashlib.sha256(json.dumps(precache, sort_keys=True).encode()).hexdigest()[:12]
+
+    worker = TEMPLATE_FILE.read_text(encoding="utf-8").replace(
+        "__PRECACHE__", json.dumps(precache, indent=2)
+    )
+    (dist / "sw.js").write_text(worker, encoding="utf-8")
+
+    return {
+        "version": precache["version"],
+        "shell_files": len(shell),
+        "shell_bytes": len(index_html) + sum(size(f) for f in dict.fromkeys(shell_files)),
+        "module_files": len(modules),
+        "module_bytes": spent,
+        "included": included,
+        "deferred": deferred,
+        "missing": missing,
+        "budget": budget,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build dist/sw.js with a precache manifest from the registry and Vite manifest",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python build_precache.py
+  python build_precache.py --budget 1000000
+        """,
+    )
+
+    parser.add_argument("--dist", default=str(DIST_DIR), help="Vite output directory")
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help="Bytes of module chunks to prefetch")
+
+    args = parser.parse_args()
+
+    try:
+        result = build_precache(args.dist, args.registry, args.budget)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("📦 SERVICE WORKER PRECACHE")
+    print("=" * 60)
+    print(f"Version:          {result['version']}")
+    print(f"Shell (install):  {result['shell_files']} files, {result['shell_bytes'] / 1024:.1f} KiB")
+    print(
+        f"Modules (later):  {len(result['included'])} modules, {result['module_files']} files, "
+        f"{result['module_bytes'] / 1024:.1f} of {result['budget'] / 1024:.0f} KiB budget"
+    )
+    print(f"On first visit:   {len(result['deferred'])} modules over budget")
+    print("=" * 60)
+    for module_id in result["deferred"]:
+        print(f"   ⏭️  {module_id}")
+    for module_id in result["missing"]:
+        print(f"   ⚠️  {module_id} is enabled but not in the Vite manifest (stale build?)")
+    print("Wrote dist/sw.js")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
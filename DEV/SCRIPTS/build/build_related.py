@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Precompute "related modules" suggestions with TF-IDF similarity.
+
+For every enabled registry entry a document is built from:
+
+- its title, subtitle and concept (weighted up)
+- the matching REACT_CONCEPTS.json definition and importance, joined via
+  concept_catalog.py (same registry linking as compile_prompts.py)
+- the module's prose: chapter text and JSX text in src/modules/<id>/*.tsx
+  and chapters/*.json, with code samples filtered out
+
+The documents become one sparse TF-IDF matrix (sublinear tf, smoothed idf,
+L2-normalized rows), so cosine similarity is a single sparse product
+X @ X.T. It is computed in row blocks and the top k of each row is picked
+with argpartition - no pairwise Python loops, and memory stays bounded at
+thousands of modules.
+
+Output: src/generated/relatedModules.json, {"<id>": ["<neighbor id>", ...]}
+ordered by similarity. compile_registry.py folds the neighbors into each
+module's registry/<id>.json, so a module page only loads its own list.
+
+Usage:
+    python build_related.py             # regenerate, then run compile_registry.py
+    python build_related.py --check     # exit 1 if stale
+    python build_related.py -k 6 -v     # more neighbors, print scores
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "analysis"))
+from concept_catalog import load_concept_catalog  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+OUTPUT_FILE = PROJECT_ROOT / "src" / "generated" / "relatedModules.json"
+
+DEFAULT_K = 4
+# Neighbors below this cosine similarity aren't worth suggesting
+MIN_SCORE = 0.05
+# Terms in more than this share of documents carry no signal (React, chapter, ...)
+MAX_DF = 0.5
+# Rows of the similarity matrix materialized at once
+BLOCK_ROWS = 1024
+
+# Repeats per field: the concept matters more than the story around it
+FIELD_WEIGHTS = (("concept", 3), ("definition", 2), ("title", 2), ("subtitle", 1), ("prose", 1))
+
+STOPWORDS = frozenset(
+    """
+    the and for are but not you your with this that from have has had was were will would can could
+    into when what which who whom them they their there then than its it's our out all any each
+    been being more most other some such only own same too very just also about over under again
+    one two via use used using like how why where while these those his her him she he we us
+    """.split()
+)
+
+WORD = re.compile(r"[a-z][a-z0-9]{2,}")
+STRING_LITERAL = re.compile(r"`((?:\\.|[^`\\])*)`|\"((?:\\.|[^\"\\\n])*)\"|'((?:\\.|[^'\\\n])*)'", re.DOTALL)
+JSX_TEXT = re.compile(r">([^<>{}]+)<")
+CODE_CHARS = re.compile(r"[{};=<>()\[\]]")
+
+
+def is_prose(text: str) -> bool:
+    """Sentences, not code samples, class lists or import paths."""
+    words = text.split()
+    if len(words) < 4:
+        return False
+    if len(CODE_CHARS.findall(text)) > 0.02 * len(text):
+        return False
+    # Tailwind class strings: every word has a dash or colon
+    return sum(1 for w in words if "-" not in w and ":" not in w) > len(words) // 2
+
+
+def module_prose(module_dir: Path) -> str:
+    parts = []
+    for path in sorted(module_dir.glob("*.tsx")):
+        text = path.read_text(encoding="utf-8")
+        for match in STRING_LITERAL.finditer(text):
+            literal = next(g for g in match.groups() if g is not None)
+            if is_prose(literal):
+                parts.append(literal)
+        parts.extend(t for t in JSX_TEXT.findall(text) if is_prose(t))
+    # Chapters moved out by externalize_chapters.py
+    for path in sorted(module_dir.glob("chapters/*.json")):
+        parts.extend(v for v in json.loads(path.read_text(encoding="utf-8")).values() if is_prose(v))
+    return "\n".join(parts)
+
+
+def tokenize(text: str) -> List[str]:
+    return [w for w in WORD.findall(text.lower()) if w not in STOPWORDS]
+
+
+def build_documents(registry: List[Dict[str, Any]], modules_dir: Path) -> Tuple[List[str], List[Counter]]:
+    catalog = load_concept_catalog()
+    ids, documents = [], []
+    for entry in registry:
+        if not entry.get("enabled"):
+            continue
+        module = catalog.by_module.get(entry["id"])
+        concept = catalog.by_key.get(module.concept_key) if module and module.concept_key else None
+        fields = {
+            "concept": entry.get("concept", ""),
+            "title": entry.get("title", ""),
+            "subtitle": entry.get("subtitle", ""),
+            "definition": " ".join(filter(None, (concept.definition, concept.importance))) if concept else "",
+            "prose": module_prose(modules_dir / entry["id"]),
+        }
+        counts: Counter = Counter()
+        for name, weight in FIELD_WEIGHTS:
+            for token, n in Counter(tokenize(fields[name])).items():
+                counts[token] += n * weight
+        ids.append(entry["id"])
+        documents.append(counts)
+    return ids, documents
+
+
+def tfidf_matrix(documents: List[Counter], max_df: float = MAX_DF) -> sparse.csr_matrix:
+    """Rows: documents, L2-normalized sublinear-tf * smoothed-idf weights.
+
+    The CSR arrays are filled straight from the Counters (no per-term
+    Python loop), and terms above max_df are dropped as columns.
+    """
+    n = len(documents)
+    vocabulary = {token: i for i, token in enumerate(dict.fromkeys(chain.from_iterable(documents)))}
+    nnz = sum(map(len, documents))
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(counts) for counts in documents], out=indptr[1:])
+    indices = np.fromiter(
+        chain.from_iterable(map(vocabulary.__getitem__, counts) for counts in documents), np.int32, nnz
+    )
+    data = np.fromiter(chain.from_iterable(counts.values() for counts in documents), np.float32, nnz)
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(n, len(vocabulary)))
+
+    doc_freq = np.bincount(indices, minlength=len(vocabulary))
+    limit = max(1, math.floor(max_df * n)) if n > 2 else n
+    keep = np.flatnonzero(doc_freq <= limit)
+    matrix = matrix[:, keep]
+    doc_freq = doc_freq[keep]
+
+    matrix.data = 1.0 + np.log(matrix.data)
+    idf = (np.log((1.0 + n) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+    matrix = matrix @ sparse.diags(idf)
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+
+def top_neighbors(
+    matrix: sparse.csr_matrix, k: int, min_score: float = MIN_SCORE, block_rows: int = BLOCK_ROWS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(indices, scores), each n x k; missing neighbors are -1 / 0."""
+    n = matrix.shape[0]
+    k = min(k, max(n - 1, 0))
+    indices = np.full((n, k), -1, dtype=np.int64)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        block = (matrix[start:stop] @ transposed).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -1.0  # not its own neighbor
+
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        keep = top_scores >= min_score
+        indices[start:stop] = np.where(keep, top, -1)
+        scores[start:stop] = np.where(keep, top_scores, 0.0)
+
+    return indices, scores
+
+
+def render(ids: List[str], indices: np.ndarray) -> str:
+    related = {module_id: [ids[j] for j in row if j >= 0] for module_id, row in zip(ids, indices)}
+    return json.dumps(related, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def build_related(
+    registry_file: str = str(REGISTRY_FILE),
+    modules_dir: str = str(MODULES_DIR),
+    output_file: str = str(OUTPUT_FILE),
+    k: int = DEFAULT_K,
+    min_score: float = MIN_SCORE,
+    check: bool = False,
+) -> Dict[str, Any]:
+    timings = {}
+    started = time.perf_counter()
+    registry = json.loads(Path(registry_file).read_text(encoding="utf-8"))
+    ids, documents = build_documents(registry, Path(modules_dir))
+    timings["documents"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matrix = tfidf_matrix(documents)
+    indices, scores = top_neighbors(matrix, k, min_score)
+    timings["similarity"] = time.perf_counter() - started
+
+    output = Path(output_file)
+    content = render(ids, indices)
+    changed = not output.exists() or output.read_text(encoding="utf-8") != content
+    if changed and not check:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(content, encoding="utf-8")
+
+    return {
+        "modules": len(ids),
+        "terms": matrix.shape[1],
+        "nonzero": matrix.nnz,
+        "neighbors": {
+            module_id: [(ids[j], float(s)) for j, s in zip(row, row_scores) if j >= 0]
+            for module_id, row, row_scores in zip(ids, indices, scores)
+        },
+        "bytes": len(content.encode("utf-8")),
+        "timings": timings,
+        "changed": changed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Precompute related-module suggestions with TF-IDF similarity",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python build_related.py
+  python build_related.py --check
+  python build_related.py -k 6 -v
+        """,
+    )
+
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module sources")
+    parser.add_argument("--output", default=str(OUTPUT_FILE), help="Generated id -> neighbors JSON")
+    parser.add_argument("-k", type=int, default=DEFAULT_K, help="Neighbors per module")
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE, help="Minimum cosine similarity")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the output is stale")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print neighbors with scores")
+
+    args = parser.parse_args()
+
+    try:
+        result = build_related(args.registry, args.modules_dir, args.output, args.k, args.min_score, args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    timings = result["timings"]
+    lonely = [m for m, neighbors in result["neighbors"].items() if not neighbors]
+    print("\n" + "=" * 60)
+    print("🧭 RELATED MODULES")
+    print("=" * 60)
+    print(f"Modules:      {result['modules']}")
+    print(f"Terms:        {result['terms']} ({result['nonzero']} non-zero weights)")
+    print(f"Output:       {result['bytes'] / 1024:.1f} KiB")
+    print(f"Documents:    {timings['documents'] * 1000:.0f} ms")
+    print(f"Similarity:   {timings['similarity'] * 1000:.0f} ms (TF-IDF + blocked X·Xᵀ + top-{args.k})")
+    print("=" * 60)
+    if args.verbose:
+        for module_id, neighbors in result["neighbors"].items():
+            print(f"{module_id}")
+            for neighbor, score in neighbors:
+                print(f"   {score:.3f}  {neighbor}")
+    for module_id in lonely:
+        print(f"   ⚠️  {module_id}: no neighbor above {args.min_score}")
+
+    if args.check:
+        if result["changed"]:
+            print("\nRun: python build_related.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print("Updated relatedModules.json" if result["changed"] else "relatedModules.json already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
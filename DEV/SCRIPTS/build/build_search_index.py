@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Build the full-text search index for module chapters.
+
+Module narrative lives in per-chapter JSON (src/modules/<id>/chapters/<n>.json,
+see externalize_chapters.py) or, for modules not yet externalized, in an
+inline `chapters: Chapter[]` array, so it can't be searched without loading
+every lazy chunk. This script extracts each enabled module's chapter titles and prose
+(plus one overview document from its registry title, subtitle and concept)
+and writes a compact BM25 index the home page fetches on first search:
+
+    src/generated/searchIndex.bin   (imported with ?url - hashed, immutable)
+
+Format (little-endian; "varint" = unsigned LEB128):
+
+    "CRPS" u8 version  f32 scale
+    varint modules   { varint len, utf-8 id }
+    varint docs      { varint module, varint chapter + 1 (0 = overview),
+                       varint len, utf-8 chapter title }
+    varint terms     { varint shared prefix, varint suffix len, suffix bytes,
+                       varint postings { varint doc delta, u8 impact } }
+
+Terms are sorted and front-coded (each stores only what differs from the
+previous term); postings hold doc-id gaps. BM25 (k1=1.2, b=0.75) is
+computed here, so each posting is its term's final score contribution
+quantized to a byte (impact * scale) and the client just adds them up.
+The tokenizer matches src/modules/home/search.ts.
+
+Indexing is incremental: extracted documents are cached per module by the
+hash of its sources and registry fields (./.cache/search_index.json), so
+only changed modules are parsed again.
+
+Usage:
+    python build_search_index.py            # regenerate
+    python build_search_index.py --check    # exit 1 if stale
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "analysis"))
+from chapter_source import MARKDOWN, extract_chapters  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+OUTPUT_FILE = PROJECT_ROOT / "src" / "generated" / "searchIndex.bin"
+CACHE_FILE = Path(__file__).resolve().parent / ".cache" / "search_index.json"
+
+MAGIC = b"CRPS"
+VERSION = 1
+# Bump when extraction or tokenization changes, to invalidate the cache
+EXTRACTOR_VERSION = "2"
+
+K1 = 1.2
+B = 0.75
+# Title words count this many times toward a chapter's term frequency
+TITLE_WEIGHT = 2
+
+# Keep in sync with STOPWORDS in src/modules/home/search.ts
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he his in is it its of on or "
+    "that the their them they this to was were will with".split()
+)
+TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _chapter_number(path: Path) -> int:
+    return int(path.stem) if path.stem.isdigit() else -1
+
+
+def module_chapters(module_dir: Path) -> List[Dict[str, str]]:
+    """Externalized chapters/<n>.json in order, else the inline array."""
+    files = sorted((module_dir / "chapters").glob("*.json"), key=_chapter_number)
+    if files:
+        chapters = [json.loads(path.read_text(encoding="utf-8")) for path in files]
+        return [
+            {name: MARKDOWN.sub("", c.get(name, "")).strip() for name in ("title", "content")}
+            for c in chapters
+            if c.get("content")
+        ]
+    source = module_dir / "index.tsx"
+    return extract_chapters(source.read_text(encoding="utf-8")) if source.exists() else []
+
+
+def module_documents(entry: Dict[str, Any], modules_dir: Path) -> List[Dict[str, Any]]:
+    overview = " ".join(entry.get(f, "") for f in ("title", "subtitle", "concept"))
+    documents = [{"chapter": -1, "title": "", "terms": Counter(tokenize(overview))}]
+
+    for number, chapter in enumerate(module_chapters(modules_dir / entry["id"])):
+        title = chapter.get("title", "")
+        terms = Counter(tokenize(chapter["content"]))
+        for token in tokenize(title):
+            terms[token] += TITLE_WEIGHT
+        documents.append({"chapter": number, "title": title, "terms": terms})
+    return documents
+
+
+def module_hash(entry: Dict[str, Any], modules_dir: Path) -> str:
+    digest = hashlib.sha256(EXTRACTOR_VERSION.encode())
+    digest.update(json.dumps([entry.get(f) for f in ("title", "subtitle", "concept")]).encode())
+    module_dir = modules_dir / entry["id"]
+    for path in sorted([*module_dir.glob("*.tsx"), *module_dir.glob("chapters/*.json")]):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def collect_documents(
+    registry: List[Dict[str, Any]], modules_dir: Path, cache_file: Path
+) -> Tuple[List[str], List[Dict[str, Any]], Dict[str, int]]:
+    """Module ids and their documents, re-extracting only changed modules."""
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+
+    modules, documents, updated = [], [], {}
+    stats = {"reindexed": 0, "cached": 0}
+    for entry in registry:
+        if not entry.get("enabled"):
+            continue
+        digest = module_hash(entry, modules_dir)
+        cached = cache.get(entry["id"])
+        if cached and cached["hash"] == digest:
+            docs = cached["documents"]
+            stats["cached"] += 1
+        else:
+            docs = [dict(d, terms=dict(d["terms"])) for d in module_documents(entry, modules_dir)]
+            stats["reindexed"] += 1
+        updated[entry["id"]] = {"hash": digest, "documents": docs}
+        module = len(modules)
+        modules.append(entry["id"])
+        documents.extend(dict(d, module=module) for d in docs)
+
+    if updated != cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(updated, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    return modules, documents, stats
+
+
+def bm25_postings(documents: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, float]]]:
+    """term -> [(doc, BM25 contribution)] in doc order."""
+    n = len(documents)
+    lengths = [sum(d["terms"].values()) for d in documents]
+    average = (sum(lengths) / n) if n else 1.0
+    df = Counter(term for d in documents for term in d["terms"])
+
+    postings: Dict[str, List[Tuple[int, float]]] = {}
+    for doc, (document, length) in enumerate(zip(documents, lengths)):
+        norm = K1 * (1 - B + B * length / average)
+        for term, tf in document["terms"].items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            postings.setdefault(term, []).append((doc, idf * tf * (K1 + 1) / (tf + norm)))
+    return postings
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _string(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _varint(len(data)) + data
+
+
+def encode_index(modules: List[str], documents: List[Dict[str, Any]]) -> Tuple[bytes, Dict[str, int]]:
+    postings = bm25_postings(documents)
+    top = max((score for plist in postings.values() for _, score in plist), default=1.0)
+    scale = top / 255
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out += struct.pack("<f", scale)
+
+    out += _varint(len(modules))
+    for module_id in modules:
+        out += _string(module_id)
+
+    out += _varint(len(documents))
+    for document in documents:
+        out += _varint(document["module"]) + _varint(document["chapter"] + 1) + _string(document["title"])
+    sections = {"header": len(out)}
+
+    terms = sorted(postings, key=lambda t: t.encode("utf-8"))
+    out += _varint(len(terms))
+    previous = b""
+    dictionary = postings_bytes = 0
+    for term in terms:
+        data = term.encode("utf-8")
+        shared = 0
+        while shared < min(len(data), len(previous)) and data[shared] == previous[shared]:
+            shared += 1
+        entry = _varint(shared) + _varint(len(data) - shared) + data[shared:]
+        dictionary += len(entry)
+
+        plist = bytearray(_varint(len(postings[term])))
+        last = 0
+        for doc, score in postings[term]:
+            plist += _varint(doc - last)
+            plist.append(max(1, min(255, round(score / scale))))
+            last = doc
+        postings_bytes += len(plist)
+        out += entry + plist
+        previous = data
+
+    sections.update(dictionary=dictionary, postings=postings_bytes, terms=len(terms))
+    return bytes(out), sections
+
+
+def build_search_index(
+    registry_file: str = str(REGISTRY_FILE),
+    modules_dir: str = str(MODULES_DIR),
+    output_file: str = str(OUTPUT_FILE),
+    cache_file: str = str(CACHE_FILE),
+    check: bool = False,
+) -> Dict[str, Any]:
+    registry = json.loads(Path(registry_file).read_text(encoding="utf-8"))
+    modules, documents, stats = collect_documents(registry, Path(modules_dir), Path(cache_file))
+    data, sections = encode_index(modules, documents)
+
+    output = Path(output_file)
+    changed = not output.exists() or output.read_bytes() != data
+    if changed and not check:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(data)
+
+    chapters = Counter(modules[d["module"]] for d in documents if d["chapter"] >= 0)
+    return {
+        "modules": len(modules),
+        "documents": len(documents),
+        "no_chapters": [m for m in modules if not chapters[m]],
+        "bytes": len(data),
+        "json_bytes": _json_size(documents),
+        "sections": sections,
+        "changed": changed,
+        **stats,
+    }
+
+
+def _json_size(documents: List[Dict[str, Any]]) -> int:
+    """Size of the same postings as plain JSON, for the report."""
+    postings = bm25_postings(documents)
+    plain = {term: [[doc, round(score, 3)] for doc, score in plist] for term, plist in postings.items()}
+    return len(json.dumps(plain, separators=(",", ":")))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the BM25 search index over module chapters",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python build_search_index.py
+  python build_search_index.py --check
+        """,
+    )
+
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module sources")
+    parser.add_argument("--output", default=str(OUTPUT_FILE), help="Binary index to write")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the index is stale")
+
+    args = parser.parse_args()
+
+    try:
+        result = build_search_index(args.registry, args.modules_dir, args.output, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    sections = result["sections"]
+    print("\n" + "=" * 60)
+    print("🔎 SEARCH INDEX")
+    print("=" * 60)
+    print(f"Modules:       {result['modules']} ({result['reindexed']} re-indexed, {result['cached']} cached)")
+    print(f"Documents:     {result['documents']} (chapters + one overview per module)")
+    print(f"Terms:         {sections['terms']}")
+    print(f"Index:         {result['bytes'] / 1024:.1f} KiB (same postings as JSON: {result['json_bytes'] / 1024:.1f} KiB)")
+    print(f"   docs/header {sections['header'] / 1024:.1f} KiB, dictionary {sections['dictionary'] / 1024:.1f} KiB, "
+          f"postings {sections['postings'] / 1024:.1f} KiB")
+    print("=" * 60)
+    for module_id in result["no_chapters"]:
+        print(f"   ⚠️  {module_id}: no chapters array found (overview only)")
+
+    if args.check:
+        if result["changed"]:
+            print("\nRun: python build_search_index.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print("Updated searchIndex.bin" if result["changed"] else "searchIndex.bin already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
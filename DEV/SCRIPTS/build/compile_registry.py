@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Compile moduleRegistry.json into a slim home index and per-module details.
+
+moduleRegistry.ts used to import the whole registry into the entry bundle,
+map every record and look modules up with Array.find. The entry only needs
+what the home grid renders; wrapper and theme settings are only needed once
+a module's route is opened. This script splits the registry accordingly:
+
+- src/generated/registryIndex.json
+      {"cards": [...], "pathToId": {...}, "idToIndex": {...}, "stats": {...}}
+  Enabled modules only, with just the fields Home renders, plus the lookup
+  maps moduleRegistry.ts turns into Maps.
+- src/generated/registry/<id>.json
+      {"wrapperProps": {...}, "themeConfig": {...}, "related": [...]}
+  Loaded alongside each module's lazy chunk. `related` holds the id, path
+  and title of the module's neighbors from relatedModules.json
+  (build_related.py), when that file exists.
+- src/generated/moduleImports.ts
+  One static `import()` per enabled module. This replaces the template
+  import in moduleRegistry.ts, which Vite expanded into a glob over every
+  directory in src/modules (disabled, _template, unregistered).
+- src/generated/routes.tsx
+  The route table App renders: one `lazy()` per enabled module, created
+  once at import time.
+
+Module directories are reconciled against registry ids: directories with
+no registry entry and registry ids with no directory are reported.
+
+moduleRegistry.json stays the source of truth - integrate_modules.py and
+registry_merge.py keep writing it. Re-run this after they do.
+
+Usage:
+    python compile_registry.py            # regenerate
+    python compile_registry.py --check    # exit 1 if output is stale
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+GENERATED_DIR = PROJECT_ROOT / "src" / "generated"
+INDEX_FILE = GENERATED_DIR / "registryIndex.json"
+DETAILS_DIR = GENERATED_DIR / "registry"
+ROUTES_FILE = GENERATED_DIR / "routes.tsx"
+RELATED_FILE = GENERATED_DIR / "relatedModules.json"
+IMPORTS_FILE = GENERATED_DIR / "moduleImports.ts"
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+
+# Directories under src/modules that are part of the app shell, not modules
+NON_MODULE_DIRS = {"home"}
+
+# What the home grid renders (src/modules/home/index.tsx)
+CARD_FIELDS = ("id", "path", "title", "subtitle", "concept", "icon", "colorClass", "bgClass")
+
+# What the route wrapper and shared components need
+DETAIL_FIELDS = ("wrapperProps", "themeConfig")
+
+# What a "related modules" link shows
+RELATED_FIELDS = ("id", "path", "title", "concept")
+
+
+def compile_index(registry: List[Dict[str, Any]]) -> Dict[str, Any]:
+    enabled = [entry for entry in registry if entry.get("enabled")]
+
+    ids, paths = set(), set()
+    for entry in enabled:
+        for key, seen in (("id", ids), ("path", paths)):
+            if entry[key] in seen:
+                raise ValueError(f"Duplicate {key} in enabled modules: {entry[key]}")
+            seen.add(entry[key])
+
+    return {
+        "cards": [{field: entry[field] for field in CARD_FIELDS if field in entry} for entry in enabled],
+        "pathToId": {entry["path"]: entry["id"] for entry in enabled},
+        "idToIndex": {entry["id"]: index for index, entry in enumerate(enabled)},
+        "stats": {
+            "total": len(registry),
+            "enabled": len(enabled),
+            "disabled": len(registry) - len(enabled),
+        },
+    }
+
+
+def compile_details(
+    registry: List[Dict[str, Any]], related: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    enabled = {entry["id"]: entry for entry in registry if entry.get("enabled")}
+    details = {}
+    for module_id, entry in enabled.items():
+        detail = {field: entry[field] for field in DETAIL_FIELDS if field in entry}
+        neighbors = [enabled[n] for n in (related or {}).get(module_id, []) if n in enabled]
+        if neighbors:
+            detail["related"] = [{field: n[field] for field in RELATED_FIELDS} for n in neighbors]
+        details[module_id] = detail
+    return details
+
+
+IMPORTS_HEADER = """// Generated by DEV/SCRIPTS/build/compile_registry.py - do not edit.
+// Re-run it after changing src/config/moduleRegistry.json.
+//
+// One static import per ENABLED module. Disabled entries, _template and
+// directories without a registry entry are never referenced, so Vite
+// doesn't compile or emit them.
+import type { ComponentType } from "react";
+
+export type ModuleImport = () => Promise<{ default: ComponentType }>;
+
+export const moduleImports: Record<string, ModuleImport> = {
+"""
+
+IMPORT_ENTRY = """  {id}: () =>
+    import({module}),
+"""
+
+ROUTES_HEADER = """// Generated by DEV/SCRIPTS/build/compile_registry.py - do not edit.
+// Re-run it after changing src/config/moduleRegistry.json.
+import { lazy } from "react";
+import type { ComponentType, LazyExoticComponent } from "react";
+import { loadModuleRoute } from "@/components/common/ModuleWrapper";
+import { moduleImports } from "./moduleImports";
+
+export interface ModuleRoute {
+  id: string;
+  path: string;
+  Component: LazyExoticComponent<ComponentType>;
+}
+
+export const moduleRoutes: readonly ModuleRoute[] = [
+"""
+
+ROUTE_ENTRY = """  {{
+    id: {id},
+    path: {path},
+    Component: lazy(() =>
+      loadModuleRoute({id}, moduleImports[{id}]),
+    ),
+  }},
+"""
+
+
+def reconcile_directories(registry: List[Dict[str, Any]], modules_dir: Path) -> Dict[str, List[str]]:
+    """Compare module directories with registry ids.
+
+    Directories starting with "_" (templates) and NON_MODULE_DIRS are not
+    modules. An enabled id without a directory is an error - its import
+    would break the build.
+    """
+    found = {path.parent.name for path in modules_dir.glob("*/index.tsx")}
+    ignored = {name for name in found if name.startswith("_") or name in NON_MODULE_DIRS}
+    directories = found - ignored
+    registered = {entry["id"] for entry in registry}
+    enabled = {entry["id"] for entry in registry if entry.get("enabled")}
+
+    missing = enabled - directories
+    if missing:
+        raise ValueError(f"Enabled modules without src/modules/<id>/index.tsx: {', '.join(sorted(missing))}")
+
+    return {
+        "unregistered_dirs": sorted(directories - registered),
+        "missing_dirs": sorted(registered - directories),
+        "disabled_dirs": sorted((registered - enabled) & directories),
+        "ignored_dirs": sorted(ignored),
+    }
+
+
+def compile_imports(registry: List[Dict[str, Any]]) -> str:
+    entries = [
+        IMPORT_ENTRY.format(
+            id=json.dumps(entry["id"]),
+            module=json.dumps(f"../modules/{entry['id']}/index.tsx"),
+        )
+        for entry in registry
+        if entry.get("enabled")
+    ]
+    return IMPORTS_HEADER + "".join(entries) + "};\n"
+
+
+def compile_routes(registry: List[Dict[str, Any]]) -> str:
+    entries = [
+        ROUTE_ENTRY.format(id=json.dumps(entry["id"]), path=json.dumps(entry["path"]))
+        for entry in registry
+        if entry.get("enabled")
+    ]
+    return ROUTES_HEADER + "".join(entries) + "];\n"
+
+
+def dump(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _display(path: Path) -> str:
+    return str(path.relative_to(PROJECT_ROOT)) if path.is_relative_to(PROJECT_ROOT) else str(path)
+
+
+def compile_registry(
+    registry_file: str = str(REGISTRY_FILE),
+    index_file: str = str(INDEX_FILE),
+    details_dir: str = str(DETAILS_DIR),
+    routes_file: str = str(ROUTES_FILE),
+    imports_file: str = str(IMPORTS_FILE),
+    modules_dir: str = str(MODULES_DIR),
+    related_file: str = str(RELATED_FILE),
+    check: bool = False,
+) -> Dict[str, Any]:
+    registry = json.loads(Path(registry_file).read_text(encoding="utf-8"))
+    related_path = Path(related_file)
+    related = json.loads(related_path.read_text(encoding="utf-8")) if related_path.exists() else None
+    index_path, details_path = Path(index_file), Path(details_dir)
+    directories = reconcile_directories(registry, Path(modules_dir))
+
+    outputs = {
+        index_path: dump(compile_index(registry)),
+        Path(routes_file): compile_routes(registry),
+        Path(imports_file): compile_imports(registry),
+    }
+    for module_id, detail in compile_details(registry, related).items():
+        outputs[details_path / f"{module_id}.json"] = dump(detail)
+
+    stale = [
+        path for path, content in outputs.items()
+        if not path.exists() or path.read_text(encoding="utf-8") != content
+    ]
+    removed = [
+        path for path in (sorted(details_path.glob("*.json")) if details_path.exists() else [])
+        if path not in outputs
+    ]
+
+    if not check:
+        details_path.mkdir(parents=True, exist_ok=True)
+        for path in stale:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(outputs[path], encoding="utf-8")
+        for path in removed:
+            path.unlink()
+
+    return {
+        "modules": len(registry),
+        "enabled": sum(1 for entry in registry if entry.get("enabled")),
+        "directories": directories,
+        "related": related is not None,
+        "index_bytes": len(outputs[index_path].encode("utf-8")),
+        "registry_bytes": Path(registry_file).stat().st_size,
+        "stale": [_display(p) for p in stale],
+        "removed": [_display(p) for p in removed],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile moduleRegistry.json into a home index, import map, route table and details",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python compile_registry.py
+  python compile_registry.py --check
+        """,
+    )
+
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--index", default=str(INDEX_FILE), help="Generated home index")
+    parser.add_argument("--details-dir", default=str(DETAILS_DIR), help="Generated per-module details")
+    parser.add_argument("--routes", default=str(ROUTES_FILE), help="Generated route table")
+    parser.add_argument("--imports", default=str(IMPORTS_FILE), help="Generated module import map")
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module directories to reconcile")
+    parser.add_argument("--related", default=str(RELATED_FILE), help="build_related.py output (optional)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if output is out of date")
+
+    args = parser.parse_args()
+
+    try:
+        result = compile_registry(
+            args.registry,
+            args.index,
+            args.details_dir,
+            args.routes,
+            args.imports,
+            args.modules_dir,
+            args.related,
+            check=args.check,
+        )
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("🗂️  REGISTRY COMPILE")
+    print("=" * 60)
+    print(f"Registry modules:  {result['modules']} ({result['registry_bytes'] / 1024:.1f} KiB)")
+    print(f"Enabled:           {result['enabled']}")
+    print(f"Home index:        {result['index_bytes'] / 1024:.1f} KiB")
+    print(f"Related modules:   {'yes' if result['related'] else 'none (run build_related.py)'}")
+    directories = result["directories"]
+    print(f"Disabled (not bundled): {len(directories['disabled_dirs'])}")
+    print(f"Not modules:       {', '.join(directories['ignored_dirs']) or '-'}")
+    print("=" * 60)
+    for name in directories["unregistered_dirs"]:
+        print(f"   ⚠️  src/modules/{name} has no registry entry (not bundled)")
+    for name in directories["missing_dirs"]:
+        print(f"   ⚠️  registry id {name} has no src/modules directory (disabled)")
+
+    if args.check:
+        out_of_date = result["stale"] + result["removed"]
+        for name in out_of_date:
+            print(f"   ⚠️  {name} is out of date")
+        if out_of_date:
+            print("\nRun: python compile_registry.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print(f"Written: {len(result['stale'])}, removed: {len(result['removed'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
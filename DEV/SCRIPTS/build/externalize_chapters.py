@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Move each module's chapter prose out of its JS chunk into per-chapter JSON.
+
+Modules declare their narrative as an inline `chapters` array, so every
+chapter's text ships in the module chunk although ChapterNavigation only
+shows one at a time. This codemod rewrites src/modules/<id>/index.tsx:
+
+    const chapters: Chapter[] = [{ title: "...", content: "..." }, ...];
+    const currentChapter = chapters[chapter];
+    ... totalChapters={chapters.length}
+
+becomes src/modules/<id>/chapters/<n>.json (one file per chapter, every
+field kept) and
+
+    import { useChapters } from "@/components/common/useChapters";
+    import firstChapter from "./chapters/0.json";
+
+    const chapterFiles = import.meta.glob<Chapter>(
+      ["./chapters/*.json", "!./chapters/0.json"], { import: "default" });
+    ...
+    const { currentChapter, chapterCount, goToChapter } = useChapters(
+      chapterFiles, chapter, firstChapter, setChapter);
+    ... totalChapters={chapterCount} onChapterChange={goToChapter}
+
+Chapter 0 stays in the chunk, so the first paint needs no extra request;
+the others become their own tiny chunks, fetched on navigation, with the
+next chapter prefetched. goToChapter only moves `chapter` once the chapter
+has loaded (src/components/common/useChapters.ts).
+
+Only arrays whose fields are all plain string literals are moved. Modules
+with JSX or `${...}` in a chapter, or that use `chapters` beyond indexing
+and `.length`, are skipped and reported. _template keeps its inline array:
+generated modules start from it, and the codemod can be re-run after they
+are integrated.
+
+Usage:
+    python externalize_chapters.py              # rewrite every module
+    python externalize_chapters.py --dry-run    # report bytes, write nothing
+    python externalize_chapters.py --check      # exit 1 if a module can still be moved
+    python externalize_chapters.py --module zod-and-the-pound-of-flesh
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+
+CHAPTERS_DIR = "chapters"
+SKIP_MODULES = {"_template", "home"}
+
+CHAPTERS_DECL = re.compile(r"^[ \t]*const chapters\s*(?::\s*(\w+)\[\]\s*)?=\s*\[", re.MULTILINE)
+CURRENT_CHAPTER = re.compile(r"^([ \t]*)const currentChapter = chapters\[([^\]]+)\];", re.MULTILINE)
+CHAPTERS_LENGTH = re.compile(r"\bchapters\.length\b")
+# Any other code use of the array; prose mentioning "chapters" is followed by a space or letter
+OTHER_USE = re.compile(r"\bchapters\s*[\[.(,;)}]")
+TYPE_DECL = r"^(?:export\s+)?(?:interface|type)\s+{}\b"
+# The leading import block (imports inside code-sample template literals don't count)
+IMPORT_BLOCK = re.compile(r"\A(?:\s*(?://[^\n]*|/\*.*?\*/|import\b[^;]*;))*", re.DOTALL)
+KEY = re.compile(r"\s*(?:(\w+)|\"(\w+)\"|'(\w+)')\s*:\s*")
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+HOOK_IMPORT = 'import { useChapters } from "@/components/common/useChapters";'
+FIRST_IMPORT = f'import firstChapter from "./{CHAPTERS_DIR}/0.json";'
+
+
+class NotStatic(ValueError):
+    """The chapters array isn't plain data and has to stay inline."""
+
+
+def _array_end(text: str, start: int) -> int:
+    """Index of the `]` closing the array that opens just before `start`."""
+    depth, quote, i = 1, None, start
+    while i < len(text) and depth:
+        char = text[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'`":
+            quote = char
+        elif char in "[{(":
+            depth += 1
+        elif char in "]})":
+            depth -= 1
+        i += 1
+    return i - 1
+
+
+def _skip_space(text: str, i: int) -> int:
+    """Skip whitespace and comments."""
+    while i < len(text):
+        if text[i].isspace():
+            i += 1
+        elif text.startswith("//", i):
+            i = text.find("\n", i) + 1 or len(text)
+        elif text.startswith("/*", i):
+            i = text.find("*/", i) + 2 if text.find("*/", i) >= 0 else len(text)
+        else:
+            break
+    return i
+
+
+def parse_string(text: str, i: int) -> Tuple[str, int]:
+    """Decode the JS string literal starting at text[i]; (value, end)."""
+    quote = text[i]
+    if quote not in "\"'`":
+        raise NotStatic(f"not a string literal: {text[i:i + 30]!r}")
+    out, i = [], i + 1
+    while i < len(text):
+        char = text[i]
+        if char == quote:
+            return "".join(out), i + 1
+        if char == "\\":
+            escape = text[i + 1]
+            if escape == "u":
+                if text[i + 2] == "{":
+                    end = text.index("}", i)
+                    out.append(chr(int(text[i + 3 : end], 16)))
+                    i = end + 1
+                else:
+                    out.append(chr(int(text[i + 2 : i + 6], 16)))
+                    i += 6
+                continue
+            if escape == "x":
+                out.append(chr(int(text[i + 2 : i + 4], 16)))
+                i += 4
+                continue
+            if escape == "\n":  # line continuation
+                i += 2
+                continue
+            out.append(ESCAPES.get(escape, escape))
+            i += 2
+            continue
+        if quote == "`" and text.startswith("${", i):
+            raise NotStatic("template literal with ${...}")
+        if char == "\n" and quote != "`":
+            raise NotStatic("unterminated string")
+        out.append(char)
+        i += 1
+    raise NotStatic("unterminated string")
+
+
+def parse_chapters(array: str) -> List[Dict[str, str]]:
+    """The objects of a chapters array body, or NotStatic."""
+    chapters: List[Dict[str, str]] = []
+    i = _skip_space(array, 0)
+    while i < len(array):
+        if array[i] != "{":
+            raise NotStatic(f"chapter is not an object literal: {array[i:i + 30]!r}")
+        chapter: Dict[str, str] = {}
+        i = _skip_space(array, i + 1)
+        while array[i] != "}":
+            key = KEY.match(array, i)
+            if not key:
+                raise NotStatic(f"unsupported field: {array[i:i + 30]!r}")
+            name = next(g for g in key.groups() if g)
+            chapter[name], i = parse_string(array, key.end())
+            i = _skip_space(array, i)
+            if array[i] == ",":
+                i = _skip_space(array, i + 1)
+            elif array[i] != "}":
+                raise NotStatic(f"field {name!r} is not a plain string")
+        chapters.append(chapter)
+        i = _skip_space(array, i + 1)
+        if i < len(array) and array[i] == ",":
+            i = _skip_space(array, i + 1)
+    return chapters
+
+
+def render_chapter(chapter: Dict[str, str]) -> str:
+    return json.dumps(chapter, ensure_ascii=False, indent=2) + "\n"
+
+
+def rewrite_module(source: str) -> Tuple[str, List[Dict[str, str]], str]:
+    """(new source, chapters, removed declaration); NotStatic if it can't move."""
+    declaration = CHAPTERS_DECL.search(source)
+    if not declaration:
+        raise NotStatic("no inline chapters array")
+    end = _array_end(source, declaration.end())
+    chapters = parse_chapters(source[declaration.end() : end])
+    if not chapters:
+        raise NotStatic("empty chapters array")
+
+    statement_end = end + 1
+    if source[statement_end : statement_end + 1] == ";":
+        statement_end += 1
+    # Drop the whole statement, its line break and one blank line after it
+    statement_end = source.find("\n", statement_end) + 1 or len(source)
+    if source[statement_end : statement_end + 1] == "\n":
+        statement_end += 1
+    removed = source[declaration.start() : statement_end]
+    rest = source[: declaration.start()] + source[statement_end:]
+
+    current = CURRENT_CHAPTER.search(rest)
+    if not current:
+        raise NotStatic("no `const currentChapter = chapters[...]`")
+    indent, index = current.groups()
+    state = re.search(rf"const \[{re.escape(index)},\s*(\w+)\]\s*=\s*useState", rest)
+    if not state:
+        raise NotStatic(f"no `const [{index}, set...] = useState` for the chapter index")
+    setter = state.group(1)
+    rest = (
+        rest[: current.start()]
+        + f"{indent}const {{ currentChapter, chapterCount, goToChapter }} = useChapters(\n"
+        + f"{indent}  chapterFiles,\n{indent}  {index},\n{indent}  firstChapter,\n{indent}  {setter},\n{indent});"
+        + rest[current.end() :]
+    )
+    # Navigation goes through the hook, so the index waits for the chapter
+    rest = rest.replace(f"onChapterChange={{{setter}}}", "onChapterChange={goToChapter}")
+    rest = CHAPTERS_LENGTH.sub("chapterCount", rest)
+    other = OTHER_USE.search(rest)
+    if other:
+        line = rest.count("\n", 0, other.start()) + 1
+        raise NotStatic(f"`chapters` is used beyond indexing and .length (line {line})")
+
+    type_name = declaration.group(1)
+    if not type_name or not re.search(TYPE_DECL.format(type_name), rest, re.MULTILINE):
+        type_name = "typeof firstChapter"
+
+    imports = list(re.finditer(r"\bimport\b[^;]*;[^\n]*", rest[: IMPORT_BLOCK.match(rest).end()]))
+    if not imports:
+        raise NotStatic("no import block")
+    last = imports[-1].end()
+    glob = (
+        f"\n\n// Chapter prose lives in ./{CHAPTERS_DIR}/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)\n"
+        f"const chapterFiles = import.meta.glob<{type_name}>(\n"
+        f'  ["./{CHAPTERS_DIR}/*.json", "!./{CHAPTERS_DIR}/0.json"],\n'
+        '  { import: "default" },\n'
+        ");"
+    )
+    new_source = rest[:last] + f"\n{HOOK_IMPORT}\n{FIRST_IMPORT}" + glob + rest[last:]
+    return new_source, chapters, removed
+
+
+def externalize_module(module_dir: Path, dry_run: bool = False) -> Dict[str, Any]:
+    source_file = module_dir / "index.tsx"
+    raw = source_file.read_bytes().decode("utf-8")
+    newline = "\r\n" if "\r\n" in raw else "\n"
+    source = raw.replace("\r\n", "\n")
+    result: Dict[str, Any] = {"module": module_dir.name, "before": len(raw.encode("utf-8"))}
+
+    if FIRST_IMPORT in source:
+        return dict(result, status="done", chapters=len(list((module_dir / CHAPTERS_DIR).glob("*.json"))))
+    try:
+        new_source, chapters, removed = rewrite_module(source)
+    except NotStatic as e:
+        return dict(result, status="skipped", reason=str(e))
+
+    files = [render_chapter(chapter) for chapter in chapters]
+    if not dry_run:
+        out_dir = module_dir / CHAPTERS_DIR
+        out_dir.mkdir(exist_ok=True)
+        for stale in out_dir.glob("*.json"):
+            stale.unlink()
+        for number, content in enumerate(files):
+            (out_dir / f"{number}.json").write_text(content, encoding="utf-8")
+        # Keep the module's line endings
+        source_file.write_bytes(new_source.replace("\n", newline).encode("utf-8"))
+
+    json_bytes = [len(content.encode("utf-8")) for content in files]
+    return dict(
+        result,
+        status="moved",
+        chapters=len(chapters),
+        removed=len(removed.replace("\n", newline).encode("utf-8")),
+        after=len(new_source.replace("\n", newline).encode("utf-8")),
+        first=json_bytes[0],
+        deferred=sum(json_bytes[1:]),
+    )
+
+
+def externalize_chapters(
+    modules_dir: str = str(MODULES_DIR), only: Optional[List[str]] = None, dry_run: bool = False
+) -> Dict[str, Any]:
+    root = Path(modules_dir)
+    results = []
+    for module_dir in sorted(p for p in root.iterdir() if (p / "index.tsx").exists()):
+        if module_dir.name in SKIP_MODULES or (only and module_dir.name not in only):
+            continue
+        results.append(externalize_module(module_dir, dry_run))
+
+    moved = [r for r in results if r["status"] == "moved"]
+    return {
+        "results": results,
+        "moved": moved,
+        "removed": sum(r["removed"] for r in moved),
+        "before": sum(r["before"] for r in moved),
+        # Initial load: the rewritten source plus chapter 0, which it imports statically
+        "initial": sum(r["after"] + r["first"] for r in moved),
+        "deferred": sum(r["deferred"] for r in moved),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move module chapter prose into per-chapter JSON loaded on demand",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python externalize_chapters.py --dry-run
+  python externalize_chapters.py
+  python externalize_chapters.py --module prosperos-custom-spells
+  python externalize_chapters.py --check
+        """,
+    )
+
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module sources")
+    parser.add_argument("--module", action="append", help="Only this module id (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any module can still be moved")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Per-module sizes")
+
+    args = parser.parse_args()
+
+    try:
+        result = externalize_chapters(args.modules_dir, args.module, dry_run=args.dry_run or args.check)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+
+    results = result["results"]
+    moved = result["moved"]
+    print("\n" + "=" * 60)
+    print("📚 CHAPTER EXTERNALIZATION" + (" (dry run)" if args.dry_run or args.check else ""))
+    print("=" * 60)
+    print(f"Modules:      {len(results)} scanned, {len(moved)} to move, "
+          f"{sum(r['status'] == 'done' for r in results)} already external")
+    if moved:
+        print(f"Chapters:     {sum(r['chapters'] for r in moved)} → {CHAPTERS_DIR}/<n>.json")
+        print(f"Moved:        {result['removed'] / 1024:.1f} KiB of chapter arrays out of index.tsx")
+        print(f"Initial load: {result['before'] / 1024:.1f} → {result['initial'] / 1024:.1f} KiB of source "
+              f"(code + chapter 0)")
+        print(f"On demand:    {result['deferred'] / 1024:.1f} KiB of later chapters")
+    print("=" * 60)
+    if args.verbose:
+        for r in moved:
+            print(f"   {r['module']:44} {r['chapters']} chapters  -{r['removed']:>6} B  "
+                  f"first {r['first']:>5} B  later {r['deferred']:>6} B")
+    for r in results:
+        if r["status"] == "skipped":
+            print(f"   ⚠️  {r['module']}: {r['reason']}")
+
+    if args.check:
+        if moved:
+            print("\nRun: python externalize_chapters.py")
+            return 1
+        print("✅ Nothing left to move")
+        return 0
+
+    if moved and not args.dry_run:
+        print(f"Rewrote {len(moved)} modules. Then run: python build_search_index.py --check")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
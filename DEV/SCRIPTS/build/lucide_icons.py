@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Vendored slice of lucide-react's export table and icon definitions.
+
+Lucide component names don't map to icon files by a naming rule: many are
+aliases kept after a rename (AlertTriangle -> triangle-alert.js, Home ->
+house.js, XCircle -> circle-x.js), and digits split differently (Volume2 ->
+volume-2.js). plan_chunks.py needs the real file of every imported icon to
+match Rollup module ids, and snapshot_home.py needs the SVG nodes to inline
+icons. Both read lucide_icons.json, committed beside this script, so their
+output and --check don't depend on whether node_modules is installed.
+
+This script refreshes lucide_icons.json from an installed lucide-react: the
+component -> file table ("exports") for every icon imported under src/, and
+the nodes ("nodes") of the icons the home snapshot renders.
+
+Usage:
+    python lucide_icons.py            # refresh lucide_icons.json (needs npm install)
+    python lucide_icons.py --check    # exit 1 if it disagrees with node_modules
+"""
+
+import argparse
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+LUCIDE_DIR = PROJECT_ROOT / "node_modules" / "lucide-react"
+VENDORED_FILE = Path(__file__).resolve().with_name("lucide_icons.json")
+
+EXPORT_PATTERN = re.compile(r"""export\s*\{([^}]*)\}\s*from\s*["']\./icons/([\w-]+)\.js["']""")
+NODE_PATTERN = re.compile(r'\[\s*"(\w+)"\s*,\s*\{([^}]*)\}\s*\]')
+
+
+def kebab(name: str) -> str:
+    """Naive file name for a component; wrong for aliases, hence the table."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Za-z])(?=[0-9])", "-", name).lower()
+
+
+@lru_cache(maxsize=2)
+def load_table(path: Path = VENDORED_FILE) -> Dict[str, Any]:
+    """The vendored {"version", "exports", "nodes"} table."""
+    if not path.exists():
+        return {"version": None, "exports": {}, "nodes": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def icon_file(component: str, table: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """File stem lucide-react ships a component in ("AlertTriangle" -> "triangle-alert")."""
+    table = table or load_table()
+    return table["exports"].get(component)
+
+
+def icon_nodes(component: str, table: Optional[Dict[str, Any]] = None) -> Optional[List[list]]:
+    """[[tag, {attr: value}]] of an icon, or None if it isn't vendored."""
+    table = table or load_table()
+    stem = icon_file(component, table)
+    return table["nodes"].get(stem) if stem else None
+
+
+# ---------------------------------------------------------------------------
+# Reading an installed lucide-react
+# ---------------------------------------------------------------------------
+
+
+def installed_exports(lucide_dir: Path) -> Dict[str, str]:
+    """Every component name (aliases included) -> icon file stem."""
+    source = (lucide_dir / "dist" / "esm" / "lucide-react.js").read_text(encoding="utf-8")
+    exports = {}
+    for names, stem in EXPORT_PATTERN.findall(source):
+        for name in re.findall(r"default\s+as\s+(\w+)", names):
+            exports[name] = stem
+    return exports
+
+
+def installed_nodes(lucide_dir: Path, stem: str) -> Optional[List[list]]:
+    path = lucide_dir / "dist" / "esm" / "icons" / f"{stem}.js"
+    if not path.exists():
+        return None
+    nodes = []
+    for tag, attrs in NODE_PATTERN.findall(path.read_text(encoding="utf-8")):
+        parsed = dict(re.findall(r'(\w+)\s*:\s*"([^"]*)"', attrs))
+        parsed.pop("key", None)
+        nodes.append([tag, parsed])
+    return nodes or None
+
+
+def imported_icons() -> List[str]:
+    """Lucide components imported anywhere under src/."""
+    from plan_chunks import IMPORT_PATTERN, SRC_DIR, lucide_icons, mask_source
+
+    names = set()
+    for path in sorted(SRC_DIR.rglob("*")):
+        if path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
+            continue
+        for match in IMPORT_PATTERN.finditer(mask_source(path.read_text(encoding="utf-8"))):
+            if match.group("spec") == "lucide-react" and not match.group("type"):
+                names.update(lucide_icons(match.group("clause")))
+    return sorted(names)
+
+
+def rendered_icons() -> List[str]:
+    """Lucide components snapshot_home.py inlines into index.html."""
+    from snapshot_home import REGISTRY_FILE, REGISTRY_TS, icon_aliases, snapshot_icons
+
+    registry = json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
+    return sorted(snapshot_icons(registry, icon_aliases(REGISTRY_TS)))
+
+
+def build_table(lucide_dir: Path, components: Iterable[str], rendered: Iterable[str]) -> Dict[str, Any]:
+    version = json.loads((lucide_dir / "package.json").read_text(encoding="utf-8"))["version"]
+    exports = installed_exports(lucide_dir)
+    components = set(components) | set(rendered)
+    missing = sorted(name for name in components if name not in exports)
+    if missing:
+        raise ValueError(f"lucide-react {version} exports no {', '.join(missing)}")
+    table_exports = {name: exports[name] for name in sorted(components)}
+    nodes = {}
+    for stem in sorted({exports[name] for name in rendered}):
+        found = installed_nodes(lucide_dir, stem)
+        if found:
+            nodes[stem] = found
+    return {
+        "generatedBy": "DEV/SCRIPTS/build/lucide_icons.py",
+        "version": version,
+        "exports": table_exports,
+        "nodes": nodes,
+    }
+
+
+def serialize(data: Any) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Refresh the vendored lucide-react icon table",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python lucide_icons.py
+  python lucide_icons.py --check
+        """,
+    )
+
+    parser.add_argument("--lucide-dir", default=str(LUCIDE_DIR), help="Installed lucide-react package")
+    parser.add_argument("--output", default=str(VENDORED_FILE), help="Vendored table path")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the table is out of date")
+
+    args = parser.parse_args()
+
+    lucide_dir = Path(args.lucide_dir)
+    if not (lucide_dir / "package.json").exists():
+        print(f"❌ lucide-react is not installed at {lucide_dir} (run npm install)")
+        return 1
+
+    try:
+        table = build_table(lucide_dir, imported_icons(), rendered_icons())
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    output = Path(args.output)
+    text = serialize(table)
+    current = output.read_text(encoding="utf-8") if output.exists() else None
+
+    print("\n" + "=" * 60)
+    print("🎨 LUCIDE ICONS")
+    print("=" * 60)
+    print(f"lucide-react:  {table['version']}")
+    print(f"Components:    {len(table['exports'])}")
+    print(f"Vendored SVGs: {len(table['nodes'])}")
+    print(f"Aliases:       {sum(1 for n, s in table['exports'].items() if kebab(n) != s)}")
+    print("=" * 60)
+
+    if args.check:
+        if current != text:
+            print(f"\n⚠️  {output} is out of date. Run: python lucide_icons.py")
+            return 1
+        print("\n✅ Up to date")
+        return 0
+
+    if current != text:
+        output.write_text(text, encoding="utf-8")
+        print(f"\n📄 Table written to {output}")
+    else:
+        print("\n✅ Already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
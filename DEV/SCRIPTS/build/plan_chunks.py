@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Plan Vite manualChunks from the per-module import graph.
+
+vite.config.ts used to hardcode two vendor chunks, which put every Lucide
+icon used anywhere into a chunk the home page downloads, and left the
+heavier per-module libraries (zustand, redux toolkit, react-query,
+framer-motion, react-hook-form, zod, yup...) to chance. This script:
+
+1. Follows static imports from src/main.tsx (the entry) and from every
+   enabled module's index.tsx, through local files (@/, @modules/, ./)
+2. Records which modules need each "unit": a third-party package, a single
+   Lucide icon (by its real file, from lucide_icons.json - an icon missing
+   there fails the plan), or a shared local file such as CodeBlock.tsx
+3. Groups units used by exactly the same modules, then greedily merges
+   groups while that lowers the expected bytes of a typical session
+   (home page + N random modules, each extra request costing a fixed
+   number of bytes)
+4. Writes src/generated/chunkPlan.json, which vite.config.ts reads in its
+   manualChunks function, and prints the predicted download per route
+
+Package sizes are approximate min+gzip figures (PACKAGE_SIZES); pass
+--sizes with measured numbers from a real build to refine them. Local files
+are measured as their zlib-compressed source.
+
+Usage:
+    python plan_chunks.py                      # write the plan + report
+    python plan_chunks.py --session-modules 5  # longer sessions
+    python plan_chunks.py --check              # exit 1 if plan is stale
+"""
+
+import argparse
+import json
+import re
+import sys
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from math import comb
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from lucide_icons import icon_file
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = PROJECT_ROOT / "src"
+MODULES_DIR = SRC_DIR / "modules"
+ENTRY_FILE = SRC_DIR / "main.tsx"
+REGISTRY_FILE = SRC_DIR / "config" / "moduleRegistry.json"
+OUTPUT_FILE = SRC_DIR / "generated" / "chunkPlan.json"
+
+ENTRY = "<entry>"
+ENTRY_CHUNK = "react-vendor"
+
+# Unit for an icon name missing from lucide_icons.json; fails the plan
+UNRESOLVED_ICON = "lucide-react/unresolved/"
+
+# Approximate min+gzip bytes per package (bundlephobia-style figures)
+PACKAGE_SIZES = {
+    "react": 3_000,
+    "react-dom": 45_000,
+    "react-router-dom": 22_000,
+    "lucide-react": 1_200,  # createLucideIcon + defaults; icons counted separately
+    "@formkit/auto-animate": 3_500,
+    "@headlessui/react": 28_000,
+    "@radix-ui/react-primitive": 1_500,
+    "@reduxjs/toolkit": 14_000,
+    "@tanstack/react-query": 13_000,
+    "framer-motion": 42_000,
+    "react-error-boundary": 1_800,
+    "react-hook-form": 10_500,
+    "react-redux": 5_000,
+    "yup": 13_000,
+    "zod": 16_000,
+    "zustand": 1_200,
+}
+DEFAULT_PACKAGE_SIZE = 5_000
+LUCIDE_ICON_SIZE = 450
+
+# Packages pulled in by a planned package; kept in the same chunk so
+# Rollup doesn't scatter them into extra requests
+TRANSITIVE = {
+    "react-dom": ["scheduler"],
+    "react-router-dom": ["react-router", "@remix-run/router"],
+    "@reduxjs/toolkit": ["redux", "redux-thunk", "immer", "reselect"],
+    "react-redux": ["use-sync-external-store"],
+    "framer-motion": ["motion-dom", "motion-utils"],
+    "@headlessui/react": ["@floating-ui/react", "@floating-ui/dom", "@react-aria/focus", "@react-aria/interactions", "@tanstack/react-virtual"],
+    "yup": ["property-expr", "tiny-case", "toposort", "type-fest"],
+}
+
+EXTENSIONS = ("", ".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts")
+
+IMPORT_PATTERN = re.compile(
+    r"""^[ \t]*(?:import|export)\s+(?P<type>type\s+)?(?:(?P<clause>[^;'"]*?)\s+from\s+)?["'](?P<spec>[^"']+)["']""",
+    re.M,
+)
+
+
+def mask_source(source: str) -> str:
+    """Blank out comments and template literals (code samples live there).
+
+    Single/double-quoted strings are kept but never span lines, so
+    apostrophes in JSX text can't swallow the rest of the file.
+    """
+    out = list(source)
+    i, n = 0, len(source)
+    while i < n:
+        ch = source[i]
+        if ch == "/" and source.startswith("//", i):
+            end = source.find("\n", i)
+            end = n if end == -1 else end
+        elif ch == "/" and source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+        elif ch == "`":
+            end = i + 1
+            while end < n and source[end] != "`":
+                end += 2 if source[end] == "\\" else 1
+            end += 1
+        elif ch in "\"'":
+            close = i + 1
+            while close < n and source[close] not in (ch, "\n"):
+                close += 2 if source[close] == "\\" else 1
+            i = close + 1 if close < n and source[close] == ch else i + 1
+            continue
+        else:
+            i += 1
+            continue
+        for j in range(i, min(end, n)):
+            if out[j] != "\n":
+                out[j] = " "
+        i = end
+    return "".join(out)
+
+
+def package_name(spec: str) -> str:
+    parts = spec.split("/")
+    return "/".join(parts[:2]) if spec.startswith("@") else parts[0]
+
+
+def resolve_local(spec: str, importer: Path) -> Optional[Path]:
+    if spec.startswith("@/"):
+        base = SRC_DIR / spec[2:]
+    elif spec.startswith("@modules/"):
+        base = MODULES_DIR / spec[len("@modules/"):]
+    elif spec.startswith("."):
+        base = importer.parent / spec
+    else:
+        return None
+    for ext in EXTENSIONS:
+        candidate = Path(f"{base}{ext}")
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def lucide_icons(clause: str) -> List[str]:
+    names = re.search(r"\{([^}]*)\}", clause or "")
+    icons = []
+    for part in (names.group(1).split(",") if names else []):
+        part = part.strip()
+        if not part or part.startswith("type "):
+            continue
+        icons.append(part.split(" as ")[0].strip())
+    return icons
+
+
+def file_imports(path: Path) -> Tuple[Set[Path], Set[str]]:
+    """Static local files and units (packages, lucide icons) imported by path."""
+    source = mask_source(path.read_text(encoding="utf-8"))
+    local, units = set(), set()
+    for match in IMPORT_PATTERN.finditer(source):
+        if match.group("type"):
+            continue
+        spec = match.group("spec")
+        if spec.endswith(".css"):
+            continue
+        resolved = resolve_local(spec, path)
+        if resolved is not None:
+            local.add(resolved)
+            continue
+        if spec.startswith((".", "@/", "@modules/")):
+            continue
+        package = package_name(spec)
+        units.add(package)
+        if package == "lucide-react":
+            for icon in lucide_icons(match.group("clause")):
+                stem = icon_file(icon)
+                units.add(f"lucide-react/icons/{stem}" if stem else UNRESOLVED_ICON + icon)
+    return local, units
+
+
+def closure(start: Path, cache: Dict[Path, Tuple[Set[Path], Set[str]]]) -> Tuple[Set[Path], Set[str]]:
+    """All local files and units statically reachable from start."""
+    seen, units, stack = set(), set(), [start.resolve()]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if path not in cache:
+            cache[path] = file_imports(path) if path.suffix in (".ts", ".tsx", ".js", ".jsx") else (set(), set())
+        local, found = cache[path]
+        units |= found
+        stack.extend(local - seen)
+    return seen, units
+
+
+def relative(path: Path) -> str:
+    return path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def local_size(path: Path) -> int:
+    return len(zlib.compress(path.read_bytes(), 9))
+
+
+def unit_size(unit: str, sizes: Dict[str, int]) -> int:
+    if unit in sizes:
+        return sizes[unit]
+    if unit.startswith("lucide-react/icons/"):
+        return LUCIDE_ICON_SIZE
+    if unit.startswith("src/"):
+        return local_size(PROJECT_ROOT / unit)
+    return PACKAGE_SIZES.get(unit, DEFAULT_PACKAGE_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Session model
+# ---------------------------------------------------------------------------
+
+
+class SessionModel:
+    """Home page + `visits` distinct modules picked uniformly at random."""
+
+    def __init__(self, total_modules: int, visits: int, request_cost: int):
+        self.total = total_modules
+        self.visits = min(visits, total_modules)
+        self.request_cost = request_cost
+        self._p: Dict[int, float] = {}
+
+    def p_needed(self, users: int) -> float:
+        """Probability that at least one of `users` modules is visited."""
+        if users not in self._p:
+            if self.total == 0:
+                self._p[users] = 0.0
+            else:
+                miss = comb(self.total - users, self.visits) / comb(self.total, self.visits)
+                self._p[users] = 1.0 - miss
+        return self._p[users]
+
+    def cost(self, size: int, users: FrozenSet[str]) -> float:
+        """Expected bytes for one shared chunk (payload + request)."""
+        return (size + self.request_cost) * self.p_needed(len(users))
+
+
+def plan(
+    unit_users: Dict[str, FrozenSet[str]], sizes: Dict[str, int], model: SessionModel
+) -> Tuple[List[Dict[str, Any]], Set[str]]:
+    """Group shared units into chunks.
+
+    Returns (chunks, entry_units). Units used by a single module aren't
+    planned - Rollup already bundles those into the module's own chunk.
+    """
+    entry_units = {u for u, users in unit_users.items() if ENTRY in users}
+
+    groups: Dict[FrozenSet[str], List[str]] = defaultdict(list)
+    for unit, users in unit_users.items():
+        if ENTRY not in users and len(users) > 1:
+            groups[users].append(unit)
+
+    chunks = [
+        {"units": sorted(units), "users": users, "size": sum(unit_size(u, sizes) for u in units)}
+        for users, units in groups.items()
+    ]
+
+    entry_size = sum(unit_size(u, sizes) for u in entry_units)
+
+    while True:
+        best: Optional[Tuple[float, Any]] = None
+
+        # Merge two chunks into one request
+        for a, b in combinations(range(len(chunks)), 2):
+            x, y = chunks[a], chunks[b]
+            users = x["users"] | y["users"]
+            delta = model.cost(x["size"] + y["size"], users) - model.cost(x["size"], x["users"]) - model.cost(y["size"], y["users"])
+            if delta < -1e-9 and (best is None or delta < best[0]):
+                best = (delta, ("merge", a, b))
+
+        # Fold a chunk into the always-loaded entry vendor chunk. Local files
+        # stay out so editing a component doesn't bust the vendor cache.
+        for a, x in enumerate(chunks):
+            if any(u.startswith("src/") for u in x["units"]):
+                continue
+            delta = x["size"] - model.cost(x["size"], x["users"])
+            if delta < -1e-9 and (best is None or delta < best[0]):
+                best = (delta, ("entry", a))
+
+        if best is None:
+            break
+
+        action = best[1]
+        if action[0] == "merge":
+            _, a, b = action
+            x, y = chunks[a], chunks[b]
+            merged = {"units": sorted(x["units"] + y["units"]), "users": x["users"] | y["users"], "size": x["size"] + y["size"]}
+            chunks = [c for i, c in enumerate(chunks) if i not in (a, b)] + [merged]
+        else:
+            _, a = action
+            entry_units.update(chunks[a]["units"])
+            entry_size += chunks[a]["size"]
+            del chunks[a]
+
+    chunks.sort(key=lambda c: (-c["size"], c["units"]))
+    return chunks, entry_units
+
+
+def chunk_name(chunk: Dict[str, Any], sizes: Dict[str, int], taken: Set[str]) -> str:
+    local = [u for u in chunk["units"] if u.startswith("src/")]
+    largest = max(local or chunk["units"], key=lambda u: (unit_size(u, sizes), u))
+    if local:
+        stem = Path(largest).parent.name
+    else:
+        stem = largest.replace("lucide-react/icons/", "icon-").replace("@", "").replace("/", "-")
+    base = f"shared-{stem.lower()}"
+    name, i = base, 2
+    while name in taken:
+        name, i = f"{base}-{i}", i + 1
+    taken.add(name)
+    return name
+
+
+def enabled_modules() -> List[str]:
+    registry = json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
+    return [
+        entry["id"]
+        for entry in registry
+        if entry.get("enabled") and (MODULES_DIR / entry["id"] / "index.tsx").is_file()
+    ]
+
+
+def build_plan(
+    session_modules: int = 3, request_cost: int = 2_048, sizes: Optional[Dict[str, int]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return (plan written for vite.config.ts, report)."""
+    sizes = sizes or {}
+    cache: Dict[Path, Tuple[Set[Path], Set[str]]] = {}
+
+    entry_files, entry_packages = closure(ENTRY_FILE, cache)
+
+    module_ids = enabled_modules()
+    unit_users: Dict[str, Set[str]] = defaultdict(set)
+    module_units: Dict[str, Set[str]] = {}
+    module_own: Dict[str, int] = {}
+
+    for unit in entry_packages | {relative(p) for p in entry_files}:
+        unit_users[unit].add(ENTRY)
+
+    for module_id in module_ids:
+        files, packages = closure(MODULES_DIR / module_id / "index.tsx", cache)
+        module_dir = (MODULES_DIR / module_id).resolve()
+        own = {p for p in files if module_dir in p.parents}
+        shared_files = {relative(p) for p in files - own - entry_files}
+        units = packages | shared_files
+        module_units[module_id] = units
+        module_own[module_id] = sum(local_size(p) for p in own)
+        for unit in units:
+            unit_users[unit].add(module_id)
+
+    unresolved = sorted(u[len(UNRESOLVED_ICON):] for u in unit_users if u.startswith(UNRESOLVED_ICON))
+    if unresolved:
+        raise ValueError(
+            f"lucide-react icon(s) not in lucide_icons.json: {', '.join(unresolved)}"
+            " - run python lucide_icons.py after npm install"
+        )
+
+    frozen = {unit: frozenset(users) for unit, users in unit_users.items()}
+    model = SessionModel(len(module_ids), session_modules, request_cost)
+    chunks, entry_units = plan(frozen, sizes, model)
+
+    taken = {ENTRY_CHUNK}
+    packages: Dict[str, str] = {}
+    files: Dict[str, str] = {}
+    chunk_rows = []
+
+    def assign(unit: str, name: str):
+        if unit.startswith("src/") or unit.startswith("lucide-react/icons/"):
+            files[unit] = name
+        else:
+            packages[unit] = name
+            for dep in TRANSITIVE.get(unit, []):
+                packages.setdefault(dep, name)
+
+    # Entry-only local files stay in the entry chunk Vite already makes
+    for unit in sorted(entry_units):
+        if not (unit.startswith("src/") and ENTRY in frozen[unit]):
+            assign(unit, ENTRY_CHUNK)
+
+    for chunk in chunks:
+        name = chunk_name(chunk, sizes, taken)
+        for unit in chunk["units"]:
+            assign(unit, name)
+        chunk_rows.append(
+            {
+                "name": name,
+                "size": chunk["size"],
+                "modules": len(chunk["users"]),
+                "p_needed": round(model.p_needed(len(chunk["users"])), 3),
+                "units": chunk["units"],
+            }
+        )
+
+    entry_size = sum(unit_size(u, sizes) for u in entry_units)
+    chunk_of = {**packages, **files}
+    chunk_size = {row["name"]: row["size"] for row in chunk_rows}
+
+    routes = {}
+    for module_id in module_ids:
+        needed = {chunk_of[u] for u in module_units[module_id] if u in chunk_of and chunk_of[u] != ENTRY_CHUNK}
+        inline = sum(unit_size(u, sizes) for u in module_units[module_id] if u not in chunk_of and u not in entry_units)
+        module_bytes = module_own[module_id] + inline
+        routes[module_id] = {
+            "module": module_bytes,
+            "shared": sum(chunk_size[c] for c in needed),
+            "requests": 1 + len(needed),
+            "cold_total": entry_size + module_bytes + sum(chunk_size[c] for c in needed),
+        }
+
+    expected_session = entry_size + sum(
+        model.cost(chunk["size"], chunk["users"]) for chunk in chunks
+    ) + model.visits * (
+        sum(r["module"] for r in routes.values()) / max(len(routes), 1) + request_cost
+    )
+
+    generated = {
+        "generatedBy": "DEV/SCRIPTS/build/plan_chunks.py",
+        "sessionModules": model.visits,
+        "requestCost": request_cost,
+        "packages": dict(sorted(packages.items())),
+        "files": dict(sorted(files.items())),
+    }
+    report = {
+        "entry_size": entry_size,
+        "modules": len(module_ids),
+        "chunks": chunk_rows,
+        "routes": routes,
+        "expected_session": round(expected_session),
+    }
+    return generated, report
+
+
+def print_report(report: Dict[str, Any]):
+    print("\n" + "=" * 60)
+    print("📦 CHUNK PLAN")
+    print("=" * 60)
+    print(f"Modules:               {report['modules']}")
+    print(f"Entry vendor (always): {report['entry_size'] / 1024:.1f} KiB")
+    print(f"Shared chunks:         {len(report['chunks'])}")
+    print(f"Expected session:      {report['expected_session'] / 1024:.1f} KiB")
+    print("=" * 60)
+
+    for row in report["chunks"]:
+        print(f"\n{row['name']}  {row['size'] / 1024:.1f} KiB  "
+              f"({row['modules']} modules, P(needed)={row['p_needed']})")
+        units = row["units"]
+        print("   " + ", ".join(units[:6]) + (f" +{len(units) - 6} more" if len(units) > 6 else ""))
+
+    print("\n" + "-" * 60)
+    print(f"{'Route':<45} {'KiB':>7} {'Reqs':>5}")
+    print("-" * 60)
+    for module_id, row in sorted(report["routes"].items(), key=lambda kv: -kv[1]["cold_total"]):
+        print(f"/{module_id:<44} {row['cold_total'] / 1024:>7.1f} {row['requests']:>5}")
+
+
+def serialize(data: Any) -> str:
+    return json.dumps(data, indent=2) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plan Vite manualChunks from the module import graph",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python plan_chunks.py
+  python plan_chunks.py --session-modules 5 --request-cost 4096
+  python plan_chunks.py --sizes measured_sizes.json --report report.json
+        """,
+    )
+
+    parser.add_argument("--session-modules", type=int, default=3, help="Modules visited per session (default: 3)")
+    parser.add_argument("--request-cost", type=int, default=2_048, help="Bytes charged per extra request (default: 2048)")
+    parser.add_argument("--sizes", help="JSON of {unit: min+gzip bytes} overriding the estimates")
+    parser.add_argument("--output", default=str(OUTPUT_FILE), help="Generated plan path")
+    parser.add_argument("--report", help="Also write the report as JSON")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the plan is out of date")
+
+    args = parser.parse_args()
+
+    try:
+        sizes = json.loads(Path(args.sizes).read_text(encoding="utf-8")) if args.sizes else {}
+        generated, report = build_plan(args.session_modules, args.request_cost, sizes)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_report(report)
+
+    output = Path(args.output)
+    text = serialize(generated)
+    current = output.read_text(encoding="utf-8") if output.exists() else None
+
+    if args.check:
+        if current != text:
+            print(f"\n⚠️  {output} is out of date. Run: python plan_chunks.py")
+            return 1
+        print("\n✅ Up to date")
+        return 0
+
+    if current != text:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text, encoding="utf-8")
+        print(f"\n📄 Plan written to {output}")
+
+    if args.report:
+        Path(args.report).write_text(serialize(report), encoding="utf-8")
+        print(f"📄 Report written to {args.report}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Post-build step: precompress dist/ and generate Firebase cache headers.
+
+Run after `npm run build`:
+
+1. Compress every compressible asset in dist/ with gzip (and brotli, if the
+   `brotli` package is installed), in parallel, for the size report.
+   Compressed bytes are cached by content hash in ./.cache/compress, so a
+   rebuild only compresses files whose content changed; entries for content
+   no longer in dist/ are pruned. With --variants, the `.gz` / `.br` files
+   are also written next to each asset.
+2. Regenerate `hosting.headers` in firebase.json:
+   - Vite's content-hashed files: `public, max-age=31536000, immutable`
+   - index.html, SPA routes and sw.js: `no-cache`, so a deploy is picked up
+     at once
+3. Print sizes and compression ratios.
+
+Firebase Hosting compresses responses itself and doesn't look for `.gz` /
+`.br` siblings, so variants are off by default. They're for hosts and CDNs
+that serve precompressed files; --variants also adds them to
+`hosting.ignore` so a Firebase deploy from the same dist/ skips them.
+
+Usage:
+    python postbuild_compress.py                 # report + update firebase.json
+    python postbuild_compress.py --variants      # also write .gz/.br next to assets
+    python postbuild_compress.py --check         # exit 1 if firebase.json headers are stale
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import brotli
+except ImportError:  # optional - gzip only without it
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DIST_DIR = PROJECT_ROOT / "dist"
+FIREBASE_JSON = PROJECT_ROOT / "firebase.json"
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "compress"
+
+COMPRESSIBLE = {".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".xml", ".map", ".wasm", ".ico"}
+VARIANT_SUFFIXES = (".gz", ".br")
+
+# Smaller files aren't worth a variant; neither is one that saves < 5%
+MIN_SIZE = 1024
+MIN_SAVING = 0.05
+
+# Vite's default `[name]-[hash].[ext]`: 8 base64url characters
+HASHED_NAME = re.compile(r"-[A-Za-z0-9_-]{8}\.[a-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+NO_CACHE = "no-cache"
+
+# Paths that must revalidate: index.html (the root, the file itself and
+# extensionless SPA routes) and the service worker from build_precache.py
+DOCUMENT_SOURCES = ("/", "/index.html", "**/!(*.*)", "/sw.js")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gz":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def compress_file(path: Path, encodings: List[str], cache_dir: Path, write: bool) -> Dict[str, Any]:
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    entry: Dict[str, Any] = {"size": len(data), "digest": digest, "variants": {}, "cached": 0}
+
+    for encoding in encodings:
+        cached = cache_dir / f"{digest}.{encoding}"
+        if cached.exists():
+            packed = cached.read_bytes()
+            entry["cached"] += 1
+        else:
+            packed = compress(data, encoding)
+            tmp = cached.with_suffix(f".{encoding}.{os.getpid()}.tmp")
+            tmp.write_bytes(packed)
+            os.replace(tmp, cached)
+
+        variant = path.with_name(f"{path.name}.{encoding}")
+        if len(packed) > len(data) * (1 - MIN_SAVING):
+            if write and variant.exists():
+                variant.unlink()
+            continue
+        entry["variants"][encoding] = len(packed)
+        if write and (not variant.exists() or variant.stat().st_size != len(packed)):
+            variant.write_bytes(packed)
+
+    return entry
+
+
+def prune_cache(cache_dir: Path, digests: Set[str]) -> int:
+    """Delete cached variants of content no longer in dist. Returns the count."""
+    removed = 0
+    for cached in cache_dir.iterdir():
+        if cached.name.split(".", 1)[0] not in digests:
+            cached.unlink()
+            removed += 1
+    return removed
+
+
+def asset_files(dist: Path) -> List[Path]:
+    return sorted(p for p in dist.rglob("*") if p.is_file() and not p.name.endswith(VARIANT_SUFFIXES))
+
+
+def cache_headers(dist: Path, files: List[Path]) -> List[Dict[str, Any]]:
+    """Firebase `headers` rules for the files in dist.
+
+    A top-level directory whose files are all content-hashed gets one
+    `/<dir>/**` rule; hashed files elsewhere get a rule each.
+    """
+    immutable: List[str] = []
+    by_dir: Dict[str, List[Path]] = {}
+    for path in files:
+        rel = path.relative_to(dist)
+        if len(rel.parts) > 1:
+            by_dir.setdefault(rel.parts[0], []).append(path)
+        elif HASHED_NAME.search(path.name):
+            immutable.append(f"/{rel.as_posix()}")
+
+    for directory, paths in sorted(by_dir.items()):
+        if all(HASHED_NAME.search(p.name) for p in paths):
+            immutable.append(f"/{directory}/**")
+        else:
+            immutable.extend(
+                f"/{p.relative_to(dist).as_posix()}" for p in paths if HASHED_NAME.search(p.name)
+            )
+
+    rules = [
+        {"source": source, "headers": [{"key": "Cache-Control", "value": IMMUTABLE}]}
+        for source in sorted(immutable)
+    ]
+    rules += [
+        {"source": source, "headers": [{"key": "Cache-Control", "value": NO_CACHE}]}
+        for source in DOCUMENT_SOURCES
+    ]
+    return rules
+
+
+def update_firebase(firebase_json: Path, headers: List[Dict[str, Any]], ignore_variants: bool, check: bool) -> bool:
+    """Replace hosting.headers (owned by this script). Returns True if it changed."""
+    config = json.loads(firebase_json.read_text(encoding="utf-8"))
+    hosting = config.setdefault("hosting", {})
+    before = json.dumps(hosting, sort_keys=True)
+
+    hosting["headers"] = headers
+    if ignore_variants:
+        ignore = hosting.setdefault("ignore", [])
+        for pattern in (f"**/*{suffix}" for suffix in VARIANT_SUFFIXES):
+            if pattern not in ignore:
+                ignore.append(pattern)
+
+    changed = json.dumps(hosting, sort_keys=True) != before
+    if changed and not check:
+        firebase_json.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    return changed
+
+
+def postbuild_compress(
+    dist_dir: str = str(DIST_DIR),
+    firebase_json: str = str(FIREBASE_JSON),
+    cache_dir: str = str(CACHE_DIR),
+    write_variants: bool = False,
+    workers: Optional[int] = None,
+    check: bool = False,
+) -> Dict[str, Any]:
+    dist = Path(dist_dir)
+    if not (dist / "index.html").exists():
+        raise FileNotFoundError(f"No build in {dist} - run npm run build first")
+
+    encodings = ["gz"] + (["br"] if brotli is not None else [])
+    cache = Path(cache_dir)
+    cache.mkdir(parents=True, exist_ok=True)
+
+    files = asset_files(dist)
+    targets = [p for p in files if p.suffix.lower() in COMPRESSIBLE and p.stat().st_size >= MIN_SIZE]
+
+    write = write_variants and not check
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        entries = dict(zip(targets, pool.map(lambda p: compress_file(p, encodings, cache, write), targets)))
+
+    pruned = 0 if check else prune_cache(cache, {e["digest"] for e in entries.values()})
+    changed = update_firebase(Path(firebase_json), cache_headers(dist, files), write, check)
+
+    return {
+        "files": len(files),
+        "encodings": encodings,
+        "assets": {str(p.relative_to(dist).as_posix()): e for p, e in entries.items()},
+        "total_size": sum(p.stat().st_size for p in files),
+        "variants_written": write,
+        "cache_pruned": pruned,
+        "firebase_changed": changed,
+    }
+
+
+def _ratio(size: int, packed: Optional[int]) -> str:
+    return f"{packed / size:6.1%}" if packed else "     -"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Precompress dist/ and generate Firebase cache headers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python postbuild_compress.py
+  python postbuild_compress.py --variants
+  python postbuild_compress.py --check
+        """,
+    )
+
+    parser.add_argument("--dist", default=str(DIST_DIR), help="Vite output directory")
+    parser.add_argument("--firebase", default=str(FIREBASE_JSON), help="firebase.json to update")
+    parser.add_argument("--variants", action="store_true", help="Write .gz/.br files next to the assets")
+    parser.add_argument("--workers", type=int, default=None, help="Compression threads (default: CPUs)")
+    parser.add_argument("--top", type=int, default=15, help="Largest assets to list")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if firebase.json headers are stale")
+
+    args = parser.parse_args()
+
+    try:
+        result = postbuild_compress(
+            args.dist, args.firebase, write_variants=args.variants, workers=args.workers, check=args.check
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    assets = result["assets"]
+    raw = sum(e["size"] for e in assets.values())
+    gz = sum(e["variants"].get("gz", e["size"]) for e in assets.values())
+    br = sum(e["variants"].get("br", e["size"]) for e in assets.values())
+    cached = sum(e["cached"] for e in assets.values())
+
+    print("\n" + "=" * 60)
+    print("🗜️  POST-BUILD COMPRESSION")
+    print("=" * 60)
+    print(f"{'asset':40} {'size':>9} {'gzip':>7} {'brotli':>7}")
+    largest = sorted(assets.items(), key=lambda item: -item[1]["size"])[: args.top]
+    for name, entry in largest:
+        variants = entry["variants"]
+        print(
+            f"{name[-40:]:40} {entry['size'] / 1024:7.1f}KB "
+            f"{_ratio(entry['size'], variants.get('gz'))} {_ratio(entry['size'], variants.get('br'))}"
+        )
+    print("-" * 60)
+    print(f"Files in dist:     {result['files']} ({result['total_size'] / 1024:.1f} KiB)")
+    print(f"Compressible:      {len(assets)} ({raw / 1024:.1f} KiB)")
+    print(f"gzip:              {gz / 1024:.1f} KiB ({gz / raw:.1%})" if raw else "gzip:              -")
+    if "br" in result["encodings"]:
+        print(f"brotli:            {br / 1024:.1f} KiB ({br / raw:.1%})" if raw else "brotli:            -")
+    else:
+        print("brotli:            skipped (pip install brotli)")
+    print(f"From cache:        {cached} of {len(assets) * len(result['encodings'])} variants")
+    print(f"Pruned from cache: {result['cache_pruned']}")
+    print(f"Variants written:  {'yes' if result['variants_written'] else 'no (--variants to write)'}")
+    print("=" * 60)
+
+    if args.check:
+        if result["firebase_changed"]:
+            print("   ⚠️  firebase.json headers are out of date")
+            print("\nRun: python postbuild_compress.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print("Updated firebase.json" if result["firebase_changed"] else "firebase.json already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Pre-tokenize static CodeBlock samples at build time (Pygments).
+
+CodeBlock used to ship the full Prism build of react-syntax-highlighter and
+tokenize every sample in the browser on each expand. Almost every sample is
+a static template literal, so the tokenizing can happen once, here:
+
+1. Find the `code` / `badCode` / `goodCode` expressions of every <CodeBlock>
+   and <CodeComparison> in src/modules/*/index.tsx
+2. Resolve them to static strings - inline template literals, module-level
+   `const name = \\`...\\``, and `obj.key` properties of module-level objects.
+   Literals with `${...}` interpolation are left to the runtime highlighter.
+3. Tokenize with Pygments and map token types onto the vscDarkPlus palette
+4. Write one compact JSON per module to src/generated/codeblocks/<id>.json
+   plus an index (sample hash -> module id) that CodeBlock imports
+
+Samples are keyed by FNV-1a over `language + "\\n" + code` (UTF-16 code
+units), which src/components/common/prehighlighted.ts computes the same way.
+Anything missing from the index falls back to the lazily loaded Prism
+highlighter, so stale output is never wrong - only slower.
+
+Usage:
+    python prehighlight_code.py            # regenerate
+    python prehighlight_code.py --check    # exit 1 if output is stale
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Keyword, Name, Number, Punctuation, String
+from pygments.util import ClassNotFound
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+OUTPUT_DIR = PROJECT_ROOT / "src" / "generated" / "codeblocks"
+
+FORMAT_VERSION = 1
+
+# Components whose props end up as CodeBlock `code`
+CODE_PROPS = {
+    "CodeBlock": ("code",),
+    "CodeComparison": ("badCode", "goodCode"),
+}
+
+# CodeBlock's own default for `language`
+DEFAULT_LANGUAGE = "jsx"
+
+LEXER_ALIASES = {
+    "ts": "typescript",
+    "js": "javascript",
+    "shell": "bash",
+    "sh": "bash",
+}
+
+# vscDarkPlus colors. Index 0 is the plain text color and is rendered
+# without a span.
+PALETTE = [
+    "#d4d4d4",  # plain / punctuation / operator
+    "#6a9955",  # comment
+    "#569cd6",  # keyword, boolean, builtin, tag
+    "#c586c0",  # module + control-flow keywords
+    "#ce9178",  # string
+    "#b5cea8",  # number
+    "#9cdcfe",  # variable, property, attr-name
+    "#dcdcaa",  # function
+    "#4ec9b0",  # class-name, type
+    "#808080",  # JSX tag punctuation
+    "#d16969",  # regex
+]
+
+CONTROL_FLOW = {
+    "import", "export", "from", "default", "return", "if", "else", "for", "while",
+    "do", "switch", "case", "break", "continue", "try", "catch", "finally",
+    "throw", "await", "yield", "as",
+}
+
+
+def fnv1a(text: str) -> str:
+    """32-bit FNV-1a over UTF-16 code units, as 8 hex digits (matches JS)."""
+    h = 0x811C9DC5
+    data = text.encode("utf-16-le")
+    for i in range(0, len(data), 2):
+        h ^= data[i] | (data[i + 1] << 8)
+        h = (h * 0x01000193) & 0xFFFFFFFF
+    return f"{h:08x}"
+
+
+def sample_key(language: str, code: str) -> str:
+    return fnv1a(f"{language}\n{code}")
+
+
+# ---------------------------------------------------------------------------
+# Source scanning
+# ---------------------------------------------------------------------------
+
+
+def skip_string(source: str, i: int) -> int:
+    """Return the index just past the quoted string/template starting at i."""
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if quote == "`" and ch == "$" and source.startswith("${", i):
+            i = skip_braces(source, i + 1)
+            continue
+        if ch == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def skip_braces(source: str, i: int) -> int:
+    """Return the index just past the balanced {...} starting at i."""
+    depth = 0
+    while i < len(source):
+        ch = source[i]
+        if ch in "\"'`":
+            i = skip_string(source, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def template_literals(expression: str) -> Iterator[str]:
+    """Yield the raw bodies of top-level template literals in an expression."""
+    i = 0
+    while i < len(expression):
+        ch = expression[i]
+        if ch in "\"'`":
+            end = skip_string(expression, i)
+            if ch == "`":
+                yield expression[i + 1 : end - 1]
+            i = end
+        else:
+            i += 1
+
+
+_ESCAPES = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)", re.DOTALL)
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+def cook_template(raw: str) -> Optional[str]:
+    """Evaluate a template literal body, or None if it interpolates."""
+    if re.search(r"(?<!\\)\$\{", raw):
+        return None
+
+    def replace(match: re.Match) -> str:
+        seq = match.group(1)
+        if seq.startswith("u{"):
+            return chr(int(seq[2:-1], 16))
+        if seq[0] in "ux" and len(seq) > 1:
+            return chr(int(seq[1:], 16))
+        if seq in ("\n", "\r\n"):
+            return ""
+        return _SIMPLE_ESCAPES.get(seq, seq)
+
+    return _ESCAPES.sub(replace, raw.replace("\r\n", "\n"))
+
+
+def jsx_attributes(source: str, start: int) -> Tuple[Dict[str, str], int]:
+    """Collect attribute values of the JSX element whose name ends at start.
+
+    Values are returned as source text: `{...}` contents or the quoted string.
+    """
+    attrs = {}
+    i = start
+    while i < len(source):
+        while i < len(source) and source[i].isspace():
+            i += 1
+        if source.startswith("/>", i) or source.startswith(">", i):
+            break
+        if source[i] == "{":  # {...spread}
+            i = skip_braces(source, i)
+            continue
+        name = re.match(r"[A-Za-z_][\w-]*", source[i:])
+        if not name:
+            i += 1
+            continue
+        i += name.end()
+        if not source.startswith("=", i):
+            attrs[name.group()] = "true"
+            continue
+        i += 1
+        if source[i] == "{":
+            end = skip_braces(source, i)
+            attrs[name.group()] = source[i + 1 : end - 1]
+        else:
+            end = skip_string(source, i)
+            attrs[name.group()] = source[i:end]
+        i = end
+    return attrs, i
+
+
+def module_constants(source: str) -> Dict[str, str]:
+    """Map `name` and `obj.key` to static template literal values.
+
+    Samples are usually declared inside the component body, so indented
+    declarations count too.
+    """
+    constants = {}
+
+    for match in re.finditer(r"^[ \t]*(?:export\s+)?const\s+(\w+)(?:\s*:\s*[\w.]+)?\s*=\s*`", source, re.M):
+        start = match.end() - 1
+        end = skip_string(source, start)
+        value = cook_template(source[start + 1 : end - 1])
+        if value is not None:
+            constants[match.group(1)] = value
+
+    for match in re.finditer(r"^[ \t]*(?:export\s+)?const\s+(\w+)(?:\s*:\s*[^=]+)?\s*=\s*\{", source, re.M):
+        start = match.end() - 1
+        body = source[start + 1 : skip_braces(source, start) - 1]
+        for prop in re.finditer(r"(?:^|[,{\s])(\w+)\s*:\s*`", body):
+            literal_start = prop.end() - 1
+            end = skip_string(body, literal_start)
+            value = cook_template(body[literal_start + 1 : end - 1])
+            if value is not None:
+                constants[f"{match.group(1)}.{prop.group(1)}"] = value
+
+    return constants
+
+
+def resolve_expression(expression: str, constants: Dict[str, str]) -> Tuple[List[str], int]:
+    """Resolve a code-prop expression to static strings.
+
+    Returns (strings, dynamic_count). A ternary or `||` between two known
+    samples yields both.
+    """
+    found = []
+    dynamic = 0
+
+    for raw in template_literals(expression):
+        value = cook_template(raw)
+        if value is None:
+            dynamic += 1
+        else:
+            found.append(value)
+
+    without_literals = re.sub(r"`(?:\\.|[^`\\])*`|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'", "", expression)
+    for ref in re.findall(r"[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)?", without_literals):
+        if ref in constants:
+            found.append(constants[ref])
+
+    if not found and not dynamic:
+        dynamic = 1
+    return found, dynamic
+
+
+def string_value(attr: Optional[str]) -> Optional[str]:
+    """Value of a JSX attribute given as a plain string literal."""
+    if not attr:
+        return None
+    attr = attr.strip()
+    if len(attr) >= 2 and attr[0] in "\"'`" and attr[-1] == attr[0] and "${" not in attr:
+        return attr[1:-1]
+    return None
+
+
+def find_samples(source: str) -> Tuple[List[Tuple[str, str]], int]:
+    """Return ([(language, code)], dynamic_count) for one module source."""
+    constants = module_constants(source)
+    samples = []
+    dynamic = 0
+
+    pattern = re.compile(r"<(%s)\b" % "|".join(CODE_PROPS))
+    for match in pattern.finditer(source):
+        attrs, _ = jsx_attributes(source, match.end())
+        language = string_value(attrs.get("language")) or DEFAULT_LANGUAGE
+
+        for prop in CODE_PROPS[match.group(1)]:
+            expression = attrs.get(prop)
+            if expression is None:
+                continue
+            literal = string_value(expression)
+            if literal is not None:
+                samples.append((language, literal))
+                continue
+            found, unresolved = resolve_expression(expression, constants)
+            samples.extend((language, code) for code in found)
+            dynamic += unresolved
+
+    return samples, dynamic
+
+
+# ---------------------------------------------------------------------------
+# Tokenizing
+# ---------------------------------------------------------------------------
+
+_lexers: Dict[str, Any] = {}
+
+
+def lexer_for(language: str):
+    name = LEXER_ALIASES.get(language, language)
+    if name not in _lexers:
+        try:
+            _lexers[name] = get_lexer_by_name(name, stripnl=False, ensurenl=False)
+        except ClassNotFound:
+            _lexers[name] = get_lexer_by_name(DEFAULT_LANGUAGE, stripnl=False, ensurenl=False)
+    return _lexers[name]
+
+
+def color_for(ttype, value: str, next_value: str) -> int:
+    """Pick a PALETTE index for a Pygments token."""
+    if ttype in Comment:
+        return 1
+    if ttype in String.Regex:
+        return 10
+    if ttype in String:
+        return 4
+    if ttype in Number:
+        return 5
+    if ttype in Keyword.Type:
+        return 8
+    if ttype in Keyword:
+        return 3 if value in CONTROL_FLOW else 2
+    if ttype in Name.Tag:
+        return 8 if value[:1].isupper() else 2
+    if ttype in Name.Attribute:
+        return 6
+    if ttype in Name.Builtin:
+        return 8 if value[:1].isupper() else 2
+    if ttype in Name.Class:
+        return 8
+    if ttype in Name.Function:
+        return 7
+    if ttype in Name:
+        if next_value.startswith("("):
+            return 7
+        if value[:1].isupper():
+            return 8
+        return 6
+    if ttype in Punctuation and value in ("<", ">", "</", "/>"):
+        return 9
+    return 0
+
+
+def tokenize(language: str, code: str) -> List[Any]:
+    """Tokenize into a flat [text, colorIndex, text, colorIndex, ...] list.
+
+    Adjacent runs with the same color are merged; plain runs are emitted as
+    a bare string with color 0 omitted by the renderer.
+    """
+    tokens = [(t, v) for t, v in lexer_for(language).get_tokens(code) if v]
+
+    # Next non-blank token text, for spotting calls: name followed by "("
+    following = [""] * len(tokens)
+    upcoming = ""
+    for i in range(len(tokens) - 1, -1, -1):
+        following[i] = upcoming
+        if tokens[i][1].strip():
+            upcoming = tokens[i][1].lstrip()
+
+    spans: List[Any] = []
+    for i, (ttype, value) in enumerate(tokens):
+        color = 0 if not value.strip() else color_for(ttype, value, following[i])
+        if spans and (spans[-1] == color or not value.strip()):
+            spans[-2] += value
+        else:
+            spans.extend([value, color])
+
+    if "".join(spans[::2]) != code:
+        raise ValueError("Tokenizer did not round-trip the sample")
+    return spans
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+
+def build_payloads(modules_dir: Path) -> Tuple[Dict[str, Dict], Dict[str, str], Dict[str, int]]:
+    """Return (per-module payloads, index, stats)."""
+    payloads: Dict[str, Dict] = {}
+    index: Dict[str, str] = {}
+    stats = {"modules": 0, "samples": 0, "dynamic": 0, "code_bytes": 0, "json_bytes": 0}
+
+    for module_dir in sorted(p for p in modules_dir.iterdir() if p.is_dir()):
+        if module_dir.name.startswith("_"):
+            continue
+        source_file = module_dir / "index.tsx"
+        if not source_file.exists():
+            continue
+
+        samples, dynamic = find_samples(source_file.read_text(encoding="utf-8"))
+        stats["dynamic"] += dynamic
+
+        blocks = {}
+        for language, code in samples:
+            key = sample_key(language, code)
+            if key in blocks or key in index:
+                continue
+            blocks[key] = {"n": len(code.encode("utf-16-le")) // 2, "t": tokenize(language, code)}
+            index[key] = module_dir.name
+            stats["code_bytes"] += len(code.encode("utf-8"))
+
+        if blocks:
+            payloads[module_dir.name] = {"v": FORMAT_VERSION, "palette": PALETTE, "blocks": blocks}
+            stats["modules"] += 1
+            stats["samples"] += len(blocks)
+
+    return payloads, dict(sorted(index.items())), stats
+
+
+def serialize(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def prehighlight(
+    modules_dir: Optional[str] = None, output_dir: Optional[str] = None, check: bool = False
+) -> Dict[str, Any]:
+    """Regenerate (or, with check=True, verify) the pre-tokenized samples.
+
+    Returns:
+        Dict with stats, written/removed/stale file lists
+    """
+    modules_dir = Path(modules_dir) if modules_dir else MODULES_DIR
+    output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
+
+    payloads, index, stats = build_payloads(modules_dir)
+
+    expected = {f"{module_id}.json": serialize(payload) for module_id, payload in payloads.items()}
+    expected["index.json"] = serialize(index)
+    stats["json_bytes"] = sum(len(text.encode("utf-8")) for text in expected.values())
+
+    existing = {p.name for p in output_dir.glob("*.json")} if output_dir.exists() else set()
+    stale = sorted(
+        name
+        for name, text in expected.items()
+        if not (output_dir / name).exists() or (output_dir / name).read_text(encoding="utf-8") != text
+    )
+    orphans = sorted(existing - set(expected))
+
+    result = {"stats": stats, "stale": stale, "removed": [], "written": []}
+    if check:
+        result["removed"] = orphans
+        return result
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name in stale:
+        (output_dir / name).write_text(expected[name], encoding="utf-8")
+        result["written"].append(name)
+    for name in orphans:
+        (output_dir / name).unlink()
+        result["removed"].append(name)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-tokenize static CodeBlock samples with Pygments",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python prehighlight_code.py
+  python prehighlight_code.py --check
+        """,
+    )
+
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module directory")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR), help="Generated JSON directory")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if output is out of date")
+
+    args = parser.parse_args()
+
+    try:
+        result = prehighlight(args.modules_dir, args.output_dir, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    stats = result["stats"]
+    print("\n" + "=" * 60)
+    print("🎨 CODE PRE-HIGHLIGHTING")
+    print("=" * 60)
+    print(f"Modules with samples: {stats['modules']}")
+    print(f"Static samples:       {stats['samples']}")
+    print(f"Left to runtime:      {stats['dynamic']}")
+    print(f"Source code:          {stats['code_bytes'] / 1024:.1f} KiB")
+    print(f"Token JSON:           {stats['json_bytes'] / 1024:.1f} KiB")
+    print("=" * 60)
+
+    if args.check:
+        out_of_date = result["stale"] + result["removed"]
+        for name in out_of_date:
+            print(f"   ⚠️  {name} is out of date")
+        if out_of_date:
+            print("\nRun: python prehighlight_code.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print(f"Written: {len(result['written'])}, removed: {len(result['removed'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
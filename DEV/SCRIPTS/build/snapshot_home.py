@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Render a static snapshot of the home page module grid into index.html.
+
+`Home` (src/modules/home/index.tsx) only paints its cards once the entry
+chunk has downloaded, parsed moduleRegistry.json and run
+getEnabledModules(). Until then the page is an empty <div id="root">.
+
+This script renders the same markup for the enabled registry entries and
+writes it inside #root, between snapshot markers. The browser paints it
+straight from the HTML; when React starts, createRoot().render() replaces
+it with the live component. A tiny inline script hides the snapshot on
+any path other than "/", so deep links into a module don't flash the grid.
+
+Icons are inlined as SVG from the lucide-react icon nodes vendored in
+lucide_icons.json, so the output doesn't depend on node_modules. An icon
+missing there renders as an empty box of the same size (the layout doesn't
+shift) and fails --check until lucide_icons.py adds it.
+
+The markup mirrors Home by hand - keep SNAPSHOT_TEMPLATE in sync when the
+home page layout changes.
+
+Usage:
+    python snapshot_home.py            # update index.html
+    python snapshot_home.py --check    # exit 1 if the snapshot is stale
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+from lucide_icons import icon_file, icon_nodes, kebab
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+INDEX_HTML = PROJECT_ROOT / "index.html"
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+REGISTRY_TS = PROJECT_ROOT / "src" / "config" / "moduleRegistry.ts"
+
+HEAD_START = "<!-- home-snapshot:head -->"
+HEAD_END = "<!-- /home-snapshot:head -->"
+ROOT_START = "<!-- home-snapshot:root -->"
+ROOT_END = "<!-- /home-snapshot:root -->"
+
+# moduleRegistry.ts falls back to Brain for unknown icon names
+DEFAULT_ICON = "Brain"
+
+HEAD_SNIPPET = """{start}
+    <style>
+      .home-snapshot-off #home-snapshot {{
+        display: none;
+      }}
+    </style>
+    <script>
+      if (location.pathname !== "/") {{
+        document.documentElement.classList.add("home-snapshot-off");
+      }}
+    </script>
+    {end}"""
+
+SNAPSHOT_TEMPLATE = """<div id="home-snapshot" class="flex min-h-screen items-center justify-center bg-zinc-950 p-4 text-white md:p-8"><div class="w-full max-w-5xl"><div class="mb-16 text-center"><div class="mb-4 inline-flex items-center gap-3 rounded-full border border-zinc-800 bg-zinc-900/50 px-6 py-3">{film}<span class="font-mono text-sm tracking-widest text-zinc-400 uppercase">Educational Series</span></div><h1 class="mb-4 text-5xl font-black tracking-tighter md:text-7xl">Cinematic <span class="text-emerald-500">React</span> Patterns</h1><p class="mx-auto max-w-2xl text-lg leading-relaxed text-zinc-400 md:text-xl">Master React fundamentals through the lens of iconic film narratives. Each module transforms complex concepts into memorable, story-driven experiences.</p></div>{search}<div class="mb-12 grid gap-6 md:grid-cols-3">{cards}</div><div class="text-center"><p class="font-mono text-sm tracking-[0.3em] text-zinc-600 uppercase">A World-Class Learning Experience</p></div></div><div class="pointer-events-none fixed inset-0 z-[-1] opacity-[0.02]"><div class="absolute top-1/4 left-1/4 h-96 w-96 rounded-full bg-emerald-500 blur-[128px]"></div><div class="absolute right-1/4 bottom-1/4 h-96 w-96 rounded-full bg-red-500 blur-[128px]"></div></div></div>"""
+
+# ModuleSearch's idle state, so the grid doesn't move when React takes over
+SEARCH_TEMPLATE = """<div class="mx-auto mb-12 max-w-2xl"><label class="flex items-center gap-3 rounded-xl border border-zinc-800 bg-zinc-900/50 px-4 py-3 focus-within:border-emerald-500/60">{icon}<input type="search" placeholder="Search chapters: useRef, reconciliation, Hamlet…" aria-label="Search module chapters" class="w-full bg-transparent text-white placeholder-zinc-600 outline-none"></label></div>"""
+
+CARD_TEMPLATE = """<a href="{path}" class="group {bg_class} relative overflow-hidden rounded-2xl border-2 p-6 transition-all duration-300 hover:scale-105 hover:shadow-2xl"><div class="absolute top-0 right-0 p-6 opacity-5 transition-opacity group-hover:opacity-10">{icon_large}</div><div class="relative z-10"><div class="mb-4 flex items-center gap-4">{icon_small}<p class="text-sm font-semibold tracking-wider text-zinc-400 uppercase">{concept}</p></div><div class="border-t border-zinc-800 pt-4"></div><div class="mt-4"><h3 class="mb-1 text-3xl leading-snug font-bold transition-colors group-hover:text-white">{title}</h3><p class="text-sm text-zinc-500 italic">{subtitle}</p></div></div><div class="absolute right-4 bottom-4 opacity-0 transition-opacity group-hover:opacity-100"><span class="{color_class} text-2xl">→</span></div></a>"""
+
+
+def icon_aliases(registry_ts: Path) -> Dict[str, str]:
+    """JSON icon name -> Lucide component, from `iconMap` in moduleRegistry.ts."""
+    if not registry_ts.exists():
+        return {}
+    match = re.search(r"const iconMap[^=]*=\s*\{(.*?)\};", registry_ts.read_text(encoding="utf-8"), re.S)
+    if not match:
+        return {}
+    aliases = {}
+    for entry in re.findall(r"(\w+(?:\s*:\s*\w+)?)\s*,", match.group(1)):
+        key, _, value = (part.strip() for part in entry.partition(":"))
+        aliases[key] = value or key
+    return aliases
+
+
+def icon_component(name: str, aliases: Dict[str, str]) -> str:
+    """Lucide component a registry `icon` resolves to, as iconMap does."""
+    if not aliases:
+        return name or DEFAULT_ICON
+    return aliases.get(name, DEFAULT_ICON)
+
+
+def render_icon(component: str, size: int, class_name: str) -> str:
+    """Same markup lucide-react renders for <Icon size={size} className=... />."""
+    nodes = icon_nodes(component)
+    if nodes is None:
+        classes = f"inline-block {class_name}".strip()
+        return f'<span class="{classes}" style="width:{size}px;height:{size}px" aria-hidden="true"></span>'
+    children = "".join(
+        f"<{tag} " + " ".join(f'{kebab(k)}="{html.escape(v)}"' for k, v in attrs.items()) + f"></{tag}>"
+        for tag, attrs in nodes
+    )
+    classes = f"lucide lucide-{icon_file(component) or kebab(component)} {class_name}".strip()
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 24 24" '
+        f'fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" '
+        f'stroke-linejoin="round" class="{classes}" aria-hidden="true">{children}</svg>'
+    )
+
+
+def snapshot_icons(registry: List[dict], aliases: Dict[str, str]) -> Set[str]:
+    """Lucide components the snapshot renders."""
+    return {icon_component(m.get("icon", ""), aliases) for m in registry if m.get("enabled")} | {"Film", "Search"}
+
+
+def render_snapshot(registry: List[dict], aliases: Dict[str, str]) -> str:
+    cards = []
+    for module in registry:
+        if not module.get("enabled"):
+            continue
+        component = icon_component(module.get("icon", ""), aliases)
+        color = module.get("colorClass", "")
+        cards.append(
+            CARD_TEMPLATE.format(
+                path=html.escape(module["path"]),
+                bg_class=html.escape(module.get("bgClass", "")),
+                color_class=html.escape(color),
+                icon_large=render_icon(component, 120, ""),
+                icon_small=render_icon(component, 32, f"{color} flex-shrink-0 transition-transform group-hover:scale-110"),
+                concept=html.escape(module.get("concept", "")),
+                title=html.escape(module.get("title", "")),
+                subtitle=html.escape(module.get("subtitle", "")),
+            )
+        )
+    film = render_icon("Film", 24, "text-emerald-500")
+    search = SEARCH_TEMPLATE.format(icon=render_icon("Search", 20, "text-zinc-500"))
+    return SNAPSHOT_TEMPLATE.format(film=film, search=search, cards="".join(cards))
+
+
+def replace_block(text: str, start: str, end: str, block: str, insert: Callable[[str], str]) -> str:
+    """Swap the text between markers, or add the block with `insert` the first time."""
+    pattern = re.compile(re.escape(start) + r".*?" + re.escape(end), re.S)
+    if pattern.search(text):
+        return pattern.sub(lambda _: block, text, count=1)
+    return insert(text)
+
+
+def inject(index_text: str, snapshot: str) -> str:
+    for anchor in ("</head>", '<div id="root">'):
+        if anchor not in index_text:
+            raise ValueError(f"index.html has no {anchor} to anchor the snapshot")
+
+    head = HEAD_SNIPPET.format(start=HEAD_START, end=HEAD_END)
+    text = replace_block(
+        index_text, HEAD_START, HEAD_END, head,
+        lambda t: re.sub(r"(\n\s*)</head>", lambda m: "\n    " + head + m.group(0), t, count=1),
+    )
+    root = f"{ROOT_START}{snapshot}{ROOT_END}"
+    return replace_block(
+        text, ROOT_START, ROOT_END, root,
+        lambda t: t.replace('<div id="root">', '<div id="root">' + root, 1),
+    )
+
+
+def snapshot_home(
+    index_html: str = str(INDEX_HTML),
+    registry_file: str = str(REGISTRY_FILE),
+    check: bool = False,
+) -> dict:
+    index_path = Path(index_html)
+    registry = json.loads(Path(registry_file).read_text(encoding="utf-8"))
+    aliases = icon_aliases(REGISTRY_TS)
+
+    snapshot = render_snapshot(registry, aliases)
+    current = index_path.read_text(encoding="utf-8")
+    updated = inject(current, snapshot)
+
+    missing_icons = sorted(name for name in snapshot_icons(registry, aliases) if icon_nodes(name) is None)
+
+    stale = updated != current
+    if stale and not check:
+        index_path.write_text(updated, encoding="utf-8")
+
+    return {
+        "cards": sum(1 for m in registry if m.get("enabled")),
+        "bytes": len(snapshot.encode("utf-8")),
+        "missing_icons": missing_icons,
+        "stale": stale,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the home module grid into index.html",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python snapshot_home.py
+  python snapshot_home.py --check
+        """,
+    )
+
+    parser.add_argument("--index", default=str(INDEX_HTML), help="index.html to update")
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the snapshot is out of date")
+
+    args = parser.parse_args()
+
+    try:
+        result = snapshot_home(args.index, args.registry, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("🏠 HOME SNAPSHOT")
+    print("=" * 60)
+    print(f"Module cards:  {result['cards']}")
+    print(f"Snapshot size: {result['bytes'] / 1024:.1f} KiB")
+    print("=" * 60)
+    if result["missing_icons"]:
+        print(f"⚠️  No vendored nodes for {', '.join(result['missing_icons'])} - rendered as placeholders")
+        print("   (run python lucide_icons.py after npm install)")
+
+    if args.check:
+        if result["missing_icons"]:
+            return 1
+        if result["stale"]:
+            print("   ⚠️  index.html snapshot is out of date")
+            print("\nRun: python snapshot_home.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print("Updated index.html" if result["stale"] else "index.html already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+/* Service worker - generated by DEV/SCRIPTS/build/build_precache.py from
+ * this template. Do not edit dist/sw.js by hand. */
+
+const PRECACHE = __PRECACHE__;
+
+const PREFIX = "crp-precache-";
+const CACHE = PREFIX + PRECACHE.version;
+const SHELL_URL = "/index.html";
+
+/**
+ * Put a URL into the new cache. Hashed URLs are immutable, so a copy from
+ * an older cache is as good as the network - after a deploy only changed
+ * chunks are downloaded.
+ */
+async function precache(cache, url, revision) {
+  if (!revision) {
+    const previous = await caches.match(url);
+    if (previous) return cache.put(url, previous);
+  }
+  const response = await fetch(url, { cache: "reload" });
+  if (!response.ok) throw new Error(`${url}: ${response.status}`);
+  return cache.put(url, response);
+}
+
+/**
+ * Copy the module chunks this deploy shares with the previous one into the
+ * new cache (cache to cache, no network). It has to happen during install:
+ * activate deletes the old caches before the background fill runs.
+ */
+async function carryOverModules(cache) {
+  await Promise.all(
+    PRECACHE.modules.map(async (url) => {
+      const previous = await caches.match(url);
+      if (previous) await cache.put(url, previous);
+    }),
+  );
+}
+
+let backgroundRun = null;
+
+/** Module chunks, in registry order, within the build-time byte budget */
+function precacheModules() {
+  backgroundRun ??= (async () => {
+    const cache = await caches.open(CACHE);
+    for (const url of PRECACHE.modules) {
+      if (await cache.match(url)) continue;
+      try {
+        await precache(cache, url);
+      } catch {
+        // Offline or evicted deploy - the next run picks it up
+        return;
+      }
+    }
+  })().finally(() => {
+    backgroundRun = null;
+  });
+  return backgroundRun;
+}
+
+self.addEventListener("install", (event) => {
+  // The shell (entry chunk, home, CSS, index.html) is required up front;
+  // module chunks are only carried over, the rest comes with the fill
+  event.waitUntil(
+    caches
+      .open(CACHE)
+      .then((cache) =>
+        Promise.all([
+          ...PRECACHE.shell.map(({ url, revision }) => precache(cache, url, revision)),
+          carryOverModules(cache),
+        ]),
+      )
+      .then(() => self.skipWaiting()),
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) =>
+        Promise.all(
+          keys
+            .filter((key) => key.startsWith(PREFIX) && key !== CACHE)
+            .map((key) => caches.delete(key)),
+        ),
+      )
+      .then(() => self.clients.claim()),
+  );
+});
+
+// The page asks for the background fill once it has finished loading
+self.addEventListener("message", (event) => {
+  if (event.data?.type === "precache-modules") {
+    event.waitUntil(precacheModules());
+  }
+});
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") return;
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  // SPA navigations: network first, cached shell when offline
+  if (request.mode === "navigate") {
+    event.respondWith(
+      fetch(request).catch(() =>
+        caches.match(SHELL_URL).then((cached) => cached ?? Response.error()),
+      ),
+    );
+    return;
+  }
+
+  // Hashed assets: cache first, and keep whatever we had to fetch
+  if (url.pathname.startsWith(PRECACHE.assetsPrefix)) {
+    event.respondWith(
+      caches.match(request).then(
+        (cached) =>
+          cached ??
+          fetch(request).then((response) => {
+            if (response.ok) {
+              const copy = response.clone();
+              caches.open(CACHE).then((cache) => cache.put(request, copy));
+            }
+            return response;
+          }),
+      ),
+    );
+  }
+});
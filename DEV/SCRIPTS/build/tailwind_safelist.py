@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Generate the exact Tailwind safelist for classes built at runtime.
+
+Some class names never appear literally in the source, so Tailwind's
+scanner can't find them:
+
+1. moduleRegistry.json `colorClass`, `bgClass` and `wrapperProps` strings,
+   applied by Home and ModuleWrapper
+2. Shared components that build classes from a color prop, e.g.
+   `bg-${themeColor}-900/40` in ChapterNavigation, CodeComparison and
+   ModuleHeader. Those are expanded only for the colors actually passed
+   to each component in src/modules (plus `themeConfig.primaryColor`)
+
+tailwind.config.ts used to safelist regex patterns for 17 colors instead.
+With Tailwind v4 the file isn't loaded at all (index.css has no @config),
+so the generated list is emitted as `@source inline(...)` in
+src/generated/safelist.css, which index.css imports.
+
+Usage:
+    python tailwind_safelist.py            # regenerate
+    python tailwind_safelist.py --check    # exit 1 if stale
+    python tailwind_safelist.py --css dist/assets/index-abc.css
+"""
+
+import argparse
+import itertools
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+MODULES_DIR = PROJECT_ROOT / "src" / "modules"
+COMPONENTS_DIR = PROJECT_ROOT / "src" / "components" / "common"
+OUTPUT_FILE = PROJECT_ROOT / "src" / "generated" / "safelist.css"
+
+# Props whose value is interpolated into class names
+COLOR_PROPS = ("themeColor",)
+
+REGISTRY_CLASS_FIELDS = ("colorClass", "bgClass")
+
+# The regex safelist from tailwind.config.ts this replaces, for the report
+LEGACY_COLORS = (
+    "red orange amber yellow lime green emerald teal cyan sky blue indigo violet purple fuchsia pink rose"
+).split()
+LEGACY_PATTERNS = (
+    ("text-{c}-{s}", ("400", "500")),
+    ("bg-{c}-{s}", ("950/20", "950/30", "500/20", "500/30")),
+    ("border-{c}-{s}", ("500/30",)),
+)
+
+CLASS_TOKEN = r"[\w:/\[\].%-]*"
+
+
+def legacy_safelist() -> Set[str]:
+    return {
+        pattern.format(c=color, s=shade)
+        for pattern, shades in LEGACY_PATTERNS
+        for color, shade in itertools.product(LEGACY_COLORS, shades)
+    }
+
+
+def registry_classes(registry: List[dict]) -> Set[str]:
+    classes = set()
+    for entry in registry:
+        strings = [entry.get(name, "") for name in REGISTRY_CLASS_FIELDS]
+        strings += list((entry.get("wrapperProps") or {}).values())
+        for value in strings:
+            if isinstance(value, str):
+                classes.update(value.split())
+    return classes
+
+
+def color_templates(components_dir: Path) -> Dict[str, Dict[str, Set[str]]]:
+    """component -> prop -> class templates like "hover:bg-{}-900/60"."""
+    templates: Dict[str, Dict[str, Set[str]]] = {}
+    for path in sorted(components_dir.glob("*.tsx")):
+        text = path.read_text(encoding="utf-8")
+        for prop in COLOR_PROPS:
+            found = {
+                match.group(0).replace("${" + prop + "}", "{}")
+                for match in re.finditer(CLASS_TOKEN + re.escape("${" + prop + "}") + CLASS_TOKEN, text)
+            }
+            if found:
+                templates.setdefault(path.stem, {})[prop] = found
+    return templates
+
+
+def opening_tags(text: str, name: str) -> Iterator[Tuple[int, str]]:
+    """(line, source) of every `<Name ...>` tag, skipping `>` inside {...} and strings."""
+    for match in re.finditer(r"<" + re.escape(name) + r"\b", text):
+        depth, quote, i = 0, None, match.end()
+        while i < len(text):
+            char = text[i]
+            if quote:
+                if char == quote and text[i - 1] != "\\":
+                    quote = None
+            elif char in "\"'`":
+                quote = char
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+            elif char == ">" and depth == 0:
+                break
+            i += 1
+        yield text.count("\n", 0, match.start()) + 1, text[match.start() : i + 1]
+
+
+def prop_values(
+    modules_dir: Path, components: Dict[str, Dict[str, Set[str]]]
+) -> Tuple[Dict[Tuple[str, str], Set[str]], List[str]]:
+    """Literal color values passed to each (component, prop), and the call sites we couldn't read."""
+    values: Dict[Tuple[str, str], Set[str]] = {}
+    unresolved = []
+    for path in sorted(modules_dir.glob("*/*.tsx")):
+        text = path.read_text(encoding="utf-8")
+        for component, props in components.items():
+            for line, tag in opening_tags(text, component):
+                for prop in props:
+                    match = re.search(r"\b" + prop + r"""=(?:"([\w-]+)"|\{\s*["'`]([\w-]+)["'`]\s*\}|(\{))""", tag)
+                    if not match:
+                        continue
+                    literal = match.group(1) or match.group(2)
+                    if literal:
+                        values.setdefault((component, prop), set()).add(literal)
+                    else:
+                        unresolved.append(f"{path.relative_to(modules_dir)}:{line} <{component} {prop}={{...}}>")
+    return values, unresolved
+
+
+def collect(registry_file: Path, modules_dir: Path, components_dir: Path) -> Dict[str, object]:
+    registry = json.loads(registry_file.read_text(encoding="utf-8"))
+    templates = color_templates(components_dir)
+    values, unresolved = prop_values(modules_dir, templates)
+
+    # themeConfig.primaryColor feeds the same props of every shared component
+    primary = {(entry.get("themeConfig") or {}).get("primaryColor") for entry in registry} - {None}
+    for component, props in templates.items():
+        for prop in props:
+            values.setdefault((component, prop), set()).update(primary)
+
+    sources: Dict[str, Set[str]] = {"moduleRegistry.json": registry_classes(registry)}
+    for (component, prop), colors in sorted(values.items()):
+        sources[f"{component}.{prop}"] = {
+            template.format(color) for template in templates[component][prop] for color in colors
+        }
+
+    return {
+        "classes": set().union(*sources.values()),
+        "sources": sources,
+        "colors": {f"{c}.{p}": sorted(v) for (c, p), v in sorted(values.items())},
+        "unresolved": unresolved,
+    }
+
+
+def render(classes: Set[str]) -> str:
+    lines = [
+        "/* Generated by DEV/SCRIPTS/build/tailwind_safelist.py - do not edit. */",
+        "/* Classes assembled at runtime from the registry and color props. */",
+    ]
+    for _, group in itertools.groupby(sorted(classes, key=_sort_key), key=lambda c: _sort_key(c)[0]):
+        lines.append(f'@source inline("{" ".join(group)}");')
+    return "\n".join(lines) + "\n"
+
+
+def _sort_key(cls: str) -> Tuple[str, str]:
+    utility = cls.rsplit(":", 1)[-1]
+    return utility.split("-", 1)[0], cls
+
+
+def read_safelist(path: Path) -> Set[str]:
+    if not path.exists():
+        return set()
+    text = path.read_text(encoding="utf-8")
+    return {cls for group in re.findall(r'@source inline\("([^"]*)"\)', text) for cls in group.split()}
+
+
+def estimate_css_bytes(classes: Set[str]) -> int:
+    """Rough minified CSS size for a set of color utilities.
+
+    One rule per class (selector + declaration), color-mix() fallbacks for
+    opacity modifiers, a media/hover wrapper per variant, and one theme
+    variable per distinct color. Good for comparing two safelists, not for
+    predicting the real stylesheet.
+    """
+    total = 0
+    variables = set()
+    for cls in classes:
+        *variants, utility = cls.split(":")
+        selector = "." + re.sub(r"([:/\[\].%])", r"\\\1", cls)
+        color = re.match(r"[a-z]+-((?:[a-z]+)-\d{2,3})(?:/(\d+))?$", utility)
+        if color:
+            variables.add(color.group(1))
+            rule = len(selector) + len("{color:var(--color-)}") + len(color.group(1)) + 12
+            if color.group(2):
+                rule *= 2
+                rule += len("@supports (color:color-mix(in lab, red, red)){}") + len("color-mix(in oklab,  0%,transparent)")
+        else:
+            rule = len(selector) + 30
+        total += rule + 30 * len(variants)
+    return total + 40 * len(variables)
+
+
+def tailwind_safelist(
+    registry_file: str = str(REGISTRY_FILE),
+    modules_dir: str = str(MODULES_DIR),
+    components_dir: str = str(COMPONENTS_DIR),
+    output_file: str = str(OUTPUT_FILE),
+    check: bool = False,
+) -> Dict[str, object]:
+    output = Path(output_file)
+    result = collect(Path(registry_file), Path(modules_dir), Path(components_dir))
+    classes = result["classes"]
+
+    current = read_safelist(output)
+    result["added"] = sorted(classes - current)
+    result["stale"] = sorted(current - classes)
+
+    content = render(classes)
+    result["changed"] = not output.exists() or output.read_text(encoding="utf-8") != content
+    if result["changed"] and not check:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(content, encoding="utf-8")
+
+    legacy = legacy_safelist()
+    result["legacy"] = legacy
+    result["legacy_bytes"] = estimate_css_bytes(legacy)
+    result["bytes"] = estimate_css_bytes(classes)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the exact Tailwind safelist for runtime-built classes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python tailwind_safelist.py
+  python tailwind_safelist.py --check
+  python tailwind_safelist.py --css ../../../dist/assets/index-abc.css
+        """,
+    )
+
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json")
+    parser.add_argument("--modules-dir", default=str(MODULES_DIR), help="Module directory")
+    parser.add_argument("--components-dir", default=str(COMPONENTS_DIR), help="Shared components")
+    parser.add_argument("--output", default=str(OUTPUT_FILE), help="Generated CSS file")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the safelist is stale")
+    parser.add_argument("--css", nargs="+", help="Built stylesheet(s) to measure")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List classes per source")
+
+    args = parser.parse_args()
+
+    try:
+        result = tailwind_safelist(args.registry, args.modules_dir, args.components_dir, args.output, args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    classes, legacy = result["classes"], result["legacy"]
+    print("\n" + "=" * 60)
+    print("🎨 TAILWIND SAFELIST")
+    print("=" * 60)
+    for source, source_classes in result["sources"].items():
+        print(f"{source:32} {len(source_classes):4} classes")
+    for key, colors in result["colors"].items():
+        print(f"   {key}: {', '.join(colors)}")
+    print("-" * 60)
+    unused, missed = legacy - classes, classes - legacy
+    print(f"Safelisted:          {len(classes)} classes (~{result['bytes'] / 1024:.1f} KiB CSS)")
+    print(f"Old pattern list:    {len(legacy)} classes (~{result['legacy_bytes'] / 1024:.1f} KiB CSS)")
+    print(f"   never used:       {len(unused)} (~{estimate_css_bytes(unused) / 1024:.1f} KiB saved)")
+    print(f"   needed, missing:  {len(missed)} (~{estimate_css_bytes(missed) / 1024:.1f} KiB)")
+    if args.css:
+        for css in args.css:
+            size = Path(css).stat().st_size
+            print(f"Built {Path(css).name}: {size / 1024:.1f} KiB")
+    print("=" * 60)
+
+    if args.verbose:
+        for source, source_classes in result["sources"].items():
+            print(f"\n{source}:")
+            print("   " + " ".join(sorted(source_classes)))
+
+    for site in result["unresolved"]:
+        print(f"   ⚠️  non-literal color, classes not safelisted: {site}")
+
+    if args.check:
+        for cls in result["stale"]:
+            print(f"   ⚠️  stale: {cls}")
+        for cls in result["added"]:
+            print(f"   ⚠️  missing: {cls}")
+        if result["changed"]:
+            print("\nRun: python tailwind_safelist.py")
+            return 1
+        print("✅ Up to date")
+        return 0
+
+    print(f"Added: {len(result['added'])}, removed stale: {len(result['stale'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
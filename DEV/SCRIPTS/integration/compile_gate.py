@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Compile-check a batch of Persona B responses before their files land in src/.
+
+Every module file from the batch is staged into a scratch tree inside the
+project, then checked with ONE compiler invocation (tsc --noEmit or esbuild).
+Diagnostics are mapped back to the response index and slug, and only the
+modules that compile are written to the output directory.
+
+Uses the locally installed node tooling (node_modules/.bin) - nothing is
+downloaded, so the gate works fully offline.
+
+Usage as a library:
+    from compile_gate import compile_gate
+
+    result = compile_gate(
+        xml_contents=xml_strings,
+        project_root="../../..",
+        output_dir="../../../src",
+        compiler="tsc",
+    )
+
+Usage as CLI:
+    python compile_gate.py --project-root ../../.. --output-dir ../../../src \\
+        response1.xml response2.xml response3.xml
+"""
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from extract_persona_b_output import (
+    clean_xml_string,
+    extract_files,
+    format_written,
+    parse_xml,
+    write_files,
+)
+
+DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# tsc --pretty false:  src/modules/x/index.tsx(12,5): error TS2304: Cannot find name 'y'.
+TSC_DIAGNOSTIC = re.compile(
+    r"^(?P<file>.+?)\((?P<line>\d+),(?P<column>\d+)\): "
+    r"(?P<severity>error|warning) (?P<code>TS\d+): (?P<message>.*)$",
+    re.MULTILINE,
+)
+
+# esbuild --color=false:
+#   ✘ [ERROR] Expected ";" but found "y"
+#
+#       src/modules/x/index.tsx:12:5:
+ESBUILD_DIAGNOSTIC = re.compile(
+    r"\[(?P<severity>ERROR|WARNING)\] (?P<message>[^\n]+)\n\s*\n\s+"
+    r"(?P<file>[^\n]+?):(?P<line>\d+):(?P<column>\d+):"
+)
+
+COMPILERS = ("tsc", "esbuild")
+
+
+def find_local_binary(name: str, project_root: Path) -> Optional[Path]:
+    """Locate a node binary installed in the project (never via npx download)."""
+    bin_dir = project_root / "node_modules" / ".bin"
+    for candidate in (name, f"{name}.cmd"):
+        path = bin_dir / candidate
+        if path.exists():
+            return path
+
+    found = shutil.which(name)
+    return Path(found) if found else None
+
+
+def src_relative(file_path: str) -> Path:
+    """Path of a response file relative to src/ (mirrors write_files)."""
+    path = Path(file_path)
+    if path.parts[0] == "src":
+        path = Path(*path.parts[1:])
+    return path
+
+
+def stage_batch(
+    xml_contents: List[str], scratch_dir: Path
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Write every module file in the batch into the scratch tree.
+
+    Returns:
+        (staged, modules) where staged maps a scratch-relative POSIX path to
+        its module record, and modules lists one record per response.
+    """
+    staged = {}
+    modules = []
+
+    for i, xml_content in enumerate(xml_contents, 1):
+        record = {"index": i, "slug": None, "files": [], "diagnostics": []}
+        modules.append(record)
+
+        root = parse_xml(clean_xml_string(xml_content))
+        if root is None:
+            record["status"] = "skipped"
+            record["reason"] = "XML could not be parsed"
+            continue
+
+        slug = root.find("slug")
+        record["slug"] = slug.text.strip() if slug is not None and slug.text else None
+
+        files = extract_files(root)
+        if not files:
+            record["status"] = "skipped"
+            record["reason"] = "No files found"
+            continue
+
+        record["files"] = files
+        for file_info in files:
+            rel = (Path("src") / src_relative(file_info["path"])).as_posix()
+
+            if rel in staged:
+                # Only the last copy gets compiled, so neither response passes
+                other = staged[rel]
+                record["diagnostics"].append(
+                    {"file": rel, "severity": "error", "message": f"Path also written by response {other['index']}"}
+                )
+                if other is not record:
+                    other["diagnostics"].append(
+                        {"file": rel, "severity": "error", "message": f"Path also written by response {i}"}
+                    )
+
+            staged[rel] = record
+            full_path = scratch_dir / rel
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_text(file_info["content"], encoding="utf-8")
+
+    return staged, modules
+
+
+def write_scratch_tsconfig(scratch_dir: Path, project_root: Path, staged: List[str]) -> Path:
+    """Write a tsconfig that checks only the staged files against the project.
+
+    `paths` and `rootDirs` let staged files resolve both alias imports
+    (@/components/...) and relative imports into the real src/ tree.
+    """
+    project_rel = Path("..") if scratch_dir.parent == project_root else project_root
+    project_rel = project_rel.as_posix()
+
+    tsconfig = {
+        "extends": f"{project_rel}/tsconfig.json",
+        "compilerOptions": {
+            "noEmit": True,
+            "baseUrl": ".",
+            "rootDirs": [".", project_rel],
+            "paths": {
+                "@/*": ["./src/*", f"{project_rel}/src/*"],
+                "@modules/*": ["./src/modules/*", f"{project_rel}/src/modules/*"],
+            },
+        },
+        "include": staged,
+    }
+
+    path = scratch_dir / "tsconfig.json"
+    path.write_text(json.dumps(tsconfig, indent=2), encoding="utf-8")
+    return path
+
+
+def run_compiler(
+    compiler: str, scratch_dir: Path, project_root: Path, staged: List[str]
+) -> Tuple[int, str]:
+    """Run a single compiler invocation over every staged file."""
+    binary = find_local_binary(compiler, project_root)
+    if binary is None:
+        raise FileNotFoundError(
+            f"{compiler} not found in {project_root / 'node_modules' / '.bin'} or PATH "
+            f"(run `npm install` once; the gate never downloads tooling)"
+        )
+
+    if compiler == "tsc":
+        write_scratch_tsconfig(scratch_dir, project_root, staged)
+        cmd = [str(binary), "--noEmit", "--pretty", "false", "-p", "tsconfig.json"]
+    else:
+        cmd = [
+            str(binary),
+            *staged,
+            "--outdir=.out",
+            "--log-limit=0",
+            "--color=false",
+        ]
+
+    proc = subprocess.run(
+        cmd,
+        cwd=scratch_dir,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    return proc.returncode, proc.stdout + proc.stderr
+
+
+def parse_diagnostics(compiler: str, output: str) -> List[Dict[str, Any]]:
+    """Turn raw compiler output into diagnostic dicts."""
+    pattern = TSC_DIAGNOSTIC if compiler == "tsc" else ESBUILD_DIAGNOSTIC
+
+    diagnostics = []
+    for match in pattern.finditer(output):
+        diagnostics.append(
+            {
+                "file": match.group("file").strip().replace("\\", "/"),
+                "line": int(match.group("line")),
+                "column": int(match.group("column")),
+                "severity": match.group("severity").lower(),
+                "code": match.groupdict().get("code"),
+                "message": match.group("message").strip(),
+            }
+        )
+    return diagnostics
+
+
+def compile_gate(
+    xml_contents: List[str],
+    project_root: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    compiler: str = "tsc",
+    dry_run: bool = False,
+    keep_scratch: bool = False,
+) -> Dict[str, Any]:
+    """Compile-check a batch of responses and write only the modules that pass.
+
+    Args:
+        xml_contents: List of Persona B XML strings (raw or cleaned)
+        project_root: Project root containing tsconfig.json and node_modules
+        output_dir: Where passing modules are written (default: <project_root>/src)
+        compiler: "tsc" (type check) or "esbuild" (syntax check only)
+        dry_run: Check the batch but don't write any files
+        keep_scratch: Leave the scratch tree on disk for inspection
+
+    Returns:
+        Dict containing operation results
+    """
+    if compiler not in COMPILERS:
+        raise ValueError(f"compiler must be one of {COMPILERS}, got {compiler!r}")
+
+    project_root = Path(project_root) if project_root else DEFAULT_PROJECT_ROOT
+    project_root = project_root.resolve()
+    output_dir = Path(output_dir) if output_dir else project_root / "src"
+
+    result = {
+        "success": False,
+        "total_modules": len(xml_contents),
+        "committed": 0,
+        "failed": 0,
+        "skipped": 0,
+        "files_written": 0,
+        "written_files": [],
+        "unattributed": [],
+        "errors": [],
+        "modules": [],
+    }
+
+    # Scratch tree lives inside the project so node resolution finds node_modules
+    scratch_dir = Path(tempfile.mkdtemp(prefix=".compile-gate-", dir=project_root))
+
+    try:
+        print(f"📦 Staging {len(xml_contents)} responses in {scratch_dir.name}...")
+        staged, modules = stage_batch(xml_contents, scratch_dir)
+        result["modules"] = modules
+
+        staged_paths = sorted(staged)
+        if not staged_paths:
+            print("⚠️  Nothing to compile")
+            result["skipped"] = len(modules)
+            result["success"] = True
+            return result
+
+        print(f"🔍 Running {compiler} once over {len(staged_paths)} files...")
+        returncode, output = run_compiler(compiler, scratch_dir, project_root, staged_paths)
+
+        diagnostics = parse_diagnostics(compiler, output)
+        for diagnostic in diagnostics:
+            record = staged.get(diagnostic["file"])
+            if record is None:
+                # e.g. an error surfaced in a shared component the module imports
+                result["unattributed"].append(diagnostic)
+            else:
+                record["diagnostics"].append(diagnostic)
+
+        if returncode != 0 and not diagnostics:
+            result["errors"].append(f"{compiler} exited {returncode}: {output.strip()[:500]}")
+            return result
+
+        print("=" * 60)
+        for record in modules:
+            label = f"[{record['index']}/{len(modules)}] {record['slug'] or '?'}"
+
+            if record.get("status") == "skipped":
+                result["skipped"] += 1
+                print(f"{label} ⏭️  Skipped - {record['reason']}")
+                continue
+
+            errors = [d for d in record["diagnostics"] if d.get("severity", "error") == "error"]
+            if errors:
+                record["status"] = "failed"
+                result["failed"] += 1
+                print(f"{label} ❌ {len(errors)} error(s)")
+                for d in errors[:5]:
+                    where = f"{d['file']}:{d['line']}:{d['column']}" if "line" in d else d["file"]
+                    print(f"      {where} {d.get('code') or ''} {d['message']}")
+                continue
+
+            record["status"] = "committed"
+            result["committed"] += 1
+            if not dry_run:
+                result["files_written"] += write_files(
+                    record["files"], output_dir, written=result["written_files"]
+                )
+            print(f"{label} ✅ compiles")
+        print("=" * 60)
+
+        result["success"] = True
+
+    except Exception as e:
+        result["errors"].append(str(e))
+        print(f"❌ {e}")
+
+    finally:
+        if keep_scratch:
+            print(f"🗂️  Scratch tree kept at {scratch_dir}")
+        else:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile-check a batch of Persona B responses before writing them",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example:
+  python compile_gate.py \\
+      --project-root ../../.. \\
+      --output-dir ../../../src \\
+      --compiler tsc \\
+      module1.xml module2.xml module3.xml
+        """,
+    )
+
+    parser.add_argument("xml_files", nargs="+", help="XML files containing Persona B output")
+
+    parser.add_argument(
+        "--project-root",
+        default=str(DEFAULT_PROJECT_ROOT),
+        help="Project root with tsconfig.json and node_modules",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Where modules that compile are written (default: <project-root>/src)",
+    )
+
+    parser.add_argument(
+        "--compiler",
+        choices=COMPILERS,
+        default="tsc",
+        help="tsc for a full type check, esbuild for a fast syntax check (default: tsc)",
+    )
+
+    parser.add_argument("--dry-run", action="store_true", help="Check only, write nothing")
+
+    parser.add_argument(
+        "--keep-scratch", action="store_true", help="Keep the scratch tree for inspection"
+    )
+
+    parser.add_argument(
+        "--format",
+        action="store_true",
+        help="Run Prettier once over the files written (instead of npm run format)",
+    )
+
+    args = parser.parse_args()
+
+    xml_contents = []
+    for xml_file in args.xml_files:
+        try:
+            xml_contents.append(Path(xml_file).read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"❌ Error reading {xml_file}: {e}")
+            return 1
+
+    result = compile_gate(
+        xml_contents=xml_contents,
+        project_root=args.project_root,
+        output_dir=args.output_dir,
+        compiler=args.compiler,
+        dry_run=args.dry_run,
+        keep_scratch=args.keep_scratch,
+    )
+
+    print("\n" + "=" * 60)
+    print("📊 COMPILE GATE SUMMARY")
+    print("=" * 60)
+    print(f"Total XML inputs:   {result['total_modules']}")
+    print(f"Committed:          {result['committed']}")
+    print(f"Failed to compile:  {result['failed']}")
+    print(f"Skipped:            {result['skipped']}")
+    print(f"Unattributed diags: {len(result['unattributed'])}")
+    print("=" * 60)
+
+    if result["errors"]:
+        print("\n❌ Errors:")
+        for error in result["errors"]:
+            print(f"   - {error}")
+
+    if args.format and result["written_files"]:
+        if not format_written(result["written_files"]):
+            return 1
+
+    return 0 if result["success"] and result["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
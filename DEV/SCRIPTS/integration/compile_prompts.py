@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Compile persona templates + concept lists into a batch of generation requests.
+
+The persona templates and the concept lists used to be combined by hand, one
+prompt at a time. This compiler:
+
+1. Parses each template ONCE into a compiled form: literal segments split
+   around its input slot ([MAPPING_JSON], [NARRATIVE_XML] or
+   NARRATIVE_XML_PLACEHOLDER)
+2. Streams concepts from one or more concept files (V3.0 01.json/02.json,
+   REACT_CONCEPTS.json, react-fiction-mappings.json), filtered by tier
+3. Skips concepts that moduleRegistry.json already covers
+4. Renders one request per concept and writes it to requests.jsonl
+   immediately - only the current prompt is ever in memory
+5. Drops requests whose (system, prompt) hash was already written
+
+Each line is self-contained so a whole tier can go out as one batch job:
+
+    {"custom_id": "v3-components-1a2b3c", "prompt_hash": "...",
+     "concept": "Components", "tier": "Core Fundamentals",
+     "template": "v3", "system": "...", "prompt": "..."}
+
+Usage:
+    # Every uncovered V3.0 concept -> ../../../requests.jsonl
+    python compile_prompts.py
+
+    # One tier of REACT_CONCEPTS.json through the Persona A template
+    python compile_prompts.py --template a --concepts ../../REACT_CONCEPTS.json \\
+        --tier advanced --output advanced.jsonl
+
+    # Persona B with narratives from a directory (<slug>.xml per concept)
+    python compile_prompts.py --template b --narratives ./narratives --append
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "analysis"))
+from build_catalog import normalize_concept  # noqa: E402
+from concept_catalog import link_registry  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEV_DIR = PROJECT_ROOT / "DEV"
+PERSONAS_DIR = DEV_DIR / "DOCS" / "personas"
+V3_DIR = DEV_DIR / "PROMPTS" / "PERSONA" / "V3.0_PERSONAS"
+REGISTRY_FILE = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+DEFAULT_OUTPUT = PROJECT_ROOT / "requests.jsonl"
+
+TEMPLATES = {
+    "v3": {"template": V3_DIR / "PROMPT_TEMPLATE.md", "system": V3_DIR / "SYSTEM_PROMPT.md"},
+    "a": {
+        "template": PERSONAS_DIR / "A_PROMPT_TEMPLATE_UPDATED.md",
+        "system": PERSONAS_DIR / "Persona_A_SYSTEM_PROMPT_UPDATED.md",
+    },
+    "b": {
+        "template": PERSONAS_DIR / "B_PROMPT_TEMPLATE_UPDATED.md",
+        "system": PERSONAS_DIR / "Persona_B_SYSTEM_PROMPT_UPDATED.md",
+        # Persona B turns a Persona A narrative into code; the concept JSON
+        # is no substitute, so concepts without a narrative are skipped
+        "requires_narrative": True,
+    },
+}
+
+SLOT_PATTERN = re.compile(r"\[(MAPPING_JSON|NARRATIVE_XML)\]|(NARRATIVE_XML)_PLACEHOLDER")
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class CompiledTemplate:
+    """A prompt template split into literal segments and input slots."""
+
+    def __init__(self, name: str, template_text: str, system: str, requires_narrative: bool = False):
+        self.name = name
+        self.system = system
+        self.requires_narrative = requires_narrative
+        self.segments: List[str] = []
+        self.slots: List[str] = []
+
+        position = 0
+        for match in SLOT_PATTERN.finditer(template_text):
+            self.segments.append(template_text[position : match.start()])
+            self.slots.append(match.group(1) or match.group(2))
+            position = match.end()
+        self.segments.append(template_text[position:])
+
+        if not self.slots:
+            raise ValueError(f"Template '{name}' has no input slot")
+
+    @classmethod
+    def load(cls, name: str) -> "CompiledTemplate":
+        if name not in TEMPLATES:
+            raise ValueError(f"Unknown template '{name}' (choose from {', '.join(TEMPLATES)})")
+        paths = TEMPLATES[name]
+        return cls(
+            name,
+            paths["template"].read_text(encoding="utf-8"),
+            paths["system"].read_text(encoding="utf-8").strip(),
+            paths.get("requires_narrative", False),
+        )
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = [self.segments[0]]
+        for slot, segment in zip(self.slots, self.segments[1:]):
+            parts.append(values[slot])
+            parts.append(segment)
+        return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Concept sources
+# ---------------------------------------------------------------------------
+
+
+def iter_concepts(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield {name, tier, data} from any of the known concept file shapes."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+
+    if isinstance(data, dict) and "reactConcepts" in data:
+        for tier, concepts in data["reactConcepts"].items():
+            for concept in concepts:
+                yield {"name": concept["name"], "tier": tier, "data": concept}
+        return
+
+    if isinstance(data, list):
+        for concept in data:
+            name = concept.get("name") or concept.get("concept")
+            if name:
+                yield {"name": name, "tier": concept.get("phase", "unassigned"), "data": concept}
+        return
+
+    raise ValueError(f"{path}: unrecognized concept file format")
+
+
+class RegistryCoverage:
+    """Decide whether moduleRegistry.json already has a module for a concept.
+
+    Uses the same registry -> concept linking as concept_catalog.py.
+    """
+
+    def __init__(self, registry_path: Optional[Path], concept_files: List[Path]):
+        self.matched: Set[str] = set()
+
+        if registry_path is None or not registry_path.exists():
+            return
+
+        # Names only - the full concept records are streamed later
+        names: Dict[str, Set[str]] = {}
+        for path in concept_files:
+            for concept in iter_concepts(path):
+                names.setdefault(normalize_concept(concept["name"]), set()).add(concept["name"])
+        registry = json.loads(registry_path.read_text(encoding="utf-8"))
+        self.matched = set(link_registry(names, registry, preferred=names).values())
+
+    def covers(self, name: str) -> bool:
+        return normalize_concept(name) in self.matched
+
+
+def narrative_for(concept: Dict[str, Any], narratives_dir: Optional[Path]) -> Optional[str]:
+    if narratives_dir is None:
+        return None
+    for stem in (slugify(concept["name"]), str(concept["data"].get("id", ""))):
+        candidate = narratives_dir / f"{stem}.xml"
+        if stem and candidate.exists():
+            return candidate.read_text(encoding="utf-8").strip()
+    return None
+
+
+def existing_hashes(path: Path) -> Set[str]:
+    """prompt_hash of every request already in an output file."""
+    hashes = set()
+    if not path.exists():
+        return hashes
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                hashes.add(json.loads(line).get("prompt_hash"))
+    return hashes
+
+
+# ---------------------------------------------------------------------------
+# Compile
+# ---------------------------------------------------------------------------
+
+
+def write_requests(
+    out: TextIO,
+    template: CompiledTemplate,
+    concept_files: List[Path],
+    tiers: Optional[Set[str]],
+    coverage: Optional[RegistryCoverage],
+    narratives_dir: Optional[Path],
+    seen: Set[str],
+) -> Dict[str, Any]:
+    stats = {"written": 0, "covered": [], "no_narrative": [], "duplicates": 0, "filtered": 0}
+
+    for path in concept_files:
+        for concept in iter_concepts(path):
+            if tiers and concept["tier"].lower() not in tiers:
+                stats["filtered"] += 1
+                continue
+            if coverage is not None and coverage.covers(concept["name"]):
+                stats["covered"].append(concept["name"])
+                continue
+
+            mapping = json.dumps(concept["data"], indent=2, ensure_ascii=False)
+            narrative = narrative_for(concept, narratives_dir)
+            if narrative is None and template.requires_narrative:
+                stats["no_narrative"].append(concept["name"])
+                continue
+            prompt = template.render({"MAPPING_JSON": mapping, "NARRATIVE_XML": narrative or mapping})
+
+            digest = hashlib.sha256(f"{template.system}\0{prompt}".encode("utf-8")).hexdigest()[:16]
+            if digest in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(digest)
+
+            request = {
+                "custom_id": f"{template.name}-{slugify(concept['name'])[:48]}-{digest[:6]}",
+                "prompt_hash": digest,
+                "concept": concept["name"],
+                "tier": concept["tier"],
+                "template": template.name,
+                "system": template.system,
+                "prompt": prompt,
+            }
+            out.write(json.dumps(request, ensure_ascii=False) + "\n")
+            stats["written"] += 1
+
+    return stats
+
+
+def check_narratives(template: CompiledTemplate, stats: Dict[str, Any]):
+    """A narrative template that found no narrative at all is a setup error."""
+    if template.requires_narrative and stats["no_narrative"] and not stats["written"] and not stats["duplicates"]:
+        raise ValueError(
+            f"No narratives found for {len(stats['no_narrative'])} concept(s) - "
+            "expected <concept-slug>.xml or <id>.xml in --narratives"
+        )
+
+
+def compile_prompts(
+    template_name: str = "v3",
+    concept_files: Optional[List[str]] = None,
+    output_path: Optional[str] = None,
+    tiers: Optional[List[str]] = None,
+    registry_path: Optional[str] = None,
+    skip_registered: bool = True,
+    narratives_dir: Optional[str] = None,
+    append: bool = False,
+) -> Dict[str, Any]:
+    """Stream one request per uncovered concept into a JSONL file.
+
+    Without append the file is written to a temp file and swapped in at the
+    end, so an interrupted run never leaves a half-written batch behind.
+
+    Templates that require a narrative (Persona B) skip concepts without a
+    <slug>.xml in narratives_dir, and raise ValueError if none has one.
+
+    Returns:
+        Dict with written, covered, no_narrative, duplicates and filtered counts
+    """
+    template = CompiledTemplate.load(template_name)
+    files = [Path(p) for p in concept_files] if concept_files else [V3_DIR / "01.json"]
+    output = Path(output_path) if output_path else DEFAULT_OUTPUT
+    registry = Path(registry_path) if registry_path else REGISTRY_FILE
+    coverage = RegistryCoverage(registry, files) if skip_registered else None
+    tier_filter = {t.lower() for t in tiers} if tiers else None
+    narratives = Path(narratives_dir) if narratives_dir else None
+    if template.requires_narrative and (narratives is None or not narratives.is_dir()):
+        raise ValueError(f"Template '{template_name}' needs --narratives (a directory of <concept-slug>.xml)")
+
+    if append:
+        seen = existing_hashes(output)
+        with open(output, "a", encoding="utf-8") as out:
+            stats = write_requests(out, template, files, tier_filter, coverage, narratives, seen)
+        check_narratives(template, stats)
+        return stats
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{output.name}.", suffix=".tmp", dir=output.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            stats = write_requests(out, template, files, tier_filter, coverage, narratives, set())
+        check_narratives(template, stats)
+        os.replace(tmp_name, output)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile persona templates and concept lists into requests.jsonl",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python compile_prompts.py
+  python compile_prompts.py --template a --concepts ../../REACT_CONCEPTS.json --tier advanced
+  python compile_prompts.py --template b --narratives ./narratives --append
+        """,
+    )
+
+    parser.add_argument("--template", default="v3", choices=sorted(TEMPLATES), help="Persona template (default: v3)")
+    parser.add_argument("--concepts", nargs="+", help="Concept JSON files (default: V3.0_PERSONAS/01.json)")
+    parser.add_argument("--tier", action="append", help="Only these tiers/phases (repeatable)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Output JSONL (default: repo root requests.jsonl)")
+    parser.add_argument("--registry", default=str(REGISTRY_FILE), help="moduleRegistry.json used to skip covered concepts")
+    parser.add_argument("--include-registered", action="store_true", help="Don't skip concepts the registry covers")
+    parser.add_argument("--narratives", help="Directory of <concept-slug>.xml narratives for the NARRATIVE_XML slot")
+    parser.add_argument("--append", action="store_true", help="Append, skipping prompts already in the output")
+
+    args = parser.parse_args()
+
+    try:
+        stats = compile_prompts(
+            template_name=args.template,
+            concept_files=args.concepts,
+            output_path=args.output,
+            tiers=args.tier,
+            registry_path=args.registry,
+            skip_registered=not args.include_registered,
+            narratives_dir=args.narratives,
+            append=args.append,
+        )
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("📝 PROMPT COMPILATION SUMMARY")
+    print("=" * 60)
+    print(f"Requests written:     {stats['written']}")
+    print(f"Already in registry:  {len(stats['covered'])}")
+    print(f"No narrative:         {len(stats['no_narrative'])}")
+    print(f"Duplicate prompts:    {stats['duplicates']}")
+    print(f"Filtered by tier:     {stats['filtered']}")
+    print(f"Output:               {args.output}")
+    print("=" * 60)
+
+    for name in stats["covered"]:
+        print(f"   ⏭️  {name}")
+    for name in stats["no_narrative"]:
+        print(f"   📭 {name} (no narrative)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,11 +16,40 @@ Usage:
 import sys
 import argparse
 import html
+import re
 
 from pathlib import Path
 from typing import Optional, Dict, Any
 import xml.etree.ElementTree as ET
 
+from response_archive import ResponseArchive, is_archive
+from response_stats import StatsDB, measure_response, stats_path_for
+
+
+def clean_xml_string(s: str) -> str:
+    """Clean XML string by removing markdown fences and extracting XML content."""
+    s = s.strip()
+
+    # Remove markdown code fences with language identifier
+    s = re.sub(r"^```xml\s*\n", "", s, flags=re.MULTILINE)
+    s = re.sub(r"^```\s*\n", "", s, flags=re.MULTILINE)
+    s = re.sub(r"\n```\s*$", "", s, flags=re.MULTILINE)
+
+    # Remove any remaining ``` markers
+    s = s.strip("`").strip()
+
+    # Find the actual XML start if there's junk before it
+    xml_start = s.find("<?xml")
+    if xml_start > 0:
+        s = s[xml_start:]
+
+    # Find the XML end if there's junk after it
+    xml_end = s.find("</module>")
+    if xml_end > 0:
+        s = s[: xml_end + len("</module>")]
+
+    return s.strip()
+
 
 def parse_xml(xml_content):
     """Parse XML string and return root element with automatic error recovery."""
@@ -151,9 +180,15 @@ def extract_integration(root: ET.Element) -> dict:
     return integration
 
 
-def write_files(files: list[dict], output_dir: Path, dry_run: bool = False) -> int:
+def write_files(
+    files: list[dict], output_dir: Path, dry_run: bool = False, written: Optional[list] = None
+) -> int:
     """Write extracted files to filesystem.
 
+    Args:
+        written: If given, the path of every file written is appended to it
+            (for format_changed.py)
+
     Returns:
         Number of files written
     """
@@ -177,6 +212,8 @@ def write_files(files: list[dict], output_dir: Path, dry_run: bool = False) -> i
         # Write file
         full_path.write_text(file_info["content"], encoding="utf-8")
         print(f"✅ Written: {full_path}")
+        if written is not None:
+            written.append(str(full_path))
         count += 1
 
     return count
@@ -256,6 +293,9 @@ def main(
     dry_run: bool = False,
     save_snippets: bool = False,
     save_plan: bool = False,
+    stats_db: Optional[StatsDB] = None,
+    stats_source: Optional[str] = None,
+    stats_row: Optional[int] = None,
     **kwargs,
 ) -> Dict[str, Any]:
     """Extract code from Persona B XML output.
@@ -267,15 +307,22 @@ def main(
         dry_run: Show what would be extracted without writing files
         save_snippets: Save integration snippets to separate files
         save_plan: Save implementation plan to PLAN.md
+        stats_db: Record the response's sizes here (response_stats.py),
+            parsed or not
+        stats_source: Archive or file the response came from, for stats_db
+        stats_row: Record number within stats_source
         **kwargs: Additional arguments for future extensibility
 
     Returns:
         Dict containing:
             - success (bool): Whether extraction succeeded
             - files_written (int): Number of files written
+            - written_files (list): Paths of the module files written, to
+              format in one batch with format_changed.py
             - output_dir (Path): Where files were written
             - module_info (dict): Extracted module information
             - errors (list): Any errors encountered
+            - stats (dict): Response sizes, when stats_db is given
 
     Raises:
         FileNotFoundError: If path=True and input_file doesn't exist
@@ -303,6 +350,7 @@ def main(
     result = {
         "success": False,
         "files_written": 0,
+        "written_files": [],
         "output_dir": Path(output_dir),
         "module_info": {},
         "errors": [],
@@ -326,6 +374,8 @@ def main(
 
         # Parse XML
         root = parse_xml(xml_content)
+        if root is None and stats_db is not None:
+            stats_db.record(measure_response(xml_content), source=stats_source, row=stats_row)
 
         # Extract components
         module_info = extract_module_info(root)
@@ -333,6 +383,10 @@ def main(
         files = extract_files(root)
         integration = extract_integration(root)
 
+        if stats_db is not None:
+            result["stats"] = measure_response(xml_content, module_info, plan, files)
+            stats_db.record(result["stats"], source=stats_source, row=stats_row)
+
         result["module_info"] = module_info
         result["files"] = files
         result["integration"] = integration
@@ -349,7 +403,9 @@ def main(
         output_dir_path = Path(output_dir)
 
         # Write files
-        files_written = write_files(files, output_dir_path, dry_run=dry_run)
+        files_written = write_files(
+            files, output_dir_path, dry_run=dry_run, written=result["written_files"]
+        )
         result["files_written"] += files_written
 
         # Write integration snippets if requested
@@ -396,6 +452,18 @@ def main(
     return result
 
 
+def format_written(paths: list) -> bool:
+    """Format the files this run wrote in one Prettier invocation."""
+    from format_changed import format_changed, print_format_summary
+
+    try:
+        print_format_summary(format_changed(paths))
+    except (OSError, RuntimeError) as e:
+        print(f"❌ Formatting failed: {e}")
+        return False
+    return True
+
+
 def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
     """Parse command-line arguments.
 
@@ -422,7 +490,16 @@ Examples:
     )
 
     parser.add_argument(
-        "input_file", type=str, help="Path to XML file containing Persona B output"
+        "input_file",
+        type=str,
+        help="Path to XML file (or .crpa response archive) containing Persona B output",
+    )
+
+    parser.add_argument(
+        "--slug",
+        type=str,
+        default=None,
+        help="With an archive: only extract this module (default: every record)",
     )
 
     parser.add_argument(
@@ -448,6 +525,22 @@ Examples:
         "--save-plan", action="store_true", help="Save implementation plan to PLAN.md"
     )
 
+    parser.add_argument(
+        "--stats-db",
+        type=str,
+        nargs="?",
+        const="",
+        default=None,
+        help="Record response sizes (response_stats.py) in this database "
+        "(no path: <archive>.stats.sqlite, or responses.stats.sqlite beside XML files)",
+    )
+
+    parser.add_argument(
+        "--format",
+        action="store_true",
+        help="Run Prettier once over the files written (instead of npm run format)",
+    )
+
     return parser.parse_args(argv)
 
 
@@ -461,6 +554,52 @@ def cli_main(argv: Optional[list] = None) -> int:
         Exit code (0 for success, 1 for failure)
     """
     args = parse_args(argv)
+    stats_db = None
+    if args.stats_db is not None:
+        stats_db = StatsDB(args.stats_db or stats_path_for(args.input_file))
+
+    try:
+        return _run(args, stats_db)
+    finally:
+        if stats_db is not None:
+            stats_db.close()
+            print(f"📏 Response sizes recorded in {stats_db.path}")
+
+
+def _run(args: argparse.Namespace, stats_db: Optional[StatsDB]) -> int:
+    if is_archive(args.input_file):
+        with ResponseArchive(args.input_file) as archive:
+            if args.slug:
+                try:
+                    xml_content = archive.get_by_slug(args.slug)
+                    # get_by_slug returns the last record with that slug
+                    row = len(archive) - 1 - archive.slugs[::-1].index(args.slug)
+                except (KeyError, ValueError):
+                    print(f"❌ No record with slug {args.slug!r} in {args.input_file}")
+                    return 1
+                records = [(row, xml_content)]
+            else:
+                records = enumerate(archive)
+
+            ok = True
+            written = []
+            for row, xml_content in records:
+                result = main(
+                    input_file=clean_xml_string(xml_content),
+                    output_dir=args.output_dir,
+                    path=False,
+                    dry_run=args.dry_run,
+                    save_snippets=args.save_snippets,
+                    save_plan=args.save_plan,
+                    stats_db=stats_db,
+                    stats_source=args.input_file,
+                    stats_row=row,
+                )
+                ok = ok and result["success"]
+                written.extend(result["written_files"])
+        if args.format and not args.dry_run:
+            ok = format_written(written) and ok
+        return 0 if ok else 1
 
     result = main(
         input_file=args.input_file,
@@ -469,8 +608,14 @@ def cli_main(argv: Optional[list] = None) -> int:
         dry_run=args.dry_run,
         save_snippets=args.save_snippets,
         save_plan=args.save_plan,
+        stats_db=stats_db,
+        stats_source=args.input_file,
     )
 
+    if args.format and not args.dry_run and result["success"]:
+        if not format_written(result["written_files"]):
+            return 1
+
     return 0 if result["success"] else 1
 
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Format only the files an ingest wrote, with one Prettier run.
+
+`npm run format` rewrites every file under src/ - about 19k lines of
+modules - when an ingest added one or two. The extraction and integration
+tools now return the exact paths they wrote (`written_files`), and this
+script formats just those:
+
+- Files Prettier doesn't handle are dropped.
+- Files whose content hash matches the hash recorded the last time they
+  were formatted are skipped (cache in ./.cache/format.json, keyed by the
+  Prettier version and .prettierrc, so a config change invalidates it).
+- Everything left is passed to ONE `prettier --write` invocation using the
+  project's local binary (node_modules/.bin), so Node and the Tailwind
+  plugin load once rather than once per file.
+
+Formatting cost scales with the ingest, not with the repo.
+
+Usage as a library:
+    from format_changed import format_changed
+
+    result = format_changed(extract_result["written_files"])
+
+Usage as CLI:
+    python format_changed.py ../../../src/modules/foo/index.tsx ...
+    python format_changed.py --check $(git diff --name-only)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from compile_gate import DEFAULT_PROJECT_ROOT, find_local_binary
+
+CACHE_FILE = Path(__file__).resolve().parent / ".cache" / "format.json"
+
+# Same extensions as the `format` script in package.json
+PRETTIER_SUFFIXES = {".ts", ".tsx", ".json", ".css", ".md"}
+
+# Keep each command line well under Windows' 32k character limit
+MAX_ARGS_CHARS = 24000
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def config_fingerprint(project_root: Path) -> str:
+    """Prettier version + config: formatted hashes are only valid for the same pair."""
+    parts = []
+    for path in (project_root / "node_modules" / "prettier" / "package.json", project_root / ".prettierrc"):
+        parts.append(path.read_bytes() if path.exists() else b"")
+    return _sha(b"\0".join(parts))[:16]
+
+
+def load_cache(cache_file: Path, fingerprint: str) -> Dict[str, str]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("fingerprint") == fingerprint else {}
+
+
+def save_cache(cache_file: Path, fingerprint: str, files: Dict[str, str]):
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"fingerprint": fingerprint, "files": files}, indent=1), encoding="utf-8")
+    os.replace(tmp, cache_file)
+
+
+def _batches(paths: List[str]) -> Iterable[List[str]]:
+    batch, size = [], 0
+    for path in paths:
+        if batch and size + len(path) > MAX_ARGS_CHARS:
+            yield batch
+            batch, size = [], 0
+        batch.append(path)
+        size += len(path) + 1
+    if batch:
+        yield batch
+
+
+def format_changed(
+    paths: Iterable[str],
+    project_root: Optional[str] = None,
+    cache_file: str = str(CACHE_FILE),
+    check: bool = False,
+) -> Dict[str, Any]:
+    """Run Prettier over the given files, skipping ones already formatted.
+
+    Args:
+        paths: Files written by an ingest (e.g. a result's `written_files`)
+        project_root: Project with node_modules/.bin/prettier and .prettierrc
+        cache_file: JSON of path -> content hash after the last format
+        check: Report files that need formatting without writing them
+
+    Returns:
+        Dict with formatted / unchanged / skipped / unsupported path lists
+    """
+    root = Path(project_root).resolve() if project_root else DEFAULT_PROJECT_ROOT
+    cache_path = Path(cache_file)
+    fingerprint = config_fingerprint(root)
+    cache = load_cache(cache_path, fingerprint)
+
+    result = {"formatted": [], "unchanged": [], "skipped": [], "unsupported": [], "missing": []}
+    targets: Dict[str, bytes] = {}
+    for raw in dict.fromkeys(str(Path(p).resolve()) for p in paths):
+        path = Path(raw)
+        if path.suffix.lower() not in PRETTIER_SUFFIXES:
+            result["unsupported"].append(raw)
+        elif not path.exists():
+            result["missing"].append(raw)
+        else:
+            data = path.read_bytes()
+            if cache.get(raw) == _sha(data):
+                result["skipped"].append(raw)
+            else:
+                targets[raw] = data
+
+    if targets:
+        binary = find_local_binary("prettier", root)
+        if binary is None:
+            raise FileNotFoundError(
+                f"prettier not found in {root / 'node_modules' / '.bin'} or PATH (run `npm install` once)"
+            )
+
+        mode = "--list-different" if check else "--write"
+        listed = set()
+        for batch in _batches(sorted(targets)):
+            proc = subprocess.run(
+                [str(binary), mode, "--log-level", "warn", *batch],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            # --list-different exits 1 when it lists files; 2 is a real error
+            if proc.returncode not in (0, 1) or (proc.returncode == 1 and not check):
+                raise RuntimeError(f"prettier exited {proc.returncode}: {proc.stderr.strip()[:500]}")
+            listed.update(str((root / line.strip()).resolve()) for line in proc.stdout.splitlines() if line.strip())
+
+        for raw, before in targets.items():
+            if check:
+                (result["formatted"] if raw in listed else result["unchanged"]).append(raw)
+                if raw not in listed:
+                    cache[raw] = _sha(before)
+                continue
+            after = Path(raw).read_bytes()
+            (result["formatted"] if after != before else result["unchanged"]).append(raw)
+            cache[raw] = _sha(after)
+
+        save_cache(cache_path, fingerprint, cache)
+
+    return result
+
+
+def print_format_summary(result: Dict[str, Any], check: bool = False):
+    print("\n" + "=" * 60)
+    print("🖌️  PRETTIER")
+    print("=" * 60)
+    print(f"{'Need formatting' if check else 'Formatted'}:  {len(result['formatted'])}")
+    print(f"Already formatted: {len(result['unchanged'])}")
+    print(f"Cached (skipped):  {len(result['skipped'])}")
+    print(f"Not Prettier:      {len(result['unsupported'])}")
+    print("=" * 60)
+    for path in result["formatted"]:
+        print(f"   {'⚠️ ' if check else '🖌️ '} {path}")
+    for path in result["missing"]:
+        print(f"   ⚠️  not found: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Format only the given files with one Prettier run",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python format_changed.py ../../../src/modules/foo/index.tsx
+  python format_changed.py --check $(git diff --name-only)
+        """,
+    )
+
+    parser.add_argument("files", nargs="+", help="Files to format")
+    parser.add_argument(
+        "--project-root", default=str(DEFAULT_PROJECT_ROOT), help="Project with node_modules and .prettierrc"
+    )
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any file needs formatting")
+
+    args = parser.parse_args()
+
+    try:
+        result = format_changed(args.files, args.project_root, check=args.check)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_format_summary(result, check=args.check)
+    if args.check and result["formatted"]:
+        print("\nRun: python format_changed.py <files>")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
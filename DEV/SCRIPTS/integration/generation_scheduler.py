@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Dispatch requests.jsonl to a generation endpoint, validating as responses land.
+
+Generation used to happen outside the repo, and broken responses (modules
+7, 9 and 26 in diagnose_failed_xml.py) were found and re-run by hand. The
+scheduler:
+
+1. Streams requests from requests.jsonl (see compile_prompts.py)
+2. Dispatches them with bounded concurrency, behind token buckets for
+   requests/minute and input tokens/minute
+3. Runs every response through clean_xml_string -> parse_xml -> the
+   extraction checks the moment it arrives
+4. Re-queues ONLY the failures, with exponential backoff and jitter,
+   without holding a concurrency slot while waiting
+5. Appends one result line per request to a results JSONL; re-running
+   skips requests that already succeeded
+
+Wall time for a tier is therefore ~ (requests / concurrency) x latency.
+
+Endpoints are pluggable:
+    --endpoint http://127.0.0.1:8765/generate
+        POSTs each request line as JSON; the reply is either plain text or
+        JSON with a "text" (or "response"/"content") field. HTTP 429/5xx are
+        retried, honouring Retry-After.
+    --endpoint my_adapter:generate
+        Imports `generate` from my_adapter.py; it must be an async function
+        taking the request dict and returning the response text.
+
+Usage:
+    python generation_scheduler.py --endpoint http://127.0.0.1:8765/generate \\
+        --concurrency 8 --rpm 50 --tpm 400000 --results results.jsonl
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import io
+import json
+import random
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from extract_persona_b_output import clean_xml_string, extract_files, extract_integration, parse_xml
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_REQUESTS = PROJECT_ROOT / "requests.jsonl"
+DEFAULT_RESULTS = Path(__file__).resolve().parent / "generation_results.jsonl"
+
+# Rough chars-per-token ratio for rate limiting input tokens
+CHARS_PER_TOKEN = 4
+
+Endpoint = Callable[[Dict[str, Any]], Awaitable[str]]
+
+
+class RetryableError(Exception):
+    """Transport failure worth retrying (timeouts, 429, 5xx)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+def per_minute_bucket(limit: Optional[float]) -> Optional[TokenBucket]:
+    return TokenBucket(limit / 60.0, limit) if limit else None
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+def http_endpoint(url: str, timeout: float = 600.0) -> Endpoint:
+    """POST the request as JSON; urllib runs in a worker thread."""
+
+    def post(request: Dict[str, Any]) -> str:
+        body = json.dumps(request).encode("utf-8")
+        req = urllib.request.Request(
+            url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                raw = response.read().decode("utf-8")
+                content_type = response.headers.get("Content-Type", "")
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                retry_after = e.headers.get("Retry-After")
+                raise RetryableError(
+                    f"HTTP {e.code}", float(retry_after) if retry_after else None
+                ) from e
+            raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise RetryableError(str(e)) from e
+
+        if "json" in content_type:
+            payload = json.loads(raw)
+            for key in ("text", "response", "content"):
+                if isinstance(payload.get(key), str):
+                    return payload[key]
+            raise ValueError("JSON reply has no text/response/content field")
+        return raw
+
+    async def generate(request: Dict[str, Any]) -> str:
+        return await asyncio.to_thread(post, request)
+
+    return generate
+
+
+def load_endpoint(spec: str, timeout: float = 600.0) -> Endpoint:
+    if spec.startswith(("http://", "https://")):
+        return http_endpoint(spec, timeout)
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Endpoint must be a URL or module:function, got '{spec}'")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+def validate_response(text: str) -> Tuple[bool, str, Optional[str]]:
+    """Run the extraction checks on a raw response.
+
+    Returns:
+        (ok, reason, slug)
+    """
+    # parse_xml/extract_* report problems on stdout; keep the log readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        root = parse_xml(clean_xml_string(text))
+        if root is None:
+            return False, "xml_parse", None
+
+        slug_element = root.find("slug")
+        name_element = root.find("module_name")
+        if slug_element is None or not (slug_element.text or "").strip():
+            return False, "missing_slug", None
+        if name_element is None or not (name_element.text or "").strip():
+            return False, "missing_module_name", None
+        slug = slug_element.text.strip()
+
+        files = extract_files(root)
+        if not files:
+            return False, "no_files", slug
+        for file in files:
+            if not file["content"]:
+                return False, "empty_file", slug
+            if f"modules/{slug}/" not in file["path"]:
+                return False, "file_outside_module", slug
+
+        integration = extract_integration(root)
+        missing = [key for key in ("route", "import", "home_card") if key not in integration]
+        if missing:
+            return False, f"missing_{missing[0]}", slug
+
+    return True, "ok", slug
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+def iter_requests(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def completed_ids(results_path: Path) -> Set[str]:
+    done = set()
+    if results_path.exists():
+        with open(results_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    result = json.loads(line)
+                    if result.get("status") == "ok":
+                        done.add(result["custom_id"])
+    return done
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+async def run_scheduler(
+    requests_path: Path,
+    endpoint: Endpoint,
+    results_path: Path,
+    concurrency: int = 4,
+    rpm: Optional[float] = None,
+    tpm: Optional[float] = None,
+    max_attempts: int = 4,
+    backoff_base: float = 2.0,
+    backoff_cap: float = 60.0,
+    validate: Callable[[str], Tuple[bool, str, Optional[str]]] = validate_response,
+) -> Dict[str, Any]:
+    """Dispatch every pending request and wait for all of them to settle."""
+    request_bucket = per_minute_bucket(rpm)
+    token_bucket = per_minute_bucket(tpm)
+    skip = completed_ids(results_path)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    outstanding = 0
+    all_queued = asyncio.Event()
+    settled = asyncio.Event()
+    stats: Dict[str, Any] = {
+        "ok": 0,
+        "failed": 0,
+        "skipped": 0,
+        "attempts": 0,
+        "retries": 0,
+        "reasons": Counter(),
+    }
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results = open(results_path, "a", encoding="utf-8")
+
+    def finish(request: Dict[str, Any], status: str, attempt: int, reason: str,
+               slug: Optional[str], response: Optional[str], elapsed: float):
+        nonlocal outstanding
+        results.write(
+            json.dumps(
+                {
+                    "custom_id": request["custom_id"],
+                    "status": status,
+                    "attempts": attempt,
+                    "reason": reason,
+                    "slug": slug,
+                    "seconds": round(elapsed, 3),
+                    "response": response,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+        results.flush()
+        stats[status] += 1
+        outstanding -= 1
+        if outstanding == 0 and all_queued.is_set():
+            settled.set()
+
+    # Strong references so pending re-queues aren't garbage collected
+    sleepers: Set[asyncio.Task] = set()
+
+    async def requeue_later(item, delay: float):
+        await asyncio.sleep(delay)
+        await queue.put(item)
+
+    async def producer():
+        nonlocal outstanding
+        for request in iter_requests(requests_path):
+            if request["custom_id"] in skip:
+                stats["skipped"] += 1
+                continue
+            outstanding += 1
+            await queue.put((request, 1, time.monotonic()))
+        all_queued.set()
+        if outstanding == 0:
+            settled.set()
+
+    async def process(request: Dict[str, Any], attempt: int, started: float):
+        """Settle one dequeued item: finish() it or schedule a re-queue."""
+        if request_bucket:
+            await request_bucket.acquire()
+        if token_bucket:
+            size = len(request.get("system", "")) + len(request.get("prompt", ""))
+            await token_bucket.acquire(size / CHARS_PER_TOKEN)
+
+        stats["attempts"] += 1
+        retry_after = None
+        response = None
+        try:
+            response = await endpoint(request)
+            ok, reason, slug = validate(response)
+        except RetryableError as e:
+            ok, reason, slug = False, "transport", None
+            retry_after = e.retry_after
+        except Exception as e:  # adapters may raise anything; never lose the request
+            ok, reason, slug = False, f"error: {type(e).__name__}: {e}", None
+
+        if ok:
+            finish(request, "ok", attempt, reason, slug, response, time.monotonic() - started)
+            return
+
+        stats["reasons"][reason] += 1
+        if attempt >= max_attempts:
+            finish(request, "failed", attempt, reason, slug, response, time.monotonic() - started)
+            return
+
+        stats["retries"] += 1
+        delay = retry_after if retry_after is not None else backoff_delay(attempt, backoff_base, backoff_cap)
+        task = asyncio.create_task(requeue_later((request, attempt + 1, started), delay))
+        sleepers.add(task)
+        task.add_done_callback(sleepers.discard)
+
+    async def worker():
+        while True:
+            request, attempt, started = await queue.get()
+            try:
+                await process(request, attempt, started)
+            except Exception as e:
+                # A bug outside the endpoint call (validator, bucket, ...):
+                # record it rather than let the worker die with the item
+                # still counted in `outstanding`, which would hang settled.wait()
+                reason = f"error: {type(e).__name__}: {e}"
+                stats["reasons"][reason] += 1
+                finish(request, "failed", attempt, reason, None, None, time.monotonic() - started)
+            finally:
+                queue.task_done()
+
+    started = time.monotonic()
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await producer()
+        await settled.wait()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        results.close()
+
+    stats["wall_seconds"] = round(time.monotonic() - started, 3)
+    stats["reasons"] = dict(stats["reasons"])
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rate-limited concurrent generation with validation-driven retries",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python generation_scheduler.py --endpoint http://127.0.0.1:8765/generate
+  python generation_scheduler.py --endpoint my_adapter:generate --concurrency 16 --rpm 50
+        """,
+    )
+
+    parser.add_argument("--endpoint", required=True, help="http(s) URL or module:async_function")
+    parser.add_argument("--requests", default=str(DEFAULT_REQUESTS), help="Requests JSONL (default: repo root requests.jsonl)")
+    parser.add_argument("--results", default=str(DEFAULT_RESULTS), help="Results JSONL (appended; successes are skipped on re-run)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight (default: 4)")
+    parser.add_argument("--rpm", type=float, help="Requests per minute limit")
+    parser.add_argument("--tpm", type=float, help="Input tokens per minute limit (~4 chars/token)")
+    parser.add_argument("--max-attempts", type=int, default=4, help="Attempts per request (default: 4)")
+    parser.add_argument("--backoff", type=float, default=2.0, help="Backoff base in seconds (default: 2)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="HTTP timeout in seconds")
+
+    args = parser.parse_args()
+
+    try:
+        endpoint = load_endpoint(args.endpoint, args.timeout)
+        stats = asyncio.run(
+            run_scheduler(
+                Path(args.requests),
+                endpoint,
+                Path(args.results),
+                concurrency=args.concurrency,
+                rpm=args.rpm,
+                tpm=args.tpm,
+                max_attempts=args.max_attempts,
+                backoff_base=args.backoff,
+            )
+        )
+    except (OSError, ValueError, ImportError, AttributeError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("🚀 GENERATION SUMMARY")
+    print("=" * 60)
+    print(f"Succeeded:        {stats['ok']}")
+    print(f"Failed:           {stats['failed']}")
+    print(f"Already done:     {stats['skipped']}")
+    print(f"Attempts:         {stats['attempts']} ({stats['retries']} retries)")
+    print(f"Wall time:        {stats['wall_seconds']:.1f}s")
+    print("=" * 60)
+
+    for reason, count in sorted(stats["reasons"].items(), key=lambda kv: -kv[1]):
+        print(f"   🔁 {reason}: {count}")
+
+    return 0 if stats["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
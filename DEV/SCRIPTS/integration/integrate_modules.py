@@ -17,20 +17,34 @@ Usage as a library:
         output_dir="./output"
     )
 
+`xml_contents` can be any iterable - a list, a generator, an open
+ResponseArchive - and is consumed one response at a time.
+
 Usage as CLI:
     python integrate_modules.py \\
         --app-tsx ./src/App.tsx \\
         --home-tsx ./src/modules/home/index.tsx \\
         --output-dir ./output \\
-        response1.xml response2.xml response3.xml
+        response1.xml responses/ "batch_*/*.xml" responses.zip responses.crpa
+
+Inputs can be XML files, directories (searched recursively), glob
+patterns, zip/tar archives of XML files and .crpa response archives. They
+are opened lazily, so memory is bounded by the largest single response.
 """
 
 import argparse
+import glob
 import re
 import sys
+import tarfile
 import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from extract_persona_b_output import clean_xml_string, format_written
+from registry_merge import DEFAULT_REGISTRY, merge_registry, registry_entry_from_integration
+from response_archive import ResponseArchive, is_archive
 
 
 def parse_xml_string(xml_content: str) -> ET.Element:
@@ -61,6 +75,12 @@ def extract_integration_from_xml(xml_content: str) -> Dict[str, str]:
     return integration
 
 
+def extract_slug_from_xml(xml_content: str) -> Optional[str]:
+    """Extract module slug from XML string."""
+    slug = parse_xml_string(xml_content).find("slug")
+    return slug.text.strip() if slug is not None and slug.text else None
+
+
 def extract_icon_from_home_card(home_card_code: str) -> Optional[str]:
     """Extract icon name from home_card object."""
     match = re.search(r'icon:\s*(\w+)', home_card_code)
@@ -196,26 +216,90 @@ def add_modules_to_home_tsx(content: str, module_cards: List[str]) -> str:
     return content[:array_start] + new_array_content + content[array_end:]
 
 
+XML_SUFFIXES = (".xml",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+def _is_tar(path: Path) -> bool:
+    return path.name.lower().endswith(TAR_SUFFIXES)
+
+
+def _expand_input(spec: str) -> Iterator[Path]:
+    """Paths for one CLI argument: a file, a directory or a glob pattern."""
+    path = Path(spec)
+    if path.is_dir():
+        for child in sorted(path.rglob("*")):
+            if child.is_file() and (
+                child.suffix.lower() in XML_SUFFIXES
+                or child.suffix.lower() in (".zip", ".crpa")
+                or _is_tar(child)
+            ):
+                yield child
+        return
+    if not path.exists() and glob.has_magic(spec):
+        matches = sorted(glob.iglob(spec, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No files match {spec}")
+        for match in matches:
+            yield from _expand_input(match)
+        return
+    if not path.exists():
+        raise FileNotFoundError(spec)
+    yield path
+
+
+def iter_xml_inputs(specs: Iterable[str]) -> Iterator[str]:
+    """Stream responses from files, directories, globs and archives.
+
+    Each response is read right before it is yielded; zip and tar members
+    are read one at a time and .crpa archives stream their records. Every
+    response goes through clean_xml_string, as archived records always did.
+    """
+    for spec in specs:
+        for path in _expand_input(spec):
+            if is_archive(str(path)):
+                with ResponseArchive(str(path)) as archive:
+                    yield from map(clean_xml_string, archive)
+            elif zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as bundle:
+                    for info in sorted(bundle.infolist(), key=lambda i: i.filename):
+                        if not info.is_dir() and info.filename.lower().endswith(XML_SUFFIXES):
+                            yield clean_xml_string(bundle.read(info).decode("utf-8"))
+            elif _is_tar(path):
+                # Streaming mode: members are read in archive order, never all at once
+                with tarfile.open(path, "r|*") as bundle:
+                    for member in bundle:
+                        if member.isfile() and member.name.lower().endswith(XML_SUFFIXES):
+                            yield clean_xml_string(bundle.extractfile(member).read().decode("utf-8"))
+            else:
+                yield clean_xml_string(path.read_text(encoding="utf-8"))
+
+
 def integrate_modules(
-    xml_contents: List[str],
+    xml_contents: Iterable[str],
     current_app_tsx: str,
     current_home_tsx: str,
     output_dir: str,
+    registry_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Integrate multiple modules from XML strings.
     
     Args:
-        xml_contents: List of XML strings containing integration snippets
+        xml_contents: Iterable of XML strings containing integration snippets,
+            consumed lazily (one response in memory at a time)
         current_app_tsx: Path to current App.tsx file
         current_home_tsx: Path to current home/index.tsx file
         output_dir: Directory where modified files will be written
+        registry_path: Optional moduleRegistry.json to merge processed modules
+            into (locked, safe to run from parallel workers)
         
     Returns:
         Dict containing operation results
     """
+    total = len(xml_contents) if hasattr(xml_contents, "__len__") else None
     result = {
         "success": False,
-        "total_modules": len(xml_contents),
+        "total_modules": total or 0,
         "processed": 0,
         "skipped": 0,
         "errors": [],
@@ -251,11 +335,14 @@ def integrate_modules(
     all_routes = []
     all_icons = []
     all_cards = []
+    registry_entries = []
     
-    print(f"\n🔍 Processing {len(xml_contents)} XML strings...")
+    print(f"\n🔍 Processing {total if total is not None else 'streamed'} XML strings...")
     print("=" * 60)
     
     for i, xml_content in enumerate(xml_contents, 1):
+        label = f"{i}/{total}" if total is not None else str(i)
+        result["total_modules"] = max(result["total_modules"], i)
         try:
             integration = extract_integration_from_xml(xml_content)
             
@@ -266,7 +353,7 @@ def integrate_modules(
                     "status": "skipped",
                     "reason": "No integration section found"
                 })
-                print(f"[{i}/{len(xml_contents)}] ⏭️  Skipped - no integration section")
+                print(f"[{label}] ⏭️  Skipped - no integration section")
                 continue
             
             # Validate required fields
@@ -277,7 +364,7 @@ def integrate_modules(
                     "status": "skipped",
                     "reason": "Missing required fields"
                 })
-                print(f"[{i}/{len(xml_contents)}] ⏭️  Skipped - missing fields")
+                print(f"[{label}] ⏭️  Skipped - missing fields")
                 continue
             
             # Extract metadata
@@ -293,7 +380,7 @@ def integrate_modules(
                     "status": "skipped",
                     "reason": "Could not extract component name"
                 })
-                print(f"[{i}/{len(xml_contents)}] ⏭️  Skipped - no component name")
+                print(f"[{label}] ⏭️  Skipped - no component name")
                 continue
             
             # Check for duplicates in current files
@@ -318,7 +405,7 @@ def integrate_modules(
                     "status": "skipped",
                     "reason": "Already exists"
                 })
-                print(f"[{i}/{len(xml_contents)}] ⏭️  {component_name} - already exists")
+                print(f"[{label}] ⏭️  {component_name} - already exists")
                 continue
             
             # Add to collections
@@ -327,6 +414,9 @@ def integrate_modules(
             all_cards.append(integration["home_card"])
             if icon_name:
                 all_icons.append(icon_name)
+            if registry_path:
+                slug = extract_slug_from_xml(xml_content) or (route_path or "").strip("/")
+                registry_entries.append(registry_entry_from_integration(slug, integration))
             
             result["processed"] += 1
             result["modules"].append({
@@ -336,7 +426,7 @@ def integrate_modules(
                 "path": route_path,
                 "status": "processed"
             })
-            print(f"[{i}/{len(xml_contents)}] ✅ {component_name} (icon: {icon_name}, path: {route_path})")
+            print(f"[{label}] ✅ {component_name} (icon: {icon_name}, path: {route_path})")
             
         except Exception as e:
             result["errors"].append(f"Module {i}: {str(e)}")
@@ -345,7 +435,7 @@ def integrate_modules(
                 "status": "error",
                 "error": str(e)
             })
-            print(f"[{i}/{len(xml_contents)}] ❌ Error: {e}")
+            print(f"[{label}] ❌ Error: {e}")
     
     print("=" * 60)
     
@@ -398,6 +488,22 @@ def integrate_modules(
             "app_tsx": str(app_output),
             "home_tsx": str(home_output)
         }
+        result["written_files"] = [str(app_output), str(home_output)]
+        
+        if registry_entries:
+            merge = merge_registry(registry_path, registry_entries)
+            result["registry"] = merge
+            result["errors"].extend(merge["errors"])
+            if merge["added"] or merge["updated"]:
+                result["written_files"].append(str(registry_path or DEFAULT_REGISTRY))
+            for conflict in merge["conflicts"]:
+                result["errors"].append(
+                    f"Registry conflict {conflict['id']} ({conflict['path']}): {conflict['reason']}"
+                )
+            print(f"   ✅ Registry: {len(merge['added'])} added, "
+                  f"{len(merge['updated'])} updated, {len(merge['conflicts'])} conflicts")
+            for kept in merge["kept"]:
+                print(f"   🔒 {kept['id']}: kept registry {', '.join(kept['fields'])}")
         
     except Exception as e:
         result["errors"].append(f"Error writing files: {e}")
@@ -416,14 +522,14 @@ Example:
       --app-tsx ./src/App.tsx \\
       --home-tsx ./src/modules/home/index.tsx \\
       --output-dir ./output \\
-      module1.xml module2.xml module3.xml
+      module1.xml responses/ "batch_*/*.xml" responses.zip responses.crpa
         """
     )
     
     parser.add_argument(
         "xml_files",
         nargs="+",
-        help="XML files containing integration snippets"
+        help="XML files, directories, glob patterns, zip/tar archives or .crpa response archives"
     )
     
     parser.add_argument(
@@ -444,24 +550,34 @@ Example:
         help="Output directory for modified files (default: ./output)"
     )
     
-    args = parser.parse_args()
-    
-    # Read XML files
-    xml_contents = []
-    for xml_file in args.xml_files:
-        try:
-            xml_contents.append(Path(xml_file).read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"❌ Error reading {xml_file}: {e}")
-            return 1
+    parser.add_argument(
+        "--registry",
+        default=None,
+        help="Also merge processed modules into this moduleRegistry.json (locked)"
+    )
     
-    result = integrate_modules(
-        xml_contents=xml_contents,
-        current_app_tsx=args.app_tsx,
-        current_home_tsx=args.home_tsx,
-        output_dir=args.output_dir
+    parser.add_argument(
+        "--format",
+        action="store_true",
+        help="Run Prettier once over the files written (instead of npm run format)"
     )
     
+    args = parser.parse_args()
+    
+    # Responses are read one at a time while integrating; a read error
+    # aborts before anything is written
+    try:
+        result = integrate_modules(
+            xml_contents=iter_xml_inputs(args.xml_files),
+            current_app_tsx=args.app_tsx,
+            current_home_tsx=args.home_tsx,
+            output_dir=args.output_dir,
+            registry_path=args.registry
+        )
+    except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        print(f"❌ Error reading inputs: {e}")
+        return 1
+    
     # Print summary
     print("\n" + "=" * 60)
     print("📊 INTEGRATION SUMMARY")
@@ -477,6 +593,10 @@ Example:
         for error in result["errors"]:
             print(f"   - {error}")
     
+    if args.format and result.get("written_files"):
+        if not format_written(result["written_files"]):
+            return 1
+    
     return 0 if result["success"] else 1
 
 
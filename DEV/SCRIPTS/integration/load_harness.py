@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Offline record/replay load test for the generation -> integration pipeline.
+
+Two parts, both local-only:
+
+- ReplayServer: a stub generation endpoint (same contract as
+  generation_scheduler.py's HTTP endpoint) that answers with recorded
+  responses from a .crpa archive, a pickle or a directory of .xml files.
+  Latency, streaming chunk size/pace and failures (HTTP 503, truncated
+  bodies, non-XML garbage) are configurable.
+
+- Load driver: pushes N generations through the REAL pipeline with C in
+  flight - HTTP request -> clean_xml_string -> parse_xml -> extract ->
+  write_files -> integrate_modules (+ locked registry merge) - into a
+  scratch copy of the project files, and reports end-to-end latency
+  percentiles, throughput and time per stage.
+
+Usage:
+    # Replay an archive with 2s +/- 0.5s latency, 10% failures, 16 in flight
+    python load_harness.py run responses.crpa -n 200 -c 16 \\
+        --latency 2 --jitter 0.5 --fail-rate 0.1
+
+    # Only the stub server, e.g. for generation_scheduler.py
+    python load_harness.py serve responses.crpa --port 8765 --latency 1
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from extract_persona_b_output import clean_xml_string, extract_files, parse_xml, write_files
+from integrate_modules import integrate_modules
+from response_archive import ResponseArchive, is_archive, load_pickle_responses
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+APP_TSX = PROJECT_ROOT / "src" / "App.tsx"
+HOME_TSX = PROJECT_ROOT / "src" / "modules" / "home" / "index.tsx"
+REGISTRY = PROJECT_ROOT / "src" / "config" / "moduleRegistry.json"
+
+STAGES = ["request", "clean", "parse", "extract", "write_files", "integrate"]
+
+
+def load_recordings(source: str) -> List[str]:
+    """Recorded responses from a .crpa archive, a pickle or a directory."""
+    path = Path(source)
+    if path.is_dir():
+        return [p.read_text(encoding="utf-8") for p in sorted(path.glob("*.xml"))]
+    if is_archive(source):
+        with ResponseArchive(source) as archive:
+            return list(archive)
+    if path.suffix == ".pkl":
+        return load_pickle_responses(source)
+    return [path.read_text(encoding="utf-8")]
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+
+class ReplayServer:
+    """Serve recorded responses over HTTP with injected latency and faults.
+
+    The response for a request is chosen by hashing its custom_id, so the
+    same request always replays the same recording.
+    """
+
+    def __init__(
+        self,
+        recordings: List[str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        chunk_size: int = 0,
+        chunk_delay: float = 0.0,
+        fail_rate: float = 0.0,
+        truncate_rate: float = 0.0,
+        garbage_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        if not recordings:
+            raise ValueError("No recorded responses to replay")
+        self.recordings = [r.encode("utf-8") for r in recordings]
+        self.latency = latency
+        self.jitter = jitter
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.fail_rate = fail_rate
+        self.truncate_rate = truncate_rate
+        self.garbage_rate = garbage_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"served": 0, "failed": 0, "truncated": 0, "garbage": 0}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                server.respond(self, request)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/generate"
+
+    def _roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+    def _count(self, name: str):
+        with self.lock:
+            self.counts[name] += 1
+
+    def respond(self, handler: BaseHTTPRequestHandler, request: Dict[str, Any]):
+        key = str(request.get("custom_id", ""))
+        index = int(hashlib.sha1(key.encode("utf-8")).hexdigest(), 16) % len(self.recordings)
+        body = self.recordings[index]
+
+        delay = max(0.0, self.latency + (self._roll() * 2 - 1) * self.jitter)
+        time.sleep(delay)
+
+        roll = self._roll()
+        if roll < self.fail_rate:
+            self._count("failed")
+            handler.send_response(503)
+            handler.send_header("Retry-After", "0")
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        roll -= self.fail_rate
+        if roll < self.truncate_rate:
+            self._count("truncated")
+            body = body[: len(body) // 2]
+        elif roll < self.truncate_rate + self.garbage_rate:
+            self._count("garbage")
+            body = b"I'm sorry, I can't produce that module right now."
+
+        self._count("served")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/plain; charset=utf-8")
+
+        if not self.chunk_size:
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        for start in range(0, len(body), self.chunk_size):
+            chunk = body[start : start + self.chunk_size]
+            handler.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            handler.wfile.flush()
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+        handler.wfile.write(b"0\r\n\r\n")
+
+    def start(self) -> "ReplayServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ---------------------------------------------------------------------------
+# Load driver
+# ---------------------------------------------------------------------------
+
+
+def fetch(url: str, custom_id: str, timeout: float) -> str:
+    body = json.dumps({"custom_id": custom_id, "system": "", "prompt": ""}).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode("utf-8")
+
+
+def run_one(url: str, index: int, workspace: Path, timeout: float) -> Dict[str, Any]:
+    """One generation through the full pipeline, timing each stage."""
+    timings: Dict[str, float] = {}
+    outcome: Dict[str, Any] = {"index": index, "ok": False, "stage": None, "timings": timings}
+    start = time.perf_counter()
+
+    def stage(name: str, func, *args):
+        t0 = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = time.perf_counter() - t0
+
+    try:
+        raw = stage("request", fetch, url, f"load-{index}", timeout)
+        xml = stage("clean", clean_xml_string, raw)
+        root = stage("parse", parse_xml, xml)
+        if root is None:
+            outcome["stage"] = "parse"
+            return outcome
+
+        files = stage("extract", extract_files, root)
+        if not files:
+            outcome["stage"] = "extract"
+            return outcome
+
+        stage("write_files", write_files, files, workspace / "src" / f"run-{index}")
+
+        result = stage(
+            "integrate",
+            integrate_modules,
+            [xml],
+            str(workspace / "App.tsx"),
+            str(workspace / "home.tsx"),
+            str(workspace / "integrated" / f"run-{index}"),
+            str(workspace / "moduleRegistry.json"),
+        )
+        if not result["success"] or result["errors"]:
+            outcome["stage"] = "integrate"
+            return outcome
+
+        outcome["ok"] = True
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        # stage() records its timing even when it raises
+        outcome["stage"] = list(timings)[-1] if timings else "request"
+        outcome["error"] = str(e)
+    finally:
+        outcome["total"] = time.perf_counter() - start
+
+    return outcome
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def run_load(
+    server_url: str, total: int, concurrency: int, timeout: float = 60.0, keep: bool = False
+) -> Dict[str, Any]:
+    """Drive `total` generations with `concurrency` in flight."""
+    workspace = Path(tempfile.mkdtemp(prefix="load-harness-"))
+    shutil.copy(APP_TSX, workspace / "App.tsx")
+    shutil.copy(HOME_TSX, workspace / "home.tsx")
+    shutil.copy(REGISTRY, workspace / "moduleRegistry.json")
+
+    # The pipeline narrates every step on stdout; silence it for the run
+    real_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(lambda i: run_one(server_url, i, workspace, timeout), range(total)))
+    finally:
+        wall = time.perf_counter() - started
+        sys.stdout = real_stdout
+        if not keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    ok = [o for o in outcomes if o["ok"]]
+    totals = [o["total"] for o in ok]
+    stage_totals = {s: sum(o["timings"].get(s, 0.0) for o in outcomes) for s in STAGES}
+    busy = sum(stage_totals.values()) or 1.0
+
+    failures: Dict[str, int] = {}
+    for o in outcomes:
+        if not o["ok"]:
+            failures[o["stage"] or "unknown"] = failures.get(o["stage"] or "unknown", 0) + 1
+
+    return {
+        "total": total,
+        "concurrency": concurrency,
+        "succeeded": len(ok),
+        "failures": failures,
+        "wall_seconds": wall,
+        "throughput": total / wall if wall else 0.0,
+        "latency": {f"p{p}": percentile(totals, p) for p in (50, 90, 95, 99)},
+        "latency_max": max(totals) if totals else 0.0,
+        "stages": {
+            s: {"seconds": stage_totals[s], "share": stage_totals[s] / busy} for s in STAGES
+        },
+        "workspace": str(workspace) if keep else None,
+    }
+
+
+def print_report(report: Dict[str, Any], server_counts: Dict[str, int]):
+    print("\n" + "=" * 60)
+    print("🏋️  PIPELINE LOAD REPORT")
+    print("=" * 60)
+    print(f"Generations:   {report['total']} ({report['concurrency']} in flight)")
+    print(f"Succeeded:     {report['succeeded']}")
+    print(f"Wall time:     {report['wall_seconds']:.2f}s")
+    print(f"Throughput:    {report['throughput']:.2f} generations/s")
+    latency = report["latency"]
+    print(
+        f"End-to-end:    p50 {latency['p50'] * 1000:.0f}ms  p90 {latency['p90'] * 1000:.0f}ms  "
+        f"p95 {latency['p95'] * 1000:.0f}ms  p99 {latency['p99'] * 1000:.0f}ms  "
+        f"max {report['latency_max'] * 1000:.0f}ms"
+    )
+    print("=" * 60)
+
+    print("\nTime per stage (summed over generations):")
+    for name, row in report["stages"].items():
+        bar = "█" * int(row["share"] * 40)
+        print(f"   {name:<12} {row['seconds']:>8.2f}s {row['share'] * 100:>5.1f}% {bar}")
+
+    if report["failures"]:
+        print("\nFailures by stage:")
+        for name, count in sorted(report["failures"].items(), key=lambda kv: -kv[1]):
+            print(f"   ❌ {name}: {count}")
+
+    print(
+        f"\nServer: {server_counts['served']} served, {server_counts['failed']} x 503, "
+        f"{server_counts['truncated']} truncated, {server_counts['garbage']} garbage"
+    )
+    if report["workspace"]:
+        print(f"Workspace kept at {report['workspace']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline record/replay load test for the generation pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python load_harness.py run responses.crpa -n 200 -c 16 --latency 2 --jitter 0.5
+  python load_harness.py run ./recorded_xml -n 50 --chunk-size 512 --chunk-delay 0.01
+  python load_harness.py serve responses.crpa --port 8765 --fail-rate 0.1
+        """,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_server_args(p):
+        p.add_argument("recordings", help=".crpa archive, .pkl, directory of .xml, or one file")
+        p.add_argument("--latency", type=float, default=0.0, help="Mean response delay (s)")
+        p.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter on latency (s)")
+        p.add_argument("--chunk-size", type=int, default=0, help="Stream body in chunks of N bytes")
+        p.add_argument("--chunk-delay", type=float, default=0.0, help="Delay between chunks (s)")
+        p.add_argument("--fail-rate", type=float, default=0.0, help="Fraction answered with HTTP 503")
+        p.add_argument("--truncate-rate", type=float, default=0.0, help="Fraction cut off mid-body")
+        p.add_argument("--garbage-rate", type=float, default=0.0, help="Fraction replaced by non-XML text")
+        p.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+
+    serve = sub.add_parser("serve", help="Run only the stub server")
+    add_server_args(serve)
+    serve.add_argument("--port", type=int, default=8765)
+
+    run = sub.add_parser("run", help="Start the stub server and drive load through the pipeline")
+    add_server_args(run)
+    run.add_argument("-n", "--total", type=int, default=100, help="Generations to run")
+    run.add_argument("-c", "--concurrency", type=int, default=8, help="Generations in flight")
+    run.add_argument("--timeout", type=float, default=60.0, help="Request timeout (s)")
+    run.add_argument("--keep", action="store_true", help="Keep the scratch workspace")
+    run.add_argument("--json", dest="json_path", help="Write the report as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        recordings = load_recordings(args.recordings)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    server = ReplayServer(
+        recordings,
+        port=getattr(args, "port", 0),
+        latency=args.latency,
+        jitter=args.jitter,
+        chunk_size=args.chunk_size,
+        chunk_delay=args.chunk_delay,
+        fail_rate=args.fail_rate,
+        truncate_rate=args.truncate_rate,
+        garbage_rate=args.garbage_rate,
+        seed=args.seed,
+    )
+
+    if args.command == "serve":
+        print(f"🎙️  Replaying {len(recordings)} responses at {server.url} (Ctrl+C to stop)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+        return 0
+
+    with server:
+        report = run_load(server.url, args.total, args.concurrency, args.timeout, args.keep)
+
+    print_report(report, server.counts)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"📄 Report written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Merge new module entries into moduleRegistry.json safely under concurrency.
+
+Parallel extraction/integration workers (notebook cells, process pools) used
+to read, modify and rewrite the registry independently - the last writer
+won and entries were silently lost. Every update now goes through one merge
+step that:
+
+1. Takes an advisory lock on <registry>.lock
+2. Re-reads the registry as it is NOW (not as it was when the worker started)
+3. Merges entries by `id`, detecting conflicts on `path`. Fields already in
+   the registry (a maintainer's `enabled: false`, a curated title) are kept
+   and reported unless the caller passes overwrite=True / --overwrite
+4. Writes atomically (temp file + os.replace), preserving line endings
+
+The lock is only held for the read-merge-write itself, so workers can do the
+slow parts (generation, parsing, compiling) fully in parallel.
+
+Usage as a library:
+    from registry_merge import merge_registry, registry_entry_from_integration
+
+    entry = registry_entry_from_integration(slug, integration)
+    result = merge_registry("../../../src/config/moduleRegistry.json", [entry])
+
+Usage as CLI:
+    python registry_merge.py --registry ../../../src/config/moduleRegistry.json \\
+        response1.xml response2.xml
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from extract_persona_b_output import clean_xml_string, extract_integration, parse_xml
+
+DEFAULT_REGISTRY = Path(__file__).resolve().parents[3] / "src" / "config" / "moduleRegistry.json"
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(handle) -> bool:
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(handle) -> bool:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class LockTimeout(TimeoutError):
+    """Raised when the advisory lock can't be acquired in time."""
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = 30.0, poll: float = 0.05) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `<path>.lock` for the block.
+
+    The lock file is separate from the target so the target itself can be
+    replaced atomically while the lock is held.
+    """
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(lock_path, "a+") as handle:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(handle):
+            if time.monotonic() > deadline:
+                raise LockTimeout(f"Timed out after {timeout}s waiting for {lock_path}")
+            time.sleep(poll)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+
+
+def read_text_preserving(path: Path) -> Tuple[str, str]:
+    """Read a file and report its newline style ("\\r\\n" or "\\n")."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        raw = f.read()
+    newline = "\r\n" if "\r\n" in raw else "\n"
+    return raw.replace("\r\n", "\n"), newline
+
+
+def atomic_write_text(path: Path, text: str, newline: str = "\n"):
+    """Write via a temp file in the same directory, then os.replace()."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text.replace("\n", newline))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def merge_entries(
+    registry: List[Dict[str, Any]], entries: List[Dict[str, Any]], overwrite: bool = False
+) -> Dict[str, Any]:
+    """Merge entries into a registry list (in place) by `id`.
+
+    - New id, unused path -> appended
+    - Known id, same path -> fields the registry lacks are added; fields it
+      has keep their value, and differing ones are listed in `kept`
+      (with overwrite=True the new values win instead)
+    - Known id with a different path, or a new id whose path belongs to
+      another id -> conflict, registry left untouched for that entry
+
+    Returns:
+        Dict with added, updated, unchanged, kept and conflicts lists
+    """
+    by_id = {entry["id"]: i for i, entry in enumerate(registry)}
+    by_path = {entry["path"]: entry["id"] for entry in registry}
+
+    outcome = {"added": [], "updated": [], "unchanged": [], "kept": [], "conflicts": []}
+
+    for entry in entries:
+        module_id = entry.get("id")
+        module_path = entry.get("path")
+        if not module_id or not module_path:
+            outcome["conflicts"].append(
+                {"id": module_id, "path": module_path, "reason": "Entry needs both id and path"}
+            )
+            continue
+
+        owner = by_path.get(module_path)
+
+        if module_id in by_id:
+            current = registry[by_id[module_id]]
+            if current["path"] != module_path:
+                outcome["conflicts"].append(
+                    {
+                        "id": module_id,
+                        "path": module_path,
+                        "reason": f"Registered with path {current['path']}",
+                    }
+                )
+                continue
+
+            differing = sorted(k for k, v in entry.items() if k in current and current[k] != v)
+            if overwrite:
+                merged = {**current, **entry}
+            else:
+                merged = {**current, **{k: v for k, v in entry.items() if k not in current}}
+                if differing:
+                    outcome["kept"].append({"id": module_id, "fields": differing})
+            if merged == current:
+                outcome["unchanged"].append(module_id)
+            else:
+                registry[by_id[module_id]] = merged
+                outcome["updated"].append(module_id)
+            continue
+
+        if owner is not None:
+            outcome["conflicts"].append(
+                {"id": module_id, "path": module_path, "reason": f"Path already used by {owner}"}
+            )
+            continue
+
+        by_id[module_id] = len(registry)
+        by_path[module_path] = module_id
+        registry.append(entry)
+        outcome["added"].append(module_id)
+
+    return outcome
+
+
+def merge_registry(
+    registry_path: Optional[str],
+    entries: List[Dict[str, Any]],
+    dry_run: bool = False,
+    timeout: float = 30.0,
+    overwrite: bool = False,
+) -> Dict[str, Any]:
+    """Lock, re-read, merge and atomically rewrite the registry.
+
+    Args:
+        registry_path: Path to moduleRegistry.json (default: project registry)
+        entries: Registry entries to merge
+        dry_run: Report what would change without writing
+        timeout: Seconds to wait for the lock
+        overwrite: Let entry fields replace the registry's existing values
+
+    Returns:
+        Dict containing operation results
+    """
+    path = Path(registry_path) if registry_path else DEFAULT_REGISTRY
+
+    result = {
+        "success": False,
+        "added": [],
+        "updated": [],
+        "unchanged": [],
+        "kept": [],
+        "conflicts": [],
+        "errors": [],
+    }
+
+    try:
+        with file_lock(path, timeout=timeout):
+            text, newline = read_text_preserving(path)
+            registry = json.loads(text)
+
+            outcome = merge_entries(registry, entries, overwrite=overwrite)
+            result.update(outcome)
+
+            if (outcome["added"] or outcome["updated"]) and not dry_run:
+                trailing = "\n" if text.endswith("\n") else ""
+                serialized = json.dumps(registry, indent=2, ensure_ascii=False) + trailing
+                atomic_write_text(path, serialized, newline=newline)
+
+        result["success"] = True
+
+    except (OSError, ValueError, LockTimeout) as e:
+        result["errors"].append(str(e))
+
+    return result
+
+
+def _card_field(home_card: str, key: str) -> Optional[str]:
+    match = re.search(rf'{key}:\s*["\']([^"\']*)["\']', home_card)
+    return match.group(1) if match else None
+
+
+def _route_prop(route: str, key: str) -> Optional[str]:
+    match = re.search(rf'{key}="([^"]*)"', route)
+    return match.group(1) if match else None
+
+
+def registry_entry_from_integration(slug: str, integration: Dict[str, str]) -> Dict[str, Any]:
+    """Build a moduleRegistry.json entry from Persona B integration snippets."""
+    home_card = integration.get("home_card", "")
+    route = integration.get("route", "")
+
+    icon = re.search(r"icon:\s*(\w+)", home_card)
+
+    wrapper_props = {"bgClass": _route_prop(route, "bgClass") or "bg-slate-950"}
+    for key in ("textClass", "fontClass"):
+        value = _route_prop(route, key)
+        if value:
+            wrapper_props[key] = value
+
+    return {
+        "id": slug,
+        "path": _card_field(home_card, "path") or _route_prop(route, "path") or f"/{slug}",
+        "title": _card_field(home_card, "title") or slug,
+        "subtitle": _card_field(home_card, "subtitle") or "",
+        "concept": _card_field(home_card, "concept") or "",
+        "icon": icon.group(1) if icon else "Brain",
+        "colorClass": _card_field(home_card, "colorClass") or "",
+        "bgClass": _card_field(home_card, "bgClass") or "",
+        "component": "dynamic_import",
+        "wrapperProps": wrapper_props,
+        "enabled": True,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge modules from XML responses into moduleRegistry.json under a lock",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example:
+  python registry_merge.py \\
+      --registry ../../../src/config/moduleRegistry.json \\
+      module1.xml module2.xml
+        """,
+    )
+
+    parser.add_argument("xml_files", nargs="+", help="XML files containing integration snippets")
+    parser.add_argument(
+        "--registry", default=str(DEFAULT_REGISTRY), help="Path to moduleRegistry.json"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="Lock timeout in seconds")
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    parser.add_argument(
+        "--overwrite", action="store_true",
+        help="Replace existing fields (enabled, title, ...) with the responses' values",
+    )
+
+    args = parser.parse_args()
+
+    entries = []
+    for xml_file in args.xml_files:
+        try:
+            root = parse_xml(clean_xml_string(Path(xml_file).read_text(encoding="utf-8")))
+        except OSError as e:
+            print(f"❌ Error reading {xml_file}: {e}")
+            return 1
+
+        slug = root.find("slug") if root is not None else None
+        if slug is None or not slug.text:
+            print(f"⏭️  {xml_file} - no slug, skipped")
+            continue
+        entries.append(registry_entry_from_integration(slug.text.strip(), extract_integration(root)))
+
+    result = merge_registry(
+        args.registry, entries, dry_run=args.dry_run, timeout=args.timeout, overwrite=args.overwrite
+    )
+
+    print("\n" + "=" * 60)
+    print("📊 REGISTRY MERGE SUMMARY")
+    print("=" * 60)
+    print(f"Added:     {len(result['added'])}")
+    print(f"Updated:   {len(result['updated'])}")
+    print(f"Unchanged: {len(result['unchanged'])}")
+    print(f"Kept:      {len(result['kept'])}")
+    print(f"Conflicts: {len(result['conflicts'])}")
+    print("=" * 60)
+
+    for kept in result["kept"]:
+        print(f"   🔒 {kept['id']}: kept registry {', '.join(kept['fields'])} (--overwrite to replace)")
+    for conflict in result["conflicts"]:
+        print(f"   ⚠️  {conflict['id']} ({conflict['path']}): {conflict['reason']}")
+    for error in result["errors"]:
+        print(f"   ❌ {error}")
+
+    return 0 if result["success"] and not result["conflicts"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
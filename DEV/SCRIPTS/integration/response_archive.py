@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Compressed archive for raw LLM responses with a shared zlib dictionary.
+
+Every Persona B response repeats the same XML skeleton, CDATA wrappers,
+ModuleHeader/ModuleLayout boilerplate and import blocks. A compression
+dictionary trained once from a sample of responses lets each response be
+stored as a small, INDEPENDENTLY decompressible record (zlib `zdict`).
+
+File layout (.crpa):
+    magic "CRPA\\x01"
+    u32 dictionary length, dictionary bytes
+    records (zlib streams compressed with the dictionary), back to back
+    index (JSON: offset, length, raw size, crc32, slug per record)
+    u64 index offset, magic "CRPA\\x01"
+
+Random access by row or slug reads one record; iteration streams records
+one at a time.
+
+Usage as a library:
+    from response_archive import ResponseArchive, write_archive
+
+    write_archive("responses.crpa", df["RESULT"])
+
+    with ResponseArchive("responses.crpa") as archive:
+        xml = archive[7]                          # by row
+        xml = archive.get_by_slug("much-ado-about-memo")
+        for xml in archive:                       # streaming
+            ...
+
+Usage as CLI:
+    python response_archive.py build RESULTS.pkl responses.crpa
+    python response_archive.py info responses.crpa
+    python response_archive.py get responses.crpa --slug much-ado-about-memo
+    python response_archive.py bench responses.crpa --pickle RESULTS.pkl
+"""
+
+import argparse
+import json
+import pickle
+import re
+import struct
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+MAGIC = b"CRPA\x01"
+MAX_DICT_SIZE = 32 * 1024  # zlib only looks back 32 KiB
+SLUG_PATTERN = re.compile(r"<slug>\s*(?:<!\[CDATA\[)?\s*([^<\]\s]+)")
+
+
+def extract_slug(response: str) -> Optional[str]:
+    """Slug of a response, without a full XML parse."""
+    match = SLUG_PATTERN.search(response)
+    return match.group(1) if match else None
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICT_SIZE) -> bytes:
+    """Build a zlib preset dictionary from the lines shared across samples.
+
+    zlib has no trainer, so this picks the lines that appear in the most
+    samples (weighted by length) until the budget is used. Lines are stripped
+    of indentation so one entry matches the same code at any nesting depth.
+    The most valuable lines go LAST: zlib prefers shorter match distances,
+    and the end of the dictionary is closest to the data.
+    """
+    document_frequency = Counter()
+    sample_count = 0
+    for sample in samples:
+        sample_count += 1
+        document_frequency.update({line.strip() + "\n" for line in sample.splitlines()})
+
+    if sample_count < 2:
+        return b""
+
+    shared = [
+        (count * len(line.encode("utf-8")), line)
+        for line, count in document_frequency.items()
+        if count >= 2 and line.strip()
+    ]
+    shared.sort(reverse=True)
+
+    chosen = []
+    used = 0
+    for _, line in shared:
+        encoded = line.encode("utf-8")
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+
+    return b"".join(reversed(chosen))
+
+
+def write_archive(
+    path: str,
+    responses: Iterable[str],
+    dictionary: Optional[bytes] = None,
+    sample_size: int = 64,
+    level: int = 9,
+) -> Dict[str, Any]:
+    """Write responses to an archive.
+
+    Args:
+        path: Output file
+        responses: Response strings (any iterable, consumed once)
+        dictionary: Preset dictionary; trained from the first `sample_size`
+            responses when omitted
+        sample_size: Responses used to train the dictionary
+        level: zlib compression level
+
+    Returns:
+        Dict with record count, raw and stored sizes
+    """
+    responses = iter(responses)
+
+    # Only the training sample is buffered; the rest streams straight through
+    sample = []
+    if dictionary is None:
+        for response in responses:
+            sample.append(response)
+            if len(sample) >= sample_size:
+                break
+        dictionary = train_dictionary(sample)
+
+    index = []
+    raw_total = 0
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(dictionary)))
+        f.write(dictionary)
+
+        def write_record(response: str):
+            nonlocal raw_total
+            raw = response.encode("utf-8")
+            compressor = zlib.compressobj(level, zdict=dictionary) if dictionary else zlib.compressobj(level)
+            data = compressor.compress(raw) + compressor.flush()
+            index.append(
+                {
+                    "offset": f.tell(),
+                    "length": len(data),
+                    "size": len(raw),
+                    "crc32": zlib.crc32(raw),
+                    "slug": extract_slug(response),
+                }
+            )
+            f.write(data)
+            raw_total += len(raw)
+
+        for response in sample:
+            write_record(response)
+        for response in responses:
+            write_record(response)
+
+        index_offset = f.tell()
+        f.write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+        f.write(struct.pack("<Q", index_offset))
+        f.write(MAGIC)
+        stored_total = f.tell()
+
+    return {
+        "records": len(index),
+        "raw_bytes": raw_total,
+        "archive_bytes": stored_total,
+        "dictionary_bytes": len(dictionary),
+    }
+
+
+class ResponseArchive:
+    """Read-only access to a .crpa archive."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+        self._by_slug = {
+            entry["slug"]: row for row, entry in enumerate(self.index) if entry["slug"]
+        }
+
+    def _read_header(self):
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is not a response archive")
+        (dict_length,) = struct.unpack("<I", self._file.read(4))
+        self.dictionary = self._file.read(dict_length)
+
+        self._file.seek(-(8 + len(MAGIC)), 2)
+        (index_offset,) = struct.unpack("<Q", self._file.read(8))
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is truncated (missing footer)")
+
+        self._file.seek(index_offset)
+        index_end = self.path.stat().st_size - 8 - len(MAGIC)
+        self.index: List[Dict[str, Any]] = json.loads(self._file.read(index_end - index_offset))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _decode(self, entry: Dict[str, Any], data: bytes) -> str:
+        decompressor = (
+            zlib.decompressobj(zdict=self.dictionary) if self.dictionary else zlib.decompressobj()
+        )
+        raw = decompressor.decompress(data) + decompressor.flush()
+        if zlib.crc32(raw) != entry["crc32"]:
+            raise ValueError(f"CRC mismatch in record at offset {entry['offset']}")
+        return raw.decode("utf-8")
+
+    def __getitem__(self, row: int) -> str:
+        entry = self.index[row]
+        self._file.seek(entry["offset"])
+        return self._decode(entry, self._file.read(entry["length"]))
+
+    def get_by_slug(self, slug: str) -> str:
+        """Response for a module slug (the last one, if it was archived twice)."""
+        if slug not in self._by_slug:
+            raise KeyError(slug)
+        return self[self._by_slug[slug]]
+
+    @property
+    def slugs(self) -> List[Optional[str]]:
+        return [entry["slug"] for entry in self.index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Stream records in order, one decompressed response at a time."""
+        for row in range(len(self.index)):
+            yield self[row]
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_archive(path: str) -> bool:
+    """True if the file starts with the archive magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def load_pickle_responses(path: str, column: str = "RESULT") -> List[str]:
+    """Responses from a pickled DataFrame (RESULTS.pkl) or a pickled list."""
+    with open(path, "rb") as f:
+        data = pickle.load(f)
+    if hasattr(data, "columns"):
+        return [str(value) for value in data[column].tolist()]
+    return [str(value) for value in data]
+
+
+def benchmark(archive_path: str, pickle_path: Optional[str] = None, column: str = "RESULT") -> Dict[str, Any]:
+    """Compare archive size and decode throughput against pickles."""
+    report = {}
+
+    with ResponseArchive(archive_path) as archive:
+        raw_bytes = sum(entry["size"] for entry in archive.index)
+        start = time.perf_counter()
+        for _ in archive:
+            pass
+        elapsed = time.perf_counter() - start
+        report["archive"] = {
+            "bytes": Path(archive_path).stat().st_size,
+            "full_decode_s": elapsed,
+            "mb_per_s": raw_bytes / 1e6 / elapsed if elapsed else float("inf"),
+        }
+
+        middle = len(archive) // 2
+        start = time.perf_counter()
+        archive[middle]
+        report["archive"]["random_access_ms"] = (time.perf_counter() - start) * 1000
+        responses = list(archive)
+
+    report["raw_bytes"] = raw_bytes
+
+    # Same per-record layout without the shared dictionary
+    compressed = [zlib.compress(r.encode("utf-8"), 9) for r in responses]
+    start = time.perf_counter()
+    for data in compressed:
+        zlib.decompress(data)
+    elapsed = time.perf_counter() - start
+    report["zlib_no_dict"] = {
+        "bytes": sum(len(data) for data in compressed),
+        "full_decode_s": elapsed,
+        "mb_per_s": raw_bytes / 1e6 / elapsed if elapsed else float("inf"),
+    }
+
+    # A pickled list of the same strings (what "one pickle" costs)
+    blob = pickle.dumps(responses, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(blob)
+    elapsed = time.perf_counter() - start
+    report["pickle_list"] = {
+        "bytes": len(blob),
+        "full_decode_s": elapsed,
+        "mb_per_s": raw_bytes / 1e6 / elapsed if elapsed else float("inf"),
+    }
+
+    if pickle_path:
+        start = time.perf_counter()
+        load_pickle_responses(pickle_path, column)
+        elapsed = time.perf_counter() - start
+        report["pickle_file"] = {
+            "bytes": Path(pickle_path).stat().st_size,
+            "full_decode_s": elapsed,
+            "mb_per_s": raw_bytes / 1e6 / elapsed if elapsed else float("inf"),
+        }
+
+    return report
+
+
+def _print_benchmark(report: Dict[str, Any]):
+    print("=" * 60)
+    print("⏱️  ARCHIVE BENCHMARK")
+    print("=" * 60)
+    print(f"Raw responses: {report['raw_bytes']:,} bytes")
+    for name in ("archive", "zlib_no_dict", "pickle_list", "pickle_file"):
+        if name not in report:
+            continue
+        row = report[name]
+        ratio = row["bytes"] / report["raw_bytes"] if report["raw_bytes"] else 0
+        print(
+            f"{name:<12} {row['bytes']:>12,} bytes ({ratio:6.1%})  "
+            f"{row['mb_per_s']:8.1f} MB/s decode"
+        )
+    if "random_access_ms" in report["archive"]:
+        print(f"Archive random access: {report['archive']['random_access_ms']:.2f} ms")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Shared-dictionary compressed archive for raw LLM responses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build an archive from a pickle or XML files")
+    build.add_argument("inputs", nargs="+", help="RESULTS.pkl and/or .xml files, then the output")
+    build.add_argument("--column", default="RESULT", help="DataFrame column (default: RESULT)")
+    build.add_argument("--sample-size", type=int, default=64, help="Responses used for training")
+
+    info = sub.add_parser("info", help="List records in an archive")
+    info.add_argument("archive")
+
+    get = sub.add_parser("get", help="Print one response")
+    get.add_argument("archive")
+    group = get.add_mutually_exclusive_group(required=True)
+    group.add_argument("--row", type=int)
+    group.add_argument("--slug")
+
+    bench = sub.add_parser("bench", help="Compare size/decode speed against pickles")
+    bench.add_argument("archive")
+    bench.add_argument("--pickle", help="Existing RESULTS.pkl to compare against")
+    bench.add_argument("--column", default="RESULT")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        *sources, output = args.inputs
+        if not sources:
+            parser.error("build needs at least one input and an output path")
+
+        def responses():
+            for source in sources:
+                if source.endswith(".pkl"):
+                    yield from load_pickle_responses(source, args.column)
+                else:
+                    yield Path(source).read_text(encoding="utf-8")
+
+        stats = write_archive(output, responses(), sample_size=args.sample_size)
+        print(
+            f"✅ {stats['records']} responses: {stats['raw_bytes']:,} → "
+            f"{stats['archive_bytes']:,} bytes "
+            f"(dictionary {stats['dictionary_bytes']:,} bytes) → {output}"
+        )
+        return 0
+
+    if args.command == "info":
+        with ResponseArchive(args.archive) as archive:
+            for row, entry in enumerate(archive.index):
+                print(f"{row:>4}  {entry['size']:>8,} → {entry['length']:>7,}  {entry['slug'] or '?'}")
+        return 0
+
+    if args.command == "get":
+        with ResponseArchive(args.archive) as archive:
+            try:
+                print(archive[args.row] if args.slug is None else archive.get_by_slug(args.slug))
+            except (IndexError, KeyError) as e:
+                print(f"❌ Not found: {e}")
+                return 1
+        return 0
+
+    if args.command == "bench":
+        _print_benchmark(benchmark(args.archive, args.pickle, args.column))
+        return 0
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Record how big each Persona B response is, at parse time, in SQLite.
+
+Pipeline_Optimization_Log.md found that Stage 1 prose needed 83%
+compression to fit a module, but only after integrating responses by hand.
+This records the numbers when a response is parsed, so prompts can be tuned
+from data:
+
+- responses: characters, bytes and approximate tokens of the raw response,
+  plan length (characters, words, tokens), file count and total file size,
+  chapter count and words per chapter (mean / max), whether it parsed
+- files:     per-file path, characters, bytes, lines, tokens
+- chapters:  per-chapter title and word count, from the module's inline
+  `chapters` array (analysis/chapter_source.py, shared with the search index)
+
+Rows are keyed by the SHA-1 of the raw response, so re-parsing the same
+response replaces its rows instead of duplicating them.
+
+The database sits next to the raw input: responses.crpa ->
+responses.stats.sqlite (loose .xml files share one responses.stats.sqlite
+per directory). extract_persona_b_output.py fills it when run with
+--stats-db; `scan` backfills a whole archive without extracting.
+
+Tokens are an approximation with no model files or network: text is split
+like a BPE pre-tokenizer (words, numbers, punctuation runs, whitespace) and
+each piece is costed by length. Piece costs are memoized, which makes code,
+full of repeated identifiers, cheap to count. The counts are for comparing
+responses and prompt versions with each other, not for billing.
+
+Usage:
+    python response_stats.py scan responses.crpa
+    python response_stats.py report responses.stats.sqlite
+    python response_stats.py report responses.stats.sqlite --top 20 --json stats.json
+    sqlite3 responses.stats.sqlite "SELECT slug, tokens, chapter_words_mean FROM responses ORDER BY tokens DESC"
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "analysis"))
+from chapter_source import extract_chapters  # noqa: E402
+
+TOKENIZER = "approx-v1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    sha TEXT PRIMARY KEY,
+    slug TEXT,
+    module_name TEXT,
+    source TEXT,
+    record INTEGER,
+    parsed_at REAL NOT NULL,
+    parsed INTEGER NOT NULL,
+    chars INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    tokenizer TEXT NOT NULL,
+    plan_chars INTEGER,
+    plan_words INTEGER,
+    plan_tokens INTEGER,
+    files INTEGER,
+    file_chars INTEGER,
+    file_tokens INTEGER,
+    chapters INTEGER,
+    chapter_words_mean REAL,
+    chapter_words_max INTEGER
+);
+CREATE TABLE IF NOT EXISTS files (
+    sha TEXT NOT NULL REFERENCES responses (sha) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    chars INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    tokens INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chapters (
+    sha TEXT NOT NULL REFERENCES responses (sha) ON DELETE CASCADE,
+    chapter INTEGER NOT NULL,
+    title TEXT,
+    words INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_sha ON files (sha);
+CREATE INDEX IF NOT EXISTS chapters_sha ON chapters (sha);
+CREATE INDEX IF NOT EXISTS responses_slug ON responses (slug);
+"""
+
+# BPE-style pre-tokenization: letters, short digit groups, punctuation runs, whitespace
+PIECE = re.compile(r" ?[A-Za-z]+| ?[0-9]{1,3}| ?[^\sA-Za-z0-9]+|\s+")
+# camelCase / PascalCase boundaries inside identifiers
+CASE_SPLIT = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+WORD = re.compile(r"\b[\w'’-]+\b")
+
+
+@lru_cache(maxsize=1 << 16)
+def _piece_tokens(piece: str) -> int:
+    body = piece.lstrip(" ") or piece
+    if body.isspace():
+        # Newline + indentation is usually one token, long runs a few more
+        return 1 + len(body) // 16
+    if not body.isascii():
+        # Accented letters, em dashes, emoji: roughly one token per character
+        return sum(2 if ord(ch) > 0xFFFF else 1 for ch in body)
+    if body[0].isalpha():
+        parts = CASE_SPLIT.findall(body) or [body]
+        # Common words are one token; longer ones split about every 6 letters
+        return sum(1 + (len(part) - 1) // 6 for part in parts)
+    if body[0].isdigit():
+        return 1
+    # Punctuation merges in pairs (`=>`, `);`, `</`) more often than not
+    return math.ceil(len(body) / 2)
+
+
+def count_tokens(text: str) -> int:
+    """Approximate BPE token count (see module docstring)."""
+    return sum(_piece_tokens(piece) for piece in PIECE.findall(text))
+
+
+def count_words(text: str) -> int:
+    return len(WORD.findall(text))
+
+
+def response_sha(response: str) -> str:
+    return hashlib.sha1(response.encode("utf-8")).hexdigest()
+
+
+def stats_path_for(input_path: str) -> Path:
+    """responses.crpa -> responses.stats.sqlite; loose XML files share
+    responses.stats.sqlite in their directory."""
+    path = Path(input_path)
+    if path.suffix == ".crpa":
+        return path.with_name(path.stem + ".stats.sqlite")
+    return path.with_name("responses.stats.sqlite")
+
+
+def measure_response(
+    response: str,
+    module_info: Optional[Dict[str, str]] = None,
+    plan: Optional[str] = None,
+    files: Optional[List[Dict[str, str]]] = None,
+) -> Dict[str, Any]:
+    """Sizes of one response. Without module_info it counts as unparsed."""
+    files = files or []
+    plan = plan or ""
+    file_rows = [
+        {
+            "path": f["path"],
+            "chars": len(f["content"]),
+            "bytes": len(f["content"].encode("utf-8")),
+            "lines": f["content"].count("\n") + 1 if f["content"] else 0,
+            "tokens": count_tokens(f["content"]),
+        }
+        for f in files
+    ]
+
+    chapter_rows = []
+    for f in files:
+        if f["path"].endswith(".tsx"):
+            chapters = extract_chapters(f["content"])
+            if chapters:
+                chapter_rows = [
+                    {"chapter": n, "title": c.get("title", ""), "words": count_words(c["content"])}
+                    for n, c in enumerate(chapters)
+                ]
+                break
+    words = [c["words"] for c in chapter_rows]
+
+    return {
+        "sha": response_sha(response),
+        "slug": (module_info or {}).get("slug"),
+        "module_name": (module_info or {}).get("module_name"),
+        "parsed": module_info is not None,
+        "chars": len(response),
+        "bytes": len(response.encode("utf-8")),
+        "tokens": count_tokens(response),
+        "tokenizer": TOKENIZER,
+        "plan_chars": len(plan),
+        "plan_words": count_words(plan),
+        "plan_tokens": count_tokens(plan),
+        "files": len(file_rows),
+        "file_chars": sum(f["chars"] for f in file_rows),
+        "file_tokens": sum(f["tokens"] for f in file_rows),
+        "chapters": len(words),
+        "chapter_words_mean": sum(words) / len(words) if words else None,
+        "chapter_words_max": max(words) if words else None,
+        "file_rows": file_rows,
+        "chapter_rows": chapter_rows,
+    }
+
+
+class StatsDB:
+    """Parse-time size table next to a response archive."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def record(self, stats: Dict[str, Any], source: Optional[str] = None, row: Optional[int] = None):
+        """Insert or replace one response's rows."""
+        with self.conn:
+            self.conn.execute("DELETE FROM responses WHERE sha = ?", (stats["sha"],))
+            self.conn.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    stats["sha"], stats["slug"], stats["module_name"], source, row, time.time(),
+                    int(stats["parsed"]), stats["chars"], stats["bytes"], stats["tokens"], stats["tokenizer"],
+                    stats["plan_chars"], stats["plan_words"], stats["plan_tokens"],
+                    stats["files"], stats["file_chars"], stats["file_tokens"],
+                    stats["chapters"], stats["chapter_words_mean"], stats["chapter_words_max"],
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                [(stats["sha"], f["path"], f["chars"], f["bytes"], f["lines"], f["tokens"]) for f in stats["file_rows"]],
+            )
+            self.conn.executemany(
+                "INSERT INTO chapters VALUES (?, ?, ?, ?)",
+                [(stats["sha"], c["chapter"], c["title"], c["words"]) for c in stats["chapter_rows"]],
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def scan_archive(archive_path: str, db_path: Optional[str] = None) -> Dict[str, Any]:
+    """Parse every record of an archive (no files written) and record its sizes."""
+    from extract_persona_b_output import (
+        clean_xml_string, extract_files, extract_module_info, extract_plan, parse_xml,
+    )
+    from response_archive import ResponseArchive
+
+    counts = {"records": 0, "parsed": 0}
+    with ResponseArchive(archive_path) as archive, StatsDB(db_path or stats_path_for(archive_path)) as db:
+        for row, raw in enumerate(archive):
+            # What extract_persona_b_output.py parses, so both key the same sha
+            response = clean_xml_string(raw)
+            root = parse_xml(response)
+            parsed = root is not None and root.find("module_name") is not None and root.find("slug") is not None
+            if parsed:
+                stats = measure_response(
+                    response, extract_module_info(root), extract_plan(root), extract_files(root)
+                )
+            else:
+                stats = measure_response(response)
+            db.record(stats, source=str(archive_path), row=row)
+            counts["records"] += 1
+            counts["parsed"] += parsed
+        counts["db"] = str(db.path)
+    return counts
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(1, math.ceil(q * len(sorted_values))) - 1]
+
+
+def stats_report(db_path: str, top: int = 10) -> Dict[str, Any]:
+    path = Path(db_path)
+    if not path.exists():
+        raise FileNotFoundError(f"No stats yet: {path}")
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+
+    rows = [dict(r) for r in conn.execute("SELECT * FROM responses ORDER BY tokens DESC")]
+    parsed = [r for r in rows if r["parsed"]]
+    summary = {}
+    for column in ("tokens", "chars", "plan_words", "file_tokens", "chapter_words_mean"):
+        values = sorted(r[column] for r in parsed if r[column] is not None)
+        summary[column] = {
+            "mean": sum(values) / len(values) if values else None,
+            "p50": _percentile(values, 0.5),
+            "p95": _percentile(values, 0.95),
+        }
+
+    total_tokens = sum(r["tokens"] for r in parsed)
+    largest_files = [
+        dict(r)
+        for r in conn.execute(
+            "SELECT responses.slug, files.path, files.tokens, files.lines FROM files "
+            "JOIN responses USING (sha) ORDER BY files.tokens DESC LIMIT ?",
+            (top,),
+        )
+    ]
+    conn.close()
+
+    return {
+        "responses": len(rows),
+        "parsed": len(parsed),
+        "summary": summary,
+        # Where the output tokens go: plan, files, the rest is XML wrapping
+        "share": {
+            "plan": sum(r["plan_tokens"] or 0 for r in parsed) / total_tokens if total_tokens else 0,
+            "files": sum(r["file_tokens"] or 0 for r in parsed) / total_tokens if total_tokens else 0,
+        },
+        "largest": [
+            {k: r[k] for k in ("slug", "tokens", "plan_words", "files", "chapter_words_mean", "parsed")}
+            for r in rows[:top]
+        ],
+        "largest_files": largest_files,
+    }
+
+
+def _num(value: Optional[float], width: int = 8) -> str:
+    return f"{value:{width},.0f}" if value is not None else " " * (width - 1) + "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record and report Persona B response sizes (chars, tokens, plan, words per chapter)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python response_stats.py scan responses.crpa
+  python response_stats.py report responses.stats.sqlite --top 20
+        """,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scan = sub.add_parser("scan", help="Record every record of a .crpa archive")
+    scan.add_argument("archive")
+    scan.add_argument("--db", help="Stats database (default: <archive>.stats.sqlite)")
+
+    report = sub.add_parser("report", help="Size percentiles and the largest responses")
+    report.add_argument("db")
+    report.add_argument("--top", type=int, default=10, help="Largest responses/files to list")
+    report.add_argument("--json", help="Also write the report to this file")
+
+    args = parser.parse_args()
+
+    if args.command == "scan":
+        try:
+            result = scan_archive(args.archive, args.db)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"✅ {result['records']} responses ({result['parsed']} parsed) → {result['db']}")
+        return 0
+
+    try:
+        result = stats_report(args.db, args.top)
+    except (OSError, sqlite3.Error) as e:
+        print(f"❌ {e}")
+        return 1
+
+    summary = result["summary"]
+    print("\n" + "=" * 60)
+    print(f"📏 RESPONSE SIZES ({TOKENIZER} tokens)")
+    print("=" * 60)
+    print(f"Responses:    {result['responses']} ({result['parsed']} parsed)")
+    print(f"{'':22}{'mean':>9}{'p50':>9}{'p95':>9}")
+    for column, label in (
+        ("tokens", "Tokens"),
+        ("chars", "Characters"),
+        ("file_tokens", "File tokens"),
+        ("plan_words", "Plan words"),
+        ("chapter_words_mean", "Words per chapter"),
+    ):
+        row = summary[column]
+        print(f"{label:22}{_num(row['mean'], 9)}{_num(row['p50'], 9)}{_num(row['p95'], 9)}")
+    print(f"Token share:  files {result['share']['files']:.0%}, plan {result['share']['plan']:.0%}, "
+          f"rest (XML, integration) {1 - result['share']['files'] - result['share']['plan']:.0%}")
+    print("-" * 60)
+    print(f"{'largest responses':36}{'tokens':>8}{'plan w':>8}{'ch. w':>8}")
+    for row in result["largest"]:
+        slug = (row["slug"] or "(unparsed)")[:35]
+        print(f"{slug:36}{_num(row['tokens'])}{_num(row['plan_words'])}{_num(row['chapter_words_mean'])}")
+    print("=" * 60)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
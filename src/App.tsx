@@ -5,62 +5,15 @@ import {
   Link,
   useLocation,
 } from "react-router-dom";
-import { useEffect, lazy, Suspense } from "react";
+import { useEffect, Suspense } from "react";
 
-// Import the centralized module registry
-import { getEnabledModules } from "./config/moduleRegistry";
+import { ModuleWrapper } from "@/components/common/ModuleWrapper";
+// Route table generated from the registry by DEV/SCRIPTS/build/compile_registry.py
+import { moduleRoutes } from "@/generated/routes";
 
 // Import home page
 import Home from "@modules/home";
 
-/**
- * Module Wrapper Component
- * Handles environment isolation for each module:
- * - Sets body background class
- * - Provides universal exit button
- * - Cleans up on unmount
- */
-interface ModuleWrapperProps {
-  children: React.ReactNode;
-  bgClass: string;
-  textClass?: string;
-  fontClass?: string;
-}
-
-const ModuleWrapper = ({
-  children,
-  bgClass,
-  textClass = "text-white",
-  fontClass = "font-sans",
-}: ModuleWrapperProps) => {
-  useEffect(() => {
-    const originalClass = document.body.className;
-    document.body.className = `${bgClass} ${textClass} ${fontClass}`;
-
-    return () => {
-      document.body.className = originalClass;
-    };
-  }, [bgClass, textClass, fontClass]);
-
-  return (
-    <div
-      className={`relative min-h-screen ${bgClass} ${textClass} ${fontClass}`}
-    >
-      {/* Universal Exit Button */}
-      <Link
-        to="/"
-        className="fixed top-4 left-3 z-[100] rounded-full bg-black/70 p-2 font-mono text-xs tracking-widest text-white uppercase opacity-30 shadow-lg transition-opacity hover:bg-black hover:opacity-100"
-        title="Return to Home"
-      >
-        ← EXIT
-      </Link>
-      <div className="mx-auto max-w-7xl px-4 sm:px-6 lg:px-12 lg:py-6">
-        {children}
-      </div>
-    </div>
-  );
-};
-
 /**
  * Scroll to Top on Route Change
  */
@@ -91,12 +44,14 @@ const ModuleLoader = () => (
  *
  * 🔌 SWITCHBOARD ARCHITECTURE
  *
- * Routes are now dynamically generated from the module registry.
+ * Routes come from src/generated/routes.tsx, compiled from the module
+ * registry: one lazy component per module, created once at import time.
  * To enable/disable a module:
- * 1. Open src/config/moduleRegistry.ts
+ * 1. Open src/config/moduleRegistry.json
  * 2. Find the module you want to toggle
  * 3. Set `enabled: true` or `enabled: false`
- * 4. Restart the dev server
+ * 4. Run DEV/SCRIPTS/build/compile_registry.py
+ * 5. Restart the dev server
  *
  * The module will automatically be:
  * - Added/removed from routing
@@ -104,9 +59,6 @@ const ModuleLoader = () => (
  * - Lazy-loaded only when needed
  */
 export default function App() {
-  // Get only enabled modules from the registry
-  const enabledModules = getEnabledModules();
-
   return (
     <BrowserRouter>
       <ScrollToTop />
@@ -122,28 +74,23 @@ export default function App() {
         />
 
         {/* Dynamically Generated Module Routes */}
-        {enabledModules.map((module) => {
-          // Lazy load the module component
-          const LazyComponent = lazy(module.component);
-
-          return (
-            <Route
-              key={module.id}
-              path={module.path}
-              element={
-                <ModuleWrapper
-                  bgClass={module.wrapperProps.bgClass}
-                  textClass={module.wrapperProps.textClass}
-                  fontClass={module.wrapperProps.fontClass}
-                >
-                  <Suspense fallback={<ModuleLoader />}>
-                    <LazyComponent />
-                  </Suspense>
-                </ModuleWrapper>
-              }
-            />
-          );
-        })}
+        {moduleRoutes.map(({ id, path, Component }) => (
+          <Route
+            key={id}
+            path={path}
+            element={
+              <Suspense
+                fallback={
+                  <ModuleWrapper bgClass="bg-zinc-950">
+                    <ModuleLoader />
+                  </ModuleWrapper>
+                }
+              >
+                <Component />
+              </Suspense>
+            }
+          />
+        ))}
 
         {/* 404 Fallback */}
         <Route
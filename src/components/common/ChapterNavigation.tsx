@@ -1,5 +1,6 @@
 import React from "react";
 import { ChevronLeft, ChevronRight } from "lucide-react";
+import { markChapterSwitch } from "./RenderProfiler";
 
 /**
  * ChapterNavigation - Standardized navigation for multi-chapter modules
@@ -92,20 +93,26 @@ export const ChapterNavigation: React.FC<ChapterNavigationProps> = ({
   const isFirstChapter = currentChapter === 0;
   const isLastChapter = currentChapter === totalChapters - 1;
 
+  // Times the transition when RUM is enabled (see RenderProfiler)
+  const changeChapter = (chapter: number) => {
+    markChapterSwitch(chapter);
+    onChapterChange(chapter);
+  };
+
   const handlePrevious = () => {
     if (!isFirstChapter) {
-      onChapterChange(currentChapter - 1);
+      changeChapter(currentChapter - 1);
     }
   };
 
   const handleNext = () => {
     if (!isLastChapter) {
-      onChapterChange(currentChapter + 1);
+      changeChapter(currentChapter + 1);
     }
   };
 
   const handleDotClick = (index: number) => {
-    onChapterChange(index);
+    changeChapter(index);
   };
 
   // Keyboard navigation
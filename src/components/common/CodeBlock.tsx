@@ -1,7 +1,15 @@
-import { Prism as SyntaxHighlighter } from "react-syntax-highlighter";
-import { vscDarkPlus } from "react-syntax-highlighter/dist/esm/styles/prism";
 import { Code2, Eye, EyeOff, Copy, Check } from "lucide-react";
-import { useState } from "react";
+import { lazy, Suspense, useState } from "react";
+import type { CSSProperties, ReactNode } from "react";
+import {
+  CODE_STYLE,
+  PRE_STYLE,
+  usePrehighlighted,
+} from "./prehighlighted";
+import type { PrehighlightedSample } from "./prehighlighted";
+
+// Only needed for samples that weren't tokenized at build time
+const PrismHighlighter = lazy(() => import("./PrismHighlighter"));
 
 type CodeBlockProps = {
   code: string;
@@ -12,6 +20,48 @@ type CodeBlockProps = {
   defaultExpanded?: boolean;
 };
 
+/** Renders build-time tokens, or the plain code while they load */
+const StaticHighlight = ({
+  code,
+  language,
+  sample,
+  customStyle,
+}: {
+  code: string;
+  language: string;
+  sample?: PrehighlightedSample | null;
+  customStyle: CSSProperties;
+}) => {
+  const parts: ReactNode[] = [];
+  if (sample) {
+    const { palette, tokens } = sample;
+    for (let i = 0; i < tokens.length; i += 2) {
+      const text = tokens[i] as string;
+      const color = tokens[i + 1] as number;
+      parts.push(
+        color ? (
+          <span key={i} style={{ color: palette[color] }}>
+            {text}
+          </span>
+        ) : (
+          text
+        ),
+      );
+    }
+  }
+
+  return (
+    <pre
+      className={`language-${language}`}
+      style={{ ...PRE_STYLE, ...customStyle }}
+    >
+      <code className={`language-${language}`} style={CODE_STYLE}>
+        {sample ? parts : code}
+      </code>
+    </pre>
+  );
+};
+
 export const CodeBlock = ({
   code,
   language = "jsx",
@@ -22,6 +72,8 @@ export const CodeBlock = ({
 }: CodeBlockProps) => {
   const [isExpanded, setIsExpanded] = useState(defaultExpanded);
   const [copied, setCopied] = useState(false);
+  const isVisible = isExpanded || !collapsible;
+  const prehighlighted = usePrehighlighted(language, code, isVisible);
 
   const handleCopy = async () => {
     try {
@@ -56,6 +108,14 @@ export const CodeBlock = ({
 
   const styles = variantStyles[variant];
 
+  const customStyle: CSSProperties = {
+    backgroundColor: styles.codeBg,
+    fontSize: "0.75rem",
+    borderRadius: "0",
+    margin: 0,
+    padding: "1rem",
+  };
+
   return (
     <div className="overflow-hidden rounded-2xl bg-gray-900/70 shadow-xl">
       <div
@@ -99,21 +159,32 @@ export const CodeBlock = ({
         </div>
       </div>
 
-      {(isExpanded || !collapsible) && (
+      {isVisible && (
         <div className={`border-t ${styles.border}`}>
-          <SyntaxHighlighter
-            language={language}
-            style={vscDarkPlus}
-            customStyle={{
-              backgroundColor: styles.codeBg,
-              fontSize: "0.75rem",
-              borderRadius: "0",
-              margin: 0,
-              padding: "1rem",
-            }}
-          >
-            {code}
-          </SyntaxHighlighter>
+          {prehighlighted === null ? (
+            <Suspense
+              fallback={
+                <StaticHighlight
+                  code={code}
+                  language={language}
+                  customStyle={customStyle}
+                />
+              }
+            >
+              <PrismHighlighter
+                code={code}
+                language={language}
+                customStyle={customStyle}
+              />
+            </Suspense>
+          ) : (
+            <StaticHighlight
+              code={code}
+              language={language}
+              sample={prehighlighted}
+              customStyle={customStyle}
+            />
+          )}
         </div>
       )}
     </div>
@@ -21,7 +21,7 @@ import React from "react";
  *
  * @example From module registry
  * ```tsx
- * const module = getModuleById('use-reducer-minority-report');
+ * const module = getEnabledModuleById('use-reducer-minority-report');
  *
  * <ModuleHeader
  *   icon={module.icon}
@@ -0,0 +1,109 @@
+import { useEffect } from "react";
+import type { ComponentType, ReactNode } from "react";
+import { Link } from "react-router-dom";
+import { loadModuleDetail } from "@/config/moduleRegistry";
+import type { RelatedModule } from "@/config/moduleRegistry";
+import { RenderProfiler } from "./RenderProfiler";
+
+/**
+ * Module Wrapper Component
+ * Handles environment isolation for each module:
+ * - Sets body background class
+ * - Provides universal exit button
+ * - Suggests related modules after the content
+ * - Cleans up on unmount
+ */
+interface ModuleWrapperProps {
+  children: ReactNode;
+  bgClass: string;
+  textClass?: string;
+  fontClass?: string;
+  related?: RelatedModule[];
+}
+
+export const ModuleWrapper = ({
+  children,
+  bgClass,
+  textClass = "text-white",
+  fontClass = "font-sans",
+  related = [],
+}: ModuleWrapperProps) => {
+  useEffect(() => {
+    const originalClass = document.body.className;
+    document.body.className = `${bgClass} ${textClass} ${fontClass}`;
+
+    return () => {
+      document.body.className = originalClass;
+    };
+  }, [bgClass, textClass, fontClass]);
+
+  return (
+    <div
+      className={`relative min-h-screen ${bgClass} ${textClass} ${fontClass}`}
+    >
+      {/* Universal Exit Button */}
+      <Link
+        to="/"
+        className="fixed top-4 left-3 z-[100] rounded-full bg-black/70 p-2 font-mono text-xs tracking-widest text-white uppercase opacity-30 shadow-lg transition-opacity hover:bg-black hover:opacity-100"
+        title="Return to Home"
+      >
+        ← EXIT
+      </Link>
+      <div className="mx-auto max-w-7xl px-4 sm:px-6 lg:px-12 lg:py-6">
+        {children}
+        {related.length > 0 && (
+          <nav
+            aria-label="Related modules"
+            className="mt-16 border-t border-white/10 pt-8 pb-12"
+          >
+            <h2 className="mb-4 font-mono text-xs tracking-widest uppercase opacity-60">
+              Related modules
+            </h2>
+            <ul className="grid gap-3 sm:grid-cols-2 lg:grid-cols-4">
+              {related.map((module) => (
+                <li key={module.id}>
+                  <Link
+                    to={module.path}
+                    className="block h-full rounded-lg border border-white/10 bg-black/20 p-4 transition-colors hover:border-white/30 hover:bg-black/40"
+                  >
+                    <span className="block font-semibold">{module.title}</span>
+                    <span className="mt-1 block text-sm opacity-70">
+                      {module.concept}
+                    </span>
+                  </Link>
+                </li>
+              ))}
+            </ul>
+          </nav>
+        )}
+      </div>
+    </div>
+  );
+};
+
+/**
+ * Loader for a module route: the module chunk and its wrapper/theme payload
+ * (src/generated/registry/<id>.json) load in parallel, then the module
+ * renders inside its ModuleWrapper. Used by the generated route table.
+ * With VITE_RUM_ENDPOINT set, renders are timed by RenderProfiler.
+ */
+export const loadModuleRoute = async (
+  id: string,
+  loadComponent: () => Promise<{ default: ComponentType }>,
+): Promise<{ default: ComponentType }> => {
+  const [{ default: Component }, detail] = await Promise.all([
+    loadComponent(),
+    loadModuleDetail(id),
+  ]);
+
+  const ModuleRoute = () => (
+    <RenderProfiler id={id}>
+      <ModuleWrapper {...detail.wrapperProps} related={detail.related}>
+        <Component />
+      </ModuleWrapper>
+    </RenderProfiler>
+  );
+  ModuleRoute.displayName = `ModuleRoute(${id})`;
+
+  return { default: ModuleRoute };
+};
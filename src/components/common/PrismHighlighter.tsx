@@ -0,0 +1,30 @@
+import type { CSSProperties } from "react";
+import { Prism as SyntaxHighlighter } from "react-syntax-highlighter";
+import { vscDarkPlus } from "react-syntax-highlighter/dist/esm/styles/prism";
+
+/**
+ * Runtime fallback for CodeBlock samples that were not pre-tokenized at
+ * build time (see DEV/SCRIPTS/build/prehighlight_code.py). Lazily imported
+ * so the Prism runtime stays out of module chunks.
+ */
+type PrismHighlighterProps = {
+  code: string;
+  language: string;
+  customStyle: CSSProperties;
+};
+
+const PrismHighlighter = ({
+  code,
+  language,
+  customStyle,
+}: PrismHighlighterProps) => (
+  <SyntaxHighlighter
+    language={language}
+    style={vscDarkPlus}
+    customStyle={customStyle}
+  >
+    {code}
+  </SyntaxHighlighter>
+);
+
+export default PrismHighlighter;
@@ -0,0 +1,121 @@
+import { Profiler } from "react";
+import type { ProfilerOnRenderCallback, ReactNode } from "react";
+
+/**
+ * RenderProfiler - opt-in real-user render timing for module pages
+ *
+ * Wraps a module route in React's <Profiler> and reports commit durations
+ * to VITE_RUM_ENDPOINT (see DEV/SCRIPTS/analysis/rum_collector.py). Without
+ * the variable it renders its children as-is and records nothing.
+ *
+ * Samples are queued and sent in batches with navigator.sendBeacon - when
+ * the queue fills, every few seconds, and when the page is hidden - so
+ * reporting never adds a request per render.
+ *
+ * ChapterNavigation calls markChapterSwitch() before changing chapter; the
+ * next commit is recorded as a "chapter" sample with the time from click
+ * to commit.
+ */
+
+const ENDPOINT: string | undefined = import.meta.env.VITE_RUM_ENDPOINT;
+
+export const rumEnabled = Boolean(ENDPOINT);
+
+const MAX_BATCH = 25;
+const FLUSH_INTERVAL_MS = 10_000;
+
+type SampleKind = "mount" | "update" | "chapter";
+
+interface RenderSample {
+  /** Module id (registry id) */
+  module: string;
+  kind: SampleKind;
+  /** Time React spent rendering the committed update (ms) */
+  actual: number;
+  /** Estimated time to render the whole subtree without memoization (ms) */
+  base: number;
+  /** Chapter switches: target chapter and click-to-commit time (ms) */
+  chapter?: number;
+  latency?: number;
+}
+
+const session = Math.random().toString(36).slice(2, 10);
+let queue: RenderSample[] = [];
+let timer: ReturnType<typeof setTimeout> | undefined;
+let pendingChapter: { chapter: number; start: number } | undefined;
+
+const flush = () => {
+  clearTimeout(timer);
+  timer = undefined;
+  if (!ENDPOINT || queue.length === 0) return;
+
+  // A plain string is sent as text/plain, which needs no CORS preflight
+  const body = JSON.stringify({
+    session,
+    path: location.pathname,
+    userAgent: navigator.userAgent,
+    samples: queue,
+  });
+  queue = [];
+  if (!navigator.sendBeacon?.(ENDPOINT, body)) {
+    fetch(ENDPOINT, { method: "POST", body, keepalive: true }).catch(() => {});
+  }
+};
+
+const record = (sample: RenderSample) => {
+  queue.push(sample);
+  if (queue.length >= MAX_BATCH) flush();
+  else timer ??= setTimeout(flush, FLUSH_INTERVAL_MS);
+};
+
+if (rumEnabled) {
+  addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flush();
+  });
+  addEventListener("pagehide", flush);
+}
+
+/** Tag the next commit as a chapter transition (no-op when RUM is off) */
+export const markChapterSwitch = (chapter: number) => {
+  if (rumEnabled) pendingChapter = { chapter, start: performance.now() };
+};
+
+const round = (ms: number) => Math.round(ms * 100) / 100;
+
+const onRender: ProfilerOnRenderCallback = (
+  id,
+  phase,
+  actualDuration,
+  baseDuration,
+  _startTime,
+  commitTime,
+) => {
+  const sample: RenderSample = {
+    module: id,
+    kind: phase === "mount" ? "mount" : "update",
+    actual: round(actualDuration),
+    base: round(baseDuration),
+  };
+  if (pendingChapter && phase !== "mount") {
+    sample.kind = "chapter";
+    sample.chapter = pendingChapter.chapter;
+    sample.latency = round(commitTime - pendingChapter.start);
+    pendingChapter = undefined;
+  }
+  record(sample);
+};
+
+interface RenderProfilerProps {
+  /** Module id reported with every sample */
+  id: string;
+  children: ReactNode;
+}
+
+export const RenderProfiler = ({ id, children }: RenderProfilerProps) =>
+  rumEnabled ? (
+    <Profiler id={id} onRender={onRender}>
+      {children}
+    </Profiler>
+  ) : (
+    <>{children}</>
+  );
@@ -0,0 +1,126 @@
+import { useEffect, useState } from "react";
+import type { CSSProperties } from "react";
+import index from "@/generated/codeblocks/index.json";
+
+/**
+ * Build-time highlighted CodeBlock samples.
+ *
+ * DEV/SCRIPTS/build/prehighlight_code.py tokenizes every static sample with
+ * Pygments and writes one JSON per module to src/generated/codeblocks. The
+ * small index (sample hash -> module id) ships with CodeBlock; token data is
+ * only fetched when a block is expanded.
+ */
+
+type Payload = {
+  v: number;
+  palette: string[];
+  blocks: Record<string, { n: number; t: (string | number)[] }>;
+};
+
+export type PrehighlightedSample = {
+  palette: string[];
+  /** Flat [text, colorIndex, text, colorIndex, ...]; color 0 is plain text */
+  tokens: (string | number)[];
+};
+
+const GENERATED_DIR = "/src/generated/codeblocks";
+
+const payloads = import.meta.glob<Payload>(
+  ["/src/generated/codeblocks/*.json", "!/src/generated/codeblocks/index.json"],
+  { import: "default" },
+);
+
+const sampleIndex: Record<string, string> = index;
+const loaded = new Map<string, Promise<Payload | null>>();
+
+/** FNV-1a over UTF-16 code units - must match prehighlight_code.sample_key */
+export const sampleKey = (language: string, code: string): string => {
+  const text = `${language}\n${code}`;
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16).padStart(8, "0");
+};
+
+export const loadPrehighlighted = async (
+  language: string,
+  code: string,
+): Promise<PrehighlightedSample | null> => {
+  const key = sampleKey(language, code);
+  const moduleId = sampleIndex[key];
+  const load = moduleId && payloads[`${GENERATED_DIR}/${moduleId}.json`];
+  if (!load) return null;
+
+  let payload = loaded.get(moduleId);
+  if (!payload) {
+    payload = load().catch(() => null);
+    loaded.set(moduleId, payload);
+  }
+
+  const data = await payload;
+  const block = data?.blocks[key];
+  if (!data || !block || block.n !== code.length) return null;
+  return { palette: data.palette, tokens: block.t };
+};
+
+/**
+ * Pre-tokenized sample for `code`, fetched once `enabled` is true.
+ *
+ * Returns undefined while loading and null when the sample has no build-time
+ * tokens (dynamic code, or generated data is stale).
+ */
+export const usePrehighlighted = (
+  language: string,
+  code: string,
+  enabled: boolean,
+): PrehighlightedSample | null | undefined => {
+  const key = sampleKey(language, code);
+  const available = key in sampleIndex;
+  const [result, setResult] = useState<{
+    key: string;
+    sample: PrehighlightedSample | null;
+  } | null>(null);
+
+  useEffect(() => {
+    if (!enabled || !available) return;
+    let cancelled = false;
+    loadPrehighlighted(language, code).then((sample) => {
+      if (!cancelled) setResult({ key, sample });
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [language, code, key, enabled, available]);
+
+  if (!available) return null;
+  return result?.key === key ? result.sample : undefined;
+};
+
+/** vscDarkPlus `pre`/`code` styles, so both render paths look identical */
+const FONT_STYLE: CSSProperties = {
+  color: "#d4d4d4",
+  fontSize: "13px",
+  textShadow: "none",
+  fontFamily:
+    'Menlo, Monaco, Consolas, "Andale Mono", "Ubuntu Mono", "Courier New", monospace',
+  direction: "ltr",
+  textAlign: "left",
+  whiteSpace: "pre",
+  wordSpacing: "normal",
+  wordBreak: "normal",
+  lineHeight: "1.5",
+  tabSize: 4,
+  hyphens: "none",
+};
+
+export const PRE_STYLE: CSSProperties = {
+  ...FONT_STYLE,
+  padding: "1em",
+  margin: ".5em 0",
+  overflow: "auto",
+  backgroundColor: "#1e1e1e",
+};
+
+export const CODE_STYLE: CSSProperties = FONT_STYLE;
@@ -0,0 +1,91 @@
+import { useCallback, useEffect, useRef, useState } from "react";
+
+/** Lazy loaders for a module's chapters/<n>.json, all but chapter 0 */
+export type ChapterFiles<T> = Record<string, () => Promise<T>>;
+
+// Loaded chapters per module, kept across remounts so going back is instant
+const loadedByModule = new WeakMap<object, Map<number, unknown>>();
+
+const chapterFile = (index: number) => `./chapters/${index}.json`;
+
+/**
+ * Chapter prose externalized by DEV/SCRIPTS/build/externalize_chapters.py.
+ *
+ * The first chapter is bundled with the module (`first`); the others are
+ * fetched on demand, and the one after the current chapter is prefetched.
+ * `goToChapter` only calls `setIndex` once the chapter has loaded, so the
+ * module's chapter index, its demo and the prose never disagree; offline,
+ * navigation stays on the current chapter.
+ */
+export function useChapters<T>(
+  files: ChapterFiles<T>,
+  index: number,
+  first: T,
+  setIndex: (index: number) => void,
+): { currentChapter: T; chapterCount: number; goToChapter: (index: number) => void } {
+  let loaded = loadedByModule.get(files) as Map<number, T> | undefined;
+  if (!loaded) {
+    loaded = new Map([[0, first]]);
+    loadedByModule.set(files, loaded);
+  }
+  const chapters = loaded;
+  const [, setVersion] = useState(0);
+  const shown = useRef(first);
+  const requested = useRef(index);
+
+  const current = chapters.get(index);
+  if (current !== undefined) shown.current = current;
+
+  const load = useCallback(
+    (i: number): Promise<unknown> => {
+      const file = files[chapterFile(i)];
+      if (chapters.has(i) || !file) return Promise.resolve();
+      return file().then((chapter) => {
+        chapters.set(i, chapter);
+      });
+    },
+    [files, chapters],
+  );
+
+  const goToChapter = useCallback(
+    (next: number) => {
+      requested.current = next;
+      if (chapters.has(next)) {
+        setIndex(next);
+        return;
+      }
+      load(next)
+        .then(() => {
+          // A later click wins over a slow earlier one
+          if (requested.current === next) setIndex(next);
+        })
+        .catch(() => {
+          // Offline or a stale deploy: stay on the current chapter
+        });
+    },
+    [chapters, load, setIndex],
+  );
+
+  useEffect(() => {
+    let active = true;
+    // Only reached when the index was set directly rather than via goToChapter
+    const missing = !chapters.has(index);
+    load(index)
+      .then(() => {
+        if (active && missing) setVersion((version) => version + 1);
+        return load(index + 1);
+      })
+      .catch(() => {
+        // Offline or a stale deploy: keep showing the last chapter that loaded
+      });
+    return () => {
+      active = false;
+    };
+  }, [chapters, load, index]);
+
+  return {
+    currentChapter: current ?? shown.current,
+    chapterCount: Object.keys(files).length + 1,
+    goToChapter,
+  };
+}
@@ -1,5 +1,7 @@
 import React from "react";
-import modulesJSONData from "./moduleRegistry.json"; // ← Changed this line
+// Generated from moduleRegistry.json by DEV/SCRIPTS/build/compile_registry.py
+import registryIndex from "@/generated/registryIndex.json";
+import { moduleImports } from "@/generated/moduleImports";
 
 export interface ThemeConfig {
   /** Primary theme color from the safelist: cyan, amber, purple, emerald, red, blue */
@@ -43,8 +45,8 @@ import {
   Image,
 } from "lucide-react";
 
-// Type for the raw JSON structure
-interface RawModuleData {
+// Home card fields, as compiled into registryIndex.json
+interface RawModuleCard {
   id: string;
   path: string;
   title: string;
@@ -53,17 +55,40 @@ interface RawModuleData {
   icon: string; // String in JSON
   colorClass: string;
   bgClass: string;
-  component: string; // String in JSON
+}
+
+interface RegistryIndex {
+  cards: RawModuleCard[];
+  pathToId: Record<string, string>;
+  idToIndex: Record<string, number>;
+  stats: { total: number; enabled: number; disabled: number };
+}
+
+/**
+ * Per-module settings that are only needed once the route is open.
+ * Compiled to src/generated/registry/<id>.json and loaded with the module.
+ */
+export interface ModuleDetail {
   wrapperProps: {
     bgClass: string;
     textClass?: string;
     fontClass?: string;
   };
-  enabled: boolean;
-  // NEW: Theme configuration for shared components
+  // Theme configuration for shared components
   themeConfig?: ThemeConfig; // Optional for backward compatibility
+  // Most similar modules (DEV/SCRIPTS/build/build_related.py)
+  related?: RelatedModule[];
+}
+
+/** Link to a similar module, shown at the end of a module page */
+export interface RelatedModule {
+  id: string;
+  path: string;
+  title: string;
+  concept: string;
 }
 
+/** Enabled module as shown on the home grid */
 export interface ModuleConfig {
   id: string;
   path: string;
@@ -74,14 +99,6 @@ export interface ModuleConfig {
   colorClass: string;
   bgClass: string;
   component: () => Promise<{ default: React.ComponentType }>;
-  wrapperProps: {
-    bgClass: string;
-    textClass?: string;
-    fontClass?: string;
-  };
-  enabled: boolean;
-  // NEW: Theme configuration for shared components
-  themeConfig?: ThemeConfig;
 }
 
 // Icon mapping - maps JSON string names to actual Lucide components
@@ -103,40 +120,54 @@ const iconMap: Record<string, React.ComponentType<any>> = {
   Car,
 };
 
-// Transform JSON data into proper ModuleConfig format
-export const moduleRegistry: ModuleConfig[] = modulesJSONData.map(
-  // ← No type assertion needed
-  (raw: RawModuleData): ModuleConfig => ({
+const index: RegistryIndex = registryIndex;
+
+const details = import.meta.glob<ModuleDetail>("/src/generated/registry/*.json", {
+  import: "default",
+});
+
+// Used when a module has no compiled detail payload (stale generated output)
+const DEFAULT_DETAIL: ModuleDetail = { wrapperProps: { bgClass: "bg-zinc-950" } };
+
+// Transform the compiled cards into ModuleConfig format. Only enabled modules
+// are compiled, so unlike the raw registry this has no disabled entries.
+export const enabledModules: ModuleConfig[] = index.cards.map(
+  (raw): ModuleConfig => ({
     ...raw,
     icon: iconMap[raw.icon] || Brain,
-    component: () => import(`../modules/${raw.id}/index.tsx`),
+    // Static per-module import; a template import would make Vite bundle
+    // every directory in src/modules
+    component: moduleImports[raw.id],
   }),
 );
 
+const moduleIndexById = new Map(Object.entries(index.idToIndex));
+const moduleIdByPath = new Map(Object.entries(index.pathToId));
+
 /**
  * UTILITY FUNCTIONS
  */
 
 // Get all enabled modules
-export const getEnabledModules = (): ModuleConfig[] => {
-  return moduleRegistry.filter((module) => module.enabled);
+export const getEnabledModules = (): ModuleConfig[] => enabledModules;
+
+// Get module by ID; undefined for disabled modules
+export const getEnabledModuleById = (id: string): ModuleConfig | undefined => {
+  const position = moduleIndexById.get(id);
+  return position === undefined ? undefined : enabledModules[position];
 };
 
-// Get module by ID
-export const getModuleById = (id: string): ModuleConfig | undefined => {
-  return moduleRegistry.find((module) => module.id === id);
+// Get module by path; undefined for disabled modules
+export const getEnabledModuleByPath = (path: string): ModuleConfig | undefined => {
+  const id = moduleIdByPath.get(path);
+  return id === undefined ? undefined : getEnabledModuleById(id);
 };
 
-// Get module by path
-export const getModuleByPath = (path: string): ModuleConfig | undefined => {
-  return moduleRegistry.find((module) => module.path === path);
+// Load wrapper/theme settings for a module (its own small chunk)
+export const loadModuleDetail = async (id: string): Promise<ModuleDetail> => {
+  const load = details[`/src/generated/registry/${id}.json`];
+  return load ? load() : DEFAULT_DETAIL;
 };
 
 // Count enabled vs total modules
-export const getModuleStats = () => {
-  const total = moduleRegistry.length;
-  const enabled = moduleRegistry.filter((m) => m.enabled).length;
-  const disabled = total - enabled;
-
-  return { total, enabled, disabled };
-};
+export const getModuleStats = () => index.stats;
@@ -0,0 +1,76 @@
+// Generated by DEV/SCRIPTS/build/compile_registry.py - do not edit.
+// Re-run it after changing src/config/moduleRegistry.json.
+//
+// One static import per ENABLED module. Disabled entries, _template and
+// directories without a registry entry are never referenced, so Vite
+// doesn't compile or emit them.
+import type { ComponentType } from "react";
+
+export type ModuleImport = () => Promise<{ default: ComponentType }>;
+
+export const moduleImports: Record<string, ModuleImport> = {
+  "usestate-hook-macbeth": () =>
+    import("../modules/usestate-hook-macbeth/index.tsx"),
+  "state-through-hamlet": () =>
+    import("../modules/state-through-hamlet/index.tsx"),
+  "jsx-hamlet-mousetrap": () =>
+    import("../modules/jsx-hamlet-mousetrap/index.tsx"),
+  "conditional-rendering-forest-of-arden": () =>
+    import("../modules/conditional-rendering-forest-of-arden/index.tsx"),
+  "event-handling-julius-caesar": () =>
+    import("../modules/event-handling-julius-caesar/index.tsx"),
+  "use-effect-hamlet-ghost": () =>
+    import("../modules/use-effect-hamlet-ghost/index.tsx"),
+  "lists-and-keys-henry-v": () =>
+    import("../modules/lists-and-keys-henry-v/index.tsx"),
+  "lifting-state-up": () =>
+    import("../modules/lifting-state-up/index.tsx"),
+  "the-tempest-composition-over-inheritance": () =>
+    import("../modules/the-tempest-composition-over-inheritance/index.tsx"),
+  "component-lifecycle-shakespeare": () =>
+    import("../modules/component-lifecycle-shakespeare/index.tsx"),
+  "the-conspiracy-context": () =>
+    import("../modules/the-conspiracy-context/index.tsx"),
+  "use-callback-hook-hamlet": () =>
+    import("../modules/use-callback-hook-hamlet/index.tsx"),
+  "prosperos-custom-spells": () =>
+    import("../modules/prosperos-custom-spells/index.tsx"),
+  "global-state-winters-tale": () =>
+    import("../modules/global-state-winters-tale/index.tsx"),
+  "memoization-merchant-of-venice": () =>
+    import("../modules/memoization-merchant-of-venice/index.tsx"),
+  "hamlet-error-boundaries": () =>
+    import("../modules/hamlet-error-boundaries/index.tsx"),
+  "portals-midsummer-play-within-play": () =>
+    import("../modules/portals-midsummer-play-within-play/index.tsx"),
+  "fragments-twins-of-ephasus": () =>
+    import("../modules/fragments-twins-of-ephasus/index.tsx"),
+  "the-mousetrap-test": () =>
+    import("../modules/the-mousetrap-test/index.tsx"),
+  "headless-ui-primitives": () =>
+    import("../modules/headless-ui-primitives/index.tsx"),
+  "much-ado-about-memo": () =>
+    import("../modules/much-ado-about-memo/index.tsx"),
+  "react-query-caesar": () =>
+    import("../modules/react-query-caesar/index.tsx"),
+  "react-router-pericles-journey": () =>
+    import("../modules/react-router-pericles-journey/index.tsx"),
+  "useref-hamlet-yoricks-skull": () =>
+    import("../modules/useref-hamlet-yoricks-skull/index.tsx"),
+  "components-mechanicals-play": () =>
+    import("../modules/components-mechanicals-play/index.tsx"),
+  "performance-profiling-agincourt": () =>
+    import("../modules/performance-profiling-agincourt/index.tsx"),
+  "strict-mode-hamlet-advice": () =>
+    import("../modules/strict-mode-hamlet-advice/index.tsx"),
+  "props-through-king-lear": () =>
+    import("../modules/props-through-king-lear/index.tsx"),
+  "merchant-of-venice-controlled-forms": () =>
+    import("../modules/merchant-of-venice-controlled-forms/index.tsx"),
+  "reducer-conspiracy": () =>
+    import("../modules/reducer-conspiracy/index.tsx"),
+  "synchronous-translation-layout-effect": () =>
+    import("../modules/synchronous-translation-layout-effect/index.tsx"),
+  "zod-and-the-pound-of-flesh": () =>
+    import("../modules/zod-and-the-pound-of-flesh/index.tsx"),
+};
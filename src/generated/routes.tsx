@@ -0,0 +1,239 @@
+// Generated by DEV/SCRIPTS/build/compile_registry.py - do not edit.
+// Re-run it after changing src/config/moduleRegistry.json.
+import { lazy } from "react";
+import type { ComponentType, LazyExoticComponent } from "react";
+import { loadModuleRoute } from "@/components/common/ModuleWrapper";
+import { moduleImports } from "./moduleImports";
+
+export interface ModuleRoute {
+  id: string;
+  path: string;
+  Component: LazyExoticComponent<ComponentType>;
+}
+
+export const moduleRoutes: readonly ModuleRoute[] = [
+  {
+    id: "usestate-hook-macbeth",
+    path: "/usestate-hook-macbeth",
+    Component: lazy(() =>
+      loadModuleRoute("usestate-hook-macbeth", moduleImports["usestate-hook-macbeth"]),
+    ),
+  },
+  {
+    id: "state-through-hamlet",
+    path: "/state-through-hamlet",
+    Component: lazy(() =>
+      loadModuleRoute("state-through-hamlet", moduleImports["state-through-hamlet"]),
+    ),
+  },
+  {
+    id: "jsx-hamlet-mousetrap",
+    path: "/jsx-hamlet-mousetrap",
+    Component: lazy(() =>
+      loadModuleRoute("jsx-hamlet-mousetrap", moduleImports["jsx-hamlet-mousetrap"]),
+    ),
+  },
+  {
+    id: "conditional-rendering-forest-of-arden",
+    path: "/conditional-rendering-forest-of-arden",
+    Component: lazy(() =>
+      loadModuleRoute("conditional-rendering-forest-of-arden", moduleImports["conditional-rendering-forest-of-arden"]),
+    ),
+  },
+  {
+    id: "event-handling-julius-caesar",
+    path: "/event-handling-julius-caesar",
+    Component: lazy(() =>
+      loadModuleRoute("event-handling-julius-caesar", moduleImports["event-handling-julius-caesar"]),
+    ),
+  },
+  {
+    id: "use-effect-hamlet-ghost",
+    path: "/use-effect-hamlet-ghost",
+    Component: lazy(() =>
+      loadModuleRoute("use-effect-hamlet-ghost", moduleImports["use-effect-hamlet-ghost"]),
+    ),
+  },
+  {
+    id: "lists-and-keys-henry-v",
+    path: "/lists-and-keys-henry-v",
+    Component: lazy(() =>
+      loadModuleRoute("lists-and-keys-henry-v", moduleImports["lists-and-keys-henry-v"]),
+    ),
+  },
+  {
+    id: "lifting-state-up",
+    path: "/lifting-state-up",
+    Component: lazy(() =>
+      loadModuleRoute("lifting-state-up", moduleImports["lifting-state-up"]),
+    ),
+  },
+  {
+    id: "the-tempest-composition-over-inheritance",
+    path: "/the-tempest-composition-over-inheritance",
+    Component: lazy(() =>
+      loadModuleRoute("the-tempest-composition-over-inheritance", moduleImports["the-tempest-composition-over-inheritance"]),
+    ),
+  },
+  {
+    id: "component-lifecycle-shakespeare",
+    path: "/component-lifecycle-shakespeare",
+    Component: lazy(() =>
+      loadModuleRoute("component-lifecycle-shakespeare", moduleImports["component-lifecycle-shakespeare"]),
+    ),
+  },
+  {
+    id: "the-conspiracy-context",
+    path: "/the-conspiracy-context",
+    Component: lazy(() =>
+      loadModuleRoute("the-conspiracy-context", moduleImports["the-conspiracy-context"]),
+    ),
+  },
+  {
+    id: "use-callback-hook-hamlet",
+    path: "/use-callback-hook-hamlet",
+    Component: lazy(() =>
+      loadModuleRoute("use-callback-hook-hamlet", moduleImports["use-callback-hook-hamlet"]),
+    ),
+  },
+  {
+    id: "prosperos-custom-spells",
+    path: "/prosperos-custom-spells",
+    Component: lazy(() =>
+      loadModuleRoute("prosperos-custom-spells", moduleImports["prosperos-custom-spells"]),
+    ),
+  },
+  {
+    id: "global-state-winters-tale",
+    path: "/global-state-winters-tale",
+    Component: lazy(() =>
+      loadModuleRoute("global-state-winters-tale", moduleImports["global-state-winters-tale"]),
+    ),
+  },
+  {
+    id: "memoization-merchant-of-venice",
+    path: "/memoization-merchant-of-venice",
+    Component: lazy(() =>
+      loadModuleRoute("memoization-merchant-of-venice", moduleImports["memoization-merchant-of-venice"]),
+    ),
+  },
+  {
+    id: "hamlet-error-boundaries",
+    path: "/hamlet-error-boundaries",
+    Component: lazy(() =>
+      loadModuleRoute("hamlet-error-boundaries", moduleImports["hamlet-error-boundaries"]),
+    ),
+  },
+  {
+    id: "portals-midsummer-play-within-play",
+    path: "/portals-midsummer-play-within-play",
+    Component: lazy(() =>
+      loadModuleRoute("portals-midsummer-play-within-play", moduleImports["portals-midsummer-play-within-play"]),
+    ),
+  },
+  {
+    id: "fragments-twins-of-ephasus",
+    path: "/fragments-twins-of-ephasus",
+    Component: lazy(() =>
+      loadModuleRoute("fragments-twins-of-ephasus", moduleImports["fragments-twins-of-ephasus"]),
+    ),
+  },
+  {
+    id: "the-mousetrap-test",
+    path: "/the-mousetrap-test",
+    Component: lazy(() =>
+      loadModuleRoute("the-mousetrap-test", moduleImports["the-mousetrap-test"]),
+    ),
+  },
+  {
+    id: "headless-ui-primitives",
+    path: "/headless-ui-primitives",
+    Component: lazy(() =>
+      loadModuleRoute("headless-ui-primitives", moduleImports["headless-ui-primitives"]),
+    ),
+  },
+  {
+    id: "much-ado-about-memo",
+    path: "/much-ado-about-memo",
+    Component: lazy(() =>
+      loadModuleRoute("much-ado-about-memo", moduleImports["much-ado-about-memo"]),
+    ),
+  },
+  {
+    id: "react-query-caesar",
+    path: "/react-query-caesar",
+    Component: lazy(() =>
+      loadModuleRoute("react-query-caesar", moduleImports["react-query-caesar"]),
+    ),
+  },
+  {
+    id: "react-router-pericles-journey",
+    path: "/react-router-pericles-journey",
+    Component: lazy(() =>
+      loadModuleRoute("react-router-pericles-journey", moduleImports["react-router-pericles-journey"]),
+    ),
+  },
+  {
+    id: "useref-hamlet-yoricks-skull",
+    path: "/useref-hamlet-yoricks-skull",
+    Component: lazy(() =>
+      loadModuleRoute("useref-hamlet-yoricks-skull", moduleImports["useref-hamlet-yoricks-skull"]),
+    ),
+  },
+  {
+    id: "components-mechanicals-play",
+    path: "/components-mechanicals-play",
+    Component: lazy(() =>
+      loadModuleRoute("components-mechanicals-play", moduleImports["components-mechanicals-play"]),
+    ),
+  },
+  {
+    id: "performance-profiling-agincourt",
+    path: "/performance-profiling-agincourt",
+    Component: lazy(() =>
+      loadModuleRoute("performance-profiling-agincourt", moduleImports["performance-profiling-agincourt"]),
+    ),
+  },
+  {
+    id: "strict-mode-hamlet-advice",
+    path: "/strict-mode-hamlet-advice",
+    Component: lazy(() =>
+      loadModuleRoute("strict-mode-hamlet-advice", moduleImports["strict-mode-hamlet-advice"]),
+    ),
+  },
+  {
+    id: "props-through-king-lear",
+    path: "/props-through-king-lear",
+    Component: lazy(() =>
+      loadModuleRoute("props-through-king-lear", moduleImports["props-through-king-lear"]),
+    ),
+  },
+  {
+    id: "merchant-of-venice-controlled-forms",
+    path: "/merchant-of-venice-controlled-forms",
+    Component: lazy(() =>
+      loadModuleRoute("merchant-of-venice-controlled-forms", moduleImports["merchant-of-venice-controlled-forms"]),
+    ),
+  },
+  {
+    id: "reducer-conspiracy",
+    path: "/reducer-conspiracy",
+    Component: lazy(() =>
+      loadModuleRoute("reducer-conspiracy", moduleImports["reducer-conspiracy"]),
+    ),
+  },
+  {
+    id: "synchronous-translation-layout-effect",
+    path: "/synchronous-translation-layout-effect",
+    Component: lazy(() =>
+      loadModuleRoute("synchronous-translation-layout-effect", moduleImports["synchronous-translation-layout-effect"]),
+    ),
+  },
+  {
+    id: "zod-and-the-pound-of-flesh",
+    path: "/zod-and-the-pound-of-flesh",
+    Component: lazy(() =>
+      loadModuleRoute("zod-and-the-pound-of-flesh", moduleImports["zod-and-the-pound-of-flesh"]),
+    ),
+  },
+];
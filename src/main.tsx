@@ -9,8 +9,37 @@ if (!root) {
   throw new Error("Root element not found");
 }
 
+// #root may hold the static home snapshot from index.html; the first render
+// replaces it.
 ReactDOM.createRoot(root).render(
   <React.StrictMode>
     <App />
   </React.StrictMode>,
 );
+
+// After a deploy the new worker is still installing when register() resolves;
+// the fill must go to it, not to the active worker it is about to replace
+const newestWorker = (registration: ServiceWorkerRegistration) =>
+  new Promise<ServiceWorker | null>((resolve) => {
+    const next = registration.installing ?? registration.waiting;
+    if (!next) return resolve(registration.active);
+    next.addEventListener("statechange", () => {
+      if (next.state === "activated") resolve(next);
+      else if (next.state === "redundant") resolve(registration.active);
+    });
+  });
+
+// Service worker built by DEV/SCRIPTS/build/build_precache.py (production
+// builds only). Once the page has loaded, it prefetches module chunks in
+// the background so later navigation doesn't wait on the network.
+if (import.meta.env.PROD && "serviceWorker" in navigator) {
+  window.addEventListener("load", () => {
+    navigator.serviceWorker
+      .register("/sw.js")
+      .then(newestWorker)
+      .then((worker) => worker?.postMessage({ type: "precache-modules" }))
+      .catch(() => {
+        // No service worker (e.g. dist without build_precache.py) - fine
+      });
+  });
+}
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -23,29 +31,6 @@ export default function ComponentLifecycleShakespeare(): JSX.Element {
   const [unmountClean, setUnmountClean] = useState<boolean>(true);
   const [lifecycleStage, setLifecycleStage] = useState<string>("WAITING");
   
-  const chapters: Chapter[] = [
-    { 
-      title: "All The World's A Stage", 
-      content: "Just as a player's entrance marks their first appearance on stage, a React component's mounting phase is its initial render. This is where the component first appears in the DOM, ready to play its part in your application." 
-    },
-    { 
-      title: "The Soldier Who Would Not Sheath His Sword", 
-      content: "Components that don't clean up resources are like soldiers who won't change roles. Timers, event listeners, and subscriptions left running cause memory leaks and bugs—cluttering your application's stage with discarded props." 
-    },
-    { 
-      title: "And One Man In His Time Plays Many Parts", 
-      content: "Lifecycle methods provide structure: mount (entrance), update (role change), unmount (exit). useEffect with cleanup functions ensures each phase transitions smoothly, preventing conflicts between a component's different roles." 
-    },
-    { 
-      title: "Exits and Entrances", 
-      content: "A messy unmount leaves orphaned resources that break the stage. A clean unmount with proper cleanup (return function in useEffect) removes event listeners and timers, leaving the DOM ready for the next component's entrance." 
-    },
-    { 
-      title: "A Completed Play", 
-      content: "Mastering the full lifecycle—mount, update, unmount—creates robust components. Each phase has specific responsibilities: setup, adaptation, and cleanup. Managed properly, your components will perform their roles flawlessly from entrance to exit." 
-    },
-  ];
-
   // Code examples
   const antiPatternCode = `// ❌ Soldier who won't sheathe his sword
 function LeakyComponent() {
@@ -185,7 +170,12 @@ function CleanExit() {
     }
   }, [chapter]);
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -758,8 +748,8 @@ function PlayerJourney() {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="emerald"
           />
         </ModuleLayout>
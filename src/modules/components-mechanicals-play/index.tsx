@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -36,29 +44,6 @@ export default function ComponentsMechanicalsPlay(): JSX.Element {
     };
   }, []);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Scroll in the Hand",
-      content: "Quince hands Bottom a scroll defining his role as Pyramus. Like an actor receiving a script, a React component receives props that define its behavior and appearance. Props are inputs that make components reusable and declarative."
-    },
-    {
-      title: "The Tangle of Ambition",
-      content: "Bottom tries to play every role, creating a tangled mess. Similarly, a monolithic React component attempting to handle all UI logic becomes unmanageable. This anti-pattern leads to complex state, poor reusability, and debugging nightmares."
-    },
-    {
-      title: "The Director's Decree",
-      content: "Quince declares 'One man to one part.' In React, this means breaking UI into focused, single-responsibility components. Modular components are easier to test, maintain, and reuse. Clear boundaries create clean architecture."
-    },
-    {
-      title: "The Wall's Chink",
-      content: "When Snout simply announces 'I am the wall,' the story flows. A well-boundaried component renders its specific UI without blocking others. Modular components work independently yet in concert, creating smooth user experiences."
-    },
-    {
-      title: "The Duke's Applause",
-      content: "The complete play emerges from well-partitioned parts. A React application is the sum of its components—each playing its specific role. Proper composition creates maintainable, scalable applications that delight users."
-    }
-  ];
-
   const mechanicals: Mechanical[] = [
     { id: 'bottom', name: 'Bottom', role: 'Pyramus', script: 'O grim-look\'d night!', color: 'bg-amber-600' },
     { id: 'flute', name: 'Flute', role: 'Thisbe', script: 'Asleep, my love?', color: 'bg-violet-600' },
@@ -138,7 +123,12 @@ function App() {
   );
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Demo effect for showing render issues
   useEffect(() => {
@@ -919,8 +909,8 @@ function App() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -81,29 +89,6 @@ export default function ConditionalRenderingForestOfArden(): JSX.Element {
     return 'neutral';
   }, [isBanished, demoMode]);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Decree",
-      content: "Duke Frederick's banishment decree instantly changes Rosalind's status—from safe princess to hunted outlaw. In React, this is a **state change** (`isBanished: true`). The app must now render different UI based on this new condition."
-    },
-    {
-      title: "The Beacon",
-      content: `Rosalind's silk gown makes her dangerously visible in the forest—the wrong UI for the environment. This is **static rendering**: showing Component A when state requires Component B. Without conditional logic, your app presents incompatible interfaces.`
-    },
-    {
-      title: "The Choice",
-      content: `In the shepherd's hut, Rosalind chooses the tunic—deliberate conditional logic. In React: \`if (isBanished) return <Ganymede />\`. The **component evaluates state** and returns appropriate JSX. This transformation happens at render time.`
-    },
-    {
-      title: "Two Faces of the Forest",
-      content: "**Static rendering** fails: forester recognizes the princess. **Conditional rendering** succeeds: Ganymede is accepted. Same forest (`isBanished: true`), different output. Conditional rendering matches UI to application state."
-    },
-    {
-      title: "A Martial Outside",
-      content: `Ganymede's performance embodies **dynamic conditional rendering**. While \`isBanished === true\`, the component returns \`<Ganymede />\`. Multiple nested conditions (Celia → Aliena) show complex logic trees. The UI continuously re-evaluates state.`
-    }
-  ];
-
   // Code examples
   const antiPatternCode = `// ❌ Static Rendering - Ignores state
 function RosalindComponent() {
@@ -154,7 +139,12 @@ function Companions({ isBanished, celiaAccompanies }: {
   return <Ganymede />;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
   const foresterResult = triggerForesterInteraction();
 
   return (
@@ -577,8 +567,8 @@ function CharacterScene() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="emerald"
           />
         </ModuleLayout>
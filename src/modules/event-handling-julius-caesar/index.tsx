@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<typeof firstChapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface CrowdState {
   loyalty: 'brutus' | 'caesar' | 'none';
@@ -87,30 +95,12 @@ export default function EventHandlingJuliusCaesar(): JSX.Element {
     setIsClimaxTriggered(false);
   };
 
-  const chapters = [
-    {
-      title: "The State of Rome",
-      content: "Brutus's speech sets the crowd's initial state: `loyalty: 'brutus'`. Like a React component receiving props, this static rendering creates a UI but provides no interactivity. The state is fixed until an event occurs."
-    },
-    {
-      title: "Lend Me Your Ears",
-      content: "Antony's request is an event. The crowd's handler—`onSilenceRequest`—fires, updating state to `isListening: true`. This is React's `onClick`: an external trigger that causes a handler function to run and update state."
-    },
-    {
-      title: "The Will and The Wave",
-      content: "A sequence of events (pause, reveal, read) triggers multiple handlers. Each updates the state (`sadness` → `rage`), culminating in a re-render—the crowd's roar. This is cascading `setState` calls within event handlers."
-    },
-    {
-      title: "The Empty Podium and The Living Code",
-      content: "Brutus's static speech has no event handlers. Antony's interactive approach binds handlers (`onClick`, `onChange`) that listen and update state. This comparison shows static rendering versus interactive, event-driven components."
-    },
-    {
-      title: "Mischief, Afoot",
-      content: "The final state (`isMob: true`) drives action—a side effect. In React, event handlers update state, and that new state can trigger side effects (API calls, navigation), completing the event handling cycle."
-    }
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Code Examples
   const staticComponentCode = `// ❌ Brutus Pattern: Static, No Handlers
@@ -599,8 +589,8 @@ const handleSilenceRequest = () => {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -17,29 +25,6 @@ export default function FragmentsTwinsOfEphesus(): JSX.Element {
   const [showDomNodes, setShowDomNodes] = useState<boolean>(true);
   const [renderCount, setRenderCount] = useState<number>(0);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "A Stage Set for Confusion", 
-      content: "Four identical-looking twins stand scattered, creating visual chaos on stage. In React, when you need to return multiple sibling elements together, you face the same grouping problem without cluttering your DOM." 
-    },
-    { 
-      title: "The Clumsy Herald", 
-      content: "The Town Crier stands between twins, becoming an unnecessary fifth character. This is the wrapper div anti-pattern—adding extra DOM nodes just for grouping, which clutters your output and breaks semantic structure." 
-    },
-    { 
-      title: "The Father's Gesture", 
-      content: "Egeon points to the twins, grouping them without adding himself to the stage. React Fragments work the same way—they let you group elements logically without rendering extra DOM nodes." 
-    },
-    { 
-      title: "The Space That Binds", 
-      content: "Compare the cluttered stage with the Crier versus the clean pairs with just Egeon's gesture. Fragments create logical grouping while wrapper divs add visual and structural noise to your DOM." 
-    },
-    { 
-      title: "Two Pairs, No Fifth", 
-      content: "The final bow shows two clean pairs with no fifth character. With Fragments, you return grouped elements without unnecessary wrapper nodes, keeping your DOM structure clean and semantic." 
-    },
-  ];
-
   // Code examples
   const wrapperDivCode = `// ❌ With Extra Wrapper Div
 function TwinGroup() {
@@ -74,7 +59,12 @@ function AntipholusSyracuse() {
   return <div className="p-4 rounded bg-amber-800/40">Antipholus of Syracuse</div>;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Demo stage components
   const StageVisualization = useMemo(() => {
@@ -458,9 +448,9 @@ function CharacterList({ characters }) {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
+            totalChapters={chapterCount}
             onChapterChange={(newChapter) => {
-              setChapter(newChapter);
+              goToChapter(newChapter);
               setRenderCount(prev => prev + 1);
             }}
             themeColor="amber"
@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import {create} from "zustand";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -104,30 +112,12 @@ export default function GlobalStateWintersTale(): JSX.Element {
   
   const { jealousy, temperature, whispers, updateJealousy, updateTemperature, addWhisper, reset } = useCourtStore();
   
-  const chapters: Chapter[] = [
-    { 
-      title: "The Seed of Winter", 
-      content: "Leontes' jealousy crystallizes into Sicilia's global state, altering all perception. In React, a Zustand store is a lightweight, central truth—easy to create and update, yet powerful enough to redefine your entire application's reality." 
-    },
-    { 
-      title: "The Chain of Whispers", 
-      content: "Leontes whispers commands through courtiers (prop drilling), creating fragile dependencies. When Camillo betrays him, the chain breaks. Similarly, manually passing state through components is brittle, verbose, and prone to failure at any link." 
-    },
-    { 
-      title: "Breathing the Same Air", 
-      content: "Paulina senses the court's chill without being told—she breathes the same atmosphere. Zustand's `useStore` hook works identically: any component can access global state directly, without prop drilling or complex context setup." 
-    },
-    { 
-      title: "Command vs. Atmosphere", 
-      content: "A specific command reaches one ear and fails. The pervasive atmosphere touches every soul and succeeds. Zustand's global state is efficient and resilient, while prop drilling is complex and brittle." 
-    },
-    { 
-      title: "The Thaw", 
-      content: "Sixteen years later, the state of repentance persists. When the statue warms (state update), the entire court reacts simultaneously. Zustand stores maintain state across time and trigger efficient, synchronized re-renders." 
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Code examples
   const antiPatternCode = `// ❌ Prop Drilling Anti-Pattern
@@ -766,8 +756,8 @@ function StatueComponent() {
           {/* Chapter Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="cyan"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -18,29 +26,6 @@ export default function HamletErrorBoundaries(): JSX.Element {
   const [errorCount, setErrorCount] = useState<number>(0);
   const [appStatus, setAppStatus] = useState<'running' | 'crashed' | 'contained'>('running');
   
-  const chapters: Chapter[] = [
-    { 
-      title: "Let the Foils Be Brought", 
-      content: `The duel is a contained component tree—a discrete section where risky interactions occur. Without boundaries, any error within can escape and crash the entire application, just as the poisoned duel could destroy the entire court.`
-    },
-    { 
-      title: "The Drink, The Drink!", 
-      content: `When Gertrude drinks from the poisoned cup, it's an uncaught JavaScript error. Without error boundaries, this error propagates upward, crashing parent components until the entire app fails—just as the poison spreads through the court.`
-    },
-    { 
-      title: "A Shield Descends", 
-      content: `Error boundaries act as protective shields around component trees. They catch errors within their boundary, display fallback UI instead of crashing, and contain the damage—isolating the tragedy to just that component section.`
-    },
-    { 
-      title: "Two Kingdoms", 
-      content: `Without boundaries: One error crashes the entire app. With boundaries: The error is contained to its component, fallback UI appears, and the rest of the application continues functioning with limited, graceful degradation.`
-    },
-    { 
-      title: "The Poison Sealed", 
-      content: `Error boundaries log errors for debugging while preventing app crashes. Fallback UI maintains user trust and limited functionality. The error is encapsulated, logged, and rendered harmless—the tale continues despite the local tragedy.`
-    },
-  ];
-
   const errorBoundaryCode = `class ErrorBoundary extends React.Component {
   state = { hasError: false };
   
@@ -121,7 +106,12 @@ function Kingdom() {
     };
   }, []);
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-950 via-purple-950/40 to-slate-950 font-serif text-slate-300">
@@ -474,8 +464,8 @@ function App() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="purple"
           />
         </ModuleLayout>
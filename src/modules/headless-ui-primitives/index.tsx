@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -24,29 +32,6 @@ export default function HeadlessUIPrimitives(): JSX.Element {
   const dialogRef = useRef<HTMLDivElement>(null);
   const triggerRef = useRef<HTMLButtonElement>(null);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Voice Without a Face", 
-      content: "Ariel's voice delivers a powerful message without visual spectacle. This demonstrates the core primitive: accessible, functional UI without styling. In React, headless UI primitives provide the core behavior and accessibility, separate from visual design." 
-    },
-    { 
-      title: "The Feast That Wasn't There", 
-      content: "The magician's illusion fails because it's built style-first. Without a functional core, the UI collapses on interaction. Similarly, building UI components by starting with styling leads to inaccessible, brittle components that fail under real use." 
-    },
-    { 
-      title: "Prospero's Realization", 
-      content: "Prospero instructs Ariel to separate the message (core functionality) from the spectacle (styling). This is the key insight of headless UI: build the accessible, functional primitive first, then add styling as a separate layer." 
-    },
-    { 
-      title: "Message vs. Mirage", 
-      content: "Compare the magician's failing illusion (style-first) with Ariel's primitive (function-first) that works, then adds styling as a separate layer. The headless approach ensures the UI is robust and accessible, regardless of the visual layer." 
-    },
-    { 
-      title: "The Word, Not the Spectacle", 
-      content: "The power lies in the accessible, unstyled primitive. Styling is a secondary layer that can be changed or removed. Headless UI libraries provide the core functionality; you provide the styling." 
-    },
-  ];
-
   // Accessibility testing simulation
   useEffect(() => {
     if (isRunning) {
@@ -231,7 +216,12 @@ function StyledDialog() {
   );
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -739,8 +729,8 @@ function StyledDialog() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="emerald"
           />
         </ModuleLayout>
@@ -0,0 +1,84 @@
+import { useRef, useState } from "react";
+import { Link } from "react-router-dom";
+import { Search } from "lucide-react";
+import { getEnabledModuleById } from "../../config/moduleRegistry";
+import type { SearchHit } from "./search";
+
+/**
+ * Search box over module chapters. The search code and its index
+ * (src/generated/searchIndex.bin) are only fetched once the box is focused.
+ */
+export function ModuleSearch() {
+  const [query, setQuery] = useState("");
+  const [hits, setHits] = useState<SearchHit[]>([]);
+  const [failed, setFailed] = useState(false);
+  const engine = useRef<Promise<(query: string) => SearchHit[]>>(undefined);
+
+  const load = () =>
+    (engine.current ??= import("./search").then(
+      async ({ loadSearchIndex, search }) => {
+        const index = await loadSearchIndex();
+        return (text: string) => search(index, text);
+      },
+    ));
+
+  const update = (text: string) => {
+    setQuery(text);
+    load()
+      .then((run) => setHits(text.trim() ? run(text) : []))
+      .catch(() => {
+        engine.current = undefined;
+        setFailed(true);
+      });
+  };
+
+  return (
+    <div className="mx-auto mb-12 max-w-2xl">
+      <label className="flex items-center gap-3 rounded-xl border border-zinc-800 bg-zinc-900/50 px-4 py-3 focus-within:border-emerald-500/60">
+        <Search className="text-zinc-500" size={20} />
+        <input
+          type="search"
+          value={query}
+          onFocus={() => void load().catch(() => setFailed(true))}
+          onChange={(event) => update(event.target.value)}
+          placeholder="Search chapters: useRef, reconciliation, Hamlet…"
+          aria-label="Search module chapters"
+          className="w-full bg-transparent text-white placeholder-zinc-600 outline-none"
+        />
+      </label>
+
+      {failed && (
+        <p className="mt-2 text-sm text-red-400">Search is unavailable.</p>
+      )}
+
+      {query.trim() && !failed && (
+        <ul className="mt-2 divide-y divide-zinc-800 rounded-xl border border-zinc-800 bg-zinc-900/80">
+          {hits.length === 0 && (
+            <li className="px-4 py-3 text-sm text-zinc-500">No matches</li>
+          )}
+          {hits.map((hit) => {
+            const module = getEnabledModuleById(hit.moduleId);
+            if (!module) return null;
+            return (
+              <li key={hit.moduleId}>
+                <Link
+                  to={module.path}
+                  className="block px-4 py-3 transition-colors hover:bg-zinc-800/60"
+                >
+                  <span className={`font-semibold ${module.colorClass}`}>
+                    {module.title}
+                  </span>
+                  <span className="ml-2 text-sm text-zinc-500">
+                    {hit.chapter >= 0
+                      ? `Chapter ${hit.chapter + 1}: ${hit.chapterTitle}`
+                      : module.concept}
+                  </span>
+                </Link>
+              </li>
+            );
+          })}
+        </ul>
+      )}
+    </div>
+  );
+}
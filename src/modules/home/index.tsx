@@ -1,6 +1,7 @@
 import { Link } from "react-router-dom";
 import { Film } from "lucide-react";
 import { getEnabledModules, getModuleStats } from "../../config/moduleRegistry";
+import { ModuleSearch } from "./ModuleSearch";
 
 /**
  * Home Page Component
@@ -10,7 +11,12 @@ import { getEnabledModules, getModuleStats } from "../../config/moduleRegistry";
  * This component now dynamically displays modules from the central registry.
  * Only modules with `enabled: true` will appear here.
  *
- * To show/hide modules, edit src/config/moduleRegistry.ts
+ * To show/hide modules, edit src/config/moduleRegistry.json and run
+ * DEV/SCRIPTS/build/compile_registry.py
+ *
+ * index.html ships a static copy of this page for first paint, generated by
+ * DEV/SCRIPTS/build/snapshot_home.py - re-run it after changing the layout
+ * or the registry.
  */
 export default function Home() {
   // Get only enabled modules from the registry
@@ -53,6 +59,9 @@ export default function Home() {
           )}
         </div>
 
+        {/* Chapter search (index loads on focus) */}
+        <ModuleSearch />
+
         {/* Module Cards */}
         <div className="mb-12 grid gap-6 md:grid-cols-3">
           {modules.map((module) => (
@@ -0,0 +1,194 @@
+// Chapter search for the home page. Loaded on first use; fetches the index
+// built by DEV/SCRIPTS/build/build_search_index.py (format documented there).
+import indexUrl from "@/generated/searchIndex.bin?url";
+
+// Keep in sync with STOPWORDS in build_search_index.py
+const STOPWORDS = new Set(
+  (
+    "a an and are as at be but by for from has have he his in is it its of on or " +
+    "that the their them they this to was were will with"
+  ).split(" "),
+);
+
+export const tokenize = (text: string): string[] =>
+  (text.toLowerCase().match(/[a-z0-9]+/g) ?? []).filter(
+    (token) => !STOPWORDS.has(token),
+  );
+
+export interface SearchHit {
+  /** Registry id of the module */
+  moduleId: string;
+  /** Chapter index, or -1 when the module's title/concept matched */
+  chapter: number;
+  chapterTitle: string;
+  score: number;
+}
+
+interface SearchIndex {
+  /** BM25 score of one impact unit */
+  scale: number;
+  modules: string[];
+  docModule: Uint32Array;
+  docChapter: Int32Array;
+  docTitle: string[];
+  /** Sorted, so prefixes are a contiguous range */
+  terms: string[];
+  postings: { docs: Uint32Array; impacts: Uint8Array }[];
+}
+
+const decode = (buffer: ArrayBuffer): SearchIndex => {
+  const bytes = new Uint8Array(buffer);
+  const text = new TextDecoder();
+  let offset = 0;
+
+  const varint = () => {
+    let value = 0;
+    let shift = 0;
+    let byte: number;
+    do {
+      byte = bytes[offset++];
+      value += (byte & 0x7f) * 2 ** shift;
+      shift += 7;
+    } while (byte & 0x80);
+    return value;
+  };
+  const string = () => {
+    const length = varint();
+    const value = text.decode(bytes.subarray(offset, offset + length));
+    offset += length;
+    return value;
+  };
+
+  if (text.decode(bytes.subarray(0, 4)) !== "CRPS" || bytes[4] !== 1) {
+    throw new Error("Unsupported search index");
+  }
+  const scale = new DataView(buffer).getFloat32(5, true);
+  offset = 9;
+
+  const modules = Array.from({ length: varint() }, string);
+
+  const docCount = varint();
+  const docModule = new Uint32Array(docCount);
+  const docChapter = new Int32Array(docCount);
+  const docTitle: string[] = [];
+  for (let doc = 0; doc < docCount; doc++) {
+    docModule[doc] = varint();
+    docChapter[doc] = varint() - 1;
+    docTitle.push(string());
+  }
+
+  const termCount = varint();
+  const terms: string[] = [];
+  const postings: SearchIndex["postings"] = [];
+  let previous = new Uint8Array(0);
+  for (let t = 0; t < termCount; t++) {
+    const shared = varint();
+    const suffix = varint();
+    const term = new Uint8Array(shared + suffix);
+    term.set(previous.subarray(0, shared));
+    term.set(bytes.subarray(offset, offset + suffix), shared);
+    offset += suffix;
+    terms.push(text.decode(term));
+    previous = term;
+
+    const count = varint();
+    const docs = new Uint32Array(count);
+    const impacts = new Uint8Array(count);
+    let doc = 0;
+    for (let p = 0; p < count; p++) {
+      doc += varint();
+      docs[p] = doc;
+      impacts[p] = bytes[offset++];
+    }
+    postings.push({ docs, impacts });
+  }
+
+  return { scale, modules, docModule, docChapter, docTitle, terms, postings };
+};
+
+let loading: Promise<SearchIndex> | undefined;
+
+/** Fetch and decode the index once; later calls reuse it */
+export const loadSearchIndex = (): Promise<SearchIndex> =>
+  (loading ??= fetch(indexUrl)
+    .then((response) => {
+      if (!response.ok) throw new Error(`Search index: ${response.status}`);
+      return response.arrayBuffer();
+    })
+    .then(decode)
+    .catch((error) => {
+      loading = undefined;
+      throw error;
+    }));
+
+// First index of a term >= prefix
+const lowerBound = (terms: string[], prefix: string) => {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < prefix) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+/**
+ * Rank chapters for a query. Every query word must match; the last word
+ * also matches as a prefix, so results update while typing. Returns the
+ * best chapter of each module, best first.
+ */
+export const search = (
+  index: SearchIndex,
+  query: string,
+  limit = 8,
+): SearchHit[] => {
+  const tokens = tokenize(query);
+  if (tokens.length === 0) return [];
+
+  const scores = new Map<number, number>();
+  for (const [position, token] of tokens.entries()) {
+    const isLast = position === tokens.length - 1;
+    const matched = new Map<number, number>();
+    for (
+      let t = lowerBound(index.terms, token);
+      t < index.terms.length &&
+      (isLast ? index.terms[t].startsWith(token) : index.terms[t] === token);
+      t++
+    ) {
+      const { docs, impacts } = index.postings[t];
+      for (let p = 0; p < docs.length; p++) {
+        matched.set(docs[p], Math.max(matched.get(docs[p]) ?? 0, impacts[p]));
+      }
+    }
+
+    if (position === 0) {
+      for (const [doc, impact] of matched) scores.set(doc, impact);
+    } else {
+      for (const [doc, score] of scores) {
+        const impact = matched.get(doc);
+        if (impact === undefined) scores.delete(doc);
+        else scores.set(doc, score + impact);
+      }
+    }
+    if (scores.size === 0) return [];
+  }
+
+  const best = new Map<number, SearchHit>();
+  for (const [doc, score] of scores) {
+    const module = index.docModule[doc];
+    const current = best.get(module);
+    if (!current || score * index.scale > current.score) {
+      best.set(module, {
+        moduleId: index.modules[module],
+        chapter: index.docChapter[doc],
+        chapterTitle: index.docTitle[doc],
+        score: score * index.scale,
+      });
+    }
+  }
+
+  return [...best.values()]
+    .sort((a, b) => b.score - a.score)
+    .slice(0, limit);
+};
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -45,30 +53,12 @@ export default function JSXHamletMousetrap(): JSX.Element {
     }
   }, [jsxInput, isPaused, chapter]);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Script in the Candlelight", 
-      content: "Hamlet's script blends dialogue with stage directions—a unified description of the performance. JSX works the same way: it's a declarative syntax that describes your UI within JavaScript, not the final UI itself." 
-    },
-    { 
-      title: "The Words, Lost in Air", 
-      content: "Without the script, actors improvise chaotically. Without JSX, developers use verbose `React.createElement` calls that separate structure from logic, making UI intent hard to visualize and maintain." 
-    },
-    { 
-      title: "One Intention Writ Together", 
-      content: "Stage directions like '*pregnant pause*' are embedded in dialogue—inseparable. JSX unifies HTML-like tags with JavaScript logic in one readable syntax, compiling down to efficient React instructions." 
-    },
-    { 
-      title: "A Flourish or a Breath", 
-      content: "An actor's improv flourish ruins the moment. Manual `createElement` calls often miss the intent. JSX ensures your rendered output matches your developer intent through descriptive, reliable syntax." 
-    },
-    { 
-      title: "The Conscience is Caught", 
-      content: "The script performed perfectly provokes Claudius's reaction. JSX's descriptive power lets React compile your intent into precise UI that users experience exactly as designed—no improvisation needed." 
-    }
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Code examples
   const antiPatternCode = `// ❌ Without JSX - Chaotic Improvisation
@@ -526,8 +516,8 @@ function MousetrapPlay({ characters, isRevealing }) {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -77,30 +85,12 @@ export default function LiftingStateUp(): JSX.Element {
     setIsSynced(true);
   };
   
-  const chapters: Chapter[] = [
-    {
-      title: "The Balcony Promise",
-      content: "Juliet's request for marriage coordination reveals the need for shared state. Like components with isolated state, they require a common plan to synchronize."
-    },
-    {
-      title: "Crossed Messages",
-      content: "Direct coordination fails as messages cross, causing a missed meeting. This demonstrates the anti-pattern of managing shared state separately in components."
-    },
-    {
-      title: "The Friar's Accord",
-      content: "Friar Laurence becomes the common ground, lifting their shared intention to his management. Similarly, lift state to the closest common ancestor component."
-    },
-    {
-      title: "Two Paths Diverged",
-      content: "Contrast: Direct coordination leads to miscommunication; lifted state ensures synchronization. Use a common parent to manage and pass down shared state."
-    },
-    {
-      title: "One Bond, One Hand",
-      content: "The wedding ceremony symbolizes successful shared state management. Lifting state up enables components to coordinate seamlessly through a single source of truth."
-    }
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
   
   // Code examples
   const antiPatternCode = `// ❌ Anti-Pattern: Direct sibling coordination
@@ -503,8 +493,8 @@ function Parent() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="rose"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Soldier {
   id: string;
@@ -45,29 +53,6 @@ export default function ListsAndKeysHenryV(): JSX.Element {
     setRenderCount(prev => prev + 1);
   });
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Band of Brothers",
-      content: "Henry addresses his army—a list of soldiers with inherent identity. Each man is a distinct component in the formation."
-    },
-    {
-      title: "Chaos in the Mud",
-      content: "Counting soldiers by position fails when mud obscures faces and positions shift—just like using array indices as React keys."
-    },
-    {
-      title: "The Name That Endures",
-      content: "Calling soldiers by name works despite the mud—unique identifiers ensure correct tracking, like proper React keys."
-    },
-    {
-      title: "Position vs. Identity",
-      content: "Positional tracking fails when soldiers swap places. Named identification succeeds because identity persists through changes."
-    },
-    {
-      title: "Remembered by Key",
-      content: "Each soldier remembered by his unique identifier. React keys ensure efficient reconciliation and accurate updates."
-    }
-  ];
-
   const simulateBattle = useCallback(() => {
     setIsSimulating(true);
     
@@ -158,7 +143,12 @@ function SoldierCard({ soldier }: { soldier: Soldier }) {
   );
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -578,8 +568,8 @@ function ArmyList({ soldiers }: { soldiers: Soldier[] }) {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
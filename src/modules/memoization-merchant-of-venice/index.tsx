@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -100,30 +108,12 @@ export default function MemoizationMerchantOfVenice(): JSX.Element {
     }
   }, []);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Tome of Reason", 
-      content: "Portia's legal argument is a heavy, complex calculation—weaving law, equity, and rhetoric. Like parsing deep component props or filtering large lists, some operations are inherently expensive and costly to recompute." 
-    },
-    { 
-      title: "Rebuilding the Cathedral", 
-      content: "Re-deriving the full argument for every minor question wastes mental effort and time. In React, recalculating expensive values on every render causes performance lag—blocking the main thread like a ticking clock." 
-    },
-    { 
-      title: "Written in the Mind", 
-      content: "Portia prepares by studying the bond and law—her dependencies. She caches the perfected argument. `useMemo` does this: compute once based on dependencies, cache the result, and recall it efficiently until inputs change." 
-    },
-    { 
-      title: "A Bond of Dependencies", 
-      content: "Shylock's claim fails when a new law (dependency) appears; his logic didn't include it. Portia's memoized argument succeeds—built on complete dependencies. An accurate dependency array is critical for correct memoization." 
-    },
-    { 
-      title: "The Quality of Performance", 
-      content: "The trial's success came from prepared, cached reasoning delivered efficiently. `useMemo` optimizes performance by caching expensive calculations, ensuring smooth UI rendering and preserving user experience." 
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Code examples
   const antiPatternCode = `// ❌ Recalculates on every render
@@ -580,8 +570,8 @@ const config = useMemo(
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { useAutoAnimate } from "@formkit/auto-animate/react";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 type Casket = "gold" | "silver" | "lead";
 type DemoMode = "uncontrolled" | "controlled";
@@ -78,29 +86,6 @@ export default function MerchantOfVeniceControlledFormsModule(): JSX.Element {
     }
   };
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Will of a Dead Father",
-      content: "Portia's father's will is the **single source of truth**, like React state. The caskets are form inputs. A suitor's choice is only valid if it aligns with the will's logic (the state), not the caskets' appearance (the DOM). This is the core of a controlled component.",
-    },
-    {
-      title: "The Anti-Pattern: Impulse",
-      content: "An **uncontrolled component** is like Morocco's choice. He interacts directly with the UI (the gold casket), reading its value from the DOM. The result is immediate and wrong because it bypasses the governing logic (state). The DOM, not state, dictates the outcome.",
-    },
-    {
-      title: "The Solution: Deliberation",
-      content: "A **controlled component** is Bassanio's choice. He deliberates (the `onChange` handler), updates his internal state, and *then* the UI reflects his decision. The input's `value` is driven by state, and user actions (`onChange`) update that state. State is the source of truth.",
-    },
-    {
-      title: "Outward Shows vs. Inner Truth",
-      content: "Uncontrolled components read values directly from the DOM. Controlled components use an `onChange` handler to update state, and the component re-renders to show the `value` from state. The UI becomes a predictable reflection of the application's inner truth.",
-    },
-    {
-      title: "The Reward of Control",
-      content: "The reward for using controlled components is a predictable, reliable UI. The form's value (Portia's portrait) is a guaranteed reflection of the application's state, preventing bugs and inconsistencies. The system behaves as expected because it's governed by state.",
-    },
-  ];
-
   const uncontrolledCode = `function UncontrolledCasket() {
   const choiceRef = useRef(null);
 
@@ -144,7 +129,12 @@ export default function MerchantOfVeniceControlledFormsModule(): JSX.Element {
   );
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   const renderDemo = () => (
     <div ref={animationParent}>
@@ -332,8 +322,8 @@ export default function MerchantOfVeniceControlledFormsModule(): JSX.Element {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
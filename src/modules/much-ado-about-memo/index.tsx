@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -25,29 +33,6 @@ export default function MuchAdoAboutMemo(): JSX.Element {
     return fibonacci(n - 1) + fibonacci(n - 2);
   };
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Bachelor in the Orchard", 
-      content: "Benedick represents an expensive React component. His complex bachelor philosophy is like a component with heavy internal logic. The orchard is his scope—private, isolated, ready to process inputs (props) that arrive from outside."
-    },
-    { 
-      title: "The Whispered Lie", 
-      content: "When Benedick hears the fabricated story (new props), he completely re-evaluates his worldview, even though the underlying truth hasn't changed. This is the anti-pattern: an expensive component re-rendering when props are effectively the same."
-    },
-    { 
-      title: "The Unmade Decision", 
-      content: "A memoized Benedick compares the new story to the old one. Finding them shallowly equal—same lie, different teller—he skips the costly internal turmoil. React.memo does this: shallow prop comparison prevents unnecessary re-renders."
-    },
-    { 
-      title: "Two Paths in the Garden", 
-      content: "Without memo: every whisper triggers complete re-evaluation. With memo: only truly new information causes a re-render. The ledger shows wasted effort versus conserved performance. Memoization is a filter, not a gate."
-    },
-    { 
-      title: "The Gate and the Filter", 
-      content: "Not every component needs React.memo. Use it for expensive components with stable props—like Benedick should have filtered gossip. It's an optimization tool, not a default. Wise components know when to re-render."
-    }
-  ];
-
   // Code examples
   const expensiveComponentCode = `// Benedick - Expensive Component
 const ExpensiveComponent = ({ story }: { story: string }) => {
@@ -101,7 +86,12 @@ const CustomMemoizedComponent = memo(ExpensiveComponent, (prev, next) => {
   return prev.story === next.story;
 });`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
   const expensiveComponentRef = useRef<number>(0);
   const memoizedComponentRef = useRef<number>(0);
 
@@ -676,8 +666,8 @@ const Button = memo(({ onClick, children }) => {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="emerald"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -33,29 +41,6 @@ export default function PerformanceProfilingAgincourt(): JSX.Element {
   const [isProfiling, setIsProfiling] = useState<boolean>(false);
   const renderCountRef = useRef<number>(0);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Observer's Eye", 
-      content: "Henry V walks his camp, observing each soldier's readiness. Some fires burn steady, others flicker weakly.\n\nReact's Profiler works the same—it measures component render performance, showing which parts of your app need optimization." 
-    },
-    { 
-      title: "The Cost of Blindness", 
-      content: "A knight's heavy armor becomes a liability in Agincourt's mud—it slows the entire charge.\n\nWithout profiling, expensive components drag down your app's performance, causing unnecessary re-renders and slow interactions." 
-    },
-    { 
-      title: "The Measure of a Man", 
-      content: "Henry targets his speech: \"We few, we happy few, each man's duty known.\"\n\nProfiling identifies specific bottlenecks. Use React.memo for expensive components and useCallback for stable function references." 
-    },
-    { 
-      title: "Mud Versus Momentum", 
-      content: "The French knight sinks in mud while English arrows fly true.\n\nCompare unoptimized components (slow, heavy) versus optimized ones (fast, targeted). Profiling shows the dramatic difference." 
-    },
-    { 
-      title: "The Band of Brothers", 
-      content: "After battle, Henry sees an army performing as one—archers cover, infantry holds, knights strike.\n\nProfiling creates a harmonious app where each component renders efficiently, creating a smooth user experience." 
-    },
-  ];
-
   const antiPattern = `// ❌ Without Profiling - Expensive Component
 function HeavyKnight({ armorWeight }: KnightProps) {
   // Expensive calculation on every render
@@ -186,7 +171,12 @@ function App() {
     }
   }, [isProfiling, startProfiling]);
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -615,8 +605,8 @@ function Battlefield() {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -6,6 +6,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -45,29 +53,6 @@ export default function PortalsMidsummerPlayWithinPlay(): JSX.Element {
     setRenderCount(prev => prev + 1);
   }, [chapter, demoMode, isModalOpen]);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Play Within Must Have Its Space", 
-      content: "The Mechanicals perform 'Pyramus and Thisbe' in a separate chalk circle, distinct from the Athenian court. This visual separation is the core metaphor for React Portals—rendering a component to a different DOM location while keeping it logically in the React tree."
-    },
-    { 
-      title: "The Lion Amidst the Lords", 
-      content: "Snug's lion costume gets tangled in the court's furniture when performed within the crowded space. This represents the anti-pattern: rendering modals inside parent containers with overflow:hidden or z-index constraints causes visual clipping and obstruction."
-    },
-    { 
-      title: "Decree for a Separate Stage", 
-      content: "Quince directs the lion to the chalk circle—the designated space. The performance stays in the script (React tree) but renders to the separate stage (DOM node). This is ReactDOM.createPortal: logical containment doesn't require physical DOM containment."
-    },
-    { 
-      title: "A Roar in the Ear vs. A Roar on the Stage", 
-      content: "A roar in the Duke's ear breaks the illusion (modal clipped by parent). A roar on the stage maintains separation (portal to document.body). Portals provide proper stacking context for overlays, tooltips, and modals that need to escape parent boundaries."
-    },
-    { 
-      title: "Seen in Their Proper Place", 
-      content: "The Mechanicals bow within their circle—visible because they're in the right place. Portals ensure child components render where they can be viewed unobstructed. The worst components are 'no worse, if they are seen in their proper place'—the right DOM location."
-    }
-  ];
-
   // Code examples
   const antiPatternCode = `// ❌ Modal rendered within parent container
 function ClippedModal() {
@@ -146,7 +131,12 @@ function MyModal() {
     );
   };
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-950 to-purple-950/30 font-serif text-slate-300">
@@ -557,8 +547,8 @@ function MyModal() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="purple"
           />
         </ModuleLayout>
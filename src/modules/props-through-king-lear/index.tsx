@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { AnimatePresence, motion } from "framer-motion";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -60,30 +68,12 @@ export default function PropsKingLearModule(): JSX.Element {
   const [rebellionAttempts, setRebellionAttempts] = useState(0);
   const [learGenerosity, setLearGenerosity] = useState(66);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Divestiture",
-      content: "King Lear divides his kingdom, bestowing portions upon his daughters. This is the parent component passing data—props—to its children. The map with its clear divisions is the props object, a defined and immutable contract passed down.",
-    },
-    {
-      title: "The Breach of Bond",
-      content: "Cordelia attempts to renegotiate her inheritance, effectively trying to send data back up to her father. In React, this is an anti-pattern. Props are read-only; a child component cannot modify the props it receives from its parent.",
-    },
-    {
-      title: "The Hollow Crown",
-      content: "Lear, cast out, rages, 'I gave you all.' He understands the data flow is one-way. He passed the props (the kingdom) but cannot control his daughters' internal logic (their cruelty). The parent sets the props; the child determines its own behavior.",
-    },
-    {
-      title: "Two Thrones",
-      content: "Goneril accepts her prop and renders her domain. Cordelia receives nothing and renders accordingly. This shows how components behave based on the props they receive. A component's output is a function of its props.",
-    },
-    {
-      title: "The Ancient Dower",
-      content: "Despite the tragedy, the map's divisions remain. This demonstrates reusability. The same 'Daughter' component can represent Goneril, Regan, or Cordelia, rendering differently based on the unique 'kingdom' prop it receives each time.",
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   const code = {
     passingProps: `// Parent Component: KingLear.tsx
@@ -352,8 +342,8 @@ function RoyalCourt() {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -147,39 +155,6 @@ export default function ProsperosCustomSpells(): JSX.Element {
     }
   };
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Mage's Invocation", 
-      content: `Prospero's storm spell—a single command creates or calms a tempest. One complex effect, encapsulated and reusable.
-
-Custom hooks work the same way. Encapsulate complex logic into a reusable function like \`useStorm\`, then invoke it anywhere.` 
-    },
-    { 
-      title: "The Forgotten Incantation", 
-      content: `Without encapsulation, Prospero recites full incantations for each charm attempt. He forgets a line, and the magic fails.
-
-Duplicating logic across components leads to the same errors. State management becomes fragile and inconsistent.` 
-    },
-    { 
-      title: "The Codified Spell", 
-      content: `Prospero writes the charm once in his book, naming it \`useCharm\`. Now he can invoke it with a single word.
-
-Custom hooks encapsulate logic so you write it once, then reuse it anywhere with consistent, reliable behavior.` 
-    },
-    { 
-      title: "Chaos and Order", 
-      content: `Duplicate commands to spirits create chaotic collisions. Using \`useSummonSpirit\` for each creates orderly coordination.
-
-Custom hooks manage side effects cleanly, preventing conflicts when multiple instances run simultaneously.` 
-    },
-    { 
-      title: "The Mage's Renunciation", 
-      content: `Prospero breaks his staff and drowns his book, ending all active spells and cleaning up their effects.
-
-Custom hooks include cleanup functions that run on unmount, preventing memory leaks when components are removed.` 
-    },
-  ];
-
   // Code examples
   const duplicatedCharmCode = `// ❌ Duplicated logic
 function CharmFerdinand() {
@@ -244,7 +219,12 @@ function WeatherControl() {
   </button>;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-950 via-purple-950/30 to-slate-950 font-serif text-slate-300">
@@ -843,8 +823,8 @@ const goblin = useSummonSpirit("Goblin");`}
           {/* Chapter Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="violet"
           />
         </ModuleLayout>
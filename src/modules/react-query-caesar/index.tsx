@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { useQuery, useMutation, QueryClient, QueryClientProvider } from "@tanstack/react-query";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 // Mock server state simulation
 interface RomanState {
@@ -91,29 +99,6 @@ export default function ReactQueryCaesar(): JSX.Element {
     };
   }, []);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Ides of March: A Mutation",
-      content: "Caesar's assassination is a server state mutation. The UI—citizens and senators—must refetch reality. Without React Query, every component triggers its own frantic network request, leading to chaos and conflicting data across Rome."
-    },
-    {
-      title: "The Chaos of Manual Fetching",
-      content: "Manual useEffect fetching creates duplicate requests, inconsistent caches, and stale data. Like citizens with different rumors, components show conflicting states. The Cinna error occurs when stale cache keys cause catastrophic UI failures."
-    },
-    {
-      title: "The Declarative Oration",
-      content: "React Query provides centralized cache management. Antony's speech demonstrates declarative data fetching: one source, consistent delivery, automatic cache updates. Components receive synchronized state without manual coordination or duplicate requests."
-    },
-    {
-      title: "Cache Invalidation vs. Background Refetch",
-      content: "Manual fetching fails at cache invalidation—stale data causes errors. React Query handles background refetching automatically. Caesar's will triggers seamless UI updates without jarring reloads, keeping all components synchronized with server truth."
-    },
-    {
-      title: "A New Query for a New State",
-      content: "With server state managed, new queries integrate seamlessly. Octavius's arrival demonstrates React Query's consistency: fresh data caches properly, components update uniformly, and the UI remains stable despite server mutations."
-    }
-  ];
-
   // Manual fetching simulation
   const simulateManualFetch = useCallback(() => {
     if (activeRequests >= 10) return; // Circuit breaker
@@ -194,7 +179,12 @@ function RomanCitizen() {
 // Benefits: Single source, automatic caching,
 // background refetch, synchronized components`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // React Query components
   function RomanStateQuery() {
@@ -679,8 +669,8 @@ function NewLeadershipView() {
             {/* Navigation */}
             <ChapterNavigation
               currentChapter={chapter}
-              totalChapters={chapters.length}
-              onChapterChange={setChapter}
+              totalChapters={chapterCount}
+              onChapterChange={goToChapter}
               themeColor="red"
             />
           </ModuleLayout>
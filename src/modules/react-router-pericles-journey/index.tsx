@@ -6,6 +6,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -20,29 +28,6 @@ export default function ReactRouterPericlesJourney(): JSX.Element {
   const [frustrationLevel, setFrustrationLevel] = useState<number>(0);
   const intervalRef = useRef<NodeJS.Timeout | null>(null);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Single-Page Epic",
-      content: "Pericles' entire life is one play—a Single-Page Application (SPA). His scroll to Pentapolis is a destination. Changing visible shores without a new play is **client-side navigation**."
-    },
-    {
-      title: "Shards of a Story",
-      content: "Landing in Tarsus only to instantly flee is **jarring context reset**. Without a routing system, navigation becomes manual state juggling. The story shatters into disconnected scenes."
-    },
-    {
-      title: "The Chorus of Code",
-      content: "Gower narrates seamless scene transitions. He is **React Router**. He manages the history stack, renders the correct component for the location, and preserves state—all without a page reload."
-    },
-    {
-      title: "Recitation vs. Route",
-      content: "**Marina's manual recap** forces Pericles to rebuild context painfully. **Gower's declarative routes** (`<Route path=\"ephesus\">`) flow naturally. One is laborious code; the other is elegant configuration."
-    },
-    {
-      title: "The Chart of All Shores",
-      content: "The final map shows all connected sea-routes. This is your **`<Routes>` configuration**. Each city is a `<Route>`. The entire navigable structure exists within one SPA scroll."
-    }
-  ];
-
   // Code Examples
   const antiPatternManualNav = `// ❌ Manual Navigation (Anti-Pattern)
 function App() {
@@ -144,7 +129,12 @@ function NavigationControls() {
     };
   }, []);
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // City Components for Router Demo
   const Antioch = () => (
@@ -791,8 +781,8 @@ function App() {
             {/* Navigation */}
             <ChapterNavigation
               currentChapter={chapter}
-              totalChapters={chapters.length}
-              onChapterChange={setChapter}
+              totalChapters={chapterCount}
+              onChapterChange={goToChapter}
               themeColor="teal"
             />
           </ModuleLayout>
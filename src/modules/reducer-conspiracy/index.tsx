@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { AnimatePresence, motion } from "framer-motion";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<typeof firstChapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 // --- State and Reducer Definition ---
 
@@ -130,30 +138,12 @@ export default function ReducerConspiracyModule(): JSX.Element {
     return "text-amber-300";
   }, [state.anger, chaoticState.anger, comparisonMode]);
 
-  const chapters = [
-    {
-      title: "The Ledger of Grievances",
-      content: "The relationship between Brutus and Cassius is a complex state object, full of interrelated values like anger, trust, and loyalty. Managing this with simple booleans is impossible; changing one value affects all others. This requires a more robust state management system.",
-    },
-    {
-      title: "The Spiral of Setters",
-      content: "Using multiple `useState` hooks for related state is like shouting fragmented accusations. Each `setState` call triggers a reaction, leading to unpredictable side effects, extra re-renders, and chaotic, tangled logic. The state becomes difficult to reason about and debug.",
-    },
-    {
-      title: "The Function of Confrontation",
-      content: "The `useReducer` hook provides a formal protocol. Instead of setting state directly, you dispatch actions—structured objects describing what happened. A central reducer function processes these actions, calculating the next state predictably and immutably. It's a clear, debuggable process.",
-    },
-    {
-      title: "Chaos vs. Protocol",
-      content: "Contrast the chaos of interdependent `useState` setters with the clean, predictable flow of `useReducer`. One creates tangled side effects; the other guarantees deterministic state transitions from a single source of truth. The reducer pattern is scalable and easier to test.",
-    },
-    {
-      title: "The Reconciled State Object",
-      content: "The final, reconciled state is the result of a clear sequence of dispatched actions. `useReducer` provides a history of how state evolved, making complex transitions transparent. The system is stable, predictable, and ready for the next event.",
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
   const memorablePhrases = [
     "The gulf between us is not empty air, but a ledger of grievances.",
     "You have done that you should be sorry for.",
@@ -358,8 +348,8 @@ function handleAccusation() {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
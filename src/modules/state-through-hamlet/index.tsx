@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -48,30 +56,6 @@ export default function StateThroughHamlet(): JSX.Element {
 
   const renderCount = useRenderCounter("HamletComponent");
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Weight of the Question",
-      content: `Hamlet holds Yorick's skull—a tangible object representing his **internal state**. His "to be or not to be" contemplation is **mutable component data** that defines his current condition and drives his behavior.`,
-    },
-    {
-      title: "The Prison of Stasis",
-      content: `When Ophelia appears, Hamlet's **stale state** can't process new input. His wild, broken reaction is a **buggy re-render** caused by **incorrect state updates**. A locked mind renders broken UI.`,
-    },
-    {
-      title: "The Trigger Within",
-      content:
-        "Watching Claudius panic, Hamlet's internal state flips from suspicion to certainty. This **internal setState call** triggers an **automatic re-render**: new purposeful behavior. The change within commands the change without.",
-    },
-    {
-      title: "To Suffer or To Act",
-      content: `**Passive state** (Ghost's tale) overwhelms → ineffective inaction. **Active state** (Mousetrap realization) is managed internally → decisive action. The difference is **who controls the update**.`,
-    },
-    {
-      title: "The Engine of the Self",
-      content: `State isn't a cage—it's the **engine**. Hamlet's changing thoughts (state) make him dynamic, not static. A component's **internal state** is its capacity to be interactive, to respond, to *be*.`,
-    },
-  ];
-
   // Code examples
   const staticComponent = `// ❌ Static Portrait
 function StaticHamlet() {
@@ -192,7 +176,12 @@ function ActiveHamlet() {
     setActiveState(0);
   };
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -737,8 +726,8 @@ function DynamicComponent() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="cyan"
           />
         </ModuleLayout>
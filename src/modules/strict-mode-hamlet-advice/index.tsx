@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -66,29 +74,6 @@ export default function StrictModeHamletAdvice(): JSX.Element {
     }
   };
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Fatherly Wrapper", 
-      content: "Polonius's advice wraps Laertes like Strict Mode wraps components. It's a development-only layer that scrutinizes without changing runtime behavior, preparing for production." 
-    },
-    { 
-      title: "The Unchecked Component", 
-      content: "Without Strict Mode, Laertes's impulsiveness causes chaos in production. Similarly, unchecked components can have side effects and bugs that crash apps when deployed." 
-    },
-    { 
-      title: "The Double Invocation", 
-      content: "Polonius repeats advice to reveal deeper consequences. Strict Mode double-invokes functions to detect hidden side effects, ensuring purity by stress-testing logic." 
-    },
-    { 
-      title: "A Tale of Two Departures", 
-      content: "With Strict Mode, components depart calmly, avoiding bugs. Without it, they fail catastrophically. The value is in preventing errors, not runtime changes." 
-    },
-    { 
-      title: "To Thine Own Self Be True", 
-      content: "\"To thine own self be true\" means building pure, predictable components. Strict Mode ensures consistency for future compatibility, making apps robust." 
-    }
-  ];
-
   const antiPatternCode = `// ❌ Without Strict Mode - Side effects go unnoticed
 function UncheckedComponent() {
   // Mutating state during render (anti-pattern)
@@ -135,7 +120,12 @@ function Component() {
   return <button onClick={increment}>Value: {value}</button>;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -462,8 +452,8 @@ function PureComponent({ initialCount }: { initialCount: number }) {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -6,6 +6,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { useAutoAnimate } from "@formkit/auto-animate/react";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -82,29 +90,6 @@ export default function SynchronousTranslationLayoutEffectModule(): JSX.Element
   const [flickerCount, setFlickerCount] = useState(0);
   const [parent] = useAutoAnimate();
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Instant of Translation",
-      content: "Puck's magic transforms Bottom's head instantly—a complete change before anyone perceives it. `useLayoutEffect` works this way, running synchronously after DOM calculations but *before* the browser paints, ensuring a seamless visual update with no intermediate state."
-    },
-    {
-      title: "The Flickering Vision",
-      content: "A flawed spell makes Bottom's head flicker between forms, a jarring visual glitch. This is like `useEffect` for layout: the browser may paint an intermediate state before the effect runs, causing UI elements to visibly jump or resize."
-    },
-    {
-      title: "A Deed Without a Name",
-      content: "Puck's true spell is a synchronous command to reality. `useLayoutEffect` is this 'deed without a name'—it guarantees DOM mutations happen in the same cycle as render, preventing any paint of a 'before' state and ensuring visual consistency."
-    },
-    {
-      title: "Perfect Horror, Final Face",
-      content: "The Mechanicals' unified scream requires a final, stable image. `useEffect` can cause mistimed reactions to a flickering UI. `useLayoutEffect` ensures the user only ever perceives and reacts to the final, correct DOM state, creating a perfect experience."
-    },
-    {
-      title: "Thou Art Translated",
-      content: "Bottom accepts his new form as reality, unaware of the magic. A good layout effect is invisible to the user. The UI change is so seamlessly integrated into the paint cycle that it feels like it was always there, stable and ready for interaction."
-    },
-  ];
-
   const handleTrigger = () => {
     if (trigger > 50) { // Circuit breaker
         alert("Puck's magic is tiring! Resetting the scene.");
@@ -157,7 +142,12 @@ function Tooltip() {
   return <div style={position}>...</div>;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -295,8 +285,8 @@ function Tooltip() {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="violet"
           />
         </ModuleLayout>
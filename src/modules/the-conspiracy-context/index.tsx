@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 // Context for the conspiracy
 interface ConspiracyContextType {
@@ -50,29 +58,6 @@ export default function TheConspiracyContext(): JSX.Element {
     }, []),
   };
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Silent Understanding",
-      content: "Cassius's dagger gesture communicates everything without words within Brutus's house—the shared conspiracy is already understood. In React, `useContext` provides this instant, implicit data access to any component within the Provider's scope, eliminating verbose prop passing."
-    },
-    {
-      title: "The Poet's Confusion",
-      content: "Cinna the poet lacks the conspiracy's context when questioned by the mob. He fails catastrophically, unable to explain motives never passed to him. This illustrates **prop drilling**: manually passing data through components is fragile, error-prone, and inefficient."
-    },
-    {
-      title: "The Orchard Oath",
-      content: "Brutus declares the conspiracy's motive in the orchard: \"If these be motives weak, break off betimes.\" He establishes the shared context for all present. This is `createContext` and `Provider`—defining the data value and making it available to the entire component subtree."
-    },
-    {
-      title: "Inside the Light, Outside the Dark",
-      content: "**Inside**: Ligarius instantly understands Brutus's cryptic message—direct context access. **Outside**: Antony must laboriously rebuild understanding for the crowd—manual prop drilling. `useContext` provides efficient data access; prop drilling requires verbose, explicit passing."
-    },
-    {
-      title: "The Synchronized Blow",
-      content: "The conspirators strike as one on an unspoken signal—shared context enabling perfect coordination. In React, multiple components can act on the same context value, triggering synchronized updates without prop chains. The shared state update is immediate and consistent."
-    }
-  ];
-
   // Demo components
   const ConspiratorWithContext: React.FC<{ name: string }> = ({ name }) => {
     const ctx = useContext(ConspiracyContext);
@@ -170,7 +155,12 @@ function App() {
   );
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-950 via-slate-900 to-stone-950 font-serif text-slate-300">
@@ -593,8 +583,8 @@ function Conspirator({ name }) {
             {/* Chapter Navigation */}
             <ChapterNavigation
               currentChapter={chapter}
-              totalChapters={chapters.length}
-              onChapterChange={setChapter}
+              totalChapters={chapterCount}
+              onChapterChange={goToChapter}
               themeColor="amber"
             />
           </ModuleLayout>
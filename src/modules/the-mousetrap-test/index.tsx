@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -38,29 +46,6 @@ export default function TheMousetrapTest(): JSX.Element {
     }
   }, [testRunCount]);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Conscience of the King", 
-      content: "Hamlet tests Claudius not by analyzing the play's mechanics, but by observing his reaction. React Testing Library follows the same principle: test components from the user's perspective, focusing on observable behavior rather than implementation details." 
-    },
-    { 
-      title: "That Within Which Passeth Show", 
-      content: "Hamlet's internal knowledge of murder couldn't be tested—it produced no observable outcome. Similarly, testing a component's internal state or methods doesn't guarantee a good user experience. Focus on what users can actually see and do." 
-    },
-    { 
-      title: "Give Me Some Light", 
-      content: "Claudius's cry—'Give me some light! Away!'—was observable proof. In React Testing Library, you simulate user interactions (clicks, typing) and assert on visible outcomes (text appears, element is visible). The user's reaction validates the test." 
-    },
-    { 
-      title: "The Play's the Thing", 
-      content: "A perfect performance means nothing if the king sits unmoved. A technically perfect component means nothing if users can't interact with it correctly. Test user impact, not implementation purity." 
-    },
-    { 
-      title: "For What I Have Seen", 
-      content: "Hamlet's validated hypothesis came from observable behavior, not internal truth. Your tests should give the same confidence: if the test passes, users will have the intended experience. Behavior-focused tests are actionable proof." 
-    },
-  ];
-
   // Code examples for demonstrations
   const implementationTest = `// ❌ Testing Implementation Details
 import { render, screen } from '@testing-library/react';
@@ -178,7 +163,12 @@ function KingReaction() {
     setIsTestRunning(false);
   };
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -611,8 +601,8 @@ expect(screen.queryByRole('alert')).not.toBeInTheDocument();`}
           {/* Chapter Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -19,29 +27,6 @@ export default function TheTempestCompositionOverInheritance(): JSX.Element {
   const [renderCount, setRenderCount] = useState<number>(0);
   const timerRef = useRef<NodeJS.Timeout | null>(null);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Library, Not the Dukedom",
-      content: "Prospero's power comes from composing spirits (components), not inheriting a dukedom (base class). In React, build UIs by combining independent components with props, not extending rigid class hierarchies. Composition gives you flexible, reusable power."
-    },
-    {
-      title: "The Curse of the Wrong Interface",
-      content: "Forcing Caliban into a courtier's role crashes the system. Forcing React components into inheritance hierarchies creates bugs and rigid code. Components need interfaces (props) that match their capabilities, not pre-defined class structures."
-    },
-    {
-      title: "Go Make Thyself Like a Nymph",
-      content: "Prospero composes the tempest by directing Ariel with specific instructions (props). Build complex React features by composing specialized components with clear interfaces. Delegate implementation to components; orchestrate with props."
-    },
-    {
-      title: "Chains vs. The Network",
-      content: "Inheritance creates brittle chains—break one link, everything fails. Composition creates resilient networks—components work independently. Compare rigid class hierarchies with flexible component composition for maintainable React apps."
-    },
-    {
-      title: "Drowning the Book",
-      content: "When the play ends, Prospero releases his components cleanly. Composed React systems allow clean separation—components unmount independently, no tangled inheritance to unravel. Composition enables maintainable, flexible application lifecycles."
-    }
-  ];
-
   // Code examples
   const inheritanceAntiPattern = `// ❌ Inheritance Anti-Pattern
 class Notification extends BaseComponent {
@@ -189,7 +174,12 @@ function WeatherDisplay() {
     }
   };
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -579,8 +569,8 @@ useEffect(() => {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="cyan"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -76,30 +84,12 @@ export default function UseCallbackHookHamlet(): JSX.Element {
 
   const currentCallback = demoMode === "improvised" ? improvisedCallback : memoizedCallback;
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Instruction",
-      content: "Hamlet defines a precise hand gesture—a **fixed point** for the Players to follow. In React, this is a **callback function**. When passed to a child component, its stability determines performance.",
-    },
-    {
-      title: "The Unstable Reference",
-      content: "Without a stable reference, the Players improvise the gesture **differently each rehearsal**. This is the anti-pattern: a new function instance on every render, causing **unnecessary child re-renders**.",
-    },
-    {
-      title: "The Fixed Point",
-      content: "Hamlet returns to the **exact hand position**, memoizing the instruction. `useCallback` does this: it returns the **same function instance** unless dependencies change, stabilizing the reference.",
-    },
-    {
-      title: "Decided Once",
-      content: "**Chaos vs. Coordination.** Improvised callbacks waste renders re-deciding logic. A memoized callback is **decided once**, enabling efficient, unified performance in child components.",
-    },
-    {
-      title: "The Performance",
-      content: "The play succeeds because the gesture **did not change**. Similarly, `useCallback` optimizes apps by providing stable function references, preventing wasteful re-renders and ensuring smooth execution.",
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Code examples
   const antiPatternCode = `// ❌ IMPROVISED (New function each render)
@@ -515,8 +505,8 @@ function Director() {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -24,29 +32,6 @@ export default function UseEffectHamletGhost(): JSX.Element {
   // Circuit breaker for infinite loop demo
   const safetyRenderCount = useRef<number>(0);
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Unbidden Visitor",
-      content: `The Ghost's command, "Revenge his murder," is an external event that changes Hamlet's state. **useEffect synchronizes external events (APIs, subscriptions) with your component's state, running after render.**`
-    },
-    {
-      title: "The Frozen Prince",
-      content: `Trying to process the Ghost's command *during* the encounter freezes Hamlet. **Side effects in the render body block React updates, causing UI freezes and infinite loops.**`
-    },
-    {
-      title: "The Patient Vow",
-      content: `Hamlet stores the command in memory and acts *after* the encounter. **useEffect schedules side effects to run after rendering, preventing blocking and enabling smooth updates.**`
-    },
-    {
-      title: "Court Chaos vs. Battlements Resolve",
-      content: `Without useEffect, side effects run during render and break the UI. **With useEffect, they run after render, allowing the component to update smoothly and predictably.**`
-    },
-    {
-      title: "The Engine of Vengeance",
-      content: `The Ghost departs (cleanup), but his command persists in Hamlet's state. **useEffect cleanup disconnects from external sources, while the effect's state changes remain, driving future behavior.**`
-    }
-  ];
-
   // Code examples
   const antiPatternRender = `// ❌ Side effect in render body (FREEZES UI)
 function FrozenPrince() {
@@ -93,7 +78,12 @@ function EngineOfVengeance() {
   return <div>{purpose}</div>;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   // Demo 1: Ghost encounter (external event)
   const handleSummonGhost = () => {
@@ -628,8 +618,8 @@ useEffect(() => {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="indigo"
           />
         </ModuleLayout>
@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -38,29 +46,6 @@ export default function UseRefHamletYoricksSkull(): JSX.Element {
     };
   }, []);
 
-  const chapters: Chapter[] = [
-    { 
-      title: "The Gravedigger's Gift", 
-      content: "Hamlet picks up Yorick's skull—a persistent object that outlasts the man. Like useRef, it provides a stable reference that survives renders without triggering re-renders. The skull is a mutable ref (.current) you can hold onto."
-    },
-    { 
-      title: "The Ghost That Fades", 
-      content: "Using state (emotions) to hold a memory causes it to fade on every re-render. The reference is unstable, like a ghost that vanishes when needed. State changes trigger re-renders, resetting values inefficiently."
-    },
-    { 
-      title: "This Bone Does Not Change", 
-      content: "The skull remains unchanged despite Hamlet's volatile state. useRef creates a mutable ref object (.current) that persists across renders without causing re-renders. It's a container for values that must endure."
-    },
-    { 
-      title: "A Fixed Point in a Shifting World", 
-      content: "State-based references fail when needed most; ref-based references enable direct manipulation. The skull allows precise measurement (DOM focus), unlike the fading ghost. useRef is for direct access and persistence."
-    },
-    { 
-      title: "That Did Outlast the Man", 
-      content: "The skull persists beyond Hamlet's death, ready for new use. useRef objects outlive component lifecycle, providing enduring references. They survive re-renders and can be passed between components."
-    }
-  ];
-
   // Code examples as template literals
   const introCode = `import { useRef } from 'react';
 
@@ -152,7 +137,12 @@ function ChildComponent({ ref }: { ref: React.RefObject<string> }) {
   return null;
 }`;
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -594,8 +584,8 @@ function ChildComponent({ ref }: { ref: React.RefObject<string> }) {
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="cyan"
           />
         </ModuleLayout>
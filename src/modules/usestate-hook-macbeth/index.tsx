@@ -5,6 +5,14 @@ import { ModuleLayout } from "@/components/common/ModuleLayout";
 import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -29,29 +37,6 @@ export default function UseStateHookMacbeth(): JSX.Element {
     ambition: 0,
   });
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Prophecy",
-      content: `The witches' prophecy hooks state onto Macbeth. \`useState("king")\` initializes ambition inside him. A static component becomes dynamic, its future now dictated by this internal, mutable data.`,
-    },
-    {
-      title: "The Unmanaged State",
-      content: `Without a state mechanism, ambition is a chaotic internal variable. Changing it directly doesn't trigger a re-render. The component appears frozen, unable to reflect its new internal reality—a broken, buggy UI.`,
-    },
-    {
-      title: "The Setter is Summoned",
-      content: `Lady Macbeth's persuasion is the setter function: \`setAmbition("actionable")\`. This declarative update cleanly changes the state value. The component re-renders immediately, its actions now driven by the new state.`,
-    },
-    {
-      title: "Two Kings, Two States",
-      content: `Compare approaches. Wrong: Ignoring the state hook leads to internal corruption and UI stasis. Right: Using \`useState\` and its setter allows state to cleanly drive the component's narrative and rendered output.`,
-    },
-    {
-      title: "A State of Being",
-      content: `The crown is the rendered output. The throne room UI is a direct expression of the managed ambition state. \`useState\` transformed a static noble into a dynamic, state-driven king.`,
-    },
-  ];
-
   // Anti-pattern and correct pattern code examples
   const antiPatternCode = `// ❌ Unmanaged State - The Wrong Way
 function MacbethComponent() {
@@ -123,7 +108,12 @@ function KingMacbeth() {
     setRenderCount(0);
   };
 
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   return (
     <div className="min-h-screen bg-slate-950 font-serif text-slate-300">
@@ -659,8 +649,8 @@ const handleSeizePower = () => {
           {/* Navigation */}
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
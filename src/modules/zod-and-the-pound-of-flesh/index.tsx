@@ -7,6 +7,14 @@ import { ChapterNavigation } from "@/components/common/ChapterNavigation";
 import { CodeBlock } from "@/components/common/CodeBlock";
 import { CodeComparison } from "@/components/common/CodeComparison";
 import { SafeParseReturnType } from "zod";
+import { useChapters } from "@/components/common/useChapters";
+import firstChapter from "./chapters/0.json";
+
+// Chapter prose lives in ./chapters/<n>.json (DEV/SCRIPTS/build/externalize_chapters.py)
+const chapterFiles = import.meta.glob<Chapter>(
+  ["./chapters/*.json", "!./chapters/0.json"],
+  { import: "default" },
+);
 
 interface Chapter {
   title: string;
@@ -29,40 +37,12 @@ export default function ZodPoundOfFleshModule(): JSX.Element {
   const [blood, setBlood] = useState<string>("0");
   const [location, setLocation] = useState<string>("nearest the merchant's heart");
 
-  const chapters: Chapter[] = [
-    {
-      title: "The Literal Bond",
-      content: "Shylock's bond is raw, unchecked data—a contract with immense power and risk. In React, this is like user input or an API response before validation. It exists, but its shape and consequences are not yet enforced or understood.",
-      quote: "I stand for judgment. The contract. A pound of flesh.",
-      author: "— Shylock"
-    },
-    {
-      title: "Pleading to the Literal",
-      content: "Appeals for mercy are like weak, manual validation (if/else checks). They are easily bypassed by strictly literal data that doesn't fit the expected 'happy path'. This anti-pattern is a fragile defense against malformed data.",
-      quote: "Can you, with any hope of success, plead mercy to the literal?",
-      author: "— Bassanio (paraphrased)"
-    },
-    {
-      title: "The Precise Condition",
-      content: "Portia's conditions are the Zod schema. She doesn't argue with the data's existence; she defines the *only* acceptable shape for its execution. This is how we declare an immutable, precise contract for our data.",
-      quote: "This bond doth give thee here no jot of blood.",
-      author: "— Portia (as Balthazar)"
-    },
-    {
-      title: "The Validation Moment",
-      content: "Shylock's attempt to cut is the runtime validation: `schema.safeParse()`. His immediate failure is a validation error. The data cannot be processed because it violates the schema's strict rules, protecting the system (Antonio).",
-      quote: "The condition is the condition. No more, no less.",
-      author: "— Portia (as Balthazar)"
-    },
-    {
-      title: "The Guardian Schema",
-      content: "The schema acts as a guardian. It doesn't destroy bad data, but it prevents it from causing harm. By validating inputs, Zod ensures application integrity and provides static type safety through type inference (`z.infer`).",
-      quote: "The law is not a weapon, but a measure.",
-      author: "— Portia (as Balthazar)"
-    },
-  ];
-
-  const currentChapter = chapters[chapter];
+  const { currentChapter, chapterCount, goToChapter } = useChapters(
+    chapterFiles,
+    chapter,
+    firstChapter,
+    setChapter,
+  );
 
   const validationResult: SafeParseReturnType<{ flesh: number; blood: number; location: string; }, Bond> = useMemo(() => {
     const parsedFlesh = parseFloat(flesh);
@@ -296,8 +276,8 @@ type Bond = z.infer<typeof bondSchema>;
 
           <ChapterNavigation
             currentChapter={chapter}
-            totalChapters={chapters.length}
-            onChapterChange={setChapter}
+            totalChapters={chapterCount}
+            onChapterChange={goToChapter}
             themeColor="amber"
           />
         </ModuleLayout>
@@ -0,0 +1,6 @@
+/// <reference types="vite/client" />
+
+interface ImportMetaEnv {
+  /** Render-timing collector (DEV/SCRIPTS/analysis/rum_collector.py); unset disables RUM */
+  readonly VITE_RUM_ENDPOINT?: string;
+}
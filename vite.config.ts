@@ -2,6 +2,39 @@ import path from "path";
 import { defineConfig, loadEnv } from "vite";
 import react from "@vitejs/plugin-react";
 import tailwindcss from '@tailwindcss/vite'  // Add this import
+// Generated by DEV/SCRIPTS/build/plan_chunks.py - re-run it after adding modules
+import chunkPlan from "./src/generated/chunkPlan.json";
+
+const packages: Record<string, string> = chunkPlan.packages;
+const files: Record<string, string> = chunkPlan.files;
+
+/**
+ * Map a module id to its planned chunk. Anything the plan doesn't mention
+ * (module-only code, icons used by a single module) is left to Rollup.
+ */
+const manualChunks = (id: string): string | undefined => {
+  const normalized = id.split(path.sep).join("/");
+
+  const icon = normalized.match(/node_modules\/lucide-react\/dist\/esm\/icons\/([^/]+)\.js$/);
+  if (icon) return files[`lucide-react/icons/${icon[1]}`];
+
+  const pkg = normalized.match(/.*node_modules\/((?:@[^/]+\/)?[^/]+)\//);
+  if (pkg) return packages[pkg[1]];
+
+  return files[path.relative(__dirname, id).split(path.sep).join("/")];
+};
+
+/**
+ * Name each module's lazy chunk after its registry id (the module directory)
+ * instead of Rollup's default "index-[hash].js".
+ */
+const chunkFileNames = ({ facadeModuleId }: { facadeModuleId: string | null }) => {
+  const module = facadeModuleId
+    ?.split(path.sep)
+    .join("/")
+    .match(/\/src\/modules\/([^/]+)\/index\.tsx$/);
+  return module ? `assets/module-${module[1]}-[hash].js` : "assets/[name]-[hash].js";
+};
 
 export default defineConfig(({ mode }) => {
   const env = loadEnv(mode, ".", "");
@@ -16,10 +49,15 @@ export default defineConfig(({ mode }) => {
     tailwindcss(), // Add this
   ],
     resolve: {
-      alias: {
-        "@": path.resolve(__dirname, "./src"),
-        "@modules": path.resolve(__dirname, "./src/modules"),
-      },
+      alias: [
+        { find: "@", replacement: path.resolve(__dirname, "./src") },
+        { find: "@modules", replacement: path.resolve(__dirname, "./src/modules") },
+        // <Profiler> onRender is a no-op in React's production build; opting
+        // in to RUM (VITE_RUM_ENDPOINT) switches to the profiling build
+        ...(env.VITE_RUM_ENDPOINT
+          ? [{ find: /^react-dom\/client$/, replacement: "react-dom/profiling" }]
+          : []),
+      ],
     },
     define: {
       "process.env.VITE_GEMINI_API_KEY": JSON.stringify(
@@ -27,12 +65,12 @@ export default defineConfig(({ mode }) => {
       ),
     },
     build: {
+      // dist/.vite/manifest.json - read by DEV/SCRIPTS/build/build_precache.py
+      manifest: true,
       rollupOptions: {
         output: {
-          manualChunks: {
-            "react-vendor": ["react", "react-dom", "react-router-dom"],
-            "ui-vendor": ["lucide-react"],
-          },
+          manualChunks,
+          chunkFileNames,
         },
       },
     },